@@ -0,0 +1,114 @@
+"""
+Benchmark SimpleBM25 Top-k Search: Exhaustive vs Dynamic Pruning
+
+Builds a SimpleBM25 index over the Family Law corpus (or a synthetic
+Zipf-distributed corpus when it is not available), then runs the same
+queries with exhaustive scoring (the previous implementation) and with
+the MaxScore and WAND pruning methods. Rankings are checked to be identical.
+
+Usage:
+    python scripts/benchmark_bm25_search.py [corpus.jsonl] [--docs N] [--top-k K]
+
+Features:
+- Queries mix very common terms ("court", "order", "child") with rarer ones
+- Reports mean latency per method and the speedup
+"""
+
+import argparse
+import json
+import random
+import sys
+import time
+from pathlib import Path
+
+# Set UTF-8 encoding for Windows console
+if sys.platform == "win32":
+    import io
+    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
+
+# Add project root to path
+project_root = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(project_root))
+
+from src.retrieval.retriever import SimpleBM25
+
+COMMON = ["court", "order", "child", "the", "of", "parties", "mother", "father"]
+QUERY_TERMS = ["relocation", "contravention", "superannuation", "spousal", "maintenance",
+               "interim", "violence", "consent", "appeal", "property"]
+
+
+def synthetic_index(num_docs: int, seed: int = 0) -> SimpleBM25:
+    """Zipf-like corpus: a few terms occur in nearly every document, query terms are mid-frequency."""
+    rng = random.Random(seed)
+    filler = [f"term{i}" for i in range(20000)]
+    vocab = COMMON + filler[:300] + QUERY_TERMS + filler[300:]
+    weights = [1.0 / (rank + 1) ** 1.1 for rank in range(len(vocab))]
+
+    bm25 = SimpleBM25()
+    for i in range(num_docs):
+        words = rng.choices(vocab, weights=weights, k=rng.randint(100, 600))
+        bm25.add_document(" ".join(words), {"id": f"doc_{i}"})
+    bm25.finalize()
+    return bm25
+
+
+def corpus_index(path: Path, num_docs: int) -> SimpleBM25:
+    bm25 = SimpleBM25()
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            if bm25.corpus_size >= num_docs:
+                break
+            try:
+                doc = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            bm25.add_document(doc.get('text', ''), {'id': doc.get('citation', bm25.corpus_size)})
+    bm25.finalize()
+    return bm25
+
+
+def timed(bm25: SimpleBM25, queries, top_k: int, method: str):
+    start = time.perf_counter()
+    results = [bm25.search(q, top_k=top_k, method=method) for q in queries]
+    return results, (time.perf_counter() - start) / len(queries)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark exhaustive vs pruned BM25 search")
+    parser.add_argument("corpus", nargs="?", default=str(project_root / "data" / "by_court" / "family.jsonl"))
+    parser.add_argument("--docs", type=int, default=10000, help="Documents to index")
+    parser.add_argument("--top-k", type=int, default=10)
+    parser.add_argument("--queries", type=int, default=50)
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    corpus = Path(args.corpus)
+    if corpus.exists():
+        print(f"Indexing up to {args.docs:,} documents from {corpus}...")
+        bm25 = corpus_index(corpus, args.docs)
+    else:
+        print(f"Corpus not found, indexing {args.docs:,} synthetic documents...")
+        bm25 = synthetic_index(args.docs)
+    print(f"  {bm25.corpus_size:,} documents, {len(bm25.inverted_index):,} terms "
+          f"({time.perf_counter() - start:.1f}s)")
+
+    rng = random.Random(1)
+    queries = [
+        " ".join(rng.sample(COMMON, 2) + rng.sample(QUERY_TERMS, rng.randint(1, 3)))
+        for _ in range(args.queries)
+    ]
+
+    exhaustive, exhaustive_time = timed(bm25, queries, args.top_k, "exhaustive")
+    print(f"\n  Exhaustive: {exhaustive_time * 1000:8.2f} ms/query")
+    for method, label in (("maxscore", "MaxScore"), ("wand", "WAND")):
+        results, elapsed = timed(bm25, queries, args.top_k, method)
+        identical = all(
+            [(d['id'], s) for d, s in a] == [(d['id'], s) for d, s in b]
+            for a, b in zip(exhaustive, results)
+        )
+        print(f"  {label + ':':11s} {elapsed * 1000:8.2f} ms/query "
+              f"({exhaustive_time / elapsed:.1f}x, rankings identical: {identical})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""
+Build the Persistent BM25 Index
+
+Indexes a JSONL case corpus into the array-backed, memory-mappable BM25
+index that LegalRetriever opens at startup (data/indexes/bm25_family by
+default). LegalRetriever rebuilds the index itself when the corpus file
+changes; run this offline so service start never pays for indexing.
+
+Usage:
+    python scripts/build_bm25_index.py [corpus.jsonl] [index_dir]
+
+Features:
+- Reports build time, postings and vocabulary size
+- Reports index open time and a sample query latency
+"""
+
+import sys
+import time
+from pathlib import Path
+
+# Set UTF-8 encoding for Windows console
+if sys.platform == "win32":
+    import io
+    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
+
+# Add project root to path
+project_root = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(project_root))
+
+from src.retrieval.bm25_index import BM25Index, build_corpus_index
+
+
+def main():
+    source = Path(sys.argv[1]) if len(sys.argv) > 1 else project_root / "data" / "by_court" / "family.jsonl"
+    index_dir = Path(sys.argv[2]) if len(sys.argv) > 2 else project_root / "data" / "indexes" / "bm25_family"
+
+    if not source.exists():
+        print(f"Corpus not found: {source}")
+        return
+
+    print(f"Indexing {source} -> {index_dir}")
+    start = time.perf_counter()
+    build_corpus_index(source, index_dir)
+    build_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    index = BM25Index.load(index_dir)
+    open_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    index.search("parenting orders best interests of the child", top_k=10)
+    query_time = time.perf_counter() - start
+
+    print(f"\n  Documents: {index.corpus_size:,}")
+    print(f"  Terms:     {index.meta['num_terms']:,}")
+    print(f"  Postings:  {index.meta['num_postings']:,}")
+    print(f"  Built in {build_time:.1f}s, opened in {open_time * 1000:.1f}ms, "
+          f"sample query {query_time * 1000:.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -14,6 +14,12 @@ Usage:
 
     # Build with custom paths
     python scripts/build_citation_graph.py --input_dir data/processed/domains --output_dir data/processed/graph
+
+    # Rebuild, re-extracting citations only from new or changed cases
+    python scripts/build_citation_graph.py --incremental
+
+    # Scan domain files in 4 processes
+    python scripts/build_citation_graph.py --workers 4
 """
 
 import sys
@@ -35,7 +41,8 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
-def build_graph(input_dir: Path, output_dir: Path, domain_filter: str = None):
+def build_graph(input_dir: Path, output_dir: Path, domain_filter: str = None, incremental: bool = False,
+                workers: int = 1):
     """
     Build citation graph from domain files.
 
@@ -43,6 +50,8 @@ def build_graph(input_dir: Path, output_dir: Path, domain_filter: str = None):
         input_dir: Directory containing domain JSONL files
         output_dir: Directory to save graph TOON files
         domain_filter: Optional domain name to filter (e.g., 'family')
+        incremental: Reuse citations extracted by the previous build for unchanged cases
+        workers: Processes for scanning domain files
     """
     logger.info("=" * 70)
     logger.info("SPCNet Citation Graph Builder")
@@ -61,10 +70,10 @@ def build_graph(input_dir: Path, output_dir: Path, domain_filter: str = None):
         temp_input = input_dir / "_temp_single_domain"
         temp_input.mkdir(exist_ok=True)
 
-        # Copy domain file to temp
+        # Copy domain file to temp (keeping its mtime for incremental builds)
         import shutil
         temp_domain_file = temp_input / domain_file.name
-        shutil.copy(domain_file, temp_domain_file)
+        shutil.copy2(domain_file, temp_domain_file)
 
         # Use temp directory as input
         actual_input = temp_input
@@ -75,14 +84,15 @@ def build_graph(input_dir: Path, output_dir: Path, domain_filter: str = None):
     # Initialize builder
     builder = SPCNetBuilder(
         input_dir=actual_input,
-        output_dir=output_dir
+        output_dir=output_dir,
+        workers=workers
     )
 
     # Build graph
     try:
         logger.info("")
         logger.info("Starting graph build process...")
-        builder.build()
+        builder.build(incremental=incremental)
         logger.info("")
         logger.info("Graph build completed successfully!")
 
@@ -133,6 +143,19 @@ def main():
         help="Build graph for specific domain only (e.g., 'family', 'criminal')"
     )
 
+    parser.add_argument(
+        '--incremental',
+        action='store_true',
+        help="Only re-extract citations from new or changed cases"
+    )
+
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=1,
+        help="Processes for scanning domain files (default: 1)"
+    )
+
     args = parser.parse_args()
 
     # Validate input directory
@@ -147,7 +170,9 @@ def main():
     success = build_graph(
         input_dir=args.input_dir,
         output_dir=args.output_dir,
-        domain_filter=args.domain
+        domain_filter=args.domain,
+        incremental=args.incremental,
+        workers=args.workers
     )
 
     if success:
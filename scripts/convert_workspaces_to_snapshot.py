@@ -0,0 +1,80 @@
+"""
+Convert JSON Workspaces to Binary Snapshots
+
+Writes a memory-mappable columnar snapshot (*_workspace.gsws) next to each
+JSON workspace. GSWRetriever prefers a snapshot when it is at least as new
+as the JSON file.
+
+Usage:
+    python scripts/convert_workspaces_to_snapshot.py [workspace_dir]
+
+Features:
+- Auto-discovers all workspace JSON files
+- Validates round-trip conversion
+- Reports size and load-time savings
+"""
+
+import sys
+import time
+from pathlib import Path
+
+# Set UTF-8 encoding for Windows console
+if sys.platform == "win32":
+    import io
+    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
+
+# Add project root to path
+project_root = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(project_root))
+
+from src.gsw.workspace import WorkspaceManager
+
+
+def convert_workspace(json_path: Path, validate: bool = True) -> Path:
+    """Convert a single JSON workspace to a snapshot and report savings."""
+    print(f"\n{'='*60}")
+    print(f"Converting: {json_path.name}")
+    print(f"{'='*60}")
+
+    start = time.perf_counter()
+    manager = WorkspaceManager.load(json_path)
+    json_load = time.perf_counter() - start
+
+    snapshot_path = json_path.with_suffix('.gsws')
+    manager.save_snapshot(snapshot_path)
+
+    start = time.perf_counter()
+    loaded = WorkspaceManager.load(snapshot_path)
+    snapshot_load = time.perf_counter() - start
+
+    json_size = json_path.stat().st_size
+    snapshot_size = snapshot_path.stat().st_size
+    print(f"\n  JSON:     {json_size:,} bytes, loaded in {json_load * 1000:.1f}ms")
+    print(f"  Snapshot: {snapshot_size:,} bytes, opened in {snapshot_load * 1000:.1f}ms")
+
+    if validate:
+        original = WorkspaceManager._serialize_workspace(manager.workspace)
+        restored = WorkspaceManager._serialize_workspace(loaded.workspace)
+        if original != restored:
+            raise ValueError(f"Round-trip mismatch for {json_path}")
+        print("  Round-trip: OK")
+
+    return snapshot_path
+
+
+def main():
+    workspace_dir = Path(sys.argv[1]) if len(sys.argv) > 1 else project_root / "data" / "workspaces"
+    json_files = sorted(workspace_dir.glob("*_workspace.json"))
+
+    if not json_files:
+        print(f"No workspace JSON files found in {workspace_dir}")
+        return
+
+    for json_path in json_files:
+        convert_workspace(json_path)
+
+    print(f"\nConverted {len(json_files)} workspace(s)")
+
+
+if __name__ == "__main__":
+    main()
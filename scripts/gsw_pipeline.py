@@ -24,7 +24,7 @@ import argparse
 import json
 import sys
 import os
-import time
+from itertools import islice
 from pathlib import Path
 from datetime import datetime
 from typing import Optional, List
@@ -50,6 +50,8 @@ from src.gsw.legal_operator import LegalOperator, chunk_legal_text
 from src.gsw.legal_spacetime import LegalSpacetime
 from src.gsw.legal_reconciler import LegalReconciler
 from src.gsw.workspace import WorkspaceManager
+from src.gsw.journal import WorkspaceJournal
+from src.gsw.extraction_scheduler import ExtractionScheduler, RateLimiter
 from src.gsw.legal_summary import LegalSummary
 from src.gsw.cost_tracker import reset_cost_tracker, get_cost_tracker
 
@@ -102,11 +104,17 @@ def run_gsw_processing(
     batch_size: int = 10,
     calibration: bool = False,
     resume: bool = False,
-    use_free_models: bool = False
+    use_free_models: bool = False,
+    concurrency: int = 4,
+    requests_per_minute: float = 120
 ) -> GlobalWorkspace:
     """
     Run GSW processing on a domain.
 
+    Operator/spacetime calls for up to `concurrency` documents run at once;
+    results are reconciled one at a time in file order, so the workspace
+    is the same as in a sequential run.
+
     Args:
         domain: Domain name (e.g., "family")
         limit: Maximum documents to process
@@ -114,6 +122,8 @@ def run_gsw_processing(
         calibration: If True, don't save results (test mode)
         resume: Resume from checkpoint
         use_free_models: Use free model rotation
+        concurrency: Extractions kept in flight
+        requests_per_minute: Request limit per model
     """
     print("=" * 60)
     print(f"PHASE 2: GSW Processing - {domain.title()}")
@@ -150,8 +160,11 @@ def run_gsw_processing(
     # Initialize components
     print("[Init] Loading components...")
 
+    # Shared by all in-flight requests (replaces a fixed delay per document)
+    rate_limiter = RateLimiter(default_rpm=requests_per_minute)
+
     try:
-        operator = LegalOperator(model=models)
+        operator = LegalOperator(model=models, rate_limiter=rate_limiter)
         print("  - LegalOperator: OK")
     except Exception as e:
         print(f"  - LegalOperator: FAILED ({e})")
@@ -159,7 +172,7 @@ def run_gsw_processing(
         operator = None
 
     try:
-        spacetime = LegalSpacetime()
+        spacetime = LegalSpacetime(rate_limiter=rate_limiter)
         print("  - LegalSpacetime: OK")
     except:
         spacetime = None
@@ -179,6 +192,20 @@ def run_gsw_processing(
         manager = WorkspaceManager(workspace, workspace_file)
         print("[New] Created fresh workspace")
 
+    # Write-ahead journal: each reconciled document is appended instead of
+    # rewriting the whole workspace on every checkpoint
+    journal = None
+    done_documents = set()
+    if not calibration:
+        journal = WorkspaceJournal.for_workspace(workspace_file)
+        if resume:
+            commits = journal.replay(workspace)
+            done_documents = {c.get("document_id") for c in commits}
+            if commits:
+                print(f"[Resume] Recovered {len(commits)} documents from journal")
+        else:
+            journal.discard()
+
     # Load processing state
     start_line = 0
     if resume and state_file.exists():
@@ -190,68 +217,96 @@ def run_gsw_processing(
     # Process documents
     print(f"\n[Processing] Domain: {domain}")
     print(f"[Processing] Limit: {limit or 'All'}")
+    print(f"[Processing] Concurrency: {concurrency} | Rate limit: {requests_per_minute}/min per model")
     print("-" * 40)
 
     processed = 0
     errors = 0
+    line_num = start_line - 1
+
+    def pending_documents():
+        """Documents still to process, in file order."""
+        nonlocal errors
+        with open(domain_file, 'r', encoding='utf-8') as f:
+            for n, line in enumerate(f):
+                # Skip if resuming
+                if n < start_line:
+                    continue
+                try:
+                    doc = json.loads(line)
+                except json.JSONDecodeError as e:
+                    errors += 1
+                    if errors <= 5:
+                        print(f"\n  [Error] Line {n}: {e}")
+                    continue
+
+                # Already reconciled (recovered from the journal)
+                if doc.get('version_id', str(n)) in done_documents:
+                    continue
+
+                yield n, doc
+
+    def extract_document(item):
+        """Operator + spacetime calls (worker thread; no workspace access)."""
+        n, doc = item
+        if not operator:
+            return None
+
+        text = doc.get('text', '')[:30000]
+        citation = doc.get('citation', '')
+
+        extraction = operator.extract(
+            text=text,
+            situation=f"Legal case: {citation}",
+            background_context=f"Domain: {domain}, Type: {doc.get('type', '')}",
+            document_id=doc.get('version_id', str(n))
+        )
 
-    with open(domain_file, 'r', encoding='utf-8') as f:
-        for line_num, line in enumerate(f):
-            # Skip if resuming
-            if line_num < start_line:
-                continue
-
-            # Check limit
-            if limit and processed >= limit:
-                break
+        # Add spatio-temporal links
+        if spacetime and extraction.actors:
+            links = spacetime.link_entities(extraction, text)
+            extraction.spatio_temporal_links.extend(links)
 
-            try:
-                doc = json.loads(line)
+        return extraction
 
-                # Extract with Operator
-                if operator:
-                    text = doc.get('text', '')[:30000]
-                    citation = doc.get('citation', '')
+    scheduler = ExtractionScheduler(extract_document, max_in_flight=concurrency)
 
-                    extraction = operator.extract(
-                        text=text,
-                        situation=f"Legal case: {citation}",
-                        background_context=f"Domain: {domain}, Type: {doc.get('type', '')}",
-                        document_id=doc.get('version_id', str(line_num))
-                    )
+    # Single writer: results arrive in file order and are reconciled here
+    for result in scheduler.run(islice(pending_documents(), limit)):
+        line_num, doc = result.item
 
-                    # Add spatio-temporal links
-                    if spacetime and extraction.actors:
-                        links = spacetime.link_entities(extraction, text)
-                        extraction.spatio_temporal_links.extend(links)
+        try:
+            if result.error is not None:
+                raise result.error
 
-                    # Reconcile with workspace
-                    extraction, log = reconciler.reconcile(
-                        extraction, workspace, text
-                    )
+            if operator:
+                text = doc.get('text', '')[:30000]
 
-                    processed += 1
+                # Reconcile with workspace
+                extraction, log = reconciler.reconcile(
+                    result.extraction, workspace, text, journal=journal
+                )
 
-                    # Progress with cost
-                    cost_tracker.print_progress(processed, limit or 0)
+                processed += 1
 
-                else:
-                    # Mock processing for testing without API
-                    processed += 1
-                    if processed % 100 == 0:
-                        print(f"  [Mock] Processed: {processed}", end='\r')
+                # Progress with cost
+                cost_tracker.print_progress(processed, limit or 0)
 
-            except Exception as e:
-                errors += 1
-                if errors <= 5:
-                    print(f"\n  [Error] Line {line_num}: {e}")
+            else:
+                # Mock processing for testing without API
+                processed += 1
+                if processed % 100 == 0:
+                    print(f"  [Mock] Processed: {processed}", end='\r')
 
-            # Save checkpoint every batch
-            if processed % batch_size == 0 and not calibration:
-                _save_checkpoint(manager, state_file, line_num, processed)
+        except Exception as e:
+            errors += 1
+            if errors <= 5:
+                print(f"\n  [Error] Line {line_num}: {e}")
 
-            # Small delay between documents (paid tier)
-            time.sleep(0.5)
+        # Save checkpoint every batch. Reconciliation is in file order, so
+        # every line before last_line is done.
+        if processed % batch_size == 0 and not calibration:
+            _save_checkpoint(manager, journal, state_file, line_num, processed)
 
     print(f"\n\n[Complete] Processed: {processed} | Errors: {errors}")
     print(f"[Workspace] Actors: {len(workspace.actors)} | "
@@ -268,8 +323,9 @@ def run_gsw_processing(
 
     # Save final state
     if not calibration:
-        manager.save()
-        _save_checkpoint(manager, state_file, line_num, processed)
+        journal.compact(manager)
+        journal.close()
+        _save_checkpoint(manager, journal, state_file, line_num, processed)
         print(f"[Saved] Workspace: {workspace_file}")
     else:
         print("[Calibration] Results NOT saved")
@@ -279,12 +335,21 @@ def run_gsw_processing(
 
 def _save_checkpoint(
     manager: WorkspaceManager,
+    journal: Optional[WorkspaceJournal],
     state_file: Path,
     line_num: int,
     processed: int
 ) -> None:
-    """Save processing checkpoint."""
-    manager.save()
+    """
+    Save processing checkpoint.
+
+    Workspace changes are already durable in the journal, so the full
+    workspace is only rewritten when the journal needs compacting.
+    """
+    if journal is None:
+        manager.save()
+    elif journal.should_compact():
+        journal.compact(manager)
 
     state = {
         "last_line": line_num + 1,
@@ -418,6 +483,10 @@ Examples:
                                 help="Resume from checkpoint")
     process_parser.add_argument("--free", action="store_true",
                                 help="Use free models (rotation)")
+    process_parser.add_argument("--concurrency", "-j", type=int, default=4,
+                                help="Extractions kept in flight")
+    process_parser.add_argument("--rpm", type=float, default=120,
+                                help="Request limit per model (requests/minute)")
 
     # Analyze command
     analyze_parser = subparsers.add_parser("analyze", help="Generate analysis reports")
@@ -450,7 +519,8 @@ Examples:
     elif args.command == "process":
         run_gsw_processing(
             args.domain, args.limit, args.batch,
-            args.calibration, args.resume, args.free
+            args.calibration, args.resume, args.free,
+            concurrency=args.concurrency, requests_per_minute=args.rpm
         )
 
     elif args.command == "analyze":
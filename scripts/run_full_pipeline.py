@@ -145,7 +145,13 @@ def parse_args():
     parser.add_argument(
         "--gsw-delay",
         type=float,
-        help="Delay between GSW API calls (seconds)"
+        help="Minimum delay between GSW API calls to one model (seconds)"
+    )
+
+    parser.add_argument(
+        "--gsw-concurrency",
+        type=int,
+        help="GSW extractions kept in flight"
     )
 
     # Utility commands
@@ -229,6 +235,8 @@ def main():
         config.gsw_batch_size = args.gsw_batch_size
     if args.gsw_delay is not None:
         config.gsw_delay = args.gsw_delay
+    if args.gsw_concurrency is not None:
+        config.gsw_concurrency = args.gsw_concurrency
 
     if args.verbose:
         config.verbose = True
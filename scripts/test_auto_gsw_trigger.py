@@ -137,8 +137,8 @@ def test_checkpoint_resume(queue: GSWExtractionQueue):
     print("\nLoading checkpoint...")
     checkpoint_path = queue.checkpoint_path
 
-    if not checkpoint_path.exists():
-        print("✗ FAIL: Checkpoint file not created")
+    if not queue.db_path.exists():
+        print("✗ FAIL: Queue database not created")
         return
 
     # Create new queue and load
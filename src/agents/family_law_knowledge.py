@@ -519,16 +519,16 @@ class FamilyLawAgent:
 
     def answer_question(self, question_id: str, answer: str) -> bool:
         """Mark a question as answered."""
-        if question_id in self.workspace.questions:
-            q = self.workspace.questions[question_id]
-            q.answerable = True
-            q.answer_text = answer
+        if self.workspace.answer_question(question_id, answer):
             self.workspace.touch()
             return True
         return False
 
     def get_timeline(self, party_name: Optional[str] = None) -> List[Dict[str, Any]]:
-        """Get chronological timeline of events."""
+        """Get chronological timeline of events, optionally for one party."""
+        if party_name:
+            actor = self.workspace.find_actor_by_name(party_name)
+            return self.manager.get_timeline(actor.id) if actor else []
         return self.manager.get_timeline()
 
     def get_actors_by_role(self, role: str) -> List[Dict[str, Any]]:
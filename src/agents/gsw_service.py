@@ -0,0 +1,427 @@
+"""
+GSW Query Service - Long-Lived HTTP Server over Warm Workspaces
+
+Loads the GSW workspace, the BM25 case index and the VSA validator once
+and serves the gsw_tools operations over HTTP (stdlib asyncio, no web
+framework). Callers no longer pay a cold start per query.
+
+Concurrent /search and /validate requests are micro-batched: requests
+arriving within a few milliseconds of each other are answered by one
+vectorised call (BM25Index.search_batch, VSAValidator.validate_claims).
+All workspace and model access runs on a single worker thread, so the
+event loop stays responsive and the loaded state is never shared between
+threads.
+
+Endpoints (JSON request and response bodies):
+    GET  /health
+    GET  /stats                      Workspace and batching statistics
+    POST /find_parties               {"query": ""}
+    POST /find_actors_by_role        {"role": "Judge"}
+    POST /get_case_questions         {"case_type": "parenting"}
+    POST /get_unanswered_questions   {"limit": 10}
+    POST /get_knowledge_context      {"format": "toon", "max_actors": 30}
+    POST /search                     {"query": "relocation", "top_k": 5}    (batched)
+    POST /validate                   {"claims": ["..."]} or {"claim": "..."} (batched)
+    POST /validate_extraction        {"extraction": {...}, "context": ""}
+    POST /reload                     {"workspace": "path/to/workspace.json"}
+
+Usage:
+    python -m src.agents.gsw_service --workspace data/workspaces/family_law_gsw.json --port 8765
+
+    curl -s localhost:8765/search -d '{"query": "relocation", "top_k": 3}'
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from http import HTTPStatus
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from src.agents.gsw_tools import GSWToolRegistry
+from src.retrieval.retriever import LegalRetriever
+
+DEFAULT_PORT = 8765
+MAX_BODY_BYTES = 10 * 1024 * 1024
+
+
+class RequestError(Exception):
+    """A client error, answered with the given HTTP status."""
+
+    def __init__(self, status: HTTPStatus, message: str):
+        super().__init__(message)
+        self.status = status
+
+
+# ============================================================================
+# MICRO-BATCHING
+# ============================================================================
+
+class MicroBatcher:
+    """
+    Collects concurrent requests into batches for one vectorised call.
+
+    The first request of a batch waits at most max_wait seconds for
+    others to join; a batch is flushed early once it holds max_batch
+    requests. batch_fn maps a list of items to a list of results (same
+    order) and runs on the given executor. If it raises for a batch, the
+    items are retried one at a time, so one bad item only fails its own
+    request.
+    """
+
+    def __init__(
+        self,
+        batch_fn: Callable[[List[Any]], List[Any]],
+        executor: ThreadPoolExecutor,
+        max_batch: int = 32,
+        max_wait: float = 0.005
+    ):
+        self.batch_fn = batch_fn
+        self.executor = executor
+        self.max_batch = max_batch
+        self.max_wait = max_wait
+        self._pending: List[Tuple[Any, asyncio.Future]] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+
+        self.requests = 0
+        self.batches = 0
+        self.largest_batch = 0
+
+    async def submit(self, item: Any) -> Any:
+        """Queue one item and wait for its result."""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((item, future))
+        self.requests += 1
+
+        if len(self._pending) >= self.max_batch:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.max_wait, self._flush)
+        return await future
+
+    def _flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch, self._pending = self._pending, []
+        if batch:
+            self.batches += 1
+            self.largest_batch = max(self.largest_batch, len(batch))
+            asyncio.get_running_loop().create_task(self._run(batch))
+
+    async def _run(self, batch: List[Tuple[Any, asyncio.Future]]) -> None:
+        loop = asyncio.get_running_loop()
+        try:
+            results = await loop.run_in_executor(
+                self.executor, self.batch_fn, [item for item, _ in batch]
+            )
+        except Exception as e:
+            if len(batch) == 1:
+                if not batch[0][1].done():
+                    batch[0][1].set_exception(e)
+                return
+            # Isolate the failing item(s)
+            for item, future in batch:
+                await self._run([(item, future)])
+            return
+        for (_, future), result in zip(batch, results):
+            if not future.done():
+                future.set_result(result)
+
+    def get_statistics(self) -> Dict[str, Any]:
+        return {
+            "requests": self.requests,
+            "batches": self.batches,
+            "largest_batch": self.largest_batch,
+            "avg_batch_size": self.requests / self.batches if self.batches else 0.0
+        }
+
+
+# ============================================================================
+# SERVICE
+# ============================================================================
+
+class GSWService:
+    """
+    Warm GSW state plus request handlers.
+
+    Usage:
+        service = GSWService(Path("data/workspaces/family_law_gsw.json"))
+        asyncio.run(service.serve(port=8765))  # Loads on the service thread first
+    """
+
+    def __init__(
+        self,
+        workspace_path: Optional[Path] = None,
+        data_dir: Path = Path("data"),
+        max_batch: int = 32,
+        max_wait_ms: float = 5.0
+    ):
+        self.registry = GSWToolRegistry(Path(workspace_path) if workspace_path else None)
+        self.data_dir = Path(data_dir)
+        self.retriever: Optional[LegalRetriever] = None
+        self._statutory_validator = None
+
+        # One worker: loaded state is only ever touched from this thread
+        self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="gsw-service")
+        self.search_batcher = MicroBatcher(self._search_batch, self.executor, max_batch, max_wait_ms / 1000)
+        self.validate_batcher = MicroBatcher(self._validate_batch, self.executor, max_batch, max_wait_ms / 1000)
+
+        self._routes: Dict[Tuple[str, str], Callable[[Dict[str, Any]], Awaitable[Dict[str, Any]]]] = {
+            ("GET", "/health"): self._health,
+            ("GET", "/stats"): self._stats,
+            ("POST", "/find_parties"): self._find_parties,
+            ("POST", "/find_actors_by_role"): self._find_actors_by_role,
+            ("POST", "/get_case_questions"): self._get_case_questions,
+            ("POST", "/get_unanswered_questions"): self._get_unanswered_questions,
+            ("POST", "/get_knowledge_context"): self._get_knowledge_context,
+            ("POST", "/search"): self._search,
+            ("POST", "/validate"): self._validate,
+            ("POST", "/validate_extraction"): self._validate_extraction,
+            ("POST", "/reload"): self._reload,
+        }
+
+    def load(self) -> None:
+        """Load the workspace, BM25 index and VSA validator."""
+        print("[GSWService] Loading workspace, BM25 index and VSA...")
+        agent = self.registry.agent
+        self.retriever = LegalRetriever(data_dir=str(self.data_dir))
+        print(f"[GSWService] Ready: {len(agent.workspace.actors)} actors, "
+              f"{self.retriever.bm25.corpus_size} indexed cases")
+
+    def _call(self, fn: Callable, *args) -> Awaitable:
+        """Run fn on the service thread."""
+        return asyncio.get_running_loop().run_in_executor(self.executor, fn, *args)
+
+    # =========================================================================
+    # BATCH FUNCTIONS (service thread)
+    # =========================================================================
+
+    def _search_batch(self, items: List[Tuple[str, int]]) -> List[List[Dict]]:
+        """One BM25 pass for every query; each request keeps its own top_k."""
+        top_k = max(k for _, k in items)
+        hits = self.retriever.search_batch([query for query, _ in items], top_k=top_k)
+        return [results[:k] for (_, k), results in zip(items, hits)]
+
+    def _validate_batch(self, items: List[List[str]]) -> List[List[Dict]]:
+        """One VSA pass over the claims of every request."""
+        claims = [claim for request_claims in items for claim in request_claims]
+        validations = self.retriever.batch_validate_claims(claims, self.registry.agent.workspace)
+        results, start = [], 0
+        for request_claims in items:
+            results.append(validations[start:start + len(request_claims)])
+            start += len(request_claims)
+        return results
+
+    # =========================================================================
+    # HANDLERS
+    # =========================================================================
+
+    async def handle(self, method: str, path: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Dispatch one request; raises RequestError for client errors."""
+        handler = self._routes.get((method, path))
+        if handler is None:
+            if any(route_path == path for _, route_path in self._routes):
+                raise RequestError(HTTPStatus.METHOD_NOT_ALLOWED, f"{method} not allowed for {path}")
+            raise RequestError(HTTPStatus.NOT_FOUND, f"Unknown endpoint: {path}")
+        return await handler(params)
+
+    async def _health(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        return {"success": True, "status": "ok"}
+
+    async def _stats(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        statistics = await self._call(lambda: self.registry.agent.stats)
+        return {
+            "success": True,
+            "statistics": statistics,
+            "service": {
+                "indexed_cases": self.retriever.bm25.corpus_size,
+                "search_batching": self.search_batcher.get_statistics(),
+                "validate_batching": self.validate_batcher.get_statistics()
+            }
+        }
+
+    async def _find_parties(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        results = await self._call(self.registry.agent.find_parties, params.get("query", ""))
+        return {"success": True, "count": len(results), "parties": results}
+
+    async def _find_actors_by_role(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        role = _require(params, "role")
+        results = await self._call(self.registry.agent.get_actors_by_role, role)
+        return {"success": True, "role": role, "count": len(results), "actors": results}
+
+    async def _get_case_questions(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        case_type = params.get("case_type", "parenting")
+        results = await self._call(self.registry.agent.find_cases_by_type, case_type)
+        return {"success": True, "case_type": case_type, "count": len(results), "questions": results}
+
+    async def _get_unanswered_questions(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        results = await self._call(self.registry.agent.get_unanswered_questions, int(params.get("limit", 10)))
+        return {"success": True, "count": len(results), "questions": results}
+
+    async def _get_knowledge_context(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        format = params.get("format", "toon")
+        max_actors = int(params.get("max_actors", 30))
+
+        def context() -> str:
+            agent = self.registry.agent
+            if format.lower() == "toon":
+                return agent.get_context_toon(max_actors)
+            return json.dumps(agent.get_context_json(max_actors), indent=2)
+
+        return {"success": True, "format": format, "context": await self._call(context)}
+
+    async def _search(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        query = _require(params, "query")
+        top_k = params.get("top_k", 5)
+        if not isinstance(query, str):
+            raise RequestError(HTTPStatus.BAD_REQUEST, "'query' must be a string")
+        if not isinstance(top_k, int) or isinstance(top_k, bool) or top_k < 1:
+            raise RequestError(HTTPStatus.BAD_REQUEST, "'top_k' must be a positive integer")
+        results = await self.search_batcher.submit((query, top_k))
+        return {"success": True, "query": query, "count": len(results), "results": results}
+
+    async def _validate(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        claims = params.get("claims")
+        if claims is None:
+            claims = [_require(params, "claim")]
+        if not isinstance(claims, list) or not all(isinstance(c, str) for c in claims):
+            raise RequestError(HTTPStatus.BAD_REQUEST, "'claims' must be a list of strings")
+        validations = await self.validate_batcher.submit(claims) if claims else []
+        return {"success": True, "count": len(validations), "validations": validations}
+
+    async def _validate_extraction(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        extraction = _require(params, "extraction")
+
+        def validate() -> Dict[str, Any]:
+            if self._statutory_validator is None:
+                from src.validation.statutory_rag import StatutoryRAGValidator
+                self._statutory_validator = StatutoryRAGValidator(str(self.data_dir / "statutory_corpus"))
+            result = self._statutory_validator.validate_extraction(extraction, params.get("context", ""))
+            return {
+                "is_valid": result.is_valid,
+                "compliance_score": result.compliance_score,
+                "conflicts": result.conflicts,
+                "recommendations": result.recommendations,
+                "supporting_citations": [str(ref) for ref in result.supporting_citations]
+            }
+
+        return {"success": True, "validation": await self._call(validate)}
+
+    async def _reload(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        path = params.get("workspace")
+
+        def reload() -> int:
+            self.registry.reload(Path(path) if path else None)
+            return len(self.registry.agent.workspace.actors)
+
+        return {"success": True, "actors": await self._call(reload)}
+
+    # =========================================================================
+    # HTTP
+    # =========================================================================
+
+    async def serve(self, host: str = "127.0.0.1", port: int = DEFAULT_PORT,
+                    started: Optional[Callable[[asyncio.AbstractServer], None]] = None) -> None:
+        """Serve until cancelled. started() receives the listening server."""
+        if self.retriever is None:
+            await self._call(self.load)
+        server = await asyncio.start_server(self._handle_connection, host, port)
+        bound = server.sockets[0].getsockname()
+        print(f"[GSWService] Listening on http://{bound[0]}:{bound[1]}")
+        if started is not None:
+            started(server)
+        async with server:
+            await server.serve_forever()
+
+    async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """HTTP/1.1 with keep-alive: one request at a time per connection."""
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                method, target, version = request_line.decode("latin-1").split(" ", 2)
+
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+
+                length = int(headers.get("content-length", 0))
+                body = await reader.readexactly(length) if 0 < length <= MAX_BODY_BYTES else b""
+
+                if length > MAX_BODY_BYTES:
+                    status, payload = HTTPStatus.REQUEST_ENTITY_TOO_LARGE, {"success": False, "error": "Body too large"}
+                else:
+                    status, payload = await self._respond(method, target.split("?", 1)[0], body)
+
+                keep_alive = (headers.get("connection", "").lower() != "close"
+                              and version.strip() == "HTTP/1.1" and length <= MAX_BODY_BYTES)
+                data = json.dumps(payload).encode("utf-8")
+                writer.write(
+                    f"HTTP/1.1 {status.value} {status.phrase}\r\n"
+                    f"Content-Type: application/json\r\n"
+                    f"Content-Length: {len(data)}\r\n"
+                    f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n".encode("latin-1") + data
+                )
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (ValueError, asyncio.IncompleteReadError, ConnectionError):
+            pass  # Malformed request or client went away
+        finally:
+            writer.close()
+
+    async def _respond(self, method: str, path: str, body: bytes) -> Tuple[HTTPStatus, Dict[str, Any]]:
+        try:
+            params = json.loads(body) if body.strip() else {}
+            if not isinstance(params, dict):
+                raise RequestError(HTTPStatus.BAD_REQUEST, "Request body must be a JSON object")
+            return HTTPStatus.OK, await self.handle(method, path, params)
+        except json.JSONDecodeError as e:
+            return HTTPStatus.BAD_REQUEST, {"success": False, "error": f"Invalid JSON: {e}"}
+        except RequestError as e:
+            return e.status, {"success": False, "error": str(e)}
+        except Exception as e:
+            print(f"[GSWService] Error handling {method} {path}: {e}")
+            return HTTPStatus.INTERNAL_SERVER_ERROR, {"success": False, "error": str(e)}
+
+
+def _require(params: Dict[str, Any], name: str) -> Any:
+    if name not in params:
+        raise RequestError(HTTPStatus.BAD_REQUEST, f"Missing parameter: {name}")
+    return params[name]
+
+
+# ============================================================================
+# CLI
+# ============================================================================
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve GSW tools over HTTP")
+    parser.add_argument("--workspace", default="data/workspaces/family_law_gsw.json", help="Workspace file")
+    parser.add_argument("--data-dir", default="data", help="Data directory (BM25 corpus and index)")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--max-batch", type=int, default=32, help="Max requests per batched call")
+    parser.add_argument("--max-wait-ms", type=float, default=5.0, help="Max wait for a batch to fill")
+    args = parser.parse_args()
+
+    service = GSWService(Path(args.workspace), Path(args.data_dir), args.max_batch, args.max_wait_ms)
+    try:
+        asyncio.run(service.serve(args.host, args.port))
+    except KeyboardInterrupt:
+        print("[GSWService] Stopped")
+
+
+if __name__ == "__main__":
+    main()
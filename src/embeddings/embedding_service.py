@@ -0,0 +1,322 @@
+"""
+Embedding Service - Batched, Cached Dense Embeddings
+====================================================
+
+One place to turn text into normalised float32 vectors:
+
+- Encoders: SentenceTransformerEncoder (BGE-M3 or any small local CPU
+  model) or HashingEncoder, a deterministic character n-gram stand-in
+  that needs no model download (tests, offline runs)
+- EmbeddingCache: persistent SQLite store keyed by a hash of
+  (encoder name, text), so entity names are encoded once across chunks
+  and runs
+- EmbeddingService: deduplicates texts, serves cached vectors and
+  encodes the misses in batches
+- VectorIndex: contiguous float32 matrix for top-k cosine search with a
+  single matrix multiply per query batch
+
+Usage:
+    service = EmbeddingService(HashingEncoder(), cache=EmbeddingCache(path))
+    index = VectorIndex(service.dim)
+    index.add(ids, service.embed(names))
+    best = index.best_match(service.embed(queries))
+"""
+
+import hashlib
+import re
+import sqlite3
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+
+DEFAULT_MODEL = "BAAI/bge-m3"
+DEFAULT_CACHE_PATH = Path(__file__).resolve().parents[2] / "data" / "cache" / "embeddings.sqlite"
+
+# SQLite limits the number of bound parameters per statement
+LOOKUP_BATCH = 500
+
+
+# ============================================================================
+# ENCODERS
+# ============================================================================
+
+class SentenceTransformerEncoder:
+    """sentence-transformers model (loaded on first use)."""
+
+    def __init__(self, model_name: str = DEFAULT_MODEL, device: Optional[str] = None):
+        self.name = model_name
+        self.device = device
+        self._model = None
+
+    @property
+    def model(self):
+        if self._model is None:
+            from sentence_transformers import SentenceTransformer
+            device = self.device
+            if device is None:
+                import torch
+                device = "cuda" if torch.cuda.is_available() else "cpu"
+            print(f"[Embeddings] Loading {self.name} on {device}...")
+            self._model = SentenceTransformer(self.name, device=device)
+        return self._model
+
+    @property
+    def dim(self) -> int:
+        return self.model.get_sentence_embedding_dimension()
+
+    def encode(self, texts: List[str], batch_size: int = 64) -> np.ndarray:
+        return self.model.encode(
+            texts, batch_size=batch_size, normalize_embeddings=True,
+            convert_to_numpy=True, show_progress_bar=False
+        ).astype(np.float32, copy=False)
+
+
+class HashingEncoder:
+    """
+    Deterministic feature-hashing encoder.
+
+    Word tokens and character trigrams are hashed (signed) into `dim`
+    buckets, so texts sharing words or spelling fragments get a high
+    cosine similarity. No model, no randomness.
+    """
+
+    def __init__(self, dim: int = 256):
+        self.dim = dim
+        self.name = f"hashing-{dim}"
+
+    def _features(self, text: str) -> List[str]:
+        text = text.lower()
+        features = re.findall(r"\w+", text)
+        padded = f" {' '.join(features)} "
+        features.extend(padded[i:i + 3] for i in range(len(padded) - 2))
+        return features
+
+    def encode(self, texts: List[str], batch_size: int = 64) -> np.ndarray:
+        vectors = np.zeros((len(texts), self.dim), dtype=np.float32)
+        for row, text in enumerate(texts):
+            for feature in self._features(text):
+                digest = int.from_bytes(
+                    hashlib.blake2b(feature.encode("utf-8"), digest_size=8).digest(), "little"
+                )
+                vectors[row, digest % self.dim] += 1.0 if (digest >> 63) else -1.0
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        np.divide(vectors, norms, out=vectors, where=norms > 0)
+        return vectors
+
+
+# ============================================================================
+# CACHE
+# ============================================================================
+
+def embedding_key(encoder_name: str, text: str) -> str:
+    """Cache key of one (encoder, text) pair."""
+    return hashlib.sha256(f"{encoder_name}\0{text}".encode("utf-8")).hexdigest()
+
+
+class EmbeddingCache:
+    """Persistent key -> float32 vector store (SQLite, WAL mode)."""
+
+    def __init__(self, path: Path = DEFAULT_CACHE_PATH):
+        self.path = Path(path)
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self.path), check_same_thread=False, timeout=30)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS embeddings (key TEXT PRIMARY KEY, vector BLOB NOT NULL)"
+            )
+            conn.commit()
+            self._conn = conn
+        return self._conn
+
+    def get_many(self, keys: Sequence[str]) -> Dict[str, np.ndarray]:
+        """Cached vectors for the keys that are present."""
+        found: Dict[str, np.ndarray] = {}
+        with self._lock:
+            conn = self._connect()
+            for start in range(0, len(keys), LOOKUP_BATCH):
+                batch = list(keys[start:start + LOOKUP_BATCH])
+                marks = ",".join("?" * len(batch))
+                for key, blob in conn.execute(
+                    f"SELECT key, vector FROM embeddings WHERE key IN ({marks})", batch
+                ):
+                    found[key] = np.frombuffer(blob, dtype=np.float32)
+        return found
+
+    def put_many(self, items: Iterable[Tuple[str, np.ndarray]]) -> None:
+        """Store vectors."""
+        with self._lock:
+            conn = self._connect()
+            conn.executemany(
+                "INSERT OR REPLACE INTO embeddings (key, vector) VALUES (?, ?)",
+                ((key, np.asarray(vector, dtype=np.float32).tobytes()) for key, vector in items)
+            )
+            conn.commit()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._connect().execute("SELECT COUNT(*) FROM embeddings").fetchone()[0]
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+# ============================================================================
+# SERVICE
+# ============================================================================
+
+class EmbeddingService:
+    """Batched, cached text -> normalised float32 vectors."""
+
+    def __init__(
+        self,
+        encoder=None,
+        cache: Optional[EmbeddingCache] = None,
+        batch_size: int = 64,
+        memo_size: int = 100_000
+    ):
+        """
+        Args:
+            encoder: Object with name, dim and encode(texts, batch_size)
+                (default: SentenceTransformerEncoder for BGE-M3)
+            cache: Persistent cache (None = in-process memo only)
+            batch_size: Encoder batch size
+            memo_size: Vectors kept in memory (least recently used dropped)
+        """
+        self.encoder = encoder if encoder is not None else SentenceTransformerEncoder()
+        self.cache = cache
+        self.batch_size = batch_size
+        self.memo_size = memo_size
+        self.encoded = 0  # Texts actually sent to the encoder
+        self._memo: "OrderedDict[str, np.ndarray]" = OrderedDict()
+
+    def _remember(self, vectors: Dict[str, np.ndarray]) -> None:
+        self._memo.update(vectors)
+        while len(self._memo) > self.memo_size:
+            self._memo.popitem(last=False)
+
+    @property
+    def dim(self) -> int:
+        return self.encoder.dim
+
+    def embed(self, texts: Sequence[str]) -> np.ndarray:
+        """Embed texts as an (n, dim) float32 matrix (rows L2-normalised)."""
+        keys = [embedding_key(self.encoder.name, text) for text in texts]
+        vectors = {}
+        for key in set(keys):
+            if key in self._memo:
+                self._memo.move_to_end(key)
+                vectors[key] = self._memo[key]
+
+        missing = [key for key in dict.fromkeys(keys) if key not in vectors]
+        if missing and self.cache is not None:
+            cached = self.cache.get_many(missing)
+            vectors.update(cached)
+            self._remember(cached)
+            missing = [key for key in missing if key not in cached]
+
+        if missing:
+            text_of = dict(zip(keys, texts))
+            encoded = self.encoder.encode([text_of[key] for key in missing], batch_size=self.batch_size)
+            self.encoded += len(missing)
+            fresh = dict(zip(missing, encoded))
+            vectors.update(fresh)
+            self._remember(fresh)
+            if self.cache is not None:
+                self.cache.put_many(fresh.items())
+
+        if not keys:
+            return np.zeros((0, self.dim), dtype=np.float32)
+        return np.stack([vectors[key] for key in keys]).astype(np.float32, copy=False)
+
+    def embed_one(self, text: str) -> np.ndarray:
+        """Embed a single text as a (dim,) vector."""
+        return self.embed([text])[0]
+
+
+# ============================================================================
+# INDEX
+# ============================================================================
+
+class VectorIndex:
+    """
+    Contiguous float32 matrix of normalised vectors with id lookup.
+
+    Rows are appended into a capacity-doubling buffer; re-adding an id
+    overwrites its row in place. Search is one matrix multiply.
+    """
+
+    def __init__(self, dim: int):
+        self.dim = dim
+        self.ids: List[str] = []
+        self._rows: Dict[str, int] = {}
+        self._matrix = np.zeros((16, dim), dtype=np.float32)
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def __contains__(self, entity_id: str) -> bool:
+        return entity_id in self._rows
+
+    @property
+    def matrix(self) -> np.ndarray:
+        """View of the populated rows."""
+        return self._matrix[:len(self.ids)]
+
+    def add(self, ids: Sequence[str], vectors: np.ndarray) -> None:
+        """Add or overwrite vectors (one row per id)."""
+        vectors = np.asarray(vectors, dtype=np.float32).reshape(len(ids), self.dim)
+        for entity_id, vector in zip(ids, vectors):
+            row = self._rows.get(entity_id)
+            if row is None:
+                row = len(self.ids)
+                if row == len(self._matrix):
+                    grown = np.zeros((2 * len(self._matrix), self.dim), dtype=np.float32)
+                    grown[:row] = self._matrix
+                    self._matrix = grown
+                self.ids.append(entity_id)
+                self._rows[entity_id] = row
+            self._matrix[row] = vector
+
+    def vector(self, entity_id: str) -> Optional[np.ndarray]:
+        row = self._rows.get(entity_id)
+        return None if row is None else self._matrix[row]
+
+    def scores(self, queries: np.ndarray) -> np.ndarray:
+        """(n_queries, n_entities) cosine similarities."""
+        return np.atleast_2d(queries).astype(np.float32, copy=False) @ self.matrix.T
+
+    def search(self, queries: np.ndarray, k: int = 10) -> List[List[Tuple[str, float]]]:
+        """Top-k (id, score) per query, best first."""
+        if not self.ids:
+            return [[] for _ in range(len(np.atleast_2d(queries)))]
+        scores = self.scores(queries)
+        k = min(k, len(self.ids))
+        top = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+        results = []
+        for row, candidates in zip(scores, top):
+            # Stable sort on row index keeps earlier entities first on ties
+            order = sorted(candidates, key=lambda col: (-row[col], col))
+            results.append([(self.ids[col], float(row[col])) for col in order])
+        return results
+
+    def best_match(self, queries: np.ndarray) -> List[Tuple[Optional[str], float]]:
+        """Best (id, score) per query; (None, -1.0) when the index is empty."""
+        n_queries = len(np.atleast_2d(queries))
+        if not self.ids:
+            return [(None, -1.0)] * n_queries
+        scores = self.scores(queries)
+        best = scores.argmax(axis=1)
+        return [(self.ids[col], float(scores[row, col])) for row, col in enumerate(best)]
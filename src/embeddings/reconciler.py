@@ -1,8 +1,8 @@
 from typing import List, Dict, Optional, Any
 from datetime import date
 import numpy as np
-from sentence_transformers import SentenceTransformer
 from pydantic import BaseModel
+from .embedding_service import EmbeddingCache, EmbeddingService, SentenceTransformerEncoder
 from .schema import LegalCase, Person, Object, Entity, State, Event
 
 # Configuration for the Reconciler
@@ -18,9 +18,13 @@ class Reconciler:
     3. Coherence Checking (Ensuring new events fit the timeline).
     """
     
-    def __init__(self, device: str = "cuda"):
-        print(f"Loading Reconciler Model: {MODEL_NAME} on {device}...")
-        self.model = SentenceTransformer(MODEL_NAME, device=device)
+    def __init__(self, device: str = "cuda", service: Optional[EmbeddingService] = None):
+        if service is None:
+            print(f"Loading Reconciler Model: {MODEL_NAME} on {device}...")
+            service = EmbeddingService(SentenceTransformerEncoder(MODEL_NAME, device=device),
+                                       cache=EmbeddingCache())
+        # Batched + cached: global entity names are only encoded once
+        self.embeddings = service
         self.global_case = None # The 'Global Memory'
 
     def initialize_case(self, case_id: str, title: str):
@@ -29,7 +33,7 @@ class Reconciler:
 
     def _get_embedding(self, text: str) -> np.ndarray:
         """Generate embedding for a name/description."""
-        return self.model.encode(text, normalize_embeddings=True)
+        return self.embeddings.embed_one(text)
 
     def reconcile_chunk(self, local_workspace: LegalCase):
         """
@@ -64,17 +68,16 @@ class Reconciler:
             global_store.update(new_entities)
             return
 
-        # Pre-compute global embeddings
+        # Global embeddings (cached) and all new embeddings in one batch
         global_ids = list(global_store.keys())
         global_names = [e.name for e in global_store.values()]
-        global_embeddings = self.model.encode(global_names, normalize_embeddings=True)
+        global_embeddings = self.embeddings.embed(global_names)
+        new_embeddings = self.embeddings.embed([e.name for e in new_entities.values()])
 
-        for new_id, new_entity in new_entities.items():
-            # Compute new embedding
-            new_emb = self.model.encode(new_entity.name, normalize_embeddings=True)
-            
-            # Calculate similarities
-            scores = global_embeddings @ new_emb.T
+        # Similarities for the whole chunk in one matrix multiply
+        all_scores = new_embeddings @ global_embeddings.T
+
+        for (new_id, new_entity), scores in zip(new_entities.items(), all_scores):
             best_idx = np.argmax(scores)
             best_score = scores[best_idx]
 
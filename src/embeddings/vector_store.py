@@ -1,19 +1,25 @@
 import numpy as np
-import torch
 from typing import Dict, Optional, List, Tuple
-from sentence_transformers import SentenceTransformer
+
+from .embedding_service import (
+    DEFAULT_MODEL, EmbeddingCache, EmbeddingService, SentenceTransformerEncoder, VectorIndex
+)
 
 class LocalVectorStore:
     """
     Fast Retrieval Layer (GSW).
     Uses BGE-M3 for high-quality dense embeddings.
-    Currently strictly in-memory (Dict) for the Pilot Phase.
+    Vectors live in one contiguous float32 matrix (VectorIndex); encoding
+    is batched and cached on disk by the EmbeddingService.
     """
-    def __init__(self, device: str = "cuda" if torch.cuda.is_available() else "cpu"):
-        print(f"Initializing Vector Store with BAAI/bge-m3 on {device}...")
-        self.model = SentenceTransformer('BAAI/bge-m3', device=device)
-        # Maps UUID -> Embedding Vector
-        self.index: Dict[str, np.ndarray] = {}
+    def __init__(self, device: Optional[str] = None, service: Optional[EmbeddingService] = None):
+        if service is None:
+            print(f"Initializing Vector Store with {DEFAULT_MODEL}...")
+            service = EmbeddingService(SentenceTransformerEncoder(DEFAULT_MODEL, device=device),
+                                       cache=EmbeddingCache())
+        self.service = service
+        # UUID -> row of the embedding matrix
+        self.index = VectorIndex(service.dim)
         self.names: Dict[str, str] = {} # UUID -> Name (for debugging/verification)
 
     def add_entity(self, entity_id: str, text_representation: str):
@@ -21,33 +27,35 @@ class LocalVectorStore:
         Adds or updates an entity in the vector index.
         text_representation: Usually the entity name + description.
         """
-        embedding = self.model.encode(text_representation, normalize_embeddings=True)
-        self.index[entity_id] = embedding
-        self.names[entity_id] = text_representation
+        self.add_entities([(entity_id, text_representation)])
+
+    def add_entities(self, entities: List[Tuple[str, str]]):
+        """Adds or updates several (entity_id, text_representation) pairs in one batch."""
+        if not entities:
+            return
+        ids = [entity_id for entity_id, _ in entities]
+        texts = [text for _, text in entities]
+        self.index.add(ids, self.service.embed(texts))
+        self.names.update(entities)
 
     def find_similar_entity(self, query_text: str, threshold: float = 0.92) -> Optional[str]:
         """
         Finds the best matching entity ID for the given query text.
         Returns None if no match exceeds the threshold.
         """
-        if not self.index:
-            return None
-
-        query_emb = self.model.encode(query_text, normalize_embeddings=True)
-        
-        best_score = -1.0
-        best_id = None
-
-        # Linear scan (Acceptable for <10k entities in Pilot)
-        # For production, upgrade to FAISS or Qdrant
-        for eid, vector in self.index.items():
-            # Cosine similarity
-            score = np.dot(query_emb, vector)
-            if score > best_score:
-                best_score = score
-                best_id = eid
-        
-        if best_score > threshold:
-            return best_id
-        
-        return None
+        return self.find_similar_entities([query_text], threshold)[0]
+
+    def find_similar_entities(self, query_texts: List[str], threshold: float = 0.92) -> List[Optional[str]]:
+        """Best matching entity ID per query (one matrix multiply for the batch)."""
+        if not query_texts or not len(self.index):
+            return [None] * len(query_texts)
+
+        queries = self.service.embed(query_texts)
+        return [
+            best_id if best_score > threshold else None
+            for best_id, best_score in self.index.best_match(queries)
+        ]
+
+    def embedding(self, entity_id: str) -> Optional[np.ndarray]:
+        """Stored embedding of an entity."""
+        return self.index.vector(entity_id)
@@ -0,0 +1,343 @@
+"""
+SPCNet Graph Analytics
+======================
+
+Analytics over the citation graph in its compact CSR form (see
+src/graph/csr_graph.py; an edge points from the citing to the cited case):
+
+- PageRank and HITS authority as sparse power iterations (np.bincount
+  over the edge arrays, no dense matrices)
+- k-hop neighbourhoods, expanded one whole frontier at a time
+- Precedent chains: shortest paths from one case to another along
+  edges of chosen treatments (e.g. followed / overruled)
+
+Authority scores are precomputed when the graph is built and persisted
+as spcnet_authority.npz next to the TOON files. AuthorityIndex loads
+them into a citation -> row dict, so retrieval can blend authority into
+ranking with one dict lookup per result.
+
+Usage:
+    analytics = GraphAnalytics.load(Path("data/processed/graph"))
+    ranks = analytics.pagerank()
+    nearby = analytics.k_hop("Smith v Jones [2010] HCA 4", k=2)
+    chains = analytics.precedent_chains(citing, cited, actions=("FOLLOW", "OVERRULE"))
+
+    authority = load_authority(Path("data/processed/graph"))
+    authority.score("Smith v Jones [2010] HCA 4")   # 0-1 PageRank percentile
+"""
+
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from src.tem.action_space import ACTION_TO_ID, ID_TO_ACTION, LegalAction
+from src.graph.csr_graph import CSRGraph, file_stamps
+
+AUTHORITY_NAME = "spcnet_authority.npz"
+AUTHORITY_VERSION = 1
+
+Chain = List[Tuple[str, str, str]]  # [(citing, cited, action name)]
+
+
+def _gather(indptr: np.ndarray, frontier: np.ndarray) -> np.ndarray:
+    """Edge positions of all out-edges of the frontier nodes."""
+    starts = indptr[frontier].astype(np.int64)
+    counts = indptr[frontier + 1].astype(np.int64) - starts
+    total = int(counts.sum())
+    if total == 0:
+        return np.zeros(0, dtype=np.int64)
+    # Position within the gathered block -> offset from each node's start
+    block_starts = np.repeat(np.cumsum(counts) - counts, counts)
+    return np.repeat(starts, counts) + (np.arange(total) - block_starts)
+
+
+class GraphAnalytics:
+    """Authority scores and traversals over a CSRGraph."""
+
+    def __init__(self, graph: CSRGraph):
+        self.graph = graph
+        self.index: Dict[str, int] = {node_id: i for i, node_id in enumerate(graph.node_ids)}
+        # Source node of each edge (CSR keeps edges grouped by source)
+        self.sources = np.repeat(np.arange(graph.num_nodes, dtype=np.int32), graph.degree)
+        self._reverse: Optional[Tuple[np.ndarray, np.ndarray, np.ndarray]] = None
+
+    @classmethod
+    def load(cls, graph_dir: Path) -> "GraphAnalytics":
+        return cls(CSRGraph.load(graph_dir))
+
+    @property
+    def reverse(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """(indptr, indices, edge ids) of the in-edges, built on first use."""
+        if self._reverse is None:
+            order = np.argsort(self.graph.indices, kind='stable')
+            indptr = np.zeros(self.graph.num_nodes + 1, dtype=np.int64)
+            np.cumsum(np.bincount(self.graph.indices, minlength=self.graph.num_nodes), out=indptr[1:])
+            self._reverse = (indptr, self.sources[order], order)
+        return self._reverse
+
+    # ------------------------------------------------------------------
+    # Authority
+    # ------------------------------------------------------------------
+
+    def pagerank(self, damping: float = 0.85, tol: float = 1e-10, max_iter: int = 100) -> np.ndarray:
+        """
+        PageRank over citation edges (rank flows from citing to cited).
+        Dangling cases (citing nothing) spread their rank uniformly.
+        """
+        n = self.graph.num_nodes
+        if n == 0:
+            return np.zeros(0)
+        out_degree = self.graph.degree.astype(np.float64)
+        dangling = out_degree == 0
+        inv_degree = np.divide(1.0, out_degree, out=np.zeros(n), where=~dangling)
+
+        rank = np.full(n, 1.0 / n)
+        for _ in range(max_iter):
+            flow = np.bincount(self.graph.indices, weights=(rank * inv_degree)[self.sources], minlength=n)
+            updated = damping * (flow + rank[dangling].sum() / n) + (1.0 - damping) / n
+            delta = np.abs(updated - rank).sum()
+            rank = updated
+            if delta < n * tol:
+                break
+        return rank
+
+    def hits(self, tol: float = 1e-10, max_iter: int = 100) -> Tuple[np.ndarray, np.ndarray]:
+        """(hub, authority) scores, each summing to 1."""
+        n = self.graph.num_nodes
+        if n == 0 or self.graph.num_edges == 0:
+            return np.zeros(n), np.zeros(n)
+        hub = np.full(n, 1.0 / n)
+        authority = hub
+        for _ in range(max_iter):
+            authority = np.bincount(self.graph.indices, weights=hub[self.sources], minlength=n)
+            authority /= authority.sum()
+            updated = np.bincount(self.sources, weights=authority[self.graph.indices], minlength=n)
+            updated /= updated.sum()
+            delta = np.abs(updated - hub).sum()
+            hub = updated
+            if delta < n * tol:
+                break
+        return hub, authority
+
+    def authority_index(self) -> "AuthorityIndex":
+        hub, authority = self.hits()
+        return AuthorityIndex(
+            self.graph.node_ids,
+            pagerank=self.pagerank(),
+            hits_authority=authority,
+            hits_hub=hub,
+            in_degree=np.bincount(self.graph.indices, minlength=self.graph.num_nodes),
+        )
+
+    # ------------------------------------------------------------------
+    # Traversal
+    # ------------------------------------------------------------------
+
+    def k_hop(self, node_id: str, k: int, direction: str = "out") -> Dict[str, int]:
+        """
+        Cases within k citation hops -> hop distance (the case itself is 0).
+
+        direction: "out" (cases it cites), "in" (cases citing it) or "both".
+        """
+        if direction not in ("out", "in", "both"):
+            raise ValueError(f"Unknown direction: {direction}. Use 'out', 'in' or 'both'")
+        start = self.index.get(node_id)
+        if start is None:
+            return {}
+
+        distance = np.full(self.graph.num_nodes, -1, dtype=np.int32)
+        distance[start] = 0
+        frontier = np.array([start], dtype=np.int64)
+        for hop in range(1, k + 1):
+            reached = []
+            if direction in ("out", "both"):
+                reached.append(self.graph.indices[_gather(self.graph.indptr, frontier)])
+            if direction in ("in", "both"):
+                rev_indptr, rev_indices, _ = self.reverse
+                reached.append(rev_indices[_gather(rev_indptr, frontier)])
+            candidates = np.unique(np.concatenate(reached))
+            frontier = candidates[distance[candidates] < 0].astype(np.int64)
+            if len(frontier) == 0:
+                break
+            distance[frontier] = hop
+
+        found = np.flatnonzero(distance >= 0)
+        return {self.graph.node_ids[i]: int(distance[i]) for i in found}
+
+    def precedent_chains(
+        self,
+        source: str,
+        target: str,
+        actions: Iterable[str] = ("FOLLOW", "OVERRULE"),
+        max_depth: int = 6,
+        max_paths: int = 10,
+    ) -> List[Chain]:
+        """
+        Shortest chains of treatments from source (the citing case) to
+        target, using only edges whose action is one of `actions`
+        (LegalAction names). Returns up to max_paths chains of
+        (citing, cited, action name) steps; [] if none within max_depth.
+        """
+        start, goal = self.index.get(source), self.index.get(target)
+        if start is None or goal is None or start == goal:
+            return []
+        allowed = np.zeros(len(ID_TO_ACTION), dtype=bool)
+        allowed[[ACTION_TO_ID[LegalAction[name]] for name in actions]] = True
+
+        # Layered BFS, keeping every shortest-path parent edge
+        depth = np.full(self.graph.num_nodes, -1, dtype=np.int32)
+        depth[start] = 0
+        parents: Dict[int, List[int]] = {}  # node -> edge ids reaching it on a shortest path
+        frontier = np.array([start], dtype=np.int64)
+        for level in range(1, max_depth + 1):
+            edges = _gather(self.graph.indptr, frontier)
+            edges = edges[allowed[self.graph.actions[edges]]]
+            targets = self.graph.indices[edges]
+            fresh = (depth[targets] < 0) | (depth[targets] == level)
+            edges, targets = edges[fresh], targets[fresh]
+            if len(edges) == 0:
+                break
+            depth[targets] = level
+            for edge, node in zip(edges.tolist(), targets.tolist()):
+                parents.setdefault(node, []).append(edge)
+            if depth[goal] >= 0:
+                break
+            frontier = np.unique(targets).astype(np.int64)
+
+        if depth[goal] < 0:
+            return []
+
+        # Walk parent edges back from the goal
+        chains: List[Chain] = []
+
+        def backtrack(node: int, suffix: Chain) -> None:
+            if len(chains) >= max_paths:
+                return
+            if node == start:
+                chains.append(suffix)
+                return
+            for edge in parents.get(node, []):
+                citing = int(self.sources[edge])
+                step = (self.graph.node_ids[citing], self.graph.node_ids[node],
+                        ID_TO_ACTION[int(self.graph.actions[edge])].name)
+                backtrack(citing, [step] + suffix)
+
+        backtrack(goal, [])
+        return chains
+
+
+class AuthorityIndex:
+    """
+    Precomputed authority per case with O(1) lookup by citation.
+
+    score() is the PageRank percentile in [0, 1] (ties share the lower
+    rank), which blends with other scores without rescaling.
+    """
+
+    def __init__(self, node_ids: List[str], pagerank: np.ndarray, hits_authority: np.ndarray,
+                 hits_hub: np.ndarray, in_degree: np.ndarray):
+        self.node_ids = node_ids
+        self.pagerank = pagerank
+        self.hits_authority = hits_authority
+        self.hits_hub = hits_hub
+        self.in_degree = in_degree
+        if len(pagerank) > 1:
+            self.percentile = np.searchsorted(np.sort(pagerank), pagerank, side='left') / (len(pagerank) - 1)
+        else:
+            self.percentile = np.zeros(len(pagerank))
+        self._index: Dict[str, int] = {node_id: i for i, node_id in enumerate(node_ids)}
+
+    def __contains__(self, citation: str) -> bool:
+        return citation in self._index
+
+    def __len__(self) -> int:
+        return len(self.node_ids)
+
+    def score(self, citation: str, default: float = 0.0) -> float:
+        """PageRank percentile of a case (default if it is not in the graph)."""
+        i = self._index.get(citation)
+        return float(self.percentile[i]) if i is not None else default
+
+    def get(self, citation: str) -> Optional[Dict[str, float]]:
+        """All scores of a case."""
+        i = self._index.get(citation)
+        if i is None:
+            return None
+        return {
+            'pagerank': float(self.pagerank[i]),
+            'percentile': float(self.percentile[i]),
+            'hits_authority': float(self.hits_authority[i]),
+            'hits_hub': float(self.hits_hub[i]),
+            'in_degree': int(self.in_degree[i]),
+        }
+
+    def top(self, n: int = 10) -> List[Tuple[str, float]]:
+        """Most authoritative cases by PageRank."""
+        order = np.argsort(-self.pagerank, kind='stable')[:n]
+        return [(self.node_ids[i], float(self.pagerank[i])) for i in order]
+
+    def save(self, path: Path, stamps: Optional[np.ndarray] = None) -> None:
+        tmp_path = path.with_name(path.stem + ".tmp.npz")
+        np.savez(
+            tmp_path,
+            version=np.int64(AUTHORITY_VERSION),
+            stamps=stamps if stamps is not None else np.zeros(0, dtype=np.int64),
+            node_ids=np.array(self.node_ids, dtype=str),
+            pagerank=self.pagerank,
+            hits_authority=self.hits_authority,
+            hits_hub=self.hits_hub,
+            in_degree=self.in_degree,
+        )
+        tmp_path.replace(path)
+
+    @classmethod
+    def load(cls, graph_dir: Path) -> Optional["AuthorityIndex"]:
+        """Persisted scores from graph_dir, or None if they were never computed."""
+        path = Path(graph_dir) / AUTHORITY_NAME
+        if not path.exists():
+            return None
+        with np.load(path, allow_pickle=False) as data:
+            if int(data["version"]) != AUTHORITY_VERSION:
+                return None
+            return cls(data["node_ids"].tolist(), data["pagerank"], data["hits_authority"],
+                       data["hits_hub"], data["in_degree"])
+
+    @staticmethod
+    def is_current(graph_dir: Path) -> bool:
+        """True if the persisted scores were computed from the current TOON files."""
+        graph_dir = Path(graph_dir)
+        path = graph_dir / AUTHORITY_NAME
+        if not path.exists():
+            return False
+        stamps = file_stamps(graph_dir / "spcnet_nodes.toon", graph_dir / "spcnet_edges.toon")
+        with np.load(path, allow_pickle=False) as data:
+            return np.array_equal(data["stamps"], stamps)
+
+
+def compute_authority(graph_dir: Path) -> AuthorityIndex:
+    """Compute authority from the graph in graph_dir and persist it there."""
+    graph_dir = Path(graph_dir)
+    index = GraphAnalytics.load(graph_dir).authority_index()
+    index.save(graph_dir / AUTHORITY_NAME,
+               file_stamps(graph_dir / "spcnet_nodes.toon", graph_dir / "spcnet_edges.toon"))
+    return index
+
+
+def load_authority(graph_dir: Path) -> Optional[AuthorityIndex]:
+    """
+    Authority scores for the graph currently in graph_dir.
+
+    Persisted scores are used if they were computed from the current TOON
+    files; otherwise (the files were rebuilt by other means, or scores
+    were never computed) they are recomputed. None if there is no graph.
+    """
+    graph_dir = Path(graph_dir)
+    if AuthorityIndex.is_current(graph_dir):
+        index = AuthorityIndex.load(graph_dir)
+        if index is not None:
+            return index
+    if not (graph_dir / "spcnet_edges.toon").exists():
+        return None
+    print(f"[GraphAnalytics] Authority scores in {graph_dir} are missing or stale, recomputing")
+    return compute_authority(graph_dir)
@@ -0,0 +1,241 @@
+"""
+Compact Citation Graph Store (CSR)
+==================================
+
+Holds the Hier-SPCNet citation graph as CSR arrays instead of per-node
+Python lists:
+
+- indptr (N + 1):  out-edges of node i are indptr[i]:indptr[i + 1]
+- indices (E):     target node index of each edge
+- actions (E):     ACTION_TO_ID code of each edge
+
+Edges keep their order from spcnet_edges.toon within each source node.
+The arrays (plus node IDs and the stamps of the TOON files they were
+built from) are cached as spcnet_graph.npz next to the TOON files, so
+later loads skip TOON parsing entirely.
+
+Random walks for a whole batch advance together: each step is a handful
+of NumPy operations over all walks, so batch cost barely depends on the
+number of edges.
+
+Only NumPy is needed here; the PyTorch walk loaders for TEM training are
+in src/tem/graph_store.py.
+
+Usage:
+    graph = CSRGraph.load(Path("data/processed/graph"))
+    observations, actions = graph.sample_walks(batch_size=64, walk_length=10)
+"""
+
+from array import array
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+from src.tem.action_space import ACTION_TO_ID, LegalAction
+from src.utils.toon import ToonDecoder
+
+CACHE_NAME = "spcnet_graph.npz"
+CACHE_VERSION = 1
+
+# Edge 'action' strings in spcnet_edges.toon -> LegalAction
+ACTION_NAMES: Dict[str, LegalAction] = {
+    'CITED': LegalAction.CITE,
+    'CITE': LegalAction.CITE,
+    'CITES': LegalAction.CITE,
+    'FOLLOWED': LegalAction.FOLLOW,
+    'FOLLOW': LegalAction.FOLLOW,
+    'DISTINGUISHED': LegalAction.DISTINGUISH,
+    'DISTINGUISH': LegalAction.DISTINGUISH,
+    'OVERRULED': LegalAction.OVERRULE,
+    'OVERRULE': LegalAction.OVERRULE,
+    'CONSIDERED': LegalAction.CONSIDER,
+    'CONSIDER': LegalAction.CONSIDER,
+}
+
+
+def file_stamps(*paths: Path) -> np.ndarray:
+    """(size, mtime_ns) of each file, (-1, -1) if missing."""
+    values = []
+    for path in paths:
+        if path.exists():
+            stat = path.stat()
+            values += [stat.st_size, stat.st_mtime_ns]
+        else:
+            values += [-1, -1]
+    return np.array(values, dtype=np.int64)
+
+
+class CSRGraph:
+    """Directed, action-labelled graph in CSR form."""
+
+    def __init__(self, node_ids: List[str], indptr: np.ndarray, indices: np.ndarray, actions: np.ndarray):
+        self.node_ids = node_ids
+        self.indptr = indptr
+        self.indices = indices
+        self.actions = actions
+        self.degree = np.diff(indptr).astype(np.int32)
+        # Walks start at nodes with out-edges (all nodes if there are none)
+        self.start_nodes = np.flatnonzero(self.degree).astype(np.int32)
+        if len(self.start_nodes) == 0:
+            self.start_nodes = np.arange(self.num_nodes, dtype=np.int32)
+
+    @property
+    def num_nodes(self) -> int:
+        return len(self.node_ids)
+
+    @property
+    def num_edges(self) -> int:
+        return len(self.indices)
+
+    # ------------------------------------------------------------------
+    # Loading
+    # ------------------------------------------------------------------
+
+    @classmethod
+    def load(cls, graph_dir: Path, use_cache: bool = True) -> "CSRGraph":
+        """Load from the .npz cache if it matches the TOON files, else build and cache."""
+        graph_dir = Path(graph_dir)
+        cache_path = graph_dir / CACHE_NAME
+        stamps = file_stamps(graph_dir / "spcnet_nodes.toon", graph_dir / "spcnet_edges.toon")
+
+        if use_cache and cache_path.exists():
+            with np.load(cache_path, allow_pickle=False) as data:
+                if int(data["version"]) == CACHE_VERSION and np.array_equal(data["stamps"], stamps):
+                    return cls(data["node_ids"].tolist(), data["indptr"], data["indices"], data["actions"])
+
+        graph = cls.from_toon(graph_dir)
+        if use_cache:
+            graph.save(cache_path, stamps)
+        return graph
+
+    @classmethod
+    def from_toon(cls, graph_dir: Path) -> "CSRGraph":
+        """Stream spcnet_nodes.toon and spcnet_edges.toon into CSR arrays."""
+        nodes_path = Path(graph_dir) / "spcnet_nodes.toon"
+        edges_path = Path(graph_dir) / "spcnet_edges.toon"
+
+        node_ids: List[str] = []
+        if nodes_path.exists():
+            with open(nodes_path, 'r', encoding='utf-8', newline='') as f:
+                node_ids = [row['id'] for _, row in ToonDecoder.iter_rows(f, ["Nodes"])]
+
+        def edge_rows() -> Iterator[Tuple[str, str, str]]:
+            if not edges_path.exists():
+                return
+            with open(edges_path, 'r', encoding='utf-8', newline='') as f:
+                for _, row in ToonDecoder.iter_rows(f, ["Edges"]):
+                    rel_type = row.get('action', row.get('type', 'CITE'))  # Support both 'action' and 'type' field
+                    yield row['source'], row['target'], rel_type
+
+        return cls.from_edge_list(node_ids, edge_rows())
+
+    @classmethod
+    def from_edge_list(cls, node_ids: Iterable[str], edges: Iterable[Tuple[str, str, str]]) -> "CSRGraph":
+        """
+        Build from node IDs and (source, target, action name) edges.
+        Edge endpoints missing from node_ids are appended in first-seen order.
+        """
+        ids: List[str] = []
+        index: Dict[str, int] = {}
+
+        def node_index(node_id: str) -> int:
+            idx = index.get(node_id)
+            if idx is None:
+                idx = index[node_id] = len(ids)
+                ids.append(node_id)
+            return idx
+
+        for node_id in node_ids:
+            node_index(node_id)
+
+        sources, targets, actions = array('i'), array('i'), array('i')
+        for source, target, rel_type in edges:
+            sources.append(node_index(source))
+            targets.append(node_index(target))
+            actions.append(ACTION_TO_ID[ACTION_NAMES.get(rel_type.upper(), LegalAction.CITE)])
+
+        return cls.from_edges(
+            ids,
+            np.frombuffer(sources, dtype=np.int32),
+            np.frombuffer(targets, dtype=np.int32),
+            np.frombuffer(actions, dtype=np.int32),
+        )
+
+    @classmethod
+    def from_edges(cls, node_ids: List[str], sources: np.ndarray, targets: np.ndarray,
+                   actions: np.ndarray) -> "CSRGraph":
+        """Group edges by source (stable, so per-node edge order is kept)."""
+        order = np.argsort(sources, kind='stable')
+        indptr = np.zeros(len(node_ids) + 1, dtype=np.int32)
+        np.cumsum(np.bincount(sources, minlength=len(node_ids)), out=indptr[1:])
+        return cls(
+            node_ids,
+            indptr,
+            np.ascontiguousarray(targets[order], dtype=np.int32),
+            np.ascontiguousarray(actions[order], dtype=np.int32),
+        )
+
+    def save(self, path: Path, stamps: Optional[np.ndarray] = None) -> None:
+        tmp_path = path.with_name(path.stem + ".tmp.npz")
+        np.savez(
+            tmp_path,
+            version=np.int64(CACHE_VERSION),
+            stamps=stamps if stamps is not None else np.zeros(0, dtype=np.int64),
+            node_ids=np.array(self.node_ids, dtype=str),
+            indptr=self.indptr,
+            indices=self.indices,
+            actions=self.actions,
+        )
+        tmp_path.replace(path)
+
+    # ------------------------------------------------------------------
+    # Queries and sampling
+    # ------------------------------------------------------------------
+
+    def neighbors(self, node: int) -> Tuple[np.ndarray, np.ndarray]:
+        """(targets, action codes) of one node's out-edges."""
+        start, end = self.indptr[node], self.indptr[node + 1]
+        return self.indices[start:end], self.actions[start:end]
+
+    def sample_walks(
+        self,
+        batch_size: int,
+        walk_length: int,
+        rng: Optional[np.random.Generator] = None,
+        starts: Optional[np.ndarray] = None,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Uniform random walks, advanced together for the whole batch.
+
+        Returns (observations (B, T), actions (B, T-1)) as int64 node
+        indices and action codes. A walk that reaches a node without
+        out-edges stops there; the rest of its row is padded with 0.
+        """
+        rng = rng if rng is not None else np.random.default_rng()
+        if starts is None:
+            starts = self.start_nodes[rng.integers(0, len(self.start_nodes), size=batch_size)]
+
+        observations = np.zeros((batch_size, walk_length), dtype=np.int64)
+        actions = np.zeros((batch_size, max(walk_length - 1, 0)), dtype=np.int64)
+        if batch_size == 0 or walk_length == 0:
+            return observations, actions
+
+        current = np.asarray(starts, dtype=np.int64)
+        observations[:, 0] = current
+        alive = np.ones(batch_size, dtype=bool)
+
+        for step in range(1, walk_length):
+            degree = self.degree[current]
+            alive &= degree > 0
+            if not alive.any():
+                break
+            # Uniform choice among the current node's out-edges
+            edge = self.indptr[current] + (rng.random(batch_size) * degree).astype(np.int64)
+            edge = np.where(alive, edge, 0)
+            walkers = np.flatnonzero(alive)
+            current = np.where(alive, self.indices[edge], current)
+            observations[walkers, step] = current[walkers]
+            actions[walkers, step - 1] = self.actions[edge[walkers]]
+
+        return observations, actions
@@ -11,16 +11,35 @@ This module:
 3.  Parses case text to find citations to other cases/statutes (Edges).
 4.  Builds a graph structure (Adjacency List).
 5.  Exports nodes and edges for graph database ingestion (e.g., Neo4j).
+6.  Precomputes PageRank / HITS authority per case (spcnet_authority.npz,
+    see src/graph/analytics.py) and the CSR graph cache used for TEM.
+
+Citations are extracted from each document's text while it is read, so
+full texts are never held in memory. A single regex pass over the text
+finds every citation with its offset, the positions of the action cues
+("followed", "distinguished", ...) are indexed once per text, and each
+citation is classified from the cues within 500 characters of it. Input files that need scanning can be
+processed in a process pool (--workers), each worker streaming its file
+from disk. Per input file, the nodes and each
+document's (cited short citation, action) list are persisted under
+<output_dir>/spcnet_state. An incremental build (--incremental) reuses
+the segments of files whose size and mtime are unchanged; for a changed
+file only documents with new or changed text are re-extracted. Edges
+are then resolved against the merged node index, which is cheap.
 
 Usage:
-    python -m src.graph.spcnet_builder --input_dir data/by_court --output_dir data/processed/graph
+    python -m src.graph.spcnet_builder --input_dir data/by_court --output_dir data/processed/graph [--incremental] [--workers 4]
 """
 
+import bisect
+import hashlib
 import json
+import os
 import re
 import argparse
+from multiprocessing import Pool
 from pathlib import Path
-from typing import Dict, List, Set, Tuple
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
 from collections import defaultdict
 from datetime import datetime
 import logging
@@ -45,16 +64,143 @@ ACTION_PATTERNS = {
     'considered': re.compile(r'\b(consider(?:ed|s|ing)?|discuss(?:ed|es|ing)?|analyz(?:ed|es|ing)?)\b', re.IGNORECASE),
 }
 
-from src.utils.toon import ToonDecoder, ToonEncoder
+# Characters either side of a citation searched for action cues
+CONTEXT_WINDOW = 500
+
+# All citation formats in one pattern: a single pass finds every citation
+_CITATION_SCAN = re.compile('|'.join(pattern.pattern for pattern in CITATION_PATTERNS))
+
+# Every ACTION_PATTERNS match starts with one of these (lowercase) stems
+_ACTION_STEMS = {
+    'followed': ('follow', 'appli', 'adopt'),
+    'distinguished': ('distinguish', 'differ'),
+    'overruled': ('overrul', 'overturn', 'reject'),
+    'considered': ('consider', 'discuss', 'analyz'),
+}
+
+
+def _cue_spans(text: str, lowered: str, action: str, ranges: List[Tuple[int, int]]) -> Tuple[List[int], List[int]]:
+    """
+    (starts, ends) of the action's ACTION_PATTERNS matches that start in
+    the given sorted, disjoint ranges.
+
+    Candidates are found by substring search for the stems in the
+    lowercased text (much faster than a regex scan in CPython) and
+    confirmed with the action's pattern at that offset.
+    """
+    pattern = ACTION_PATTERNS[action]
+    spans = []
+    if len(lowered) == len(text):
+        for start, end in ranges:
+            for stem in _ACTION_STEMS[action]:
+                pos = lowered.find(stem, start, end)
+                while pos != -1:
+                    match = pattern.match(text, pos)
+                    if match:
+                        spans.append(match.span())
+                    pos = lowered.find(stem, pos + len(stem), end)
+        spans.sort()
+    else:
+        # Lowercasing changed some lengths: offsets would not line up
+        spans = [match.span() for match in pattern.finditer(text)]
+    return [start for start, _ in spans], [end for _, end in spans]
+
+
+def _merge_ranges(windows: List[Tuple[int, int]]) -> List[Tuple[int, int]]:
+    ranges = []
+    for start, end in sorted(windows):
+        if ranges and start <= ranges[-1][1]:
+            ranges[-1] = (ranges[-1][0], max(ranges[-1][1], end))
+        else:
+            ranges.append((start, end))
+    return ranges
+
+
+def scan_citations(text: str, source_short: Optional[str] = None) -> List[Tuple[str, str]]:
+    """
+    (short citation, ACTION) for each distinct citation in text, sorted.
+
+    The action is that of the first ACTION_PATTERNS entry (in priority
+    order) with a cue inside CONTEXT_WINDOW characters of the citation's
+    first occurrence, or 'CITED'. Citations equal to source_short
+    (self-references) are skipped.
+
+    Cue positions are indexed one action at a time, in priority order,
+    and only inside the windows of citations not yet classified.
+    """
+    first_seen: Dict[str, int] = {}
+    for match in _CITATION_SCAN.finditer(text):
+        first_seen.setdefault(match.group(0), match.start())
+    first_seen.pop(source_short, None)
+    if not first_seen:
+        return []
+
+    actions = dict.fromkeys(first_seen, 'cited')
+    pending = [
+        (citation, max(0, start - CONTEXT_WINDOW), start + len(citation) + CONTEXT_WINDOW)
+        for citation, start in first_seen.items()
+    ]
+    lowered = text.lower()
+    for action in ACTION_PATTERNS:
+        if not pending:
+            break
+        starts, ends = _cue_spans(text, lowered, action, _merge_ranges([(s, e) for _, s, e in pending]))
+        unclassified = []
+        for citation, window_start, window_end in pending:
+            # Cue matches never overlap, so the first one starting in the
+            # window is also the first to end
+            i = bisect.bisect_left(starts, window_start)
+            if i < len(starts) and ends[i] <= window_end:
+                actions[citation] = action
+            else:
+                unclassified.append((citation, window_start, window_end))
+        pending = unclassified
+
+    return [(citation, actions[citation].upper()) for citation in sorted(actions)]
+
+
+from src.graph.analytics import AUTHORITY_NAME, GraphAnalytics
+from src.graph.csr_graph import CACHE_NAME, CSRGraph, file_stamps
+from src.utils.toon import ToonDecoder, ToonWriter
+
+STATE_DIR = "spcnet_state"
+STATE_VERSION = 3
+
+
+def _file_stamp(path: Path) -> Dict[str, int]:
+    """Size and mtime of an input file; a change triggers a rescan."""
+    stat = path.stat()
+    return {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+
+
+def _text_hash(text: str) -> str:
+    return hashlib.blake2b(text.encode('utf-8'), digest_size=16).hexdigest()
+
+
+def _scan_file_task(task: Tuple[str, str, str, str, bool]) -> Tuple[str, Dict, Dict[str, int]]:
+    """Process pool entry point: rescan one input file, return its segment and stats."""
+    input_dir, output_dir, file_path, segment_name, has_previous = task
+    builder = SPCNetBuilder(Path(input_dir), Path(output_dir))
+    segment = builder._rescan_file(Path(file_path), segment_name, has_previous)
+    return segment_name, segment, builder.build_stats
+
 
 class SPCNetBuilder:
-    def __init__(self, input_dir: Path, output_dir: Path):
+    def __init__(self, input_dir: Path, output_dir: Path, workers: int = 1):
         self.input_dir = input_dir
         self.output_dir = output_dir
+        self.workers = workers  # Processes for scanning input files
         self.nodes: Dict[str, Dict] = {}  # Full Citation -> Metadata
         self.edges: List[Tuple[str, str, str]] = []  # (Source, Target, Type)
         self.citation_index: Set[str] = set()  # Full citations
         self.short_to_full: Dict[str, str] = {}  # Short form -> Full citation mapping
+        # Full Citation -> [(short citation, action)] found in its text
+        self.doc_citations: Dict[str, List[Tuple[str, str]]] = {}
+
+        # Incremental build state (input file -> stamp + segment name)
+        self.state_dir = Path(output_dir) / STATE_DIR
+        self._manifest: Dict[str, Dict[str, Any]] = {}
+        self.build_stats = {"files_reused": 0, "files_scanned": 0, "docs_reused": 0, "docs_extracted": 0}
 
     def _extract_short_citation(self, full_citation: str) -> str:
         """
@@ -67,17 +213,23 @@ class SPCNetBuilder:
                 return match.group(0)
         return full_citation  # Return full if no pattern found
 
-    def build(self):
-        """Main build process."""
+    def build(self, incremental: bool = False):
+        """
+        Main build process.
+
+        Args:
+            incremental: Reuse persisted per-file state for unchanged files
+                and documents (a full build still writes the state)
+        """
         self.output_dir.mkdir(parents=True, exist_ok=True)
 
-        # Pass 1: Index all nodes (Cases)
+        # Pass 1: Index all nodes (Cases) and the citations in their texts
         logger.info("Pass 1: Indexing Nodes...")
-        self._index_nodes()
+        self._index_nodes(incremental=incremental)
         logger.info(f"Indexed {len(self.nodes)} nodes.")
         logger.info(f"Built short-form index with {len(self.short_to_full)} mappings.")
 
-        # Pass 2: Extract Edges (Citations)
+        # Pass 2: Resolve Edges (Citations)
         logger.info("Pass 2: Extracting Edges...")
         self._extract_edges()
         logger.info(f"Extracted {len(self.edges)} edges.")
@@ -85,147 +237,230 @@ class SPCNetBuilder:
         # Export
         self._export()
 
-    def _index_nodes(self):
-        """Scan all files to build the node index."""
-        # Support both JSONL and TOON formats
-        jsonl_files = list(self.input_dir.rglob('*.jsonl'))
-        toon_files = list(self.input_dir.rglob('*.toon'))
-
-        # Process JSONL files (current format)
-        for file_path in jsonl_files:
-            try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    for line in f:
-                        if not line.strip():
-                            continue
-                        doc = json.loads(line)
-                        citation = doc.get('citation', '').strip()
-
-                        if citation:
-                            classification = doc.get('_classification', {})
-                            self.nodes[citation] = {
-                                'id': citation,
-                                'title': doc.get('citation', ''),
-                                'date': doc.get('date', ''),
-                                'court': classification.get('court', ''),
-                                'type': doc.get('type', 'case'),
-                                'domain': classification.get('primary_domain', ''),
-                                'category': classification.get('primary_category', ''),
-                                'text': doc.get('text', '')  # Store for edge extraction
-                            }
-                            self.citation_index.add(citation)
-
-                            # Build short-form mapping for citation matching
-                            short_form = self._extract_short_citation(citation)
-                            if short_form != citation:  # Only map if we found a short form
-                                self.short_to_full[short_form] = citation
-            except Exception as e:
-                logger.error(f"Error parsing JSONL {file_path}: {e}")
-                continue
-
-        # Process TOON files (future format)
-        for file_path in toon_files:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-
-            try:
-                tables = ToonDecoder.decode(content)
-                for table_name, rows in tables.items():
-                    for row in rows:
-                        citation = row.get('citation')
-                        if citation:
-                            citation = citation.strip()
-                            self.nodes[citation] = {
-                                'id': citation,
-                                'title': row.get('category', ''),
-                                'date': '',
-                                'court': row.get('court', ''),
-                                'type': row.get('type', 'case'),
-                                'domain': row.get('domain', ''),
-                                'category': row.get('category', ''),
-                                'text': row.get('text', '')
-                            }
-                            self.citation_index.add(citation)
-
-                            # Build short-form mapping
-                            short_form = self._extract_short_citation(citation)
-                            if short_form != citation:
-                                self.short_to_full[short_form] = citation
-            except Exception as e:
-                logger.error(f"Error parsing TOON {file_path}: {e}")
-                continue
-
-    def _extract_citations_from_text(self, text: str, source_citation: str) -> List[str]:
-        """
-        Extract all unique citations from text using multiple patterns.
-        Filters out self-references by comparing short forms.
+    def _index_nodes(self, incremental: bool = False):
         """
-        citations = set()
-        source_short = self._extract_short_citation(source_citation)
+        Scan all files to build the node index and per-document citations.
 
-        for pattern in CITATION_PATTERNS:
-            matches = pattern.finditer(text)
-            for match in matches:
-                citation_short = match.group(0).strip()
-                # Exclude self-references (compare short forms)
-                if citation_short != source_short:
-                    citations.add(citation_short)
+        Files whose stamp matches the persisted manifest are loaded from
+        their segment without being read; other files are rescanned,
+        reusing the citations of documents whose text is unchanged.
+        Files that failed to parse are recorded without a stamp, so the
+        next incremental build scans them again.
+        """
+        previous = self._load_manifest() if incremental else {}
 
-        return list(citations)
+        # Support both JSONL and TOON formats
+        jsonl_files = list(self.input_dir.rglob('*.jsonl'))
+        toon_files = list(self.input_dir.rglob('*.toon'))
 
-    def _classify_citation_action(self, text: str, cited_case: str) -> str:
+        plan = []  # (key, stamp, segment name, reused segment or None)
+        rescans = []  # (file path, segment name, has a previous segment)
+        for file_path in jsonl_files + toon_files:
+            key = file_path.relative_to(self.input_dir).as_posix()
+            stamp = _file_stamp(file_path)
+            entry = previous.get(key)
+            segment_name = hashlib.sha1(key.encode('utf-8')).hexdigest()[:16] + ".json"
+
+            segment = None
+            if entry is not None and entry["stamp"] == stamp:
+                segment = self._load_segment(segment_name)
+            if segment is not None:
+                self.build_stats["files_reused"] += 1
+            else:
+                rescans.append((file_path, segment_name, entry is not None))
+            plan.append((key, stamp, segment_name, segment))
+
+        scanned = self._rescan_files(rescans)
+
+        # Merge in file order, so nodes and edges do not depend on scheduling
+        manifest = {}
+        for key, stamp, segment_name, segment in plan:
+            if segment is None:
+                segment = scanned[segment_name]
+            manifest[key] = {"stamp": stamp if segment["complete"] else None, "segment": segment_name}
+
+            for doc in segment["docs"]:
+                self._add_node(doc["node"], [tuple(c) for c in doc["citations"]])
+
+        # Segments of deleted input files
+        for key in previous.keys() - manifest.keys():
+            (self.state_dir / "segments" / previous[key]["segment"]).unlink(missing_ok=True)
+        self._manifest = manifest
+
+        logger.info(
+            f"Files: {self.build_stats['files_scanned']} scanned, {self.build_stats['files_reused']} unchanged; "
+            f"documents: {self.build_stats['docs_extracted']} extracted, {self.build_stats['docs_reused']} reused"
+        )
+
+    def _add_node(self, node: Dict, citations: List[Tuple[str, str]]) -> None:
+        citation = node['id']
+        self.nodes[citation] = node
+        self.doc_citations[citation] = citations
+        self.citation_index.add(citation)
+
+        # Build short-form mapping for citation matching
+        short_form = self._extract_short_citation(citation)
+        if short_form != citation:  # Only map if we found a short form
+            self.short_to_full[short_form] = citation
+
+    def _rescan_files(self, rescans: List[Tuple[Path, str, bool]]) -> Dict[str, Dict]:
+        """Segment name -> freshly scanned segment, in a process pool if workers > 1."""
+        if self.workers <= 1 or len(rescans) <= 1:
+            return {name: self._rescan_file(path, name, has_previous) for path, name, has_previous in rescans}
+
+        tasks = [
+            (str(self.input_dir), str(self.output_dir), str(path), name, has_previous)
+            for path, name, has_previous in rescans
+        ]
+        scanned = {}
+        with Pool(processes=min(self.workers, len(tasks))) as pool:
+            for name, segment, stats in pool.imap_unordered(_scan_file_task, tasks):
+                scanned[name] = segment
+                for stat in ("files_scanned", "docs_reused", "docs_extracted"):
+                    self.build_stats[stat] += stats[stat]
+        return scanned
+
+    def _rescan_file(self, file_path: Path, segment_name: str, has_previous: bool) -> Dict:
+        """Scan one input file and persist its segment (unless the file failed to parse)."""
+        old = self._load_segment(segment_name) if has_previous else None
+        segment = self._scan_file(file_path, old)
+        if segment["complete"]:
+            self._write_segment(segment_name, segment)
+        self.build_stats["files_scanned"] += 1
+        return segment
+
+    def _scan_file(self, file_path: Path, old_segment: Optional[Dict]) -> Dict:
         """
-        Classify the action type based on citation context.
-
-        Looks at text surrounding the citation to determine relationship:
-        - followed: Case was followed/applied
-        - distinguished: Case was distinguished
-        - overruled: Case was overruled/rejected
-        - considered: Case was merely considered/discussed
-        - cited: Default (no specific context found)
+        Read one input file into a segment: node metadata + citations per
+        document. A parse error keeps the documents read so far and marks
+        the segment incomplete.
         """
-        # Find position of citation in text
-        citation_pos = text.find(cited_case)
-        if citation_pos == -1:
-            return 'cited'
-
-        # Extract context window (500 chars before/after)
-        context_start = max(0, citation_pos - 500)
-        context_end = min(len(text), citation_pos + len(cited_case) + 500)
-        context = text[context_start:context_end]
-
-        # Check for action patterns (prioritized order)
-        for action, pattern in ACTION_PATTERNS.items():
-            if pattern.search(context):
-                return action
-
-        return 'cited'  # Default
+        known = {}
+        if old_segment is not None:
+            known = {(d["node"]["id"], d["text_hash"]): d["citations"] for d in old_segment["docs"]}
+
+        docs = []
+        complete = True
+        try:
+            for node, text in self._iter_documents(file_path):
+                text_hash = _text_hash(text)
+                citations = known.get((node['id'], text_hash))
+                if citations is None:
+                    citations = self._extract_document_citations(text, node['id'])
+                    self.build_stats["docs_extracted"] += 1
+                else:
+                    self.build_stats["docs_reused"] += 1
+                docs.append({"node": node, "text_hash": text_hash, "citations": citations})
+        except Exception as e:
+            file_type = "JSONL" if file_path.suffix == '.jsonl' else "TOON"
+            logger.error(f"Error parsing {file_type} {file_path}: {e}")
+            complete = False
+
+        return {"path": str(file_path), "docs": docs, "complete": complete}
+
+    def _iter_documents(self, file_path: Path) -> Iterator[Tuple[Dict, str]]:
+        """(node metadata, text) for each document with a citation."""
+        if file_path.suffix == '.jsonl':
+            with open(file_path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    if not line.strip():
+                        continue
+                    doc = json.loads(line)
+                    citation = doc.get('citation', '').strip()
+
+                    if citation:
+                        classification = doc.get('_classification', {})
+                        yield {
+                            'id': citation,
+                            'title': doc.get('citation', ''),
+                            'date': doc.get('date', ''),
+                            'court': classification.get('court', ''),
+                            'type': doc.get('type', 'case'),
+                            'domain': classification.get('primary_domain', ''),
+                            'category': classification.get('primary_category', ''),
+                        }, doc.get('text', '')
+        else:
+            # Streamed row by row: domain files hold full case text
+            with open(file_path, 'r', encoding='utf-8', newline='') as f:
+                for table_name, row in ToonDecoder.iter_rows(f):
+                    citation = row.get('citation')
+                    if citation:
+                        citation = citation.strip()
+                        yield {
+                            'id': citation,
+                            'title': row.get('category', ''),
+                            'date': '',
+                            'court': row.get('court', ''),
+                            'type': row.get('type', 'case'),
+                            'domain': row.get('domain', ''),
+                            'category': row.get('category', ''),
+                        }, row.get('text', '')
+
+    def _extract_document_citations(self, text: str, citation: str) -> List[Tuple[str, str]]:
+        """(short citation, action) for every citation found in one document's text."""
+        if not text:
+            return []
+        return scan_citations(text, self._extract_short_citation(citation))
+
+    # ------------------------------------------------------------------
+    # Persisted state
+    # ------------------------------------------------------------------
+
+    def _load_manifest(self) -> Dict[str, Dict[str, Any]]:
+        path = self.state_dir / "manifest.json"
+        if not path.exists():
+            return {}
+        with open(path, 'r', encoding='utf-8') as f:
+            state = json.load(f)
+        if state.get("version") != STATE_VERSION or state.get("input_dir") != str(self.input_dir):
+            return {}
+        return state["files"]
+
+    def _save_manifest(self) -> None:
+        self._write_json(self.state_dir / "manifest.json", {
+            "version": STATE_VERSION,
+            "input_dir": str(self.input_dir),
+            "files": self._manifest,
+        })
+
+    def _load_segment(self, name: str) -> Optional[Dict]:
+        path = self.state_dir / "segments" / name
+        if not path.exists():
+            return None
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    def _write_segment(self, name: str, segment: Dict) -> None:
+        self._write_json(self.state_dir / "segments" / name, segment)
+
+    @staticmethod
+    def _write_json(path: Path, data: Any) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = path.with_suffix('.tmp')
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            # dumps() uses the C encoder; dump() to a file does not
+            f.write(json.dumps(data, ensure_ascii=False))
+        os.replace(temp_path, path)
 
     def _extract_edges(self):
-        """Extract citation edges from indexed nodes."""
+        """Resolve each document's extracted citations against the node index."""
         logger.info("Extracting edges from node texts...")
 
+        self.edges = []
         edges_found = 0
         edges_matched = 0
 
-        for citation, node in self.nodes.items():
-            text = node.get('text', '')
-            if not text:
-                continue
-
-            # Extract short-form citations from text
-            found_citations = self._extract_citations_from_text(text, citation)
+        for citation in self.nodes:
+            found_citations = self.doc_citations.get(citation, [])
             edges_found += len(found_citations)
 
-            for short_citation in found_citations:
+            for short_citation, action in found_citations:
                 # Map short form to full citation
                 full_target = self.short_to_full.get(short_citation, short_citation)
 
                 # Only create edge if target exists in our index
                 if full_target in self.citation_index:
-                    # Classify the action type
-                    action = self._classify_citation_action(text, short_citation)
-                    self.edges.append((citation, full_target, action.upper()))
+                    self.edges.append((citation, full_target, action))
                     edges_matched += 1
 
         logger.info(f"Found {edges_found} citation patterns, matched {edges_matched} to indexed nodes")
@@ -239,11 +474,10 @@ class SPCNetBuilder:
 
         logger.info(f"Exporting nodes to {nodes_path}")
 
-        # Convert nodes to list format for ToonEncoder (without text)
+        # Stream nodes as TOON rows (without text)
         node_headers = ["id", "title", "court", "type", "domain", "category", "date"]
-        node_rows = []
-        for n in self.nodes.values():
-            node_rows.append([
+        node_rows = (
+            [
                 n['id'],
                 n['title'],
                 n['court'],
@@ -251,22 +485,38 @@ class SPCNetBuilder:
                 n['domain'],
                 n.get('category', ''),
                 n.get('date', '')
-            ])
+            ]
+            for n in self.nodes.values()
+        )
 
-        with open(nodes_path, 'w', encoding='utf-8') as f:
-            f.write(ToonEncoder.encode("Nodes", node_headers, node_rows))
+        with open(nodes_path, 'w', encoding='utf-8', newline='') as f:
+            ToonWriter(f).write_table("Nodes", node_headers, node_rows)
 
         logger.info(f"Exporting edges to {edges_path}")
 
         edge_headers = ["source", "target", "action"]
-        edge_rows = [[s, t, r] for s, t, r in self.edges]
+        edge_rows = ([s, t, r] for s, t, r in self.edges)
+
+        with open(edges_path, 'w', encoding='utf-8', newline='') as f:
+            ToonWriter(f).write_table("Edges", edge_headers, edge_rows)
+
+        # Record the inputs this graph was built from (after the graph files)
+        self._save_manifest()
 
-        with open(edges_path, 'w', encoding='utf-8') as f:
-            f.write(ToonEncoder.encode("Edges", edge_headers, edge_rows))
+        # Authority scores for retrieval ranking (+ CSR cache for TEM training)
+        logger.info("Computing graph authority (PageRank / HITS)...")
+        stamps = file_stamps(nodes_path, edges_path)
+        graph = CSRGraph.from_edge_list(self.nodes, self.edges)
+        graph.save(self.output_dir / CACHE_NAME, stamps)
+        authority = GraphAnalytics(graph).authority_index()
+        authority.save(self.output_dir / AUTHORITY_NAME, stamps)
 
         # Generate and export statistics
         logger.info(f"Generating statistics...")
         stats = self._generate_statistics()
+        stats['top_authorities'] = [
+            {'citation': citation, 'pagerank': score} for citation, score in authority.top(10)
+        ]
 
         with open(stats_path, 'w', encoding='utf-8') as f:
             json.dump(stats, f, indent=2)
@@ -327,11 +577,13 @@ def main():
     parser = argparse.ArgumentParser(description="Build Hier-SPCNet from OALC data.")
     parser.add_argument('--input_dir', type=Path, default=Path('data/by_court'), help="Directory containing JSONL files.")
     parser.add_argument('--output_dir', type=Path, default=Path('data/processed/graph'), help="Output directory for graph data.")
+    parser.add_argument('--incremental', action='store_true', help="Only re-extract new or changed documents.")
+    parser.add_argument('--workers', type=int, default=1, help="Processes for scanning input files.")
     
     args = parser.parse_args()
     
-    builder = SPCNetBuilder(args.input_dir, args.output_dir)
-    builder.build()
+    builder = SPCNetBuilder(args.input_dir, args.output_dir, workers=args.workers)
+    builder.build(incremental=args.incremental)
 
 if __name__ == '__main__':
     main()
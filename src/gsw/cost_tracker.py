@@ -2,7 +2,8 @@
 Cost Tracker for GSW Pipeline
 ==============================
 
-Tracks token usage and costs for OpenRouter API calls.
+Tracks token usage and costs for OpenRouter API calls, and the hit rate
+of the LLM response cache (cached responses cost nothing).
 
 Pricing (Gemini 2.5 Flash):
 - Input: $0.30 per 1M tokens
@@ -13,6 +14,7 @@ from dataclasses import dataclass, field
 from typing import Dict, Optional
 from datetime import datetime
 import json
+import threading
 
 
 # Model pricing per 1M tokens
@@ -50,29 +52,65 @@ class CostTracker:
     summary_input: int = 0
     summary_output: int = 0
 
+    # Response cache (tokens a hit would otherwise have cost)
+    cache_hits: int = 0
+    cache_misses: int = 0
+    cached_input_tokens: int = 0
+    cached_output_tokens: int = 0
+    cache_by_component: Dict[str, Dict[str, int]] = field(default_factory=dict)
+
     start_time: Optional[datetime] = None
 
     def __post_init__(self):
         self.start_time = datetime.now()
+        self._lock = threading.Lock()
 
     def add_usage(self, component: str, input_tokens: int, output_tokens: int):
-        """Add token usage from an API call."""
-        self.total_input_tokens += input_tokens
-        self.total_output_tokens += output_tokens
-        self.total_requests += 1
-
-        if component == "operator":
-            self.operator_input += input_tokens
-            self.operator_output += output_tokens
-        elif component == "reconciler":
-            self.reconciler_input += input_tokens
-            self.reconciler_output += output_tokens
-        elif component == "spacetime":
-            self.spacetime_input += input_tokens
-            self.spacetime_output += output_tokens
-        elif component == "summary":
-            self.summary_input += input_tokens
-            self.summary_output += output_tokens
+        """Add token usage from an API call (thread-safe)."""
+        with self._lock:
+            self.total_input_tokens += input_tokens
+            self.total_output_tokens += output_tokens
+            self.total_requests += 1
+
+            if component == "operator":
+                self.operator_input += input_tokens
+                self.operator_output += output_tokens
+            elif component == "reconciler":
+                self.reconciler_input += input_tokens
+                self.reconciler_output += output_tokens
+            elif component == "spacetime":
+                self.spacetime_input += input_tokens
+                self.spacetime_output += output_tokens
+            elif component == "summary":
+                self.summary_input += input_tokens
+                self.summary_output += output_tokens
+
+    def add_cache_lookup(self, component: str, hit: bool, usage: Optional[Dict[str, int]] = None):
+        """Record a response cache lookup (thread-safe)."""
+        with self._lock:
+            counts = self.cache_by_component.setdefault(component, {"hits": 0, "misses": 0})
+            if hit:
+                self.cache_hits += 1
+                counts["hits"] += 1
+                usage = usage or {}
+                self.cached_input_tokens += usage.get("prompt_tokens", 0)
+                self.cached_output_tokens += usage.get("completion_tokens", 0)
+            else:
+                self.cache_misses += 1
+                counts["misses"] += 1
+
+    @property
+    def cache_hit_rate(self) -> float:
+        """Fraction of cache lookups answered from the cache."""
+        lookups = self.cache_hits + self.cache_misses
+        return self.cache_hits / lookups if lookups else 0.0
+
+    @property
+    def cache_savings(self) -> float:
+        """Dollars saved by cache hits."""
+        pricing = self.get_pricing()
+        return (self.cached_input_tokens / 1_000_000 * pricing["input"] +
+                self.cached_output_tokens / 1_000_000 * pricing["output"])
 
     def get_pricing(self) -> Dict[str, float]:
         """Get pricing for current model."""
@@ -125,6 +163,10 @@ PER-COMPONENT USAGE:
   Spacetime:         {self.spacetime_input:,} in / {self.spacetime_output:,} out
   Summary:           {self.summary_input:,} in / {self.summary_output:,} out
 
+RESPONSE CACHE:
+  Hits / Lookups:    {self.cache_hits:,} / {self.cache_hits + self.cache_misses:,} ({self.cache_hit_rate:.1%})
+  Tokens Saved:      {self.cached_input_tokens + self.cached_output_tokens:,} (${self.cache_savings:.4f})
+
 PERFORMANCE:
   Elapsed Time:      {elapsed:.1f}s
   Tokens/Second:     {(self.total_input_tokens + self.total_output_tokens) / max(elapsed, 1):.1f}
@@ -153,6 +195,15 @@ PERFORMANCE:
                 "reconciler": {"input": self.reconciler_input, "output": self.reconciler_output},
                 "spacetime": {"input": self.spacetime_input, "output": self.spacetime_output},
                 "summary": {"input": self.summary_input, "output": self.summary_output},
+            },
+            "cache": {
+                "hits": self.cache_hits,
+                "misses": self.cache_misses,
+                "hit_rate": self.cache_hit_rate,
+                "cached_input_tokens": self.cached_input_tokens,
+                "cached_output_tokens": self.cached_output_tokens,
+                "savings": self.cache_savings,
+                "components": self.cache_by_component,
             }
         }
 
@@ -13,8 +13,19 @@ if TYPE_CHECKING:
     from src.logic.gsw_schema import Actor, GlobalWorkspace
 
 from .reconciler_prompts import RECONCILE_SYSTEM_PROMPT, RECONCILE_USER_PROMPT
+from src.logic.gsw_index import ACTOR, normalize_name
 from src.utils.toon import ToonEncoder
 from .cost_tracker import get_cost_tracker
+from .llm_cache import LLMResponseCache, get_llm_cache, response_content
+
+# Match "the husband"/"the wife" patterns
+ROLE_MAPPINGS = {
+    "the husband": ["husband", "applicant husband", "respondent husband"],
+    "the wife": ["wife", "applicant wife", "respondent wife"],
+    "the applicant": ["applicant"],
+    "the respondent": ["respondent"],
+    "the child": ["child", "subject child"],
+}
 
 
 class EntityMatcher:
@@ -28,11 +39,13 @@ class EntityMatcher:
         self,
         client: Optional[Any] = None,
         model: str = "google/gemini-2.5-flash",
-        use_toon: bool = True
+        use_toon: bool = True,
+        cache: Optional[LLMResponseCache] = None
     ):
         self.client = client
         self.model = model
         self.use_toon = use_toon
+        self.cache = cache if cache is not None else get_llm_cache()
 
     def reconcile_entities(
         self,
@@ -109,23 +122,28 @@ class EntityMatcher:
             chunk_text=chunk_text[:5000]
         )
 
-        response = self.client.post(
-            "/chat/completions",
-            json={
-                "model": self.model,
-                "messages": [
-                    {"role": "system", "content": RECONCILE_SYSTEM_PROMPT},
-                    {"role": "user", "content": prompt}
-                ],
-                "temperature": 0.1,
-                "max_tokens": 4000
-            }
-        )
-        response.raise_for_status()
-        result = response.json()
+        payload = {
+            "model": self.model,
+            "messages": [
+                {"role": "system", "content": RECONCILE_SYSTEM_PROMPT},
+                {"role": "user", "content": prompt}
+            ],
+            "temperature": 0.1,
+            "max_tokens": 4000
+        }
+        result = self.cache.lookup(payload, "reconciler") if self.cache is not None else None
+        if result is None:
+            response = self.client.post("/chat/completions", json=payload)
+            response.raise_for_status()
+            result = response.json()
+            response_content(result)  # Error bodies are not cached
+            if self.cache is not None:
+                self.cache.store(payload, result)
+            usage = result.get("usage", {})
+        else:
+            usage = {}  # Served from cache: no tokens spent
 
         # Track token usage
-        usage = result.get("usage", {})
         if usage:
             tracker = get_cost_tracker(self.model)
             tracker.add_usage(
@@ -134,7 +152,7 @@ class EntityMatcher:
                 usage.get("completion_tokens", 0)
             )
 
-        content = result["choices"][0]["message"]["content"]
+        content = response_content(result)
 
         # Parse response
         cleaned = content.strip()
@@ -172,48 +190,29 @@ class EntityMatcher:
         - Exact name match
         - Alias match
         - Role alignment
+
+        Candidates come from the workspace search index (normalised
+        name/alias and role keys), so the cost per new actor does not
+        grow with the workspace. Of the candidates, the earliest added
+        actor is matched, as a scan over workspace.actors would.
         """
         matches = []
+        index = workspace.get_search_index()
 
         for new_actor in new_actors:
-            new_name = new_actor.name.lower().strip()
-            new_aliases = [a.lower().strip() for a in new_actor.aliases]
-
-            for existing_id, existing_actor in workspace.actors.items():
-                existing_name = existing_actor.name.lower().strip()
-                existing_aliases = [a.lower().strip() for a in existing_actor.aliases]
-
-                # Check for name/alias matches
-                match_found = False
-                reason = ""
-
-                # Exact name match
-                if new_name == existing_name:
-                    match_found = True
-                    reason = f"Exact name match: {new_actor.name}"
-
-                # New name in existing aliases
-                elif new_name in existing_aliases:
-                    match_found = True
-                    reason = f"Name matches alias: {new_actor.name}"
-
-                # Existing name in new aliases
-                elif existing_name in new_aliases:
-                    match_found = True
-                    reason = f"Alias matches name: {existing_actor.name}"
-
-                # Cross-alias match
-                elif set(new_aliases) & set(existing_aliases):
-                    match_found = True
-                    common = list(set(new_aliases) & set(existing_aliases))[0]
-                    reason = f"Common alias: {common}"
-
-                # Role-based matching for common legal terms
-                if not match_found:
-                    match_found, reason = self._check_role_match(
-                        new_name, new_aliases, existing_actor
-                    )
-
+            new_name = normalize_name(new_actor.name)
+            new_aliases = [normalize_name(a) for a in new_actor.aliases]
+
+            candidates = index.actors_by_name([new_name, *new_aliases])
+            candidates |= index.actors_by_role(self._blocking_roles(new_name, new_aliases))
+
+            for existing_id in index.in_order(ACTOR, candidates):
+                existing_actor = workspace.actors.get(existing_id)
+                if existing_actor is None:
+                    continue
+                match_found, reason = self._check_match(
+                    new_actor, new_name, new_aliases, existing_actor
+                )
                 if match_found:
                     matches.append({
                         "new_entity_id": new_actor.id,
@@ -225,6 +224,46 @@ class EntityMatcher:
 
         return matches
 
+    def _check_match(
+        self,
+        new_actor: "Actor",
+        new_name: str,
+        new_aliases: List[str],
+        existing_actor: "Actor"
+    ) -> tuple:
+        """Check a new actor against one existing actor."""
+        existing_name = normalize_name(existing_actor.name)
+        existing_aliases = [normalize_name(a) for a in existing_actor.aliases]
+
+        # Exact name match
+        if new_name == existing_name:
+            return True, f"Exact name match: {new_actor.name}"
+
+        # New name in existing aliases
+        if new_name in existing_aliases:
+            return True, f"Name matches alias: {new_actor.name}"
+
+        # Existing name in new aliases
+        if existing_name in new_aliases:
+            return True, f"Alias matches name: {existing_actor.name}"
+
+        # Cross-alias match
+        common = set(new_aliases) & set(existing_aliases)
+        if common:
+            return True, f"Common alias: {list(common)[0]}"
+
+        # Role-based matching for common legal terms
+        return self._check_role_match(new_name, new_aliases, existing_actor)
+
+    @staticmethod
+    def _blocking_roles(new_name: str, new_aliases: List[str]) -> List[str]:
+        """Roles an existing actor needs for a role-based match."""
+        roles = []
+        for term, related_roles in ROLE_MAPPINGS.items():
+            if new_name == term or term in new_aliases:
+                roles.extend(related_roles)
+        return roles
+
     def _check_role_match(
         self,
         new_name: str,
@@ -232,16 +271,7 @@ class EntityMatcher:
         existing_actor: "Actor"
     ) -> tuple:
         """Check for role-based entity matches."""
-        # Match "the husband"/"the wife" patterns
-        role_mappings = {
-            "the husband": ["husband", "applicant husband", "respondent husband"],
-            "the wife": ["wife", "applicant wife", "respondent wife"],
-            "the applicant": ["applicant"],
-            "the respondent": ["respondent"],
-            "the child": ["child", "subject child"],
-        }
-
-        for term, related_roles in role_mappings.items():
+        for term, related_roles in ROLE_MAPPINGS.items():
             if new_name == term or term in new_aliases:
                 # Check if existing actor has matching role
                 existing_roles_lower = [r.lower() for r in existing_actor.roles]
@@ -0,0 +1,155 @@
+"""
+Extraction Scheduler - Concurrent LLM Extraction, Single-Writer Reconcile
+
+Operator/spacetime calls are network-bound, so running them one document
+at a time leaves throughput bounded by a single round-trip. The scheduler
+keeps up to `max_in_flight` extractions running in a thread pool, while
+results are handed back strictly in submission order. The caller's loop
+(the only code that touches the workspace) reconciles them one by one, so
+workspace mutation is identical to a sequential run.
+
+Per-model request rates are enforced by a shared RateLimiter that the
+LegalOperator / LegalSpacetime call before every request.
+
+Usage:
+    limiter = RateLimiter(default_rpm=120)
+    operator = LegalOperator(model=models, rate_limiter=limiter)
+
+    scheduler = ExtractionScheduler(extract_fn, max_in_flight=4)
+    for result in scheduler.run(documents):
+        if result.error is None:
+            reconciler.reconcile(result.extraction, workspace, text, journal=journal)
+"""
+
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Callable, Deque, Dict, Generic, Iterable, Iterator, Optional, Tuple, TypeVar
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+class RateLimiter:
+    """
+    Per-model request rate limits (requests per minute), thread-safe.
+
+    Requests for one model are spaced at least 60/rpm seconds apart;
+    callers block in acquire() until their slot comes up. Models without
+    a limit (and no default) are not throttled.
+    """
+
+    def __init__(
+        self,
+        requests_per_minute: Optional[Dict[str, float]] = None,
+        default_rpm: Optional[float] = None
+    ):
+        """
+        Args:
+            requests_per_minute: Model name -> maximum requests per minute
+            default_rpm: Limit for models not listed (None = unlimited)
+        """
+        self.requests_per_minute = dict(requests_per_minute or {})
+        self.default_rpm = default_rpm
+        self._next_slot: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def interval(self, model: str) -> float:
+        """Minimum seconds between two requests to a model."""
+        rpm = self.requests_per_minute.get(model, self.default_rpm)
+        return 60.0 / rpm if rpm else 0.0
+
+    def acquire(self, model: str) -> float:
+        """
+        Block until a request to `model` may be sent.
+
+        Returns:
+            Seconds spent waiting
+        """
+        interval = self.interval(model)
+        if not interval:
+            return 0.0
+
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot.get(model, now))
+            self._next_slot[model] = slot + interval
+
+        wait = slot - now
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+
+@dataclass
+class ExtractionResult(Generic[T, R]):
+    """Outcome of one scheduled extraction."""
+    item: T
+    extraction: Optional[R] = None
+    error: Optional[BaseException] = None
+    seconds: float = 0.0
+
+
+class ExtractionScheduler(Generic[T, R]):
+    """
+    Bounded concurrent extraction with in-order delivery.
+
+    extract_fn runs in worker threads and must not touch the workspace;
+    results are yielded in the order items were submitted, each only
+    after the consumer has finished with the previous one.
+    """
+
+    def __init__(self, extract_fn: Callable[[T], R], max_in_flight: int = 4):
+        """
+        Args:
+            extract_fn: Called with each item in a worker thread
+            max_in_flight: Maximum concurrent extract_fn calls
+        """
+        if max_in_flight < 1:
+            raise ValueError("max_in_flight must be >= 1")
+        self.extract_fn = extract_fn
+        self.max_in_flight = max_in_flight
+
+    def _timed(self, item: T) -> Tuple[R, float]:
+        start = time.perf_counter()
+        return self.extract_fn(item), time.perf_counter() - start
+
+    def run(self, items: Iterable[T]) -> Iterator[ExtractionResult[T, R]]:
+        """
+        Extract items concurrently, yielding results in submission order.
+
+        Items are pulled lazily from the iterable (in the caller's thread),
+        so at most max_in_flight documents are held in memory. Closing the
+        iterator early cancels extractions that have not started.
+        """
+        pending: Deque[Tuple[T, Future]] = deque()
+        iterator = iter(items)
+        exhausted = False
+
+        with ThreadPoolExecutor(max_workers=self.max_in_flight,
+                                thread_name_prefix="gsw-extract") as pool:
+            try:
+                while True:
+                    while not exhausted and len(pending) < self.max_in_flight:
+                        try:
+                            item = next(iterator)
+                        except StopIteration:
+                            exhausted = True
+                            break
+                        pending.append((item, pool.submit(self._timed, item)))
+
+                    if not pending:
+                        break
+
+                    item, future = pending.popleft()
+                    try:
+                        extraction, seconds = future.result()
+                        result = ExtractionResult(item, extraction, seconds=seconds)
+                    except Exception as e:
+                        result = ExtractionResult(item, error=e)
+                    yield result
+            finally:
+                for _, future in pending:
+                    future.cancel()
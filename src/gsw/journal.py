@@ -0,0 +1,276 @@
+"""
+Workspace Journal - Append-Only Log of Reconciliation Deltas
+
+Rewriting the whole workspace on every checkpoint makes checkpoint cost
+grow with workspace size (quadratic over a long run). The journal records
+only what each reconciled chunk changed:
+
+- actor_added / actor_merged    (full actor state after the change)
+- question_added / question_answered
+- verb_added / link_added
+- commit                        (end of one chunk, with chunk metadata)
+
+Records are JSON lines. Every record carries the full post-change state
+of one entity, so replaying a record twice is harmless. A chunk's records
+only take effect once its commit marker is on disk: replay drops an
+uncommitted or torn tail, which makes each chunk atomic. A chunk whose
+reconciliation failed midway is committed with partial=True (its changes
+are already in the in-memory workspace).
+
+The journal is periodically compacted: the workspace is saved as a full
+snapshot (WorkspaceManager.save) and the journal is truncated.
+
+Usage:
+    manager = WorkspaceManager.load(workspace_path)
+    journal = WorkspaceJournal.for_workspace(workspace_path)
+    journal.replay(manager.workspace)          # recover the tail
+
+    reconciler.reconcile(extraction, manager.workspace, text, journal=journal)
+
+    if journal.should_compact():
+        journal.compact(manager)
+"""
+
+import json
+import os
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List, TYPE_CHECKING
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from src.logic.gsw_schema import (
+    GlobalWorkspace, Actor, VerbPhrase, PredictiveQuestion, SpatioTemporalLink
+)
+
+if TYPE_CHECKING:
+    from src.gsw.workspace import WorkspaceManager
+
+
+JOURNAL_SUFFIX = ".journal"
+
+# Record types
+ACTOR_ADDED = "actor_added"
+ACTOR_MERGED = "actor_merged"
+QUESTION_ADDED = "question_added"
+QUESTION_ANSWERED = "question_answered"
+VERB_ADDED = "verb_added"
+LINK_ADDED = "link_added"
+COMMIT = "commit"
+
+
+class WorkspaceJournal:
+    """
+    Write-ahead journal for one workspace file.
+
+    Records are buffered in memory and written, flushed and fsync'd once
+    per commit() - one fsync per reconciled chunk rather than one full
+    workspace rewrite per batch.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        compact_bytes: int = 64 * 1024 * 1024,
+        fsync: bool = True
+    ):
+        """
+        Args:
+            path: Journal file path
+            compact_bytes: Journal size at which should_compact() is True
+            fsync: fsync on every commit (disable for tests/calibration)
+        """
+        self.path = path
+        self.compact_bytes = compact_bytes
+        self.fsync = fsync
+        self._pending: List[Dict[str, Any]] = []
+        self._file = None
+
+    @classmethod
+    def for_workspace(cls, workspace_path: Path, **kwargs) -> "WorkspaceJournal":
+        """Journal stored next to a workspace file (family_workspace.journal)."""
+        return cls(workspace_path.with_suffix(JOURNAL_SUFFIX), **kwargs)
+
+    # =========================================================================
+    # WRITING
+    # =========================================================================
+
+    def actor_added(self, actor: Actor) -> None:
+        self._append(ACTOR_ADDED, actor=actor.model_dump(mode="json"))
+
+    def actor_merged(self, actor: Actor, merged_id: str) -> None:
+        self._append(ACTOR_MERGED, actor=actor.model_dump(mode="json"), merged_id=merged_id)
+
+    def question_added(self, question: PredictiveQuestion) -> None:
+        self._append(QUESTION_ADDED, question=question.model_dump(mode="json"))
+
+    def question_answered(self, question: PredictiveQuestion) -> None:
+        self._append(
+            QUESTION_ANSWERED,
+            question_id=question.id,
+            answer_text=question.answer_text,
+            answer_entity_id=question.answer_entity_id,
+            answered_in_chunk_id=question.answered_in_chunk_id
+        )
+
+    def verb_added(self, verb: VerbPhrase) -> None:
+        self._append(VERB_ADDED, verb=verb.model_dump(mode="json"))
+
+    def link_added(self, link: SpatioTemporalLink) -> None:
+        self._append(LINK_ADDED, link=link.model_dump(mode="json"))
+
+    def _append(self, op: str, **data: Any) -> None:
+        data["op"] = op
+        self._pending.append(data)
+
+    def commit(self, workspace: GlobalWorkspace, **meta: Any) -> None:
+        """
+        Durably write all pending records followed by a commit marker.
+
+        The marker records the workspace counters (so replay restores them)
+        plus any caller metadata, e.g. chunk_id or document_id.
+        """
+        marker = {
+            "op": COMMIT,
+            "chunk_count": workspace.chunk_count,
+            "document_count": workspace.document_count,
+            "last_updated": workspace.last_updated,
+            "committed_at": time.time(),
+        }
+        marker.update(meta)
+
+        lines = [json.dumps(r, ensure_ascii=False) for r in self._pending]
+        lines.append(json.dumps(marker, ensure_ascii=False))
+        self._pending = []
+
+        f = self._open()
+        f.write("\n".join(lines) + "\n")
+        f.flush()
+        if self.fsync:
+            os.fsync(f.fileno())
+
+    def _open(self):
+        if self._file is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._file = open(self.path, "a", encoding="utf-8", newline="\n")
+        return self._file
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    # =========================================================================
+    # RECOVERY
+    # =========================================================================
+
+    def replay(self, workspace: GlobalWorkspace) -> List[Dict[str, Any]]:
+        """
+        Apply all committed records to a workspace (loaded from the last
+        compacted snapshot).
+
+        An uncommitted or torn tail is discarded and truncated from the
+        file so that new commits start from a clean boundary.
+
+        Returns:
+            Commit markers of the replayed chunks, in order
+        """
+        if not self.path.exists():
+            return []
+
+        commits: List[Dict[str, Any]] = []
+        batch: List[Dict[str, Any]] = []
+        committed_bytes = 0
+        offset = 0
+
+        with open(self.path, "rb") as f:
+            for raw in f:
+                offset += len(raw)
+                if not raw.endswith(b"\n"):
+                    break  # Torn final write
+                try:
+                    record = json.loads(raw)
+                except json.JSONDecodeError:
+                    break
+
+                if record.get("op") == COMMIT:
+                    for r in batch:
+                        self._apply(workspace, r)
+                    workspace.chunk_count = record["chunk_count"]
+                    workspace.document_count = record["document_count"]
+                    workspace.last_updated = record["last_updated"]
+                    commits.append(record)
+                    batch = []
+                    committed_bytes = offset
+                else:
+                    batch.append(record)
+
+        if committed_bytes < self.path.stat().st_size:
+            self.close()
+            with open(self.path, "r+b") as f:
+                f.truncate(committed_bytes)
+
+        if commits:
+            print(f"[Journal] Replayed {len(commits)} committed chunk(s) from {self.path}")
+
+        return commits
+
+    @staticmethod
+    def _apply(workspace: GlobalWorkspace, record: Dict[str, Any]) -> None:
+        op = record["op"]
+        if op in (ACTOR_ADDED, ACTOR_MERGED):
+            workspace.add_actor(Actor.model_validate(record["actor"]))
+        elif op == QUESTION_ADDED:
+            workspace.add_question(PredictiveQuestion.model_validate(record["question"]))
+        elif op == QUESTION_ANSWERED:
+            workspace.answer_question(
+                record["question_id"],
+                record["answer_text"],
+                answer_entity_id=record.get("answer_entity_id"),
+                answered_in_chunk_id=record.get("answered_in_chunk_id")
+            )
+        elif op == VERB_ADDED:
+            workspace.add_verb_phrase(VerbPhrase.model_validate(record["verb"]))
+        elif op == LINK_ADDED:
+            workspace.add_spatio_temporal_link(SpatioTemporalLink.model_validate(record["link"]))
+        else:
+            raise ValueError(f"Unknown journal record: {op}")
+
+    def discard(self) -> None:
+        """Drop all journal records (e.g. when starting a fresh workspace)."""
+        self._pending = []
+        self.close()
+        if self.path.exists():
+            self.path.unlink()
+
+    # =========================================================================
+    # COMPACTION
+    # =========================================================================
+
+    def size_bytes(self) -> int:
+        """Current on-disk size of the journal."""
+        return self.path.stat().st_size if self.path.exists() else 0
+
+    def should_compact(self) -> bool:
+        """Whether the journal has grown past compact_bytes."""
+        return self.size_bytes() >= self.compact_bytes
+
+    def compact(self, manager: "WorkspaceManager") -> None:
+        """
+        Fold the journal into a full workspace snapshot and truncate it.
+
+        The snapshot is written atomically before the journal is cleared;
+        a crash in between only means some records are replayed again,
+        which is harmless.
+        """
+        if self._pending:
+            raise RuntimeError("Cannot compact with uncommitted journal records")
+
+        manager.save()
+        self.close()
+        if self.path.exists():
+            with open(self.path, "r+b") as f:
+                f.truncate(0)
+                if self.fsync:
+                    os.fsync(f.fileno())
@@ -43,6 +43,8 @@ from .operator_prompts import LEGAL_OPERATOR_SYSTEM_PROMPT, LEGAL_OPERATOR_USER_
 from .extraction_parser import ExtractionParser
 from .text_chunker import chunk_legal_text
 from .cost_tracker import get_cost_tracker
+from .extraction_scheduler import RateLimiter
+from .llm_cache import LLMResponseCache, get_llm_cache, response_content
 
 
 class LegalOperator:
@@ -65,7 +67,9 @@ class LegalOperator:
         use_openrouter: bool = True,
         enable_validation: bool = False,
         corpus_path: Optional[str] = None,
-        use_toon: bool = True  # Enable TOON format for ~40% token reduction
+        use_toon: bool = True,  # Enable TOON format for ~40% token reduction
+        rate_limiter: Optional["RateLimiter"] = None,
+        cache: Optional[LLMResponseCache] = None
     ):
         """
         Initialize the Legal Operator.
@@ -77,6 +81,8 @@ class LegalOperator:
             enable_validation: Whether to enable statutory validation
             corpus_path: Path to statutory corpus for validation
             use_toon: Whether to use TOON format for context (default: True)
+            rate_limiter: Shared per-model rate limiter (for concurrent extraction)
+            cache: LLM response cache (default: shared cache, see llm_cache.py)
         """
         if isinstance(model, list):
             self.models = model
@@ -87,6 +93,8 @@ class LegalOperator:
 
         self.use_openrouter = use_openrouter
         self.use_toon = use_toon
+        self.rate_limiter = rate_limiter
+        self.cache = cache if cache is not None else get_llm_cache()
         self.parser = ExtractionParser()
 
         # Get API key
@@ -201,20 +209,26 @@ class LegalOperator:
         for model_name in self.models:
             try:
                 if self.use_openrouter:
-                    response = self.client.post(
-                        "/chat/completions",
-                        json={
-                            "model": model_name,
-                            "messages": [
-                                {"role": "system", "content": LEGAL_OPERATOR_SYSTEM_PROMPT},
-                                {"role": "user", "content": user_prompt}
-                            ],
-                            "temperature": 0.1,
-                            "max_tokens": 8000,
-                            # Add headers to prevent caching if needed, though usually not an issue
-                            "provider": {"order": ["Google", "DeepSeek", "Meta", "Mistral"]} 
-                        }
-                    )
+                    payload = {
+                        "model": model_name,
+                        "messages": [
+                            {"role": "system", "content": LEGAL_OPERATOR_SYSTEM_PROMPT},
+                            {"role": "user", "content": user_prompt}
+                        ],
+                        "temperature": 0.1,
+                        "max_tokens": 8000,
+                        # Add headers to prevent caching if needed, though usually not an issue
+                        "provider": {"order": ["Google", "DeepSeek", "Meta", "Mistral"]} 
+                    }
+                    if self.cache is not None:
+                        cached = self.cache.lookup(payload, "operator")
+                        if cached is not None:
+                            self.model = model_name
+                            return cached["choices"][0]["message"]["content"]
+
+                    if self.rate_limiter:
+                        self.rate_limiter.acquire(model_name)
+                    response = self.client.post("/chat/completions", json=payload)
                     
                     # specific handling for 429 or 503 to trigger rotation
                     if response.status_code in [429, 502, 503, 504]:
@@ -224,6 +238,9 @@ class LegalOperator:
                         
                     response.raise_for_status()
                     result = response.json()
+                    content = response_content(result)
+                    if self.cache is not None:
+                        self.cache.store(payload, result)
 
                     # Track token usage
                     usage = result.get("usage", {})
@@ -237,8 +254,10 @@ class LegalOperator:
                     
                     # Update current effective model for logging
                     self.model = model_name
-                    return result["choices"][0]["message"]["content"]
+                    return content
                 else:
+                    if self.rate_limiter:
+                        self.rate_limiter.acquire(model_name)
                     # Non-OpenRouter fallback (Google GenAI usually single model)
                     response = self.client.generate_content(
                         f"{LEGAL_OPERATOR_SYSTEM_PROMPT}\n\n{user_prompt}"
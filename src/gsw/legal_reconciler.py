@@ -33,6 +33,8 @@ from src.logic.gsw_schema import (
     Actor, State, PredictiveQuestion, ChunkExtraction, GlobalWorkspace
 )
 from .entity_matcher import EntityMatcher
+from .journal import WorkspaceJournal
+from .llm_cache import LLMResponseCache
 from .question_answerer import QuestionAnswerer
 
 # Re-export prompts for backwards compatibility
@@ -59,7 +61,9 @@ class LegalReconciler:
         api_key: Optional[str] = None,
         use_openrouter: bool = True,
         similarity_threshold: float = 0.85,
-        use_toon: bool = True  # Enable TOON format for ~71% token reduction
+        use_toon: bool = True,  # Enable TOON format for ~71% token reduction
+        cache: Optional[LLMResponseCache] = None,
+        vector_store: Optional["VectorReconciler"] = None
     ):
         self.model = model
         self.use_openrouter = use_openrouter
@@ -79,12 +83,14 @@ class LegalReconciler:
         self.entity_matcher = EntityMatcher(
             client=self.client,
             model=self.model,
-            use_toon=self.use_toon
+            use_toon=self.use_toon,
+            cache=cache
         )
         self.question_answerer = QuestionAnswerer()
 
-        # Optional: Vector store for entity embeddings
-        self.vector_store = None
+        # Optional: Vector store for entity embeddings. Actors the matcher
+        # leaves unmatched are matched by similarity >= similarity_threshold.
+        self.vector_store = vector_store
 
     def _setup_client(self) -> None:
         """Setup LLM client."""
@@ -105,7 +111,8 @@ class LegalReconciler:
         self,
         new_extraction: ChunkExtraction,
         workspace: GlobalWorkspace,
-        chunk_text: str
+        chunk_text: str,
+        journal: Optional[WorkspaceJournal] = None
     ) -> Tuple[ChunkExtraction, List[Dict[str, Any]]]:
         """
         Reconcile a new chunk extraction with the global workspace.
@@ -114,18 +121,54 @@ class LegalReconciler:
             new_extraction: The ChunkExtraction from the Operator
             workspace: The current GlobalWorkspace
             chunk_text: Original text of the chunk
+            journal: Optional write-ahead journal. Every workspace change
+                is recorded and committed once the chunk is reconciled. If
+                reconciliation fails midway, the changes already applied
+                are committed with partial=True, so the journal matches
+                the in-memory workspace.
 
         Returns:
             Tuple of (updated_extraction, reconciliation_log)
         """
         reconciliation_log = []
+        completed = False
+        try:
+            self._apply_extraction(new_extraction, workspace, chunk_text, journal, reconciliation_log)
+            completed = True
+        finally:
+            if journal:
+                meta = {
+                    "chunk_id": new_extraction.chunk_id,
+                    "document_id": new_extraction.source_document_id
+                }
+                if not completed:
+                    meta["partial"] = True
+                journal.commit(workspace, **meta)
+
+        return new_extraction, reconciliation_log
 
+    def _apply_extraction(
+        self,
+        new_extraction: ChunkExtraction,
+        workspace: GlobalWorkspace,
+        chunk_text: str,
+        journal: Optional[WorkspaceJournal],
+        reconciliation_log: List[Dict[str, Any]]
+    ) -> None:
+        """Apply one chunk's extraction to the workspace (steps 1-5 of reconcile)."""
         # Step 1: Entity Reconciliation
         entity_matches = self.entity_matcher.reconcile_entities(
             new_extraction.actors,
             workspace,
             chunk_text
         )
+        if self.vector_store is not None:
+            matched = {m["new_entity_id"] for m in entity_matches}
+            entity_matches.extend(self.vector_store.match_entities(
+                [a for a in new_extraction.actors if a.id not in matched],
+                workspace,
+                threshold=self.similarity_threshold
+            ))
 
         # Apply entity matches
         for match in entity_matches:
@@ -141,8 +184,11 @@ class LegalReconciler:
             if new_actor and existing_id in workspace.actors:
                 existing_actor = workspace.actors[existing_id]
 
-                # Merge information
+                # Merge information (re-add to refresh workspace indexes)
                 self._merge_actors(existing_actor, new_actor)
+                workspace.add_actor(existing_actor)
+                if journal:
+                    journal.actor_merged(existing_actor, merged_id=new_id)
 
                 # Update references in extraction
                 self._update_references(new_extraction, new_id, existing_id)
@@ -155,20 +201,22 @@ class LegalReconciler:
                 })
 
         # Step 2: Answer Pending Questions
-        answered = self.question_answerer.answer_questions(
-            workspace.get_unanswered_questions(),
+        answered = self.question_answerer.answer_pending(
+            workspace,
             chunk_text,
             new_extraction
         )
 
         for answer in answered:
             q_id = answer["question_id"]
-            if q_id in workspace.questions:
-                workspace.questions[q_id].answerable = True
-                workspace.questions[q_id].answer_text = answer["answer_text"]
-                workspace.questions[q_id].answer_entity_id = answer.get("answer_entity_id")
-                workspace.questions[q_id].answered_in_chunk_id = new_extraction.chunk_id
-
+            if workspace.answer_question(
+                q_id,
+                answer["answer_text"],
+                answer_entity_id=answer.get("answer_entity_id"),
+                answered_in_chunk_id=new_extraction.chunk_id
+            ):
+                if journal:
+                    journal.question_answered(workspace.questions[q_id])
                 reconciliation_log.append({
                     "action": "answered_question",
                     "question_id": q_id,
@@ -184,6 +232,8 @@ class LegalReconciler:
 
             if not was_matched:
                 workspace.add_actor(actor)
+                if journal:
+                    journal.actor_added(actor)
                 reconciliation_log.append({
                     "action": "added_new",
                     "entity_id": actor.id,
@@ -192,21 +242,25 @@ class LegalReconciler:
 
         # Step 4: Add new questions
         for question in new_extraction.questions:
-            workspace.questions[question.id] = question
+            workspace.add_question(question)
+            if journal:
+                journal.question_added(question)
 
         # Step 5: Add verb phrases and links
         for verb in new_extraction.verb_phrases:
-            workspace.verb_phrases[verb.id] = verb
+            workspace.add_verb_phrase(verb)
+            if journal:
+                journal.verb_added(verb)
 
         for link in new_extraction.spatio_temporal_links:
-            workspace.spatio_temporal_links[link.id] = link
+            workspace.add_spatio_temporal_link(link)
+            if journal:
+                journal.link_added(link)
 
         # Update workspace metadata
         workspace.chunk_count += 1
         workspace.touch()
 
-        return new_extraction, reconciliation_log
-
     def _merge_actors(self, existing: Actor, new: Actor) -> None:
         """Merge information from new actor into existing actor."""
         # Add new aliases
@@ -27,6 +27,8 @@ from src.logic.gsw_schema import (
     Actor, SpatioTemporalLink, LinkType, ChunkExtraction
 )
 from .cost_tracker import get_cost_tracker
+from .extraction_scheduler import RateLimiter
+from .llm_cache import LLMResponseCache, get_llm_cache, response_content
 
 
 # ============================================================================
@@ -115,10 +117,14 @@ class LegalSpacetime:
         self,
         model: str = "google/gemini-2.5-flash",
         api_key: Optional[str] = None,
-        use_openrouter: bool = True
+        use_openrouter: bool = True,
+        rate_limiter: Optional[RateLimiter] = None,
+        cache: Optional[LLMResponseCache] = None
     ):
         self.model = model
         self.use_openrouter = use_openrouter
+        self.rate_limiter = rate_limiter
+        self.cache = cache if cache is not None else get_llm_cache()
 
         if api_key:
             self.api_key = api_key
@@ -191,20 +197,28 @@ class LegalSpacetime:
     def _call_llm(self, user_prompt: str) -> str:
         """Call the LLM."""
         if self.use_openrouter:
-            response = self.client.post(
-                "/chat/completions",
-                json={
-                    "model": self.model,
-                    "messages": [
-                        {"role": "system", "content": SPACETIME_SYSTEM_PROMPT},
-                        {"role": "user", "content": user_prompt}
-                    ],
-                    "temperature": 0.1,
-                    "max_tokens": 4000
-                }
-            )
+            payload = {
+                "model": self.model,
+                "messages": [
+                    {"role": "system", "content": SPACETIME_SYSTEM_PROMPT},
+                    {"role": "user", "content": user_prompt}
+                ],
+                "temperature": 0.1,
+                "max_tokens": 4000
+            }
+            if self.cache is not None:
+                cached = self.cache.lookup(payload, "spacetime")
+                if cached is not None:
+                    return cached["choices"][0]["message"]["content"]
+
+            if self.rate_limiter:
+                self.rate_limiter.acquire(self.model)
+            response = self.client.post("/chat/completions", json=payload)
             response.raise_for_status()
             result = response.json()
+            content = response_content(result)
+            if self.cache is not None:
+                self.cache.store(payload, result)
 
             # Track token usage
             usage = result.get("usage", {})
@@ -216,7 +230,7 @@ class LegalSpacetime:
                     usage.get("completion_tokens", 0)
                 )
 
-            return result["choices"][0]["message"]["content"]
+            return content
         else:
             raise NotImplementedError("Direct Google API not implemented")
 
@@ -20,6 +20,8 @@ sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
 from src.logic.gsw_schema import (
     Actor, GlobalWorkspace, State, VerbPhrase, SpatioTemporalLink
 )
+from .cost_tracker import get_cost_tracker
+from .llm_cache import LLMResponseCache, get_llm_cache, response_content
 
 
 # ============================================================================
@@ -88,10 +90,12 @@ class LegalSummary:
         self,
         model: str = "google/gemini-2.5-flash",
         api_key: Optional[str] = None,
-        use_openrouter: bool = True
+        use_openrouter: bool = True,
+        cache: Optional[LLMResponseCache] = None
     ):
         self.model = model
         self.use_openrouter = use_openrouter
+        self.cache = cache if cache is not None else get_llm_cache()
 
         if api_key:
             self.api_key = api_key
@@ -205,7 +209,7 @@ class LegalSummary:
         """Format verb phrases involving this actor."""
         actions = []
 
-        for verb in workspace.verb_phrases.values():
+        for verb in workspace.get_actor_verbs(actor_id):
             if verb.agent_id == actor_id:
                 action = f"- {verb.verb} (as agent)"
                 if verb.patient_ids:
@@ -218,7 +222,7 @@ class LegalSummary:
                         action += f" affecting {', '.join(patients)}"
                 actions.append(action)
 
-            elif actor_id in verb.patient_ids:
+            else:
                 agent_name = "Unknown"
                 if verb.agent_id and verb.agent_id in workspace.actors:
                     agent_name = workspace.actors[verb.agent_id].name
@@ -230,11 +234,10 @@ class LegalSummary:
         """Format spatio-temporal links for this actor."""
         links = []
 
-        for link in workspace.spatio_temporal_links.values():
-            if actor_id in link.linked_entity_ids:
-                tag_type = link.tag_type.value.title()
-                tag_value = link.tag_value or "Unknown"
-                links.append(f"- {tag_type}: {tag_value}")
+        for link in workspace.get_actor_links(actor_id):
+            tag_type = link.tag_type.value.title()
+            tag_value = link.tag_value or "Unknown"
+            links.append(f"- {tag_type}: {tag_value}")
 
         return "\n".join(links) if links else "No spatio-temporal context."
 
@@ -247,17 +250,15 @@ class LegalSummary:
         related = set()
 
         # Via verb phrases
-        for verb in workspace.verb_phrases.values():
+        for verb in workspace.get_actor_verbs(actor_id):
             if verb.agent_id == actor_id:
                 related.update(verb.patient_ids)
-            elif actor_id in verb.patient_ids:
-                if verb.agent_id:
-                    related.add(verb.agent_id)
+            elif verb.agent_id:
+                related.add(verb.agent_id)
 
         # Via spatio-temporal links
-        for link in workspace.spatio_temporal_links.values():
-            if actor_id in link.linked_entity_ids:
-                related.update(link.linked_entity_ids)
+        for link in workspace.get_actor_links(actor_id):
+            related.update(link.linked_entity_ids)
 
         related.discard(actor_id)  # Remove self
 
@@ -289,21 +290,34 @@ class LegalSummary:
             related_entities=related_entities
         )
 
-        response = self.client.post(
-            "/chat/completions",
-            json={
-                "model": f"google/{self.model}",
-                "messages": [
-                    {"role": "system", "content": SUMMARY_SYSTEM_PROMPT},
-                    {"role": "user", "content": prompt}
-                ],
-                "temperature": 0.3,
-                "max_tokens": 500
-            }
-        )
-        response.raise_for_status()
+        payload = {
+            "model": f"google/{self.model}",
+            "messages": [
+                {"role": "system", "content": SUMMARY_SYSTEM_PROMPT},
+                {"role": "user", "content": prompt}
+            ],
+            "temperature": 0.3,
+            "max_tokens": 500
+        }
+        result = self.cache.lookup(payload, "summary") if self.cache is not None else None
+        if result is None:
+            response = self.client.post("/chat/completions", json=payload)
+            response.raise_for_status()
+            result = response.json()
+            response_content(result)  # Error bodies are not cached
+            if self.cache is not None:
+                self.cache.store(payload, result)
+
+            # Track token usage
+            usage = result.get("usage", {})
+            if usage:
+                get_cost_tracker(payload["model"]).add_usage(
+                    "summary",
+                    usage.get("prompt_tokens", 0),
+                    usage.get("completion_tokens", 0)
+                )
 
-        return response.json()["choices"][0]["message"]["content"].strip()
+        return response_content(result).strip()
 
     def _template_summary(
         self,
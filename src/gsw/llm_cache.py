@@ -0,0 +1,215 @@
+"""
+LLM Response Cache - Content-Addressed, Disk-Backed
+====================================================
+
+Resumed, re-run and calibration runs send exactly the same prompts again.
+This cache stores each chat completion response under a SHA-256 of the
+full request payload (model, messages and sampling parameters), so a
+repeated request is answered from disk at zero token cost.
+
+Storage is a single SQLite file (WAL mode, safe across threads). Entries
+are zlib-compressed; once the store grows past `max_bytes`, the least
+recently used entries are evicted.
+
+Hits and misses are reported to the CostTracker, per component.
+
+Configuration (environment):
+    GSW_LLM_CACHE=off                  disable the default cache
+    GSW_LLM_CACHE=/path/cache.sqlite   custom location
+    GSW_LLM_CACHE_MAX_MB=2048          size bound (default 1024)
+
+Usage:
+    cache = get_llm_cache()
+    cached = cache.lookup(payload, "operator")
+    if cached is None:
+        result = client.post("/chat/completions", json=payload).json()
+        content = response_content(result)   # Raises before an error body is cached
+        cache.store(payload, result)
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from .cost_tracker import get_cost_tracker
+
+
+DEFAULT_CACHE_PATH = Path(__file__).resolve().parents[2] / "data" / "cache" / "llm_responses.sqlite"
+DEFAULT_MAX_BYTES = 1024 * 1024 * 1024
+
+# Evict down to this fraction of max_bytes, so eviction runs rarely
+EVICT_TO = 0.9
+
+
+def cache_key(payload: Dict[str, Any]) -> str:
+    """SHA-256 of the canonical JSON encoding of a request payload."""
+    canonical = json.dumps(payload, sort_keys=True, ensure_ascii=False, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def response_content(response: Dict[str, Any]) -> str:
+    """
+    Message content of a chat completion response.
+
+    Raises ValueError for responses without one (e.g. an error body sent
+    with status 200), which must not be cached.
+    """
+    try:
+        content = response["choices"][0]["message"]["content"]
+    except (KeyError, IndexError, TypeError):
+        content = None
+    if not isinstance(content, str):
+        error = response.get("error") if isinstance(response, dict) else None
+        raise ValueError(f"LLM response has no message content: {error or str(response)[:200]}")
+    return content
+
+
+class LLMResponseCache:
+    """SQLite-backed response store with size-bounded LRU eviction."""
+
+    def __init__(self, path: Path = DEFAULT_CACHE_PATH, max_bytes: int = DEFAULT_MAX_BYTES):
+        """
+        Args:
+            path: SQLite file (created on first use)
+            max_bytes: Bound on the total size of stored (compressed) responses
+        """
+        self.path = Path(path)
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._conn: Optional[sqlite3.Connection] = None
+        self._total_bytes = 0
+        self._lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self.path), check_same_thread=False, timeout=30)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS responses (
+                    key TEXT PRIMARY KEY,
+                    model TEXT,
+                    response BLOB NOT NULL,
+                    size INTEGER NOT NULL,
+                    created REAL NOT NULL,
+                    accessed REAL NOT NULL
+                )
+            """)
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_accessed ON responses(accessed)")
+            conn.commit()
+            self._total_bytes = conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+            self._conn = conn
+        return self._conn
+
+    # =========================================================================
+    # LOOKUP / STORE
+    # =========================================================================
+
+    def get(self, payload: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Cached response for a payload, or None."""
+        key = cache_key(payload)
+        with self._lock:
+            conn = self._connect()
+            row = conn.execute("SELECT response FROM responses WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            conn.execute("UPDATE responses SET accessed = ? WHERE key = ?", (time.time(), key))
+            conn.commit()
+            self.hits += 1
+        return json.loads(zlib.decompress(row[0]))
+
+    def lookup(self, payload: Dict[str, Any], component: str) -> Optional[Dict[str, Any]]:
+        """get() that also reports the hit/miss to the CostTracker."""
+        result = self.get(payload)
+        tracker = get_cost_tracker(payload.get("model", ""))
+        tracker.add_cache_lookup(component, result is not None, (result or {}).get("usage"))
+        return result
+
+    def store(self, payload: Dict[str, Any], response: Dict[str, Any]) -> None:
+        """Store a response, evicting least recently used entries if needed."""
+        key = cache_key(payload)
+        blob = zlib.compress(json.dumps(response, ensure_ascii=False).encode("utf-8"))
+        now = time.time()
+        with self._lock:
+            conn = self._connect()
+            previous = conn.execute("SELECT size FROM responses WHERE key = ?", (key,)).fetchone()
+            conn.execute(
+                "INSERT OR REPLACE INTO responses (key, model, response, size, created, accessed) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (key, payload.get("model"), blob, len(blob), now, now)
+            )
+            self._total_bytes += len(blob) - (previous[0] if previous else 0)
+            if self._total_bytes > self.max_bytes:
+                self._evict(conn)
+            conn.commit()
+
+    def _evict(self, conn: sqlite3.Connection) -> None:
+        """Delete least recently used entries down to EVICT_TO * max_bytes."""
+        target = self.max_bytes * EVICT_TO
+        doomed = []
+        for key, size in conn.execute("SELECT key, size FROM responses ORDER BY accessed"):
+            if self._total_bytes <= target:
+                break
+            doomed.append((key,))
+            self._total_bytes -= size
+        conn.executemany("DELETE FROM responses WHERE key = ?", doomed)
+
+    # =========================================================================
+    # STATISTICS
+    # =========================================================================
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._connect().execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+
+    @property
+    def size_bytes(self) -> int:
+        with self._lock:
+            self._connect()
+            return self._total_bytes
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def clear(self) -> None:
+        with self._lock:
+            conn = self._connect()
+            conn.execute("DELETE FROM responses")
+            conn.commit()
+            self._total_bytes = 0
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+# Global instance shared by operator, spacetime, reconciler and summary
+_llm_cache: Optional[LLMResponseCache] = None
+
+
+def get_llm_cache() -> Optional[LLMResponseCache]:
+    """Get or create the default cache (None when GSW_LLM_CACHE=off)."""
+    global _llm_cache
+    setting = os.getenv("GSW_LLM_CACHE", "")
+    if setting.lower() in ("off", "0", "false", "no"):
+        return None
+    if _llm_cache is None:
+        max_mb = float(os.getenv("GSW_LLM_CACHE_MAX_MB", DEFAULT_MAX_BYTES / (1024 * 1024)))
+        _llm_cache = LLMResponseCache(
+            Path(setting) if setting else DEFAULT_CACHE_PATH,
+            max_bytes=int(max_mb * 1024 * 1024)
+        )
+    return _llm_cache
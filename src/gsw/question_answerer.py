@@ -3,13 +3,72 @@ Question Answerer
 =================
 
 Handles checking if chunks answer pending questions.
+
+The facts a chunk can answer with (its first date, its first monetary
+amount, the topics it mentions and the people in its extraction) are
+extracted once per chunk. answer_pending() joins them against the
+workspace's PendingQuestionIndex, so the cost per chunk grows with the
+number of relevant questions rather than the number of pending ones.
 """
 
 import re
-from typing import Dict, List, Any, TYPE_CHECKING
+from dataclasses import dataclass, field
+from typing import Dict, List, Any, Optional, Set, Tuple, TYPE_CHECKING
+
+from src.logic.gsw_index import WHEN, WHO, VALUE, WHEN_TOPICS, question_category
 
 if TYPE_CHECKING:
-    from src.logic.gsw_schema import PredictiveQuestion, ChunkExtraction
+    from src.logic.gsw_schema import PredictiveQuestion, ChunkExtraction, GlobalWorkspace
+
+
+DATE_PATTERNS = [
+    re.compile(r'(\d{1,2}\s+(?:january|february|march|april|may|june|july|august|september|october|november|december)\s+\d{4})'),
+    re.compile(r'((?:january|february|march|april|may|june|july|august|september|october|november|december)\s+\d{1,2},?\s+\d{4})'),
+    re.compile(r'(\d{4}-\d{2}-\d{2})'),
+]
+
+MONEY_PATTERN = re.compile(r'\$[\d,]+(?:\.\d{2})?(?:\s*(?:million|m))?')
+
+
+@dataclass
+class ChunkFacts:
+    """
+    Answers a chunk can give, extracted once per chunk.
+
+    Attributes:
+        date: First date in the chunk (first matching pattern wins)
+        money: First monetary amount in the chunk
+        topics: WHEN_TOPICS mentioned in the chunk
+        persons: (name, lowercased roles) of person actors, in extraction order
+    """
+    date: Optional[str] = None
+    money: Optional[str] = None
+    topics: List[str] = field(default_factory=list)
+    persons: List[Tuple[str, List[str]]] = field(default_factory=list)
+
+    @classmethod
+    def extract(cls, chunk_text: str, extraction: "ChunkExtraction") -> "ChunkFacts":
+        chunk_lower = chunk_text.lower()
+
+        date = None
+        for pattern in DATE_PATTERNS:
+            match = pattern.search(chunk_lower)
+            if match:
+                date = match.group(1)
+                break
+
+        money = MONEY_PATTERN.search(chunk_lower)
+
+        return cls(
+            date=date,
+            money=money.group(0) if money else None,
+            topics=[word for word in WHEN_TOPICS if word in chunk_lower],
+            persons=[
+                (actor.name, [role.lower() for role in actor.roles])
+                for actor in extraction.actors
+                if actor.actor_type.value == "person"
+            ]
+        )
 
 
 class QuestionAnswerer:
@@ -22,6 +81,43 @@ class QuestionAnswerer:
     - What value questions (monetary amounts)
     """
 
+    def answer_pending(
+        self,
+        workspace: "GlobalWorkspace",
+        chunk_text: str,
+        extraction: "ChunkExtraction"
+    ) -> List[Dict[str, Any]]:
+        """
+        Check if the chunk text answers any of the workspace's unanswered
+        questions, looking only at questions relevant to the chunk.
+
+        Same answers, in the same order, as answer_questions() over
+        workspace.get_unanswered_questions().
+
+        Args:
+            workspace: Workspace holding the pending questions
+            chunk_text: The text of the current chunk
+            extraction: The ChunkExtraction with entities
+
+        Returns:
+            List of answered question dictionaries
+        """
+        facts = ChunkFacts.extract(chunk_text, extraction)
+        index = workspace.get_pending_questions()
+
+        candidates: Set[str] = set()
+        if facts.date:
+            candidates |= index.when_questions(facts.topics)
+        if facts.money:
+            candidates |= index.value_questions()
+        for name, roles in facts.persons:
+            if name:
+                for role in roles:
+                    candidates |= index.who_candidates(role)
+
+        questions = (workspace.questions.get(q_id) for q_id in index.in_order(candidates))
+        return self._answer([q for q in questions if q is not None and not q.answerable], facts)
+
     def answer_questions(
         self,
         questions: List["PredictiveQuestion"],
@@ -41,27 +137,28 @@ class QuestionAnswerer:
         """
         if not questions:
             return []
+        return self._answer(questions, ChunkFacts.extract(chunk_text, extraction))
 
+    def _answer(
+        self,
+        questions: List["PredictiveQuestion"],
+        facts: ChunkFacts
+    ) -> List[Dict[str, Any]]:
         answered = []
-        chunk_lower = chunk_text.lower()
 
         for q in questions:
             q_text = q.question_text.lower()
+            category = question_category(q_text)
 
             # Simple pattern matching for common question types
             answer_found = None
 
-            # When questions
-            if "when" in q_text:
-                answer_found = self._find_when_answer(q_text, chunk_lower)
-
-            # Who questions
-            elif "who" in q_text:
-                answer_found = self._find_who_answer(q_text, extraction)
-
-            # What questions about value
-            elif "value" in q_text or "worth" in q_text:
-                answer_found = self._find_value_answer(chunk_lower)
+            if category == WHEN:
+                answer_found = self._find_when_answer(q_text, facts)
+            elif category == WHO:
+                answer_found = self._find_who_answer(q_text, facts)
+            elif category == VALUE:
+                answer_found = facts.money
 
             if answer_found:
                 answered.append({
@@ -73,43 +170,15 @@ class QuestionAnswerer:
 
         return answered
 
-    def _find_when_answer(self, q_text: str, chunk_lower: str) -> str | None:
-        """Find date answers for 'when' questions."""
-        date_patterns = [
-            r'(\d{1,2}\s+(?:january|february|march|april|may|june|july|august|september|october|november|december)\s+\d{4})',
-            r'((?:january|february|march|april|may|june|july|august|september|october|november|december)\s+\d{1,2},?\s+\d{4})',
-            r'(\d{4}-\d{2}-\d{2})',
-        ]
-
-        # Check if question topic is in chunk
-        topic_words = ["separate", "marry", "divorce", "hear", "order", "file"]
-        for word in topic_words:
-            if word in q_text and word in chunk_lower:
-                # Find nearby date
-                for pattern in date_patterns:
-                    matches = re.findall(pattern, chunk_lower)
-                    if matches:
-                        return matches[0]
-                break
-
+    def _find_when_answer(self, q_text: str, facts: ChunkFacts) -> str | None:
+        """Find date answers for 'when' questions whose topic is in the chunk."""
+        if any(word in q_text for word in facts.topics):
+            return facts.date
         return None
 
-    def _find_who_answer(
-        self,
-        q_text: str,
-        extraction: "ChunkExtraction"
-    ) -> str | None:
+    def _find_who_answer(self, q_text: str, facts: ChunkFacts) -> str | None:
         """Find person answers for 'who' questions."""
-        for actor in extraction.actors:
-            if actor.actor_type.value == "person":
-                if any(role.lower() in q_text for role in actor.roles):
-                    return actor.name
-        return None
-
-    def _find_value_answer(self, chunk_lower: str) -> str | None:
-        """Find monetary value answers."""
-        money_pattern = r'\$[\d,]+(?:\.\d{2})?(?:\s*(?:million|m))?'
-        matches = re.findall(money_pattern, chunk_lower)
-        if matches:
-            return matches[0]
+        for name, roles in facts.persons:
+            if any(role in q_text for role in roles):
+                return name
         return None
@@ -0,0 +1,533 @@
+"""
+Workspace Snapshots - Binary Columnar Format with Memory-Mapped Loading
+
+JSON workspaces are parsed in full and every Actor/State/VerbPhrase is
+rebuilt as a pydantic object before the first query. Snapshots avoid both
+costs:
+
+- All strings are interned into a single string table
+- Actors, states, verbs, questions and links are stored as columns of
+  uint32 string ids (list fields use an offsets + values pair)
+- Lowercased actor names and aliases are stored as a sorted column, so
+  name lookups binary-search the file instead of building a dict at open
+- The file is opened with mmap and entities are materialised lazily,
+  the first time they are looked up
+
+File layout (all sections 8-byte aligned, native byte order):
+
+    b"GSWSNAP1" | uint32 header length | JSON header | sections...
+
+The header holds workspace metadata, row counts and the offset, length
+and typecode of every section.
+
+Usage:
+    write_snapshot(workspace, Path("family_workspace.gsws"))
+    workspace = read_snapshot(Path("family_workspace.gsws"))
+"""
+
+import json
+import mmap
+import struct
+import sys
+from array import array
+from collections.abc import MutableMapping
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from src.logic.gsw_schema import (
+    GlobalWorkspace, Actor, State, VerbPhrase, PredictiveQuestion,
+    SpatioTemporalLink, ActorType, QuestionType, LinkType
+)
+
+
+SNAPSHOT_MAGIC = b"GSWSNAP1"
+SNAPSHOT_SUFFIX = ".gsws"
+SNAPSHOT_VERSION = 2
+
+NULL_ID = 0xFFFFFFFF  # String id used for None
+_ALIGN = 8
+
+
+# ============================================================================
+# WRITER
+# ============================================================================
+
+class _SnapshotWriter:
+    """Accumulates interned strings and columns, then writes them out."""
+
+    def __init__(self):
+        self._string_ids: Dict[str, int] = {}
+        self._strings: List[str] = []
+        self.columns: Dict[str, array] = {}
+
+    def intern(self, value: Optional[str]) -> int:
+        if value is None:
+            return NULL_ID
+        sid = self._string_ids.get(value)
+        if sid is None:
+            sid = len(self._strings)
+            self._string_ids[value] = sid
+            self._strings.append(value)
+        return sid
+
+    def column(self, name: str, typecode: str = "I") -> array:
+        if name not in self.columns:
+            self.columns[name] = array(typecode)
+        return self.columns[name]
+
+    def add_str(self, name: str, value: Optional[str]) -> None:
+        self.column(name).append(self.intern(value))
+
+    def add_list(self, name: str, values: List[str]) -> None:
+        offsets = self.column(f"{name}.offsets")
+        items = self.column(f"{name}.values")
+        if not offsets:
+            offsets.append(0)
+        items.extend(self.intern(v) for v in values)
+        offsets.append(len(items))
+
+    def add_flag(self, name: str, value: bool) -> None:
+        self.column(name, "B").append(1 if value else 0)
+
+    def string_sections(self) -> Dict[str, Any]:
+        offsets = array("Q", [0])
+        blob = bytearray()
+        for s in self._strings:
+            blob += s.encode("utf-8")
+            offsets.append(len(blob))
+        return {"strings.offsets": offsets, "strings.blob": bytes(blob)}
+
+
+def write_snapshot(workspace: GlobalWorkspace, path: Path) -> None:
+    """
+    Write a workspace to a binary columnar snapshot.
+
+    Serialises the same fields as WorkspaceManager._serialize_workspace.
+    """
+    w = _SnapshotWriter()
+
+    for key, a in workspace.actors.items():
+        w.add_str("actors.key", key)
+        w.add_str("actors.id", a.id)
+        w.add_str("actors.name", a.name)
+        w.add_str("actors.actor_type", a.actor_type.value)
+        w.add_list("actors.aliases", a.aliases)
+        w.add_list("actors.roles", a.roles)
+        w.add_list("actors.spatio_temporal_link_ids", a.spatio_temporal_link_ids)
+        w.add_list("actors.involved_cases", a.involved_cases)
+        w.add_list("actors.source_chunk_ids", a.source_chunk_ids)
+
+        # States are stored in their own table, addressed by a row range
+        state_offsets = w.column("actors.states.offsets")
+        if not state_offsets:
+            state_offsets.append(0)
+        for s in a.states:
+            w.add_str("states.id", s.id)
+            w.add_str("states.entity_id", s.entity_id)
+            w.add_str("states.name", s.name)
+            w.add_str("states.value", s.value)
+            w.add_str("states.start_date", s.start_date)
+            w.add_str("states.end_date", s.end_date)
+            w.add_str("states.source_chunk_id", s.source_chunk_id)
+        state_offsets.append(len(w.column("states.id")))
+
+    for key, v in workspace.verb_phrases.items():
+        w.add_str("verbs.key", key)
+        w.add_str("verbs.id", v.id)
+        w.add_str("verbs.verb", v.verb)
+        w.add_str("verbs.agent_id", v.agent_id)
+        w.add_list("verbs.patient_ids", v.patient_ids)
+        w.add_str("verbs.temporal_id", v.temporal_id)
+        w.add_str("verbs.spatial_id", v.spatial_id)
+        w.add_flag("verbs.is_implicit", v.is_implicit)
+        w.add_str("verbs.source_chunk_id", v.source_chunk_id)
+
+    for key, q in workspace.questions.items():
+        w.add_str("questions.key", key)
+        w.add_str("questions.id", q.id)
+        w.add_str("questions.question_text", q.question_text)
+        w.add_str("questions.question_type", q.question_type.value)
+        w.add_str("questions.target_entity_id", q.target_entity_id)
+        w.add_flag("questions.answerable", q.answerable)
+        w.add_str("questions.answer_text", q.answer_text)
+        w.add_str("questions.answer_entity_id", q.answer_entity_id)
+        w.add_str("questions.source_chunk_id", q.source_chunk_id)
+        w.add_str("questions.answered_in_chunk_id", q.answered_in_chunk_id)
+
+    for key, l in workspace.spatio_temporal_links.items():
+        w.add_str("links.key", key)
+        w.add_str("links.id", l.id)
+        w.add_list("links.linked_entity_ids", l.linked_entity_ids)
+        w.add_str("links.tag_type", l.tag_type.value)
+        w.add_str("links.tag_value", l.tag_value)
+        w.add_str("links.source_chunk_id", l.source_chunk_id)
+
+    for key, summary in workspace.entity_summaries.items():
+        w.add_str("summaries.key", key)
+        w.add_str("summaries.value", summary)
+
+    # Sorted name/alias -> actor id (later actors win, as in
+    # GlobalWorkspace.model_post_init)
+    name_to_id: Dict[str, str] = {}
+    for key, a in workspace.actors.items():
+        name_to_id[a.name.lower()] = key
+        for alias in a.aliases:
+            name_to_id[alias.lower()] = key
+    for name in sorted(name_to_id):
+        w.add_str("names.key", name)
+        w.add_str("names.actor_id", name_to_id[name])
+
+    sections: Dict[str, Any] = dict(w.columns)
+    sections.update(w.string_sections())
+
+    # Lay out sections after the header
+    section_table: Dict[str, List[Any]] = {}
+    payloads: List[bytes] = []
+    offset = 0
+    for name, data in sections.items():
+        raw = data.tobytes() if isinstance(data, array) else data
+        typecode = data.typecode if isinstance(data, array) else "B"
+        section_table[name] = [offset, len(raw), typecode]
+        padding = (-len(raw)) % _ALIGN
+        payloads.append(raw + b"\0" * padding)
+        offset += len(raw) + padding
+
+    header = {
+        "version": SNAPSHOT_VERSION,
+        "byteorder": sys.byteorder,
+        "metadata": {
+            "created_at": workspace.created_at,
+            "last_updated": workspace.last_updated,
+            "chunk_count": workspace.chunk_count,
+            "document_count": workspace.document_count,
+            "domain": workspace.domain
+        },
+        "counts": {
+            "actors": len(workspace.actors),
+            "verbs": len(workspace.verb_phrases),
+            "questions": len(workspace.questions),
+            "links": len(workspace.spatio_temporal_links),
+            "summaries": len(workspace.entity_summaries),
+        },
+        "sections": section_table,
+    }
+    header_bytes = json.dumps(header).encode("utf-8")
+    prefix_len = len(SNAPSHOT_MAGIC) + 4 + len(header_bytes)
+    header_bytes += b" " * ((-prefix_len) % _ALIGN)
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(path.name + ".tmp")
+    with open(tmp_path, "wb") as f:
+        f.write(SNAPSHOT_MAGIC)
+        f.write(struct.pack("<I", len(header_bytes)))
+        f.write(header_bytes)
+        for payload in payloads:
+            f.write(payload)
+    tmp_path.replace(path)
+
+
+# ============================================================================
+# READER
+# ============================================================================
+
+class SnapshotReader:
+    """
+    Memory-mapped view of a snapshot file.
+
+    Columns are exposed as typed memoryviews over the mapping; strings
+    are decoded on first use and cached.
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        self._file = open(path, "rb")
+        self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        if self._mm[:len(SNAPSHOT_MAGIC)] != SNAPSHOT_MAGIC:
+            raise ValueError(f"Not a workspace snapshot: {path}")
+        pos = len(SNAPSHOT_MAGIC)
+        (header_len,) = struct.unpack("<I", self._mm[pos:pos + 4])
+        pos += 4
+        self.header = json.loads(self._mm[pos:pos + header_len])
+        self._data_start = pos + header_len
+
+        if self.header.get("version") != SNAPSHOT_VERSION:
+            raise ValueError(f"Unsupported snapshot version: {self.header.get('version')}")
+        if self.header.get("byteorder") != sys.byteorder:
+            raise ValueError(f"Snapshot byte order {self.header.get('byteorder')} "
+                             f"does not match this platform")
+
+        self.metadata: Dict[str, Any] = self.header["metadata"]
+        self.counts: Dict[str, int] = self.header["counts"]
+
+        # Typed views over every section (no data is read until indexed)
+        view = memoryview(self._mm)
+        self._columns: Dict[str, memoryview] = {}
+        for name, (offset, length, typecode) in self.header["sections"].items():
+            start = self._data_start + offset
+            self._columns[name] = view[start:start + length].cast(typecode)
+        self._empty = memoryview(array("I"))
+
+        self._string_offsets = self.column("strings.offsets")
+        self._string_blob_start = self._data_start + self.header["sections"]["strings.blob"][0]
+        self._string_cache: Dict[int, str] = {}
+
+    def column(self, name: str) -> memoryview:
+        """Typed view of a section (empty if the section was never written)."""
+        return self._columns.get(name, self._empty)
+
+    def string(self, sid: int) -> Optional[str]:
+        if sid == NULL_ID:
+            return None
+        s = self._string_cache.get(sid)
+        if s is None:
+            start = self._string_blob_start + self._string_offsets[sid]
+            end = self._string_blob_start + self._string_offsets[sid + 1]
+            s = self._mm[start:end].decode("utf-8")
+            self._string_cache[sid] = s
+        return s
+
+    def str_at(self, name: str, row: int) -> Optional[str]:
+        return self.string(self.column(name)[row])
+
+    def list_at(self, name: str, row: int) -> List[str]:
+        offsets = self.column(f"{name}.offsets")
+        values = self.column(f"{name}.values")
+        return [self.string(values[i]) for i in range(offsets[row], offsets[row + 1])]
+
+    def flag_at(self, name: str, row: int) -> bool:
+        return bool(self.column(name)[row])
+
+    def keys(self, table: str) -> List[str]:
+        return [self.string(sid) for sid in self.column(f"{table}.key")]
+
+    def find_name(self, name: str) -> Optional[str]:
+        """
+        Actor id for a lowercased name or alias, by binary search over the
+        sorted names column (only O(log n) strings are decoded).
+        """
+        keys = self.column("names.key")
+        lo, hi = 0, len(keys)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self.string(keys[mid]) < name:
+                lo = mid + 1
+            else:
+                hi = mid
+        if lo < len(keys) and self.string(keys[lo]) == name:
+            return self.str_at("names.actor_id", lo)
+        return None
+
+    def actor(self, row: int) -> Actor:
+        state_offsets = self.column("actors.states.offsets")
+        states = [
+            State(
+                id=self.str_at("states.id", i),
+                entity_id=self.str_at("states.entity_id", i),
+                name=self.str_at("states.name", i),
+                value=self.str_at("states.value", i),
+                start_date=self.str_at("states.start_date", i),
+                end_date=self.str_at("states.end_date", i),
+                source_chunk_id=self.str_at("states.source_chunk_id", i)
+            )
+            for i in range(state_offsets[row], state_offsets[row + 1])
+        ]
+        return Actor(
+            id=self.str_at("actors.id", row),
+            name=self.str_at("actors.name", row),
+            actor_type=ActorType(self.str_at("actors.actor_type", row)),
+            aliases=self.list_at("actors.aliases", row),
+            roles=self.list_at("actors.roles", row),
+            states=states,
+            spatio_temporal_link_ids=self.list_at("actors.spatio_temporal_link_ids", row),
+            involved_cases=self.list_at("actors.involved_cases", row),
+            source_chunk_ids=self.list_at("actors.source_chunk_ids", row)
+        )
+
+    def verb_phrase(self, row: int) -> VerbPhrase:
+        return VerbPhrase(
+            id=self.str_at("verbs.id", row),
+            verb=self.str_at("verbs.verb", row),
+            agent_id=self.str_at("verbs.agent_id", row),
+            patient_ids=self.list_at("verbs.patient_ids", row),
+            temporal_id=self.str_at("verbs.temporal_id", row),
+            spatial_id=self.str_at("verbs.spatial_id", row),
+            is_implicit=self.flag_at("verbs.is_implicit", row),
+            source_chunk_id=self.str_at("verbs.source_chunk_id", row)
+        )
+
+    def question(self, row: int) -> PredictiveQuestion:
+        return PredictiveQuestion(
+            id=self.str_at("questions.id", row),
+            question_text=self.str_at("questions.question_text", row),
+            question_type=QuestionType(self.str_at("questions.question_type", row)),
+            target_entity_id=self.str_at("questions.target_entity_id", row),
+            answerable=self.flag_at("questions.answerable", row),
+            answer_text=self.str_at("questions.answer_text", row),
+            answer_entity_id=self.str_at("questions.answer_entity_id", row),
+            source_chunk_id=self.str_at("questions.source_chunk_id", row),
+            answered_in_chunk_id=self.str_at("questions.answered_in_chunk_id", row)
+        )
+
+    def link(self, row: int) -> SpatioTemporalLink:
+        return SpatioTemporalLink(
+            id=self.str_at("links.id", row),
+            linked_entity_ids=self.list_at("links.linked_entity_ids", row),
+            tag_type=LinkType(self.str_at("links.tag_type", row)),
+            tag_value=self.str_at("links.tag_value", row),
+            source_chunk_id=self.str_at("links.source_chunk_id", row)
+        )
+
+
+class LazyEntityMap(MutableMapping):
+    """
+    Dict-like id -> entity map backed by snapshot rows.
+
+    Entities are materialised on first access and cached, so mutations
+    of a returned entity persist. Assignments and deletions are held in
+    memory; iteration order is snapshot order followed by new keys.
+    """
+
+    def __init__(self, reader: SnapshotReader, table: str,
+                 loader: Callable[[int], Any]):
+        self._reader = reader
+        self._table = table
+        self._loader = loader
+        self._row_count = reader.counts[table]
+        self._key_to_row: Optional[Dict[str, int]] = None
+        self._row_keys: Optional[List[str]] = None
+        self._cache: Dict[str, Any] = {}
+        self._extra_keys: Dict[str, None] = {}  # Keys not in the snapshot
+        self._deleted: set = set()
+
+    def _rows(self) -> Dict[str, int]:
+        if self._key_to_row is None:
+            self._row_keys = self._reader.keys(self._table)
+            self._key_to_row = {k: i for i, k in enumerate(self._row_keys)}
+        return self._key_to_row
+
+    def __getitem__(self, key: str) -> Any:
+        value = self._cache.get(key)
+        if value is not None:
+            return value
+        if key in self._deleted:
+            raise KeyError(key)
+        row = self._rows()[key]  # KeyError if absent
+        value = self._loader(row)
+        self._cache[key] = value
+        return value
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        self._cache[key] = value
+        self._deleted.discard(key)
+        if key not in self._rows():
+            self._extra_keys[key] = None
+
+    def __delitem__(self, key: str) -> None:
+        if key not in self:
+            raise KeyError(key)
+        self._cache.pop(key, None)
+        self._extra_keys.pop(key, None)
+        if key in self._rows():
+            self._deleted.add(key)
+
+    def __contains__(self, key: object) -> bool:
+        if key in self._deleted:
+            return False
+        return key in self._cache or key in self._rows()
+
+    def __iter__(self) -> Iterator[str]:
+        self._rows()
+        for key in self._row_keys:
+            if key not in self._deleted:
+                yield key
+        yield from list(self._extra_keys)
+
+    def __len__(self) -> int:
+        return self._row_count - len(self._deleted) + len(self._extra_keys)
+
+    def materialized_count(self) -> int:
+        """Number of entities that have been materialised or assigned."""
+        return len(self._cache)
+
+
+class SnapshotNameIndex(MutableMapping):
+    """
+    Lowercased name/alias -> actor id backed by the snapshot's sorted
+    names column. Names added after loading (add_actor) are held in memory
+    and take precedence.
+    """
+
+    def __init__(self, reader: SnapshotReader):
+        self._reader = reader
+        self._added: Dict[str, str] = {}
+        self._deleted: set = set()
+
+    def __getitem__(self, name: str) -> str:
+        if name in self._added:
+            return self._added[name]
+        actor_id = None if name in self._deleted else self._reader.find_name(name)
+        if actor_id is None:
+            raise KeyError(name)
+        return actor_id
+
+    def __setitem__(self, name: str, actor_id: str) -> None:
+        self._added[name] = actor_id
+        self._deleted.discard(name)
+
+    def __delitem__(self, name: str) -> None:
+        if name not in self:
+            raise KeyError(name)
+        self._added.pop(name, None)
+        self._deleted.add(name)
+
+    def __iter__(self) -> Iterator[str]:
+        reader = self._reader
+        for sid in reader.column("names.key"):
+            name = reader.string(sid)
+            if name not in self._added and name not in self._deleted:
+                yield name
+        yield from list(self._added)
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+
+def read_snapshot(path: Path) -> GlobalWorkspace:
+    """
+    Open a snapshot as a GlobalWorkspace with lazily materialised entities.
+
+    The returned workspace keeps the file mapped for its lifetime.
+    """
+    reader = SnapshotReader(path)
+
+    meta = reader.metadata
+    workspace = GlobalWorkspace(
+        created_at=meta["created_at"],
+        last_updated=meta["last_updated"],
+        chunk_count=meta["chunk_count"],
+        document_count=meta["document_count"],
+        domain=meta["domain"]
+    )
+    workspace.actors = LazyEntityMap(reader, "actors", reader.actor)
+    workspace.verb_phrases = LazyEntityMap(reader, "verbs", reader.verb_phrase)
+    workspace.questions = LazyEntityMap(reader, "questions", reader.question)
+    workspace.spatio_temporal_links = LazyEntityMap(reader, "links", reader.link)
+    # model_post_init ran on the empty workspace; fill the name lookup
+    workspace._name_to_actor_id = SnapshotNameIndex(reader)
+    workspace.entity_summaries = {
+        reader.str_at("summaries.key", i): reader.str_at("summaries.value", i)
+        for i in range(reader.counts["summaries"])
+    }
+    return workspace
+
+
+def is_snapshot(path: Path) -> bool:
+    """Check whether a file starts with the snapshot magic bytes."""
+    try:
+        with open(path, "rb") as f:
+            return f.read(len(SNAPSHOT_MAGIC)) == SNAPSHOT_MAGIC
+    except OSError:
+        return False
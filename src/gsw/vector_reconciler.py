@@ -5,22 +5,116 @@ Vector Reconciler
 Enhanced reconciler using vector embeddings for entity matching.
 """
 
-from typing import Dict, List
+import weakref
+from typing import Any, Dict, List, Optional, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from src.logic.gsw_schema import Actor, GlobalWorkspace
+
+from src.embeddings.embedding_service import (
+    EmbeddingCache, EmbeddingService, SentenceTransformerEncoder, VectorIndex
+)
 
 
 class VectorReconciler:
     """
     Enhanced reconciler using vector embeddings for entity matching.
 
-    Uses the existing vector_store.py for embedding-based similarity.
+    Workspace actors (name + aliases) are embedded once through the
+    cached EmbeddingService and held in a VectorIndex; the new actors of
+    a chunk are matched against all of them with one matrix multiply.
+    Between chunks only actors passed to add_actor since the last sync
+    are re-embedded.
     """
 
-    def __init__(self, embedding_model: str = "BAAI/bge-m3"):
+    def __init__(
+        self,
+        embedding_model: str = "BAAI/bge-m3",
+        service: Optional[EmbeddingService] = None,
+        threshold: float = 0.92
+    ):
+        """
+        Args:
+            embedding_model: sentence-transformers model (when no service given)
+            service: Embedding service (e.g. with a HashingEncoder for tests)
+            threshold: Minimum cosine similarity for a match
+        """
         self.embedding_model = embedding_model
-        self.embeddings: Dict[str, List[float]] = {}
+        self.service = service or EmbeddingService(
+            SentenceTransformerEncoder(embedding_model), cache=EmbeddingCache()
+        )
+        self.threshold = threshold
+        self.index = VectorIndex(self.service.dim)
+        self._indexed_text: Dict[str, str] = {}
+        self._workspace_ref: Optional[weakref.ref] = None
+        self._cursor = 0  # Position in the workspace's add_actor log
+
+    @staticmethod
+    def actor_text(actor: "Actor") -> str:
+        """Text embedded for an actor."""
+        return "; ".join([actor.name, *actor.aliases])
 
     def compute_similarity(self, text1: str, text2: str) -> float:
         """Compute semantic similarity between two texts."""
-        # This would use the sentence-transformers model
-        # Placeholder for now
-        return 0.0
+        first, second = self.service.embed([text1, text2])
+        return float(first @ second)
+
+    def sync(self, workspace: "GlobalWorkspace") -> None:
+        """Embed workspace actors that are new or changed since the last call."""
+        if self._workspace_ref is None or self._workspace_ref() is not workspace:
+            # A weak reference, since id() values are reused once a
+            # workspace is garbage collected
+            self.index = VectorIndex(self.service.dim)
+            self._indexed_text = {}
+            self._workspace_ref = weakref.ref(workspace)
+            _, self._cursor = workspace.actors_added_since(0)
+            actor_ids = list(workspace.actors)
+        else:
+            actor_ids, self._cursor = workspace.actors_added_since(self._cursor)
+            if len(self._indexed_text) + len(actor_ids) < len(workspace.actors):
+                # Actors inserted into the dict directly, bypassing add_actor
+                actor_ids = list(workspace.actors)
+
+        changed = {}
+        for actor_id in dict.fromkeys(actor_ids):
+            actor = workspace.actors.get(actor_id)
+            if actor is None:
+                continue
+            text = self.actor_text(actor)
+            if self._indexed_text.get(actor_id) != text:
+                changed[actor_id] = text
+        if changed:
+            self.index.add(list(changed), self.service.embed(list(changed.values())))
+            self._indexed_text.update(changed)
+
+    def match_entities(
+        self,
+        new_actors: List["Actor"],
+        workspace: "GlobalWorkspace",
+        threshold: Optional[float] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Match new actors to workspace actors by embedding similarity.
+
+        Returns matches in the EntityMatcher format (new_entity_id,
+        existing_entity_id, confidence, reason).
+        """
+        if not new_actors or not workspace.actors:
+            return []
+        threshold = self.threshold if threshold is None else threshold
+
+        self.sync(workspace)
+        queries = self.service.embed([self.actor_text(a) for a in new_actors])
+
+        matches = []
+        for actor, (existing_id, score) in zip(new_actors, self.index.best_match(queries)):
+            if existing_id is None or score < threshold:
+                continue
+            matches.append({
+                "new_entity_id": actor.id,
+                "existing_entity_id": existing_id,
+                "confidence": round(score, 4),
+                "reason": f"Embedding similarity {score:.2f}: {actor.name} -> "
+                          f"{workspace.actors[existing_id].name}"
+            })
+        return matches
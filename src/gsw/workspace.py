@@ -33,7 +33,7 @@ class WorkspaceManager:
     Manages the Global Semantic Workspace.
 
     Provides:
-    - Persistence (save/load to JSON)
+    - Persistence (save/load to JSON, TOON or binary snapshot)
     - Statistics and reporting
     - Ontology context extraction
     - Querying capabilities
@@ -57,6 +57,8 @@ class WorkspaceManager:
         # Auto-detect format
         if path.suffix == '.toon':
             return cls.load_toon(path)
+        elif path.suffix == '.gsws':
+            return cls.load_snapshot(path)
         else:
             return cls.load_json(path)
 
@@ -95,6 +97,24 @@ class WorkspaceManager:
 
         return manager
 
+    @classmethod
+    def load_snapshot(cls, path: Path) -> "WorkspaceManager":
+        """
+        Load workspace from a binary snapshot (.gsws).
+
+        The file is memory-mapped and entities are materialised lazily
+        on first access, so loading cost is independent of workspace size.
+        """
+        from src.gsw.snapshot import read_snapshot
+
+        workspace = read_snapshot(path)
+        manager = cls(workspace=workspace, storage_path=path)
+
+        print(f"[Workspace] Loaded snapshot: {len(workspace.actors)} actors, "
+              f"{len(workspace.questions)} questions")
+
+        return manager
+
     def save(self, path: Optional[Path] = None) -> None:
         """Save workspace to JSON file."""
         save_path = path or self.storage_path
@@ -105,8 +125,12 @@ class WorkspaceManager:
 
         data = self._serialize_workspace(self.workspace)
 
-        with open(save_path, 'w', encoding='utf-8') as f:
+        # Write to a temp file and swap it in, so a crash mid-write never
+        # leaves a truncated workspace behind
+        tmp_path = save_path.with_name(save_path.name + ".tmp")
+        with open(tmp_path, 'w', encoding='utf-8') as f:
             json.dump(data, f, indent=2, ensure_ascii=False)
+        tmp_path.replace(save_path)
 
         print(f"[Workspace] Saved to {save_path}")
 
@@ -136,37 +160,37 @@ class WorkspaceManager:
 
         print(f"[Workspace] Saved TOON to {save_path}")
 
-    def get_ontology_context(self) -> OntologyContext:
+    def save_snapshot(self, path: Optional[Path] = None) -> None:
         """
-        Extract current ontology context from workspace.
+        Save workspace to a binary columnar snapshot (.gsws).
 
-        This is used for the self-improving feedback loop (Phase 4.5).
-        The ontology context is injected into the Operator prompt.
+        Snapshots intern all strings and store entities as columns, and
+        are loaded with load_snapshot() via mmap.
         """
-        from collections import Counter
+        from src.gsw.snapshot import write_snapshot, SNAPSHOT_SUFFIX
 
-        context = OntologyContext()
+        save_path = path or self.storage_path
+        if not save_path:
+            raise ValueError("No storage path specified")
 
-        # Count actor types
-        for actor in self.workspace.actors.values():
-            context.actor_types[actor.actor_type.value] = \
-                context.actor_types.get(actor.actor_type.value, 0) + 1
+        # Force .gsws extension
+        save_path = save_path.with_suffix(SNAPSHOT_SUFFIX)
 
-            # Count roles
-            for role in actor.roles:
-                context.role_types[role] = context.role_types.get(role, 0) + 1
+        write_snapshot(self.workspace, save_path)
 
-            # Count state names
-            for state in actor.states:
-                context.state_names[state.name] = \
-                    context.state_names.get(state.name, 0) + 1
+        print(f"[Workspace] Saved snapshot to {save_path}")
+
+    def get_ontology_context(self) -> OntologyContext:
+        """
+        Extract current ontology context from workspace.
 
-        # Count verb types
-        for verb in self.workspace.verb_phrases.values():
-            context.verb_types[verb.verb] = \
-                context.verb_types.get(verb.verb, 0) + 1
+        This is used for the self-improving feedback loop (Phase 4.5).
+        The ontology context is injected into the Operator prompt.
 
-        return context
+        Counts come from the workspace's incrementally maintained
+        vocabulary counters, so this does not rescan the workspace.
+        """
+        return OntologyContext.from_vocabulary(self.workspace.get_vocabulary())
 
     def get_statistics(self) -> Dict[str, Any]:
         """Get comprehensive workspace statistics."""
@@ -204,21 +228,32 @@ class WorkspaceManager:
                         break
         return results
 
-    def get_timeline(self) -> List[Dict[str, Any]]:
-        """Get chronological timeline of events."""
+    def get_timeline(self, actor_id: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        Get chronological timeline of events.
+
+        Args:
+            actor_id: Only include actions this actor took part in
+        """
         events = []
 
+        if actor_id is not None:
+            verbs = self.workspace.get_actor_verbs(actor_id)
+        else:
+            verbs = self.workspace.verb_phrases.values()
+
         # Gather all dated items
-        for verb in self.workspace.verb_phrases.values():
+        for verb in verbs:
             if verb.temporal_id:
                 # Look up temporal entity
                 temporal = self.workspace.actors.get(verb.temporal_id)
                 if temporal:
+                    agent = self.workspace.actors.get(verb.agent_id) if verb.agent_id else None
                     events.append({
                         "date": temporal.name,
                         "type": "action",
                         "verb": verb.verb,
-                        "agent": self.workspace.actors.get(verb.agent_id, {}).get("name", "Unknown"),
+                        "agent": agent.name if agent else "Unknown",
                         "id": verb.id
                     })
 
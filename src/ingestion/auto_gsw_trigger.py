@@ -7,6 +7,7 @@ Uses a priority queue to process high-authority documents first.
 
 Key Features:
 - Authority-based priority queue (min_authority threshold)
+- Disk-backed queue (SQLite) holding document pointers, not documents
 - Smart sampling strategies (apex/appellate/trial courts)
 - Progress tracking and checkpointing
 - Batch processing for efficiency
@@ -20,20 +21,26 @@ Usage:
     from src.ingestion.auto_gsw_trigger import GSWExtractionQueue
 
     queue = GSWExtractionQueue(min_authority=60)
-    queue.add(doc, priority=85)
+    queue.add(doc, priority=85, location=DocumentLocation("corpus.jsonl", offset))
     batch = queue.process_batch(batch_size=10)
+    queue.save_checkpoint()
 """
 
+import hashlib
 import json
+import sqlite3
 import sys
+import threading
+import zlib
 from pathlib import Path
-from typing import Dict, List, Optional, Set, Any
-from queue import PriorityQueue
+from typing import BinaryIO, Dict, List, Optional, Any, Tuple
 from dataclasses import dataclass, field
 from datetime import datetime
 
 sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
 
+from src.utils.toon import ToonReader
+
 
 # ============================================================================
 # AUTHORITY THRESHOLDS
@@ -54,8 +61,12 @@ DEFAULT_MIN_AUTHORITY = 60
 
 @dataclass
 class QueueCheckpoint:
-    """Checkpoint state for GSW extraction queue."""
-    processed_ids: Set[str] = field(default_factory=set)
+    """
+    Checkpoint counters for GSW extraction queue.
+
+    Processed document ids live in the queue database, one row each,
+    so they are recorded incrementally rather than re-serialised.
+    """
     total_processed: int = 0
     total_queued: int = 0
     last_updated: str = ""
@@ -64,7 +75,6 @@ class QueueCheckpoint:
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for JSON serialization."""
         return {
-            "processed_ids": list(self.processed_ids),
             "total_processed": self.total_processed,
             "total_queued": self.total_queued,
             "last_updated": self.last_updated,
@@ -75,7 +85,6 @@ class QueueCheckpoint:
     def from_dict(cls, data: Dict[str, Any]) -> "QueueCheckpoint":
         """Load from dictionary."""
         return cls(
-            processed_ids=set(data.get("processed_ids", [])),
             total_processed=data.get("total_processed", 0),
             total_queued=data.get("total_queued", 0),
             last_updated=data.get("last_updated", ""),
@@ -83,16 +92,67 @@ class QueueCheckpoint:
         )
 
 
+# ============================================================================
+# DOCUMENT LOCATIONS
+# ============================================================================
+
+JSONL = "jsonl"  # One JSON document per line (corpus.jsonl)
+TOON = "toon"    # One row of a TOON table (classified domain files)
+
+
+@dataclass(frozen=True)
+class DocumentLocation:
+    """
+    Where a queued document's full text can be re-read from.
+
+    Attributes:
+        path: File holding the document
+        offset: Byte offset of its line (JSONL) or row (TOON)
+        format: JSONL or TOON
+        headers: Column names of the TOON table (TOON only)
+    """
+    path: str
+    offset: int
+    format: str = JSONL
+    headers: Tuple[str, ...] = ()
+
+
+def load_document(f: BinaryIO, location: DocumentLocation) -> Dict[str, Any]:
+    """Read one document back from a file opened in binary mode."""
+    if location.format == JSONL:
+        f.seek(location.offset)
+        return json.loads(f.readline())
+    if location.format == TOON:
+        from src.ingestion.toon_integration import convert_row_to_doc
+        return convert_row_to_doc(ToonReader.read_row_at(f, location.offset, list(location.headers)))
+    raise ValueError(f"Unknown document format: {location.format}")
+
+
 # ============================================================================
 # GSW EXTRACTION QUEUE
 # ============================================================================
 
+# Queue row states
+PENDING = 0
+TAKEN = 1  # Handed out by process_batch, not yet marked processed
+
+
 class GSWExtractionQueue:
     """
     Priority queue for GSW extraction based on authority score.
 
     Higher authority documents are processed first to ensure
     precedent-setting cases are analyzed with highest fidelity.
+
+    The queue is a SQLite file next to the checkpoint path. Documents
+    added with a DocumentLocation are stored as a pointer (file, byte
+    offset) plus their classification, and their text is read back when
+    they are dequeued, so memory use does not grow with the queue.
+    Documents added without a location are stored inline.
+
+    Queue changes and processed ids become durable at save_checkpoint().
+    Documents handed out but never marked processed are queued again
+    when the queue is reopened.
     """
 
     def __init__(
@@ -105,25 +165,79 @@ class GSWExtractionQueue:
 
         Args:
             min_authority: Minimum authority score to queue document (0-100)
-            checkpoint_path: Path to checkpoint file for resume capability
+            checkpoint_path: Path to checkpoint file for resume capability;
+                the queue database is stored beside it (suffix .sqlite)
         """
-        self.queue = PriorityQueue()
         self.min_authority = min_authority
-        self.checkpoint_path = checkpoint_path or Path("data/processed/gsw_queue_checkpoint.json")
+        self.checkpoint_path = Path(checkpoint_path or "data/processed/gsw_queue_checkpoint.json")
+        self.db_path = self.checkpoint_path.with_suffix(".sqlite")
 
         # Tracking
         self.checkpoint = QueueCheckpoint()
 
+        self._conn: Optional[sqlite3.Connection] = None
+        self._pending = 0
+        self._sources: Dict[Tuple[str, str, str], int] = {}  # (path, format, headers) -> source id
+        self._lock = threading.RLock()
+
         # Load checkpoint if exists
         self._load_checkpoint()
 
-    def add(self, doc: Dict[str, Any], priority: Optional[int] = None) -> bool:
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self.db_path), check_same_thread=False, timeout=30)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.executescript("""
+                CREATE TABLE IF NOT EXISTS sources (
+                    id INTEGER PRIMARY KEY,
+                    path TEXT NOT NULL,
+                    format TEXT NOT NULL,
+                    headers TEXT NOT NULL,
+                    UNIQUE (path, format, headers)
+                );
+                CREATE TABLE IF NOT EXISTS queue (
+                    doc_id TEXT PRIMARY KEY,
+                    priority REAL NOT NULL,
+                    state INTEGER NOT NULL,
+                    source INTEGER,
+                    offset INTEGER,
+                    classification TEXT,
+                    doc BLOB
+                );
+                CREATE INDEX IF NOT EXISTS idx_queue_order ON queue(state, priority DESC, doc_id);
+                CREATE TABLE IF NOT EXISTS processed (
+                    doc_id TEXT PRIMARY KEY
+                );
+                CREATE TABLE IF NOT EXISTS meta (
+                    key TEXT PRIMARY KEY,
+                    value TEXT NOT NULL
+                );
+            """)
+            # Handed out by a previous run but never processed: queue again
+            conn.execute("UPDATE queue SET state = ? WHERE state = ?", (PENDING, TAKEN))
+            conn.commit()
+            self._pending = conn.execute(
+                "SELECT COUNT(*) FROM queue WHERE state = ?", (PENDING,)
+            ).fetchone()[0]
+            self._conn = conn
+        return self._conn
+
+    def add(
+        self,
+        doc: Dict[str, Any],
+        priority: Optional[int] = None,
+        location: Optional[DocumentLocation] = None
+    ) -> bool:
         """
         Add document to queue if meets authority threshold.
 
         Args:
             doc: Document with _classification metadata
             priority: Optional override priority (default: use authority_score)
+            location: Where the document can be re-read from; when given,
+                only the pointer and classification are stored
 
         Returns:
             True if document was queued, False if rejected
@@ -141,12 +255,33 @@ class GSWExtractionQueue:
 
         # Check if already processed
         doc_id = self._get_doc_id(doc)
-        if doc_id in self.checkpoint.processed_ids:
+        if self._is_processed_id(doc_id):
             return False
 
-        # Add to queue (negative for max-heap behavior)
-        # PriorityQueue is min-heap, so negate for high-priority-first
-        self.queue.put((-effective_priority, doc_id, doc))
+        if location is not None:
+            source, offset = self._source_id(location), location.offset
+            stored_classification, stored_doc = json.dumps(classification), None
+        else:
+            source = offset = stored_classification = None
+            stored_doc = zlib.compress(json.dumps(doc, ensure_ascii=False).encode("utf-8"))
+
+        with self._lock:
+            conn = self._connect()
+            existing = conn.execute("SELECT state FROM queue WHERE doc_id = ?", (doc_id,)).fetchone()
+            if existing is None:
+                conn.execute(
+                    "INSERT INTO queue (doc_id, priority, state, source, offset, classification, doc) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (doc_id, effective_priority, PENDING, source, offset, stored_classification, stored_doc)
+                )
+                self._pending += 1
+            else:
+                # Queued again: latest priority and location win
+                conn.execute(
+                    "UPDATE queue SET priority = ?, source = ?, offset = ?, classification = ?, doc = ? "
+                    "WHERE doc_id = ?",
+                    (effective_priority, source, offset, stored_classification, stored_doc, doc_id)
+                )
 
         # Update stats
         self.checkpoint.total_queued += 1
@@ -160,20 +295,52 @@ class GSWExtractionQueue:
         """
         Get next batch of high-priority documents.
 
+        Document text is read back from its file here. Documents that can
+        no longer be read (file moved or rewritten) are skipped with a
+        warning and queued again when the queue is reopened.
+
         Args:
             batch_size: Number of documents to retrieve
 
         Returns:
             List of documents sorted by priority (highest first)
         """
-        batch = []
+        with self._lock:
+            conn = self._connect()
+            entries = conn.execute(
+                "SELECT doc_id, source, offset, classification, doc FROM queue "
+                "WHERE state = ? ORDER BY priority DESC, doc_id LIMIT ?",
+                (PENDING, max(batch_size, 0))
+            ).fetchall()
+            conn.executemany(
+                "UPDATE queue SET state = ? WHERE doc_id = ?",
+                [(TAKEN, entry[0]) for entry in entries]
+            )
+            self._pending -= len(entries)
 
-        for _ in range(min(batch_size, self.queue.qsize())):
-            if self.queue.empty():
-                break
-
-            _, doc_id, doc = self.queue.get()
-            batch.append(doc)
+        batch = []
+        files: Dict[str, BinaryIO] = {}
+        try:
+            for doc_id, source, offset, classification, stored_doc in entries:
+                try:
+                    if stored_doc is not None:
+                        batch.append(json.loads(zlib.decompress(stored_doc)))
+                        continue
+
+                    location = self._location(source, offset)
+                    if location.path not in files:
+                        files[location.path] = open(location.path, 'rb')
+                    doc = load_document(files[location.path], location)
+                    doc['_classification'] = json.loads(classification)
+                    if self._get_doc_id(doc) != doc_id:
+                        raise ValueError(f"found {self._get_doc_id(doc)!r} at offset {offset}")
+                    batch.append(doc)
+
+                except Exception as e:
+                    print(f"[Queue Warning] Could not load {doc_id}: {e}")
+        finally:
+            for f in files.values():
+                f.close()
 
         return batch
 
@@ -185,7 +352,14 @@ class GSWExtractionQueue:
             doc: Document that was processed
         """
         doc_id = self._get_doc_id(doc)
-        self.checkpoint.processed_ids.add(doc_id)
+        with self._lock:
+            conn = self._connect()
+            conn.execute("INSERT OR IGNORE INTO processed (doc_id) VALUES (?)", (doc_id,))
+            row = conn.execute("SELECT state FROM queue WHERE doc_id = ?", (doc_id,)).fetchone()
+            if row is not None:
+                conn.execute("DELETE FROM queue WHERE doc_id = ?", (doc_id,))
+                if row[0] == PENDING:
+                    self._pending -= 1
         self.checkpoint.total_processed += 1
         self.checkpoint.last_updated = datetime.now().isoformat()
 
@@ -199,16 +373,22 @@ class GSWExtractionQueue:
         Returns:
             True if already processed
         """
-        doc_id = self._get_doc_id(doc)
-        return doc_id in self.checkpoint.processed_ids
+        return self._is_processed_id(self._get_doc_id(doc))
+
+    def _is_processed_id(self, doc_id: str) -> bool:
+        with self._lock:
+            row = self._connect().execute("SELECT 1 FROM processed WHERE doc_id = ?", (doc_id,)).fetchone()
+        return row is not None
 
     def empty(self) -> bool:
         """Check if queue is empty."""
-        return self.queue.empty()
+        return self.qsize() == 0
 
     def qsize(self) -> int:
         """Get current queue size."""
-        return self.queue.qsize()
+        with self._lock:
+            self._connect()
+            return self._pending
 
     def get_statistics(self) -> Dict[str, Any]:
         """Get queue statistics."""
@@ -222,29 +402,79 @@ class GSWExtractionQueue:
         }
 
     def save_checkpoint(self) -> None:
-        """Save checkpoint to file."""
-        self.checkpoint_path.parent.mkdir(parents=True, exist_ok=True)
-
-        with open(self.checkpoint_path, 'w', encoding='utf-8') as f:
-            json.dump(self.checkpoint.to_dict(), f, indent=2)
+        """Commit queue changes, processed ids and counters."""
+        with self._lock:
+            conn = self._connect()
+            conn.execute(
+                "INSERT OR REPLACE INTO meta (key, value) VALUES ('checkpoint', ?)",
+                (json.dumps(self.checkpoint.to_dict()),)
+            )
+            conn.commit()
 
         print(f"[Queue] Checkpoint saved: {self.checkpoint.total_processed} processed")
 
-    def _load_checkpoint(self) -> None:
-        """Load checkpoint from file if exists."""
-        if not self.checkpoint_path.exists():
-            return
+    def close(self) -> None:
+        """Close the queue database without committing."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
 
+    def _load_checkpoint(self) -> None:
+        """Load checkpoint from the queue database, or import a JSON checkpoint."""
         try:
-            with open(self.checkpoint_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-
-            self.checkpoint = QueueCheckpoint.from_dict(data)
-            print(f"[Queue] Checkpoint loaded: {self.checkpoint.total_processed} previously processed")
+            if self.db_path.exists():
+                with self._lock:
+                    row = self._connect().execute(
+                        "SELECT value FROM meta WHERE key = 'checkpoint'"
+                    ).fetchone()
+                if row is not None:
+                    self.checkpoint = QueueCheckpoint.from_dict(json.loads(row[0]))
+                    print(f"[Queue] Checkpoint loaded: {self.checkpoint.total_processed} previously processed")
+                    return
+
+            if self.checkpoint_path.exists() and self.checkpoint_path.suffix == ".json":
+                self._import_json_checkpoint()
 
         except Exception as e:
             print(f"[Queue Warning] Could not load checkpoint: {e}")
 
+    def _import_json_checkpoint(self) -> None:
+        """Import a checkpoint written by the JSON-only queue (processed id list)."""
+        with open(self.checkpoint_path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+
+        self.checkpoint = QueueCheckpoint.from_dict(data)
+        with self._lock:
+            conn = self._connect()
+            conn.executemany(
+                "INSERT OR IGNORE INTO processed (doc_id) VALUES (?)",
+                ((doc_id,) for doc_id in data.get("processed_ids", []))
+            )
+        self.save_checkpoint()
+        print(f"[Queue] Checkpoint imported: {self.checkpoint.total_processed} previously processed")
+
+    def _source_id(self, location: DocumentLocation) -> int:
+        """Id of a location's file (and TOON headers), registered on first use."""
+        key = (location.path, location.format, json.dumps(list(location.headers)))
+        source = self._sources.get(key)
+        if source is None:
+            with self._lock:
+                conn = self._connect()
+                conn.execute("INSERT OR IGNORE INTO sources (path, format, headers) VALUES (?, ?, ?)", key)
+                source = conn.execute(
+                    "SELECT id FROM sources WHERE path = ? AND format = ? AND headers = ?", key
+                ).fetchone()[0]
+            self._sources[key] = source
+        return source
+
+    def _location(self, source: int, offset: int) -> DocumentLocation:
+        with self._lock:
+            path, format, headers = self._connect().execute(
+                "SELECT path, format, headers FROM sources WHERE id = ?", (source,)
+            ).fetchone()
+        return DocumentLocation(path, offset, format, tuple(json.loads(headers)))
+
     def _get_doc_id(self, doc: Dict[str, Any]) -> str:
         """
         Get unique identifier for document.
@@ -255,12 +485,13 @@ class GSWExtractionQueue:
         if citation:
             return citation.strip()
 
-        # Fallback: combine type + jurisdiction + snippet
+        # Fallback: combine type + jurisdiction + snippet (stable across runs)
         doc_type = doc.get('type', '')
         jurisdiction = doc.get('jurisdiction', '')
         text_snippet = doc.get('text', '')[:100] if doc.get('text') else ''
+        digest = hashlib.sha1(text_snippet.encode('utf-8')).hexdigest()[:16]
 
-        return f"{doc_type}_{jurisdiction}_{hash(text_snippet)}"
+        return f"{doc_type}_{jurisdiction}_{digest}"
 
 
 # ============================================================================
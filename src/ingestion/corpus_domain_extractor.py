@@ -19,6 +19,7 @@ Features:
 - Specialist court domain hints (Family, Federal, AAT, etc.)
 - Multi-domain tracking in metadata
 - Checkpoint/resume support
+- Parallel mode: byte-range shards classified in a process pool (--workers)
 - Comprehensive statistics collection (courts, legislation refs, case refs)
 
 Classification Output per Document:
@@ -33,9 +34,11 @@ Classification Output per Document:
 """
 
 import json
-import re
+import os
+import shutil
 import sys
 import argparse
+from multiprocessing import Pool
 from pathlib import Path
 from collections import Counter, defaultdict
 from dataclasses import dataclass, field, asdict
@@ -58,9 +61,10 @@ from src.ingestion.court_hierarchy import (
     COURT_CODES, get_court_info, get_authority_score,
     get_domain_hint, extract_court_from_citation
 )
-from src.ingestion.toon_integration import batch_to_toon, convert_doc_to_row, DOC_HEADERS
-from src.utils.toon import ToonEncoder
-from src.ingestion.auto_gsw_trigger import GSWExtractionQueue, SmartSampler
+from src.ingestion.keyword_automaton import KeywordAutomaton, count_leftmost_first
+from src.ingestion.toon_integration import convert_doc_to_row, DOC_HEADERS
+from src.utils.toon import ToonWriter
+from src.ingestion.auto_gsw_trigger import DocumentLocation, GSWExtractionQueue, SmartSampler
 
 
 # ============================================================================
@@ -72,9 +76,15 @@ DEFAULT_INPUT = BASE_DIR / "data" / "corpus.jsonl"
 DEFAULT_OUTPUT = BASE_DIR / "data" / "processed" / "domains"
 STATE_FILE = BASE_DIR / "data" / "processed" / "extraction_state.json"
 
+# Parallel mode: shards per worker (more shards -> better load balancing)
+SHARDS_PER_WORKER = 4
+
 # All broad domains we'll create files for
 ALL_DOMAINS = list(DOMAIN_MAPPING.keys()) + ["Legislation_Other", "Unclassified"]
 
+# Keyword automaton value tags
+KEYWORD, LEGISLATION, CASE, TITLE = range(4)
+
 
 # ============================================================================
 # DATA STRUCTURES
@@ -154,6 +164,35 @@ class DomainStats:
             "count": len(lengths)
         }
 
+    def merge(self, other: "DomainStats") -> None:
+        """Merge statistics from a later shard into this one."""
+        self.document_count += other.document_count
+        for name in ("by_type", "by_jurisdiction", "by_source", "by_category",
+                     "by_court", "by_court_level", "top_legislation_refs", "top_case_refs"):
+            getattr(self, name).update(getattr(other, name))
+        self.update_date_range(other.date_min)
+        self.update_date_range(other.date_max)
+        self.text_lengths.extend(other.text_lengths)
+        self.authority_scores.extend(other.authority_scores)
+        for citation in other.sample_citations:
+            self.add_sample_citation(citation)
+
+    def to_state(self) -> Dict[str, Any]:
+        """Lossless JSON-serialisable state (shard checkpoints)."""
+        return {
+            name: dict(value) if isinstance(value, dict) else list(value) if isinstance(value, list) else value
+            for name, value in vars(self).items()
+        }
+
+    @classmethod
+    def from_state(cls, data: Dict[str, Any]) -> "DomainStats":
+        """Rebuild from to_state() output."""
+        stats = cls(**data)
+        for name in ("by_type", "by_jurisdiction", "by_source", "by_category",
+                     "by_court", "by_court_level", "top_legislation_refs", "top_case_refs"):
+            setattr(stats, name, Counter(getattr(stats, name)))
+        return stats
+
 
 @dataclass
 class ExtractionState:
@@ -190,20 +229,76 @@ class OverlapStats:
                     pair = tuple(sorted([d1, d2]))
                     self.domain_pairs[str(pair)] += 1
 
+    def merge(self, other: "OverlapStats") -> None:
+        """Merge statistics from another shard."""
+        self.single_domain_count += other.single_domain_count
+        self.multi_domain_count += other.multi_domain_count
+        self.domain_pairs.update(other.domain_pairs)
+
+    def to_state(self) -> Dict[str, Any]:
+        """JSON-serialisable state (shard checkpoints)."""
+        return {
+            "single_domain_count": self.single_domain_count,
+            "multi_domain_count": self.multi_domain_count,
+            "domain_pairs": dict(self.domain_pairs),
+        }
+
+    @classmethod
+    def from_state(cls, data: Dict[str, Any]) -> "OverlapStats":
+        """Rebuild from to_state() output."""
+        stats = cls(**data)
+        stats.domain_pairs = Counter(stats.domain_pairs)
+        return stats
+
+
+@dataclass
+class ShardState:
+    """
+    Checkpoint state for one byte-range shard of a parallel extraction.
+
+    Output files written by the shard are recorded with their sizes at the
+    checkpoint, so a resumed shard truncates anything written after it.
+    """
+    index: int
+    start: int                  # First byte of the shard (line aligned)
+    end: int                    # Byte after the shard's last line
+    first_line: int             # Corpus line number of the first line
+    offset: int = 0             # Next unread byte
+    next_line: int = 0          # Corpus line number at offset
+    done: bool = False
+    stats: Dict[str, Any] = field(default_factory=dict)
+    overlap: Dict[str, Any] = field(default_factory=dict)
+    files: Dict[str, int] = field(default_factory=dict)
+    gsw_candidates: List[Tuple[int, int, Dict[str, Any]]] = field(default_factory=list)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "ShardState":
+        return cls(**data)
+
 
 # ============================================================================
 # CLASSIFICATION ENGINE
 # ============================================================================
 
 class DomainClassifier:
-    """Enhanced document classifier with multi-dimensional scoring."""
+    """
+    Enhanced document classifier with multi-dimensional scoring.
+
+    All category keywords, Act names and landmark case names are compiled
+    into one Aho-Corasick automaton, so each text is scanned once no matter
+    how large the vocabulary is. Per-category counts reproduce what
+    re.findall() over a per-category alternation regex would return.
+    """
 
     def __init__(self):
-        # Pre-compile regex patterns for performance
-        self.patterns: Dict[str, re.Pattern] = {}
-        for category, keywords in CLASSIFICATION_MAP.items():
-            pattern_str = "|".join([re.escape(k) for k in keywords])
-            self.patterns[category] = re.compile(pattern_str, re.IGNORECASE)
+        self.categories: List[str] = list(CLASSIFICATION_MAP.keys())
+        self.automaton = KeywordAutomaton()
+        for cat_idx, keywords in enumerate(CLASSIFICATION_MAP.values()):
+            for alt_idx, keyword in enumerate(keywords):
+                self.automaton.add(keyword.lower(), (KEYWORD, cat_idx, alt_idx))
 
         # Build category -> domain lookup
         self.category_to_domain: Dict[str, str] = {}
@@ -225,6 +320,24 @@ class DomainClassifier:
         # Keep for compatibility
         self.case_patterns = self.case_names
 
+        self._legislation_list = list(self.legislation_names.items())
+        for idx, (name_lower, _) in enumerate(self._legislation_list):
+            self.automaton.add(name_lower, (LEGISLATION, idx))
+
+        self._case_list = list(self.case_names.items())
+        for idx, (name_lower, _) in enumerate(self._case_list):
+            self.automaton.add(name_lower, (CASE, idx))
+
+        # Fallback title patterns: "<keyword> act" / "<keyword> regulation"
+        self._title_keywords = [list(keywords) for keywords in LEGISLATION_TITLE_PATTERNS.values()]
+        for domain_idx, keywords in enumerate(self._title_keywords):
+            for kw_idx, keyword in enumerate(keywords):
+                kw_lower = keyword.lower()
+                self.automaton.add(f"{kw_lower} act", (TITLE, domain_idx, kw_idx))
+                self.automaton.add(f"{kw_lower} regulation", (TITLE, domain_idx, kw_idx))
+
+        self.automaton.build()
+
     def classify(self, doc: Dict[str, Any]) -> Tuple[str, str, List[Tuple[str, int]], Dict]:
         """
         Classify a document into domains with enhanced metadata.
@@ -261,56 +374,102 @@ class DomainClassifier:
                 if domain_hint:
                     enhanced_meta['domain_hint'] = domain_hint
 
+        # Extract legislation and case references (limit text for speed)
+        search_text = f"{citation} {text[:5000]}"
+        search_text_lower = search_text.lower()
+        ref_hits = None
+
         # Different strategies for legislation vs decisions
         if doc_type in ['primary_legislation', 'secondary_legislation', 'bill']:
             primary_domain, primary_category, all_matches = self._classify_legislation(citation, jurisdiction)
         else:
+            window_lower = f"{citation} {text[:15000]}".lower()
+            window_hits = self.automaton.find_all(window_lower)
             primary_domain, primary_category, all_matches = self._classify_decision(
-                citation, text, jurisdiction, enhanced_meta
+                citation, text, jurisdiction, enhanced_meta,
+                search_text=window_lower, hits=window_hits
             )
+            # The reference window is a prefix of the classification window,
+            # so its matches are the ones that end inside it
+            if window_lower.startswith(search_text_lower):
+                limit = len(search_text_lower)
+                ref_hits = [hit for hit in window_hits if hit[1] <= limit]
 
-        # Extract legislation and case references (limit text for speed)
-        search_text = f"{citation} {text[:5000]}"
-        search_text_lower = search_text.lower()
+        if ref_hits is None:
+            ref_hits = self.automaton.find_all(search_text_lower)
 
-        leg_refs = self._extract_legislation_fast(search_text_lower)
+        leg_refs = self._extract_legislation_fast(search_text_lower, ref_hits)
         if leg_refs:
             enhanced_meta['legislation_refs'] = leg_refs[:10]
 
-        case_refs = self._extract_cases_fast(search_text_lower)
+        case_refs = self._extract_cases_fast(search_text_lower, ref_hits)
         if case_refs:
             enhanced_meta['case_refs'] = case_refs[:10]
 
         return primary_domain, primary_category, all_matches, enhanced_meta
 
-    def _extract_legislation_fast(self, text_lower: str) -> List[str]:
+    def _extract_legislation_fast(self, text_lower: str, hits: Optional[List] = None) -> List[str]:
         """Extract legislation references using pre-lowercased text."""
-        refs = []
+        if hits is None:
+            hits = self.automaton.find_all(text_lower)
 
         # 1. Specific Legislation
-        for name_lower, name_original in self.legislation_names.items():
-            if name_lower in text_lower:
-                refs.append(name_original)
+        found = self._exact_hits(text_lower, hits, LEGISLATION, self._legislation_list)
+        refs = [self._legislation_list[idx][1] for idx in sorted(found)]
 
         # 2. Fallback Patterns (if few specific refs found)
         if len(refs) < 3:
-            for domain, keywords in LEGISLATION_TITLE_PATTERNS.items():
-                for keyword in keywords:
-                    kw_lower = keyword.lower()
-                    # Simple check: keyword followed by "act" or "regulation"
-                    if f"{kw_lower} act" in text_lower or f"{kw_lower} regulation" in text_lower:
-                        refs.append(f"{keyword} Legislation")
-                        break # One per domain is enough to avoid noise
+            # Simple check: keyword followed by "act" or "regulation"
+            first_keyword: Dict[int, int] = {}
+            for _, _, values in hits:
+                for value in values:
+                    if value[0] == TITLE:
+                        _, domain_idx, kw_idx = value
+                        if kw_idx < first_keyword.get(domain_idx, kw_idx + 1):
+                            first_keyword[domain_idx] = kw_idx
+            # One per domain is enough to avoid noise
+            for domain_idx in sorted(first_keyword):
+                keyword = self._title_keywords[domain_idx][first_keyword[domain_idx]]
+                refs.append(f"{keyword} Legislation")
 
         return refs
 
-    def _extract_cases_fast(self, text_lower: str) -> List[str]:
+    def _extract_cases_fast(self, text_lower: str, hits: Optional[List] = None) -> List[str]:
         """Extract landmark case references using pre-lowercased text."""
-        refs = []
-        for name_lower, name_original in self.case_names.items():
-            if name_lower in text_lower:
-                refs.append(name_original)
-        return refs
+        if hits is None:
+            hits = self.automaton.find_all(text_lower)
+        found = self._exact_hits(text_lower, hits, CASE, self._case_list)
+        return [self._case_list[idx][1] for idx in sorted(found)]
+
+    @staticmethod
+    def _exact_hits(text_lower: str, hits: List, tag: int, names: List[Tuple[str, str]]) -> set:
+        """Indexes of names (tagged `tag`) occurring verbatim in the text."""
+        found = set()
+        verify = not text_lower.isascii()  # Automaton folds 'ſ'/'s' etc.
+        for start, end, values in hits:
+            for value in values:
+                if value[0] == tag and value[1] not in found:
+                    if not verify or text_lower[start:end] == names[value[1]][0]:
+                        found.add(value[1])
+        return found
+
+    def _category_counts(self, hits: List) -> Dict[int, int]:
+        """Per-category findall() counts (category index -> count)."""
+        spans: Dict[int, List[Tuple[int, int, int]]] = defaultdict(list)
+        for start, end, values in hits:
+            for value in values:
+                if value[0] == KEYWORD:
+                    spans[value[1]].append((start, value[2], end))
+        return {cat_idx: count_leftmost_first(s) for cat_idx, s in spans.items()}
+
+    def _categories_present(self, text_lower: str) -> set:
+        """Indexes of categories with at least one keyword in the text."""
+        return {
+            value[1]
+            for _, _, values in self.automaton.find_all(text_lower)
+            for value in values
+            if value[0] == KEYWORD
+        }
 
     def _classify_legislation(
         self,
@@ -331,9 +490,8 @@ class DomainClassifier:
 
         # 2. Exact Match (Category Keywords) - Fallback
         # This uses the massive keyword list designed for full text, which can be noisy for titles
-        for category, pattern in self.patterns.items():
-            if pattern.search(citation_lower):
-                scores[category] = 5  # Lower weight than title patterns
+        for cat_idx in sorted(self._categories_present(citation_lower)):
+            scores[self.categories[cat_idx]] = 5  # Lower weight than title patterns
 
         if scores:
             all_matches = scores.most_common()
@@ -348,24 +506,34 @@ class DomainClassifier:
         citation: str,
         text: str,
         jurisdiction: str,
-        enhanced_meta: Dict = None
+        enhanced_meta: Dict = None,
+        search_text: Optional[str] = None,
+        hits: Optional[List] = None
     ) -> Tuple[str, str, List[Tuple[str, int]]]:
-        """Classify court decisions with enhanced multi-dimensional scoring."""
+        """
+        Classify court decisions with enhanced multi-dimensional scoring.
+
+        search_text/hits may be passed in when the caller has already
+        scanned the window, so the text is only scanned once.
+        """
         scores = Counter()
 
         # Build searchable text (citation + first 15000 chars)
-        search_text = f"{citation} {text[:15000]}".lower()
+        if search_text is None:
+            search_text = f"{citation} {text[:15000]}".lower()
+        if hits is None:
+            hits = self.automaton.find_all(search_text)
         citation_lower = citation.lower()
 
-        for category, pattern in self.patterns.items():
-            matches = pattern.findall(search_text)
-            if not matches:
-                continue
+        counts = self._category_counts(hits)
+        in_citation = self._categories_present(citation_lower) if counts else set()
 
-            base_score = len(matches)
+        for cat_idx in sorted(counts):
+            category = self.categories[cat_idx]
+            base_score = counts[cat_idx]
 
             # BOOST 1: Citation match (strong indicator)
-            if pattern.search(citation_lower):
+            if cat_idx in in_citation:
                 base_score += 10
 
             # BOOST 2: Jurisdiction alignment
@@ -538,7 +706,10 @@ class BufferedToonFileManager:
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
-        # Flush all remaining buffers
+        self.flush()
+
+    def flush(self) -> None:
+        """Flush all remaining buffers."""
         for key in list(self.buffers.keys()):
             self._flush(key)
 
@@ -571,18 +742,59 @@ class BufferedToonFileManager:
             target_path = domain_dir / f"{domain}.toon"
             table_name = f"Cases_{domain}"
 
-        # Generate TOON block
-        toon_block = batch_to_toon(docs, table_name)
-
-        # Write to file
+        # Write one TOON block, row by row
         mode = 'a' if target_path.exists() else 'w'
-        with open(target_path, mode, encoding='utf-8') as f:
-            f.write(toon_block + "\n")
+        with open(target_path, mode, encoding='utf-8', newline='') as f:
+            ToonWriter(f, block_size=len(docs)).write_table(
+                table_name, DOC_HEADERS, (convert_doc_to_row(doc) for doc in docs)
+            )
 
         # Clear buffer
         self.buffers[key] = []
 
 
+# ============================================================================
+# PARALLEL SHARDS
+# ============================================================================
+
+class ShardGSWCollector:
+    """
+    Stands in for GSWExtractionQueue inside a shard worker.
+
+    Records (priority, byte offset, classification) instead of whole
+    documents; the parent queues them after merging.
+    """
+
+    def __init__(self, min_authority: int):
+        self.min_authority = min_authority
+        self.candidates: List[Tuple[int, int, Dict[str, Any]]] = []
+
+    def add(
+        self,
+        doc: Dict[str, Any],
+        priority: Optional[int] = None,
+        location: Optional[DocumentLocation] = None
+    ) -> bool:
+        self.candidates.append((priority, location.offset, doc['_classification']))
+        return True
+
+
+def _run_shard(task: Tuple[Dict[str, Any], Dict[str, Any]]) -> Dict[str, Any]:
+    """Process pool entry point: classify one shard, return its final state."""
+    shard_dict, options = task
+    shard = ShardState.from_dict(shard_dict)
+    extractor = CorpusDomainExtractor(
+        input_path=options["input_path"],
+        output_dir=Path(options["shard_root"]) / f"shard_{shard.index:04d}",
+        state_path=Path(options["state_dir"]) / f"shard_{shard.index:04d}.json"
+    )
+    if options["gsw_min_authority"] is not None:
+        extractor.enable_auto_gsw = True
+        extractor.sampler = SmartSampler()
+        extractor.gsw_queue = ShardGSWCollector(options["gsw_min_authority"])
+    return extractor._extract_shard(shard, options["checkpoint_interval"]).to_dict()
+
+
 # ============================================================================
 # MAIN EXTRACTOR
 # ============================================================================
@@ -617,11 +829,15 @@ class CorpusDomainExtractor:
         self.gsw_queue = gsw_queue or (GSWExtractionQueue(min_authority=gsw_min_authority) if enable_auto_gsw else None)
         self.sampler = SmartSampler() if enable_auto_gsw else None
 
+        # Byte offset of the corpus line being processed (GSW queue pointer)
+        self.line_offset = 0
+
     def extract_all(
         self,
         progress_interval: int = 5000,
         resume: bool = False,
-        limit: Optional[int] = None
+        limit: Optional[int] = None,
+        workers: int = 1
     ) -> Dict[str, DomainStats]:
         """
         Process entire corpus with streaming.
@@ -630,10 +846,15 @@ class CorpusDomainExtractor:
             progress_interval: Print progress every N documents
             resume: Whether to resume from checkpoint
             limit: Maximum number of documents to process (for testing)
+            workers: Worker processes; > 1 classifies byte-range shards in
+                parallel (ignored when limit is set)
 
         Returns:
             Dictionary of domain -> DomainStats
         """
+        if workers > 1 and not limit:
+            return self._extract_parallel(workers, progress_interval, resume)
+
         start_line = 0
         if resume:
             state = self._load_checkpoint()
@@ -649,8 +870,13 @@ class CorpusDomainExtractor:
         start_time = datetime.now()
 
         with BufferedToonFileManager(self.output_dir, append=resume) as file_manager:
-            with open(self.input_path, 'r', encoding='utf-8') as infile:
+            # Binary lines, so the GSW queue can point at them by byte offset
+            with open(self.input_path, 'rb') as infile:
+                offset = 0
                 for line_num, line in enumerate(infile):
+                    self.line_offset = offset
+                    offset += len(line)
+
                     # Skip lines if resuming
                     if line_num < start_line:
                         continue
@@ -762,7 +988,253 @@ class CorpusDomainExtractor:
             # Use smart sampler to determine priority
             priority = self.sampler.get_sampling_priority(doc)
             if priority >= self.gsw_queue.min_authority:
-                self.gsw_queue.add(doc, priority=priority)
+                location = DocumentLocation(str(self.input_path.resolve()), self.line_offset)
+                self.gsw_queue.add(doc, priority=priority, location=location)
+
+    # =========================================================================
+    # PARALLEL EXTRACTION
+    # =========================================================================
+
+    @property
+    def shard_state_dir(self) -> Path:
+        """Per-shard checkpoints live next to the sequential state file."""
+        return self.state_path.with_name(f"{self.state_path.stem}_shards")
+
+    @property
+    def shard_output_root(self) -> Path:
+        return self.output_dir / "_shards"
+
+    def _extract_parallel(
+        self,
+        workers: int,
+        progress_interval: int,
+        resume: bool,
+        num_shards: Optional[int] = None
+    ) -> Dict[str, DomainStats]:
+        """
+        Classify byte-range shards in a process pool, then merge.
+
+        Each shard writes its own TOON files and checkpoints independently.
+        Once all shards are done, statistics are merged and shard files are
+        concatenated in shard order, so rows keep the corpus line order.
+        """
+        state_dir = self.shard_state_dir
+        shards = self._load_shard_plan() if resume else None
+        if shards is None:
+            shutil.rmtree(state_dir, ignore_errors=True)
+            shutil.rmtree(self.shard_output_root, ignore_errors=True)
+            shards = self._plan_shards(num_shards or workers * SHARDS_PER_WORKER)
+            state_dir.mkdir(parents=True, exist_ok=True)
+            with open(state_dir / "manifest.json", 'w', encoding='utf-8') as f:
+                json.dump({
+                    "input_path": str(self.input_path),
+                    "input_size": self.input_path.stat().st_size,
+                    "shards": [s.to_dict() for s in shards]
+                }, f, indent=2)
+        else:
+            print(f"[Resume] {sum(s.done for s in shards)}/{len(shards)} shards already complete")
+
+        print(f"[Extractor] Input: {self.input_path}")
+        print(f"[Extractor] Output: {self.output_dir}")
+        print(f"[Extractor] Workers: {workers}, shards: {len(shards)}")
+        print("-" * 60)
+
+        start_time = datetime.now()
+        options = {
+            "input_path": str(self.input_path),
+            "shard_root": str(self.shard_output_root),
+            "state_dir": str(state_dir),
+            "checkpoint_interval": progress_interval,
+            "gsw_min_authority": self.gsw_queue.min_authority if self.enable_auto_gsw and self.gsw_queue else None,
+        }
+
+        pending = [(s.to_dict(), options) for s in shards if not s.done]
+        if pending:
+            with Pool(processes=min(workers, len(pending))) as pool:
+                for result in pool.imap_unordered(_run_shard, pending):
+                    finished = ShardState.from_dict(result)
+                    shards[finished.index] = finished
+                    docs = sum(d["document_count"] for d in finished.stats.values())
+                    print(f"[Shard {finished.index + 1}/{len(shards)}] {docs:,} docs")
+
+        self._merge_shards(shards)
+
+        elapsed = datetime.now() - start_time
+        print(f"\n[Complete] Processed {sum(s.document_count for s in self.stats.values())} documents in {elapsed}")
+
+        self._save_statistics()
+
+        shutil.rmtree(self.shard_output_root, ignore_errors=True)
+        shutil.rmtree(state_dir, ignore_errors=True)
+
+        return dict(self.stats)
+
+    def _plan_shards(self, num_shards: int) -> List[ShardState]:
+        """Split the input into line-aligned byte ranges and number their lines."""
+        size = self.input_path.stat().st_size
+        boundaries = [0]
+        with open(self.input_path, 'rb') as f:
+            for i in range(1, num_shards):
+                target = size * i // num_shards
+                if target <= boundaries[-1]:
+                    continue
+                f.seek(target - 1)
+                f.readline()  # Advance to the start of the next line
+                if boundaries[-1] < f.tell() < size:
+                    boundaries.append(f.tell())
+        boundaries.append(size)
+
+        # One streaming pass to count the lines before each boundary
+        first_lines = [0]
+        lines = 0
+        pos = 0
+        block_size = 16 * 1024 * 1024
+        with open(self.input_path, 'rb') as f:
+            for boundary in boundaries[1:-1]:
+                while pos < boundary:
+                    block = f.read(min(block_size, boundary - pos))
+                    lines += block.count(b"\n")
+                    pos += len(block)
+                first_lines.append(lines)
+
+        return [
+            ShardState(index=i, start=start, end=end, first_line=first_line,
+                       offset=start, next_line=first_line)
+            for i, (start, end, first_line) in enumerate(zip(boundaries, boundaries[1:], first_lines))
+        ]
+
+    def _load_shard_plan(self) -> Optional[List[ShardState]]:
+        """Load the shard plan and each shard's latest checkpoint."""
+        manifest_path = self.shard_state_dir / "manifest.json"
+        if not manifest_path.exists():
+            return None
+
+        try:
+            with open(manifest_path, 'r', encoding='utf-8') as f:
+                manifest = json.load(f)
+        except Exception as e:
+            print(f"[Warning] Could not load shard manifest: {e}")
+            return None
+
+        if manifest.get("input_size") != self.input_path.stat().st_size:
+            print("[Warning] Input changed since the shard plan was made; starting over")
+            return None
+
+        shards = []
+        for planned in manifest["shards"]:
+            shard = ShardState.from_dict(planned)
+            state_path = self.shard_state_dir / f"shard_{shard.index:04d}.json"
+            if state_path.exists():
+                with open(state_path, 'r', encoding='utf-8') as f:
+                    shard = ShardState.from_dict(json.load(f))
+            shards.append(shard)
+        return shards
+
+    def _extract_shard(self, shard: ShardState, checkpoint_interval: int) -> ShardState:
+        """Classify one shard (runs in a worker process)."""
+        # Resume: restore statistics and drop output written after the checkpoint
+        self.stats = defaultdict(DomainStats, {
+            d: DomainStats.from_state(s) for d, s in shard.stats.items()
+        })
+        if shard.overlap:
+            self.overlap_stats = OverlapStats.from_state(shard.overlap)
+        self._restore_shard_files(shard)
+        if isinstance(self.gsw_queue, ShardGSWCollector):
+            self.gsw_queue.candidates = [tuple(c) for c in shard.gsw_candidates]
+
+        processed = 0
+        with BufferedToonFileManager(self.output_dir, append=True) as file_manager:
+            with open(self.input_path, 'rb') as infile:
+                infile.seek(shard.offset)
+                offset, line_num = shard.offset, shard.next_line
+
+                while offset < shard.end:
+                    line = infile.readline()
+                    if not line:
+                        break
+                    self.line_offset = offset
+                    offset += len(line)
+
+                    try:
+                        doc = json.loads(line)
+                        self._process_document(doc, file_manager, line_num)
+                    except json.JSONDecodeError:
+                        pass
+                    except Exception as e:
+                        print(f"\n[Error] Line {line_num}: {e}")
+
+                    line_num += 1
+                    processed += 1
+
+                    if processed % checkpoint_interval == 0:
+                        file_manager.flush()
+                        self._save_shard_checkpoint(shard, offset, line_num)
+
+            file_manager.flush()
+
+        shard.done = True
+        self._save_shard_checkpoint(shard, offset, line_num)
+        return shard
+
+    def _save_shard_checkpoint(self, shard: ShardState, offset: int, line_num: int) -> None:
+        """Record shard progress, statistics and output file sizes."""
+        shard.offset = offset
+        shard.next_line = line_num
+        shard.stats = {d: s.to_state() for d, s in self.stats.items()}
+        shard.overlap = self.overlap_stats.to_state()
+        shard.files = {
+            str(path.relative_to(self.output_dir)): path.stat().st_size
+            for path in self.output_dir.rglob("*.toon")
+        }
+        if isinstance(self.gsw_queue, ShardGSWCollector):
+            shard.gsw_candidates = list(self.gsw_queue.candidates)
+
+        self.state_path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = self.state_path.with_suffix('.tmp')
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(shard.to_dict(), f)
+        os.replace(temp_path, self.state_path)
+
+    def _restore_shard_files(self, shard: ShardState) -> None:
+        """Truncate shard output back to the sizes recorded at the checkpoint."""
+        if not self.output_dir.exists():
+            return
+        for path in self.output_dir.rglob("*.toon"):
+            size = shard.files.get(str(path.relative_to(self.output_dir)))
+            if size is None:
+                path.unlink()
+            elif path.stat().st_size > size:
+                with open(path, 'r+b') as f:
+                    f.truncate(size)
+
+    def _merge_shards(self, shards: List[ShardState]) -> None:
+        """Merge shard statistics and outputs in shard (= line) order."""
+        for shard in shards:
+            for domain, data in shard.stats.items():
+                self.stats[domain].merge(DomainStats.from_state(data))
+            if shard.overlap:
+                self.overlap_stats.merge(OverlapStats.from_state(shard.overlap))
+
+        # Concatenate shard TOON files into the final outputs
+        for shard in shards:
+            shard_dir = self.shard_output_root / f"shard_{shard.index:04d}"
+            for relative in sorted(shard.files):
+                target_path = self.output_dir / relative
+                target_path.parent.mkdir(parents=True, exist_ok=True)
+                mode = 'ab' if target_path.exists() else 'wb'
+                with open(shard_dir / relative, 'rb') as src, open(target_path, mode) as dst:
+                    shutil.copyfileobj(src, dst)
+
+        # Queue GSW candidates in corpus order (as pointers to their lines)
+        if self.enable_auto_gsw and self.gsw_queue:
+            input_path = str(self.input_path.resolve())
+            with open(self.input_path, 'rb') as f:
+                for shard in shards:
+                    for priority, offset, classification in shard.gsw_candidates:
+                        f.seek(offset)
+                        doc = json.loads(f.readline())
+                        doc['_classification'] = classification
+                        self.gsw_queue.add(doc, priority=priority, location=DocumentLocation(input_path, offset))
 
     def _print_progress(self, line_num: int, start_time: datetime) -> None:
         """Print progress update."""
@@ -863,6 +1335,12 @@ def main():
         default=None,
         help="Limit number of documents to process"
     )
+    parser.add_argument(
+        "--workers", "-w",
+        type=int,
+        default=1,
+        help="Worker processes (>1 classifies byte-range shards in parallel)"
+    )
 
     args = parser.parse_args()
 
@@ -878,7 +1356,8 @@ def main():
     extractor.extract_all(
         progress_interval=args.progress,
         resume=args.resume,
-        limit=args.limit
+        limit=args.limit,
+        workers=args.workers
     )
 
 
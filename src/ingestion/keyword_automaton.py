@@ -0,0 +1,166 @@
+"""
+Keyword Automaton - Single-Pass Multi-Keyword Matching (Aho-Corasick)
+
+Matches every keyword of a large vocabulary in one pass over the text.
+Scan cost depends on text length and the number of hits, not on the
+number of keywords, so the 16k classification keywords, Act names and
+landmark case names can all be found at once.
+
+Usage:
+    automaton = KeywordAutomaton()
+    automaton.add("de facto", ("keyword", 0, 12))
+    automaton.add("family law act 1975", ("legislation", "Family Law Act 1975"))
+    automaton.build()
+
+    for start, end, values in automaton.find_all(text_lower):
+        ...
+
+Matching follows the classifier's regexes (re.IGNORECASE over lowercased
+text): characters that `re` treats as case-insensitively equal but that
+str.lower() leaves distinct (e.g. 'ſ' and 's') are folded together.
+"""
+
+from typing import Any, Dict, Iterable, List, Tuple
+
+try:
+    from re._casefix import _EXTRA_CASES
+except ImportError:  # Python < 3.11
+    _EXTRA_CASES = {}
+
+
+def _build_fold_table() -> Dict[int, int]:
+    """Map each extra case-insensitive equivalent to one canonical char."""
+    table = {}
+    for code, others in _EXTRA_CASES.items():
+        canonical = min((code,) + tuple(others))
+        for c in (code,) + tuple(others):
+            if c != canonical:
+                table[c] = canonical
+    return table
+
+
+FOLD_TABLE = _build_fold_table()
+
+
+def fold(text: str) -> str:
+    """Fold lowercased text so plain matching equals re.IGNORECASE matching."""
+    if text.isascii():
+        return text
+    return text.translate(FOLD_TABLE)
+
+
+def count_leftmost_first(spans: Iterable[Tuple[int, int, int]]) -> int:
+    """
+    Count the matches re.findall() would return for an alternation regex.
+
+    Args:
+        spans: (start, alternative_index, end) for every occurrence of every
+            alternative, overlapping or not
+
+    A regex scans left to right, takes the first alternative (in pattern
+    order) that matches at the earliest position, then resumes after it.
+    """
+    count = 0
+    pos = 0
+    for start, _, end in sorted(spans):
+        if start >= pos:
+            count += 1
+            pos = end
+    return count
+
+
+class KeywordAutomaton:
+    """
+    Aho-Corasick automaton over a fixed set of keywords.
+
+    Each keyword carries one or more values (e.g. which category it belongs
+    to); find_all() reports every occurrence, including overlapping ones.
+    """
+
+    def __init__(self):
+        self._ids: Dict[str, int] = {}
+        self._keywords: List[str] = []
+        self._values: List[List[Any]] = []
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._out: List[Tuple[int, ...]] = [()]
+        self._built = False
+
+    def add(self, keyword: str, value: Any) -> None:
+        """Add a (lowercase) keyword with a value reported on every match."""
+        if self._built:
+            raise RuntimeError("Cannot add keywords after build()")
+
+        folded = fold(keyword)
+        if not folded:
+            return
+
+        kid = self._ids.get(folded)
+        if kid is None:
+            kid = len(self._keywords)
+            self._ids[folded] = kid
+            self._keywords.append(folded)
+            self._values.append([])
+
+            state = 0
+            for ch in folded:
+                nxt = self._goto[state].get(ch)
+                if nxt is None:
+                    nxt = len(self._goto)
+                    self._goto[state][ch] = nxt
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._out.append(())
+                state = nxt
+            self._out[state] = (kid,)
+
+        self._values[kid].append(value)
+
+    def build(self) -> "KeywordAutomaton":
+        """Compute failure links (breadth-first) and merge outputs."""
+        goto, fail, out = self._goto, self._fail, self._out
+
+        queue = list(goto[0].values())
+        for state in queue:
+            for ch, nxt in goto[state].items():
+                f = fail[state]
+                while f and ch not in goto[f]:
+                    f = fail[f]
+                fail[nxt] = goto[f].get(ch, 0)
+                out[nxt] = out[nxt] + out[fail[nxt]]
+                queue.append(nxt)
+
+        self._values = [tuple(v) for v in self._values]
+        self._built = True
+        return self
+
+    def __len__(self) -> int:
+        return len(self._keywords)
+
+    def find_all(self, text: str) -> List[Tuple[int, int, Tuple[Any, ...]]]:
+        """
+        Find every keyword occurrence in lowercased text.
+
+        Returns:
+            (start, end, values) per occurrence, ordered by end position
+        """
+        if not self._built:
+            self.build()
+
+        goto, fail, out = self._goto, self._fail, self._out
+        keywords, values = self._keywords, self._values
+        hits = []
+        state = 0
+
+        for i, ch in enumerate(fold(text), 1):
+            nxt = goto[state].get(ch)
+            while nxt is None and state:
+                state = fail[state]
+                nxt = goto[state].get(ch)
+            state = nxt or 0
+
+            if out[state]:
+                for kid in out[state]:
+                    hits.append((i - len(keywords[kid]), i, values[kid]))
+
+        return hits
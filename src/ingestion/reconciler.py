@@ -125,10 +125,11 @@ class Reconciler:
         Matches new entities against the global vector store.
         UPDATED: Handles List input and List global store.
         """
-        for entity in new_entities:
-            # Generate text rep for vector search
-            text_rep = f"{entity.name} {entity.description or ''}"
-            
+        # Encode the chunk's entities in one batch (lookups below hit the cache)
+        text_reps = [f"{entity.name} {entity.description or ''}" for entity in new_entities]
+        self.vector_store.service.embed(text_reps)
+
+        for entity, text_rep in zip(new_entities, text_reps):
             # 1. Check Vector Store
             match_id = self.vector_store.find_similar_entity(text_rep)
             
@@ -48,6 +48,25 @@ def convert_doc_to_row(doc: Dict[str, Any]) -> List[str]:
         doc.get("text", "")  # Full text
     ]
 
+def convert_row_to_doc(row: Dict[str, str]) -> Dict[str, Any]:
+    """
+    Rebuild a classified document dictionary from a TOON row.
+    """
+    return {
+        'citation': row.get('citation', ''),
+        'text': row.get('text', ''),
+        'type': row.get('type', ''),
+        'jurisdiction': row.get('jurisdiction', ''),
+        '_classification': {
+            'primary_domain': row.get('domain', ''),
+            'authority_score': float(row.get('score') or 0),
+            'court': row.get('court', ''),
+            'court_level': row.get('court_level', ''),
+            'case_refs': row.get('case_refs', '').split('|') if row.get('case_refs') else [],
+            'legislation_refs': row.get('legislation_refs', '').split('|') if row.get('legislation_refs') else []
+        }
+    }
+
 def batch_to_toon(docs: List[Dict[str, Any]], table_name: str = "LegalDocs") -> str:
     """
     Convert a batch of documents to a TOON block.
@@ -0,0 +1,649 @@
+"""
+GSW Search Index - Inverted Index over Workspace Text
+
+Character trigram inverted index over the searchable text of a
+GlobalWorkspace (actor names, aliases, roles, states and types, verb
+phrases, question and answer text).
+
+Retrieval scoring in the GSW is substring based ("concept in text").
+Every substring occurrence of a concept contains all of the concept's
+trigrams, so intersecting trigram postings yields a candidate set that
+is a guaranteed superset of the matching entities. Callers re-score the
+candidates exactly, which keeps results identical to a full scan while
+only touching the postings of the query's concepts.
+
+Actors are additionally keyed by normalised name/alias and by role, so
+entity reconciliation can find exact and alias matches with hash lookups
+(see EntityMatcher.rule_based_reconcile).
+
+WorkspaceAdjacency holds the per-actor neighbourhoods (actor -> verb
+phrases and links, tag value -> links, target entity -> questions) used
+by entity summaries, timelines and spatio-temporal lookups.
+
+PendingQuestionIndex holds the unanswered questions keyed by the facts
+that can answer them (see QuestionAnswerer), so each reconciled chunk
+only looks at questions its dates, amounts and people are relevant to.
+
+WorkspaceVocabulary holds the frequency of every actor type, role, state
+name and verb (the ontology fed back into the Operator prompt), so the
+most common terms are read without recounting the workspace.
+
+All indexes are owned by GlobalWorkspace and kept in sync by its add_*
+methods (see GlobalWorkspace.get_search_index(), get_adjacency(),
+get_pending_questions() and get_vocabulary()).
+"""
+
+import heapq
+from collections import Counter, defaultdict
+from typing import Dict, Iterable, List, Optional, Set, Tuple, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from src.logic.gsw_schema import (
+        GlobalWorkspace, Actor, VerbPhrase, PredictiveQuestion,
+        SpatioTemporalLink
+    )
+
+
+NGRAM_SIZE = 3
+
+# Entity kinds held by the index
+ACTOR = "actor"
+VERB = "verb"
+QUESTION = "question"
+LINK = "link"
+
+# Question categories answerable from chunk facts (see QuestionAnswerer)
+WHEN = "when"    # answered by a date in the chunk
+WHO = "who"      # answered by a person whose role the question mentions
+VALUE = "value"  # answered by a monetary amount in the chunk
+
+# A "when" question is only answered by a chunk sharing one of its topics
+WHEN_TOPICS = ("separate", "marry", "divorce", "hear", "order", "file")
+
+
+def normalize_name(name: str) -> str:
+    """Normalised form of an actor name or alias used as a lookup key."""
+    return name.lower().strip()
+
+
+def text_ngrams(text: str, n: int = NGRAM_SIZE) -> Set[str]:
+    """Return the set of character n-grams of lowercased text."""
+    text = text.lower()
+    return {text[i:i + n] for i in range(len(text) - n + 1)}
+
+
+def question_category(q_text: str) -> Optional[str]:
+    """Answer category of lowercased question text (WHEN, WHO, VALUE or None)."""
+    if "when" in q_text:
+        return WHEN
+    if "who" in q_text:
+        return WHO
+    if "value" in q_text or "worth" in q_text:
+        return VALUE
+    return None
+
+
+def _set_keys(
+    postings: Dict[str, Set[str]], entity_id: str, old: Set[str], new: Set[str]
+) -> None:
+    """Move an entity from its old keys to its new keys."""
+    for key in old - new:
+        ids = postings.get(key)
+        if ids is not None:
+            ids.discard(entity_id)
+            if not ids:
+                del postings[key]
+    for key in new - old:
+        postings[key].add(entity_id)
+
+
+class WorkspaceSearchIndex:
+    """
+    Trigram postings for actors, verb phrases and questions.
+
+    Also tracks:
+    - Insertion ordinals, so candidates can be emitted in workspace order
+      (keeps tie-breaking identical to a dict scan)
+    - Actor -> verb phrase participation (agent or patient), so verbs can
+      be reached from matching actors without scanning all verbs
+    - Normalised actor names/aliases and lowercased roles -> actor ids,
+      the blocking keys for entity reconciliation
+    """
+
+    def __init__(self):
+        # kind -> gram -> entity ids
+        self._postings: Dict[str, Dict[str, Set[str]]] = {
+            ACTOR: defaultdict(set),
+            VERB: defaultdict(set),
+            QUESTION: defaultdict(set),
+        }
+        # kind -> entity id -> grams (needed to re-index on update)
+        self._entity_grams: Dict[str, Dict[str, Set[str]]] = {
+            ACTOR: {}, VERB: {}, QUESTION: {}
+        }
+        # kind -> entity id -> insertion ordinal
+        self._ordinals: Dict[str, Dict[str, int]] = {
+            ACTOR: {}, VERB: {}, QUESTION: {}
+        }
+        self._next_ordinal = 0
+
+        # actor id -> verb ids the actor participates in
+        self._actor_verbs: Dict[str, Set[str]] = defaultdict(set)
+        # verb id -> participating actor ids (needed to re-index on update)
+        self._verb_participants: Dict[str, Set[str]] = {}
+
+        # normalised name/alias -> actor ids, lowercased role -> actor ids
+        self._actor_names: Dict[str, Set[str]] = defaultdict(set)
+        self._actor_roles: Dict[str, Set[str]] = defaultdict(set)
+        # actor id -> (name keys, role keys) (needed to re-index on update)
+        self._actor_keys: Dict[str, Tuple[Set[str], Set[str]]] = {}
+
+    # =========================================================================
+    # BUILD / UPDATE
+    # =========================================================================
+
+    @classmethod
+    def build(cls, workspace: "GlobalWorkspace") -> "WorkspaceSearchIndex":
+        """Build an index over every entity currently in the workspace."""
+        index = cls()
+        for actor in workspace.actors.values():
+            index.index_actor(actor)
+        for verb in workspace.verb_phrases.values():
+            index.index_verb_phrase(verb)
+        for question in workspace.questions.values():
+            index.index_question(question)
+        return index
+
+    def index_actor(self, actor: "Actor") -> None:
+        """Add or re-index an actor."""
+        texts = [actor.name, actor.actor_type.value]
+        texts.extend(actor.aliases)
+        texts.extend(actor.roles)
+        texts.extend(f"{s.name} {s.value}" for s in actor.states)
+        self._set_grams(ACTOR, actor.id, texts)
+
+        names = {normalize_name(actor.name)}
+        names.update(normalize_name(alias) for alias in actor.aliases)
+        roles = {role.lower() for role in actor.roles}
+        old_names, old_roles = self._actor_keys.get(actor.id, (set(), set()))
+        _set_keys(self._actor_names, actor.id, old_names, names)
+        _set_keys(self._actor_roles, actor.id, old_roles, roles)
+        self._actor_keys[actor.id] = (names, roles)
+
+    def index_verb_phrase(self, verb: "VerbPhrase") -> None:
+        """Add or re-index a verb phrase and its participants."""
+        self._set_grams(VERB, verb.id, [verb.verb])
+
+        for actor_id in self._verb_participants.pop(verb.id, set()):
+            self._actor_verbs[actor_id].discard(verb.id)
+
+        participants = set(verb.patient_ids)
+        if verb.agent_id:
+            participants.add(verb.agent_id)
+        for actor_id in participants:
+            self._actor_verbs[actor_id].add(verb.id)
+        self._verb_participants[verb.id] = participants
+
+    def index_question(self, question: "PredictiveQuestion") -> None:
+        """Add or re-index a question (question text and answer text)."""
+        texts = [question.question_text]
+        if question.answer_text:
+            texts.append(question.answer_text)
+        self._set_grams(QUESTION, question.id, texts)
+
+    def _set_grams(self, kind: str, entity_id: str, texts: Iterable[str]) -> None:
+        """Replace the postings of one entity."""
+        grams: Set[str] = set()
+        for text in texts:
+            grams |= text_ngrams(text)
+
+        postings = self._postings[kind]
+        old_grams = self._entity_grams[kind].get(entity_id, set())
+        for gram in old_grams - grams:
+            ids = postings.get(gram)
+            if ids is not None:
+                ids.discard(entity_id)
+                if not ids:
+                    del postings[gram]
+        for gram in grams - old_grams:
+            postings[gram].add(entity_id)
+
+        self._entity_grams[kind][entity_id] = grams
+        if entity_id not in self._ordinals[kind]:
+            self._ordinals[kind][entity_id] = self._next_ordinal
+            self._next_ordinal += 1
+
+    # =========================================================================
+    # QUERY
+    # =========================================================================
+
+    def candidates(self, kind: str, concepts: Iterable[str]) -> List[str]:
+        """
+        Candidate entity ids that may contain any of the concepts.
+
+        Concepts shorter than the n-gram size cannot be resolved from the
+        postings and fall back to every entity of that kind. Returned ids
+        are ordered by insertion ordinal.
+        """
+        postings = self._postings[kind]
+        found: Set[str] = set()
+
+        for concept in concepts:
+            grams = text_ngrams(concept)
+            if not grams:
+                found = set(self._ordinals[kind])
+                break
+
+            # Intersect smallest postings first
+            lists = sorted(
+                (postings.get(g, set()) for g in grams), key=len
+            )
+            matched = set(lists[0])
+            for ids in lists[1:]:
+                if not matched:
+                    break
+                matched &= ids
+            found |= matched
+
+        return self.in_order(kind, found)
+
+    def actors_by_name(self, names: Iterable[str]) -> Set[str]:
+        """Actor ids whose name or an alias equals one of the (normalised) names."""
+        found: Set[str] = set()
+        for name in names:
+            found |= self._actor_names.get(name, set())
+        return found
+
+    def actors_by_role(self, roles: Iterable[str]) -> Set[str]:
+        """Actor ids holding one of the (lowercased) roles."""
+        found: Set[str] = set()
+        for role in roles:
+            found |= self._actor_roles.get(role, set())
+        return found
+
+    def verbs_for_actors(self, actor_ids: Iterable[str]) -> Set[str]:
+        """Verb ids in which any of the actors is agent or patient."""
+        verb_ids: Set[str] = set()
+        for actor_id in actor_ids:
+            verb_ids |= self._actor_verbs.get(actor_id, set())
+        return verb_ids
+
+    def in_order(self, kind: str, entity_ids: Iterable[str]) -> List[str]:
+        """Sort entity ids by their insertion ordinal."""
+        ordinals = self._ordinals[kind]
+        return sorted(
+            (eid for eid in entity_ids if eid in ordinals),
+            key=ordinals.__getitem__
+        )
+
+    def size(self, kind: str) -> int:
+        """Number of indexed entities of a kind."""
+        return len(self._ordinals[kind])
+
+    def is_stale(self, workspace: "GlobalWorkspace") -> bool:
+        """
+        Detect entities inserted into the workspace dicts directly,
+        bypassing the add_* methods.
+        """
+        return (
+            self.size(ACTOR) != len(workspace.actors)
+            or self.size(VERB) != len(workspace.verb_phrases)
+            or self.size(QUESTION) != len(workspace.questions)
+        )
+
+
+class WorkspaceAdjacency:
+    """
+    Per-actor neighbourhoods of a GlobalWorkspace.
+
+    Secondary indexes from an actor to the verb phrases it takes part in
+    (as agent and as patient) and the spatio-temporal links it belongs
+    to, from a tag value to its links, and from a target entity to the
+    questions about it. Neighbourhood queries cost O(degree) instead of
+    a scan over every verb, link or question.
+
+    Ids are returned in insertion order, so callers see entities in the
+    same order as a scan over the workspace dicts.
+    """
+
+    def __init__(self):
+        # kind -> entity id -> insertion ordinal
+        self._ordinals: Dict[str, Dict[str, int]] = {
+            VERB: {}, LINK: {}, QUESTION: {}
+        }
+        self._next_ordinal = 0
+
+        # actor id -> verb ids, per role
+        self._verbs_as_agent: Dict[str, Set[str]] = defaultdict(set)
+        self._verbs_as_patient: Dict[str, Set[str]] = defaultdict(set)
+        # verb id -> (agent keys, patient keys) (needed to re-index on update)
+        self._verb_keys: Dict[str, Tuple[Set[str], Set[str]]] = {}
+
+        # actor id -> link ids, tag value -> link ids
+        self._actor_links: Dict[str, Set[str]] = defaultdict(set)
+        self._tag_links: Dict[str, Set[str]] = defaultdict(set)
+        self._link_keys: Dict[str, Tuple[Set[str], Set[str]]] = {}
+
+        # target entity id -> question ids
+        self._entity_questions: Dict[str, Set[str]] = defaultdict(set)
+        self._question_keys: Dict[str, Set[str]] = {}
+
+    # =========================================================================
+    # BUILD / UPDATE
+    # =========================================================================
+
+    @classmethod
+    def build(cls, workspace: "GlobalWorkspace") -> "WorkspaceAdjacency":
+        """Build the indexes over every entity currently in the workspace."""
+        index = cls()
+        for verb in workspace.verb_phrases.values():
+            index.index_verb_phrase(verb)
+        for link in workspace.spatio_temporal_links.values():
+            index.index_link(link)
+        for question in workspace.questions.values():
+            index.index_question(question)
+        return index
+
+    def _add_ordinal(self, kind: str, entity_id: str) -> None:
+        if entity_id not in self._ordinals[kind]:
+            self._ordinals[kind][entity_id] = self._next_ordinal
+            self._next_ordinal += 1
+
+    def index_verb_phrase(self, verb: "VerbPhrase") -> None:
+        """Add or re-index a verb phrase's agent and patients."""
+        agents = {verb.agent_id} if verb.agent_id else set()
+        patients = set(verb.patient_ids)
+        old_agents, old_patients = self._verb_keys.get(verb.id, (set(), set()))
+        _set_keys(self._verbs_as_agent, verb.id, old_agents, agents)
+        _set_keys(self._verbs_as_patient, verb.id, old_patients, patients)
+        self._verb_keys[verb.id] = (agents, patients)
+        self._add_ordinal(VERB, verb.id)
+
+    def index_link(self, link: "SpatioTemporalLink") -> None:
+        """Add or re-index a spatio-temporal link's entities and tag value."""
+        actors = set(link.linked_entity_ids)
+        tags = {link.tag_value} if link.tag_value is not None else set()
+        old_actors, old_tags = self._link_keys.get(link.id, (set(), set()))
+        _set_keys(self._actor_links, link.id, old_actors, actors)
+        _set_keys(self._tag_links, link.id, old_tags, tags)
+        self._link_keys[link.id] = (actors, tags)
+        self._add_ordinal(LINK, link.id)
+
+    def index_question(self, question: "PredictiveQuestion") -> None:
+        """Add or re-index a question's target entity."""
+        targets = {question.target_entity_id} if question.target_entity_id else set()
+        _set_keys(self._entity_questions, question.id,
+                  self._question_keys.get(question.id, set()), targets)
+        self._question_keys[question.id] = targets
+        self._add_ordinal(QUESTION, question.id)
+
+    # =========================================================================
+    # QUERY
+    # =========================================================================
+
+    def _in_order(self, kind: str, entity_ids: Iterable[str]) -> List[str]:
+        return sorted(entity_ids, key=self._ordinals[kind].__getitem__)
+
+    def verbs_as_agent(self, actor_id: str) -> List[str]:
+        """Verb ids whose agent is the actor."""
+        return self._in_order(VERB, self._verbs_as_agent.get(actor_id, ()))
+
+    def verbs_as_patient(self, actor_id: str) -> List[str]:
+        """Verb ids with the actor among their patients."""
+        return self._in_order(VERB, self._verbs_as_patient.get(actor_id, ()))
+
+    def actor_verbs(self, actor_id: str) -> List[str]:
+        """Verb ids in which the actor is agent or patient."""
+        verb_ids = self._verbs_as_agent.get(actor_id, set()) | self._verbs_as_patient.get(actor_id, set())
+        return self._in_order(VERB, verb_ids)
+
+    def actor_links(self, actor_id: str) -> List[str]:
+        """Link ids that include the actor."""
+        return self._in_order(LINK, self._actor_links.get(actor_id, ()))
+
+    def tag_links(self, tag_value: str) -> List[str]:
+        """Link ids carrying the tag value."""
+        return self._in_order(LINK, self._tag_links.get(tag_value, ()))
+
+    def entity_questions(self, entity_id: str) -> List[str]:
+        """Question ids targeting the entity."""
+        return self._in_order(QUESTION, self._entity_questions.get(entity_id, ()))
+
+    def is_stale(self, workspace: "GlobalWorkspace") -> bool:
+        """
+        Detect entities inserted into the workspace dicts directly,
+        bypassing the add_* methods.
+        """
+        return (
+            len(self._ordinals[VERB]) != len(workspace.verb_phrases)
+            or len(self._ordinals[LINK]) != len(workspace.spatio_temporal_links)
+            or len(self._ordinals[QUESTION]) != len(workspace.questions)
+        )
+
+
+class PendingQuestionIndex:
+    """
+    Unanswered questions keyed by the chunk facts that can answer them.
+
+    - "when" questions by the WHEN_TOPICS they mention
+    - "who" questions by character trigram, since roles are matched as
+      substrings of the question text
+    - "value" questions as a single set
+
+    Questions in no category can never be answered from a chunk and are
+    not held. Answered questions are dropped when re-indexed.
+
+    Ids are returned in insertion order, as a scan over
+    GlobalWorkspace.get_unanswered_questions() would see them.
+    """
+
+    def __init__(self):
+        self._ordinals: Dict[str, int] = {}
+        # key ("when:<topic>", "who", "who:<gram>", "value") -> question ids
+        self._postings: Dict[str, Set[str]] = defaultdict(set)
+        self._keys: Dict[str, Set[str]] = {}
+
+    @classmethod
+    def build(cls, workspace: "GlobalWorkspace") -> "PendingQuestionIndex":
+        """Build the index over every question currently in the workspace."""
+        index = cls()
+        for question in workspace.questions.values():
+            index.index_question(question)
+        return index
+
+    def index_question(self, question: "PredictiveQuestion") -> None:
+        """Add or re-index a question (answered questions are removed)."""
+        keys: Set[str] = set()
+        if not question.answerable:
+            q_text = question.question_text.lower()
+            category = question_category(q_text)
+            if category == WHEN:
+                keys = {f"{WHEN}:{topic}" for topic in WHEN_TOPICS if topic in q_text}
+            elif category == WHO:
+                keys = {WHO} | {f"{WHO}:{gram}" for gram in text_ngrams(q_text)}
+            elif category == VALUE:
+                keys = {VALUE}
+        _set_keys(self._postings, question.id, self._keys.get(question.id, set()), keys)
+        self._keys[question.id] = keys
+        if question.id not in self._ordinals:
+            self._ordinals[question.id] = len(self._ordinals)
+
+    def when_questions(self, topics: Iterable[str]) -> Set[str]:
+        """Pending "when" questions mentioning any of the topics."""
+        found: Set[str] = set()
+        for topic in topics:
+            found |= self._postings.get(f"{WHEN}:{topic}", set())
+        return found
+
+    def who_candidates(self, role: str) -> Set[str]:
+        """
+        Pending "who" questions that may contain the role (a superset:
+        callers check the substring).
+        """
+        grams = text_ngrams(role)
+        if not grams:
+            return set(self._postings.get(WHO, ()))
+        postings = sorted((self._postings.get(f"{WHO}:{g}", set()) for g in grams), key=len)
+        return set(postings[0]).intersection(*postings[1:])
+
+    def value_questions(self) -> Set[str]:
+        """Pending "value" questions."""
+        return set(self._postings.get(VALUE, ()))
+
+    def in_order(self, question_ids: Iterable[str]) -> List[str]:
+        """Sort question ids by insertion ordinal."""
+        return sorted(question_ids, key=self._ordinals.__getitem__)
+
+    def is_stale(self, workspace: "GlobalWorkspace") -> bool:
+        """
+        Detect questions inserted into the workspace dict directly,
+        bypassing add_question.
+        """
+        return len(self._ordinals) != len(workspace.questions)
+
+
+class RankedCounter:
+    """
+    Frequency counter with cheap top-N reads.
+
+    Keys are grouped into buckets by count. A +1/-1 update moves a key
+    between adjacent buckets in O(1); top(n) walks buckets from the
+    highest count down and stops once n keys are found. Ties are broken
+    by the time a key last went from zero to a nonzero count: a key that
+    drops to zero and comes back ranks after keys that stayed counted.
+    """
+
+    def __init__(self):
+        # key -> count, in order of reaching a nonzero count
+        self.counts: Dict[str, int] = {}
+        self._ordinals: Dict[str, int] = {}
+        self._next_ordinal = 0
+        # count -> keys with that count
+        self._buckets: Dict[int, Set[str]] = defaultdict(set)
+
+    def increment(self, key: str) -> None:
+        count = self.counts.get(key, 0)
+        if count:
+            self._leave(count, key)
+        else:
+            self._ordinals[key] = self._next_ordinal
+            self._next_ordinal += 1
+        self.counts[key] = count + 1
+        self._buckets[count + 1].add(key)
+
+    def decrement(self, key: str) -> None:
+        count = self.counts.get(key, 0)
+        if not count:
+            return
+        self._leave(count, key)
+        if count == 1:
+            del self.counts[key]
+            del self._ordinals[key]
+        else:
+            self.counts[key] = count - 1
+            self._buckets[count - 1].add(key)
+
+    def _leave(self, count: int, key: str) -> None:
+        bucket = self._buckets[count]
+        bucket.discard(key)
+        if not bucket:
+            del self._buckets[count]
+
+    def top(self, n: int) -> List[str]:
+        """The n most frequent keys, most frequent first."""
+        result: List[str] = []
+        ordinal = self._ordinals.__getitem__
+        for count in sorted(self._buckets, reverse=True):
+            if len(result) >= n:
+                break
+            bucket = self._buckets[count]
+            need = n - len(result)
+            if len(bucket) <= need:
+                result.extend(sorted(bucket, key=ordinal))
+            else:
+                result.extend(heapq.nsmallest(need, bucket, key=ordinal))
+        return result
+
+
+# Vocabulary categories (OntologyContext field names)
+VOCABULARY_CATEGORIES = ("actor_types", "role_types", "state_names", "verb_types")
+
+
+class WorkspaceVocabulary:
+    """
+    Frequency of every actor type, role, state name and verb in a
+    GlobalWorkspace.
+
+    Re-indexing an actor or verb phrase (e.g. after a merge added roles
+    or states) applies only the difference from its previous terms.
+    """
+
+    def __init__(self):
+        self.counters: Dict[str, RankedCounter] = {
+            category: RankedCounter() for category in VOCABULARY_CATEGORIES
+        }
+        # actor id -> (actor type, roles, state names) as last counted
+        self._actor_terms: Dict[str, Tuple[Tuple[str, ...], Tuple[str, ...], Tuple[str, ...]]] = {}
+        # verb id -> verb as last counted
+        self._verb_terms: Dict[str, str] = {}
+
+    @classmethod
+    def build(cls, workspace: "GlobalWorkspace") -> "WorkspaceVocabulary":
+        """Count the vocabulary of every actor and verb phrase in the workspace."""
+        vocabulary = cls()
+        for actor in workspace.actors.values():
+            vocabulary.index_actor(actor)
+        for verb in workspace.verb_phrases.values():
+            vocabulary.index_verb_phrase(verb)
+        return vocabulary
+
+    def index_actor(self, actor: "Actor") -> None:
+        """Add or re-count an actor's type, roles and state names."""
+        terms = (
+            (actor.actor_type.value,),
+            tuple(actor.roles),
+            tuple(state.name for state in actor.states)
+        )
+        old = self._actor_terms.get(actor.id, ((), (), ()))
+        if terms == old:
+            return
+        for category, new_keys, old_keys in zip(VOCABULARY_CATEGORIES, terms, old):
+            self._update(category, old_keys, new_keys)
+        self._actor_terms[actor.id] = terms
+
+    def index_verb_phrase(self, verb: "VerbPhrase") -> None:
+        """Add or re-count a verb phrase's verb."""
+        old = self._verb_terms.get(verb.id)
+        if old == verb.verb:
+            return
+        self._update("verb_types", (old,) if old is not None else (), (verb.verb,))
+        self._verb_terms[verb.id] = verb.verb
+
+    def _update(self, category: str, old_keys: Iterable[str], new_keys: Iterable[str]) -> None:
+        """Apply the net change between two term lists."""
+        counter = self.counters[category]
+        delta = Counter(new_keys)
+        delta.subtract(old_keys)
+        for key, change in delta.items():
+            for _ in range(change):
+                counter.increment(key)
+            for _ in range(-change):
+                counter.decrement(key)
+
+    def counts(self, category: str) -> Dict[str, int]:
+        """Live term -> frequency dict of a category (do not modify)."""
+        return self.counters[category].counts
+
+    def top(self, category: str, n: int) -> List[str]:
+        """The n most frequent terms of a category."""
+        return self.counters[category].top(n)
+
+    def is_stale(self, workspace: "GlobalWorkspace") -> bool:
+        """
+        Detect actors or verb phrases inserted into the workspace dicts
+        directly, bypassing add_actor/add_verb_phrase.
+        """
+        return (
+            len(self._actor_terms) != len(workspace.actors)
+            or len(self._verb_terms) != len(workspace.verb_phrases)
+        )
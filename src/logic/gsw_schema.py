@@ -8,11 +8,18 @@ Based on: arXiv:2511.07587 - Functional Structure of Episodic Memory
 """
 
 from pydantic import BaseModel, Field, PrivateAttr
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple, TYPE_CHECKING
 from enum import Enum
 from uuid import uuid4
 from datetime import datetime
 
+from src.logic.gsw_index import (
+    PendingQuestionIndex, WorkspaceAdjacency, WorkspaceVocabulary, VOCABULARY_CATEGORIES
+)
+
+if TYPE_CHECKING:
+    from src.logic.gsw_index import WorkspaceSearchIndex
+
 
 # ============================================================================
 # ENUMS - Type Classifications
@@ -247,10 +254,22 @@ class GlobalWorkspace(BaseModel):
 
     # Index structures for fast lookup (private, not serialized)
     _name_to_actor_id: Dict[str, str] = PrivateAttr(default_factory=dict)
+    _search_index: Optional["WorkspaceSearchIndex"] = PrivateAttr(default=None)
+    _adjacency: Optional[WorkspaceAdjacency] = PrivateAttr(default=None)
+    _pending_questions: Optional[PendingQuestionIndex] = PrivateAttr(default=None)
+    _vocabulary: Optional[WorkspaceVocabulary] = PrivateAttr(default=None)
+    _version: int = PrivateAttr(default=0)
+    _actor_log: List[str] = PrivateAttr(default_factory=list)  # ids passed to add_actor, in order
 
     def model_post_init(self, __context) -> None:
         """Rebuild index after loading from JSON."""
         self._name_to_actor_id = {}
+        self._search_index = None
+        self._pending_questions = None
+        self._vocabulary = None
+        self._adjacency = WorkspaceAdjacency.build(self)
+        self._version = 0
+        self._actor_log = []
         for actor_id, actor in self.actors.items():
             self._name_to_actor_id[actor.name.lower()] = actor_id
             for alias in actor.aliases:
@@ -262,28 +281,157 @@ class GlobalWorkspace(BaseModel):
         self._name_to_actor_id[actor.name.lower()] = actor.id
         for alias in actor.aliases:
             self._name_to_actor_id[alias.lower()] = actor.id
+        if self._search_index is not None:
+            self._search_index.index_actor(actor)
+        if self._vocabulary is not None:
+            self._vocabulary.index_actor(actor)
+        self._actor_log.append(actor.id)
+        self._version += 1
         return actor.id
 
     def add_verb_phrase(self, verb: VerbPhrase) -> str:
         """Add a verb phrase to the workspace."""
         self.verb_phrases[verb.id] = verb
+        if self._search_index is not None:
+            self._search_index.index_verb_phrase(verb)
+        if self._vocabulary is not None:
+            self._vocabulary.index_verb_phrase(verb)
+        self._adjacency.index_verb_phrase(verb)
+        self._version += 1
         return verb.id
 
     def add_question(self, question: PredictiveQuestion) -> str:
         """Add a predictive question to the workspace."""
         self.questions[question.id] = question
+        if self._search_index is not None:
+            self._search_index.index_question(question)
+        if self._pending_questions is not None:
+            self._pending_questions.index_question(question)
+        self._adjacency.index_question(question)
+        self._version += 1
         return question.id
 
+    def answer_question(
+        self,
+        question_id: str,
+        answer_text: str,
+        answer_entity_id: Optional[str] = None,
+        answered_in_chunk_id: Optional[str] = None
+    ) -> bool:
+        """Mark a question as answered. Returns False if it doesn't exist."""
+        question = self.questions.get(question_id)
+        if question is None:
+            return False
+        question.answerable = True
+        question.answer_text = answer_text
+        question.answer_entity_id = answer_entity_id
+        question.answered_in_chunk_id = answered_in_chunk_id
+        if self._search_index is not None:
+            self._search_index.index_question(question)
+        if self._pending_questions is not None:
+            self._pending_questions.index_question(question)
+        self._version += 1
+        return True
+
     def add_spatio_temporal_link(self, link: SpatioTemporalLink) -> str:
         """Add a spatio-temporal link to the workspace."""
         self.spatio_temporal_links[link.id] = link
+        self._adjacency.index_link(link)
+        self._version += 1
         return link.id
 
     def add_state(self, state: State) -> str:
         """Add a state to the workspace."""
         self.states[state.id] = state
+        self._version += 1
         return state.id
 
+    @property
+    def version(self) -> int:
+        """
+        Monotonic change counter, bumped by every add_* and answer_question
+        call. Derived structures (e.g. VSA scene vectors) cache on it.
+        """
+        return self._version
+
+    def actors_added_since(self, cursor: int) -> Tuple[List[str], int]:
+        """
+        Ids passed to add_actor after position `cursor` of the change log,
+        and the new cursor. Consumers that cache per-actor data (e.g. actor
+        embeddings) keep the cursor to pick up new and re-added actors
+        without rescanning the workspace.
+        """
+        return self._actor_log[cursor:], len(self._actor_log)
+
+    def get_search_index(self) -> "WorkspaceSearchIndex":
+        """
+        Get the inverted search index, building it on first use.
+
+        The index is kept in sync by add_actor/add_verb_phrase/add_question
+        and answer_question. Entities inserted directly into the dicts
+        trigger a rebuild on the next call.
+        """
+        from src.logic.gsw_index import WorkspaceSearchIndex
+
+        if self._search_index is None or self._search_index.is_stale(self):
+            self._search_index = WorkspaceSearchIndex.build(self)
+        return self._search_index
+
+    def get_adjacency(self) -> WorkspaceAdjacency:
+        """
+        Get the per-actor adjacency indexes.
+
+        Kept in sync by add_verb_phrase/add_question/add_spatio_temporal_link;
+        entities inserted directly into the dicts trigger a rebuild on the
+        next call.
+        """
+        if self._adjacency.is_stale(self):
+            self._adjacency = WorkspaceAdjacency.build(self)
+        return self._adjacency
+
+    def get_pending_questions(self) -> PendingQuestionIndex:
+        """
+        Get the unanswered-question index, building it on first use.
+
+        Kept in sync by add_question and answer_question; questions
+        inserted directly into the dict trigger a rebuild on the next call.
+        """
+        if self._pending_questions is None or self._pending_questions.is_stale(self):
+            self._pending_questions = PendingQuestionIndex.build(self)
+        return self._pending_questions
+
+    def get_vocabulary(self) -> WorkspaceVocabulary:
+        """
+        Get the ontology vocabulary counters, building them on first use.
+
+        Kept in sync by add_actor and add_verb_phrase (actors changed in
+        place, e.g. merged, must be re-added); entities inserted directly
+        into the dicts trigger a rebuild on the next call.
+        """
+        if self._vocabulary is None or self._vocabulary.is_stale(self):
+            self._vocabulary = WorkspaceVocabulary.build(self)
+        return self._vocabulary
+
+    def get_actor_verbs(self, actor_id: str) -> List[VerbPhrase]:
+        """Verb phrases in which the actor is agent or patient."""
+        return [self.verb_phrases[vid] for vid in self.get_adjacency().actor_verbs(actor_id)]
+
+    def get_verbs_as_agent(self, actor_id: str) -> List[VerbPhrase]:
+        """Verb phrases performed by the actor."""
+        return [self.verb_phrases[vid] for vid in self.get_adjacency().verbs_as_agent(actor_id)]
+
+    def get_verbs_as_patient(self, actor_id: str) -> List[VerbPhrase]:
+        """Verb phrases affecting the actor."""
+        return [self.verb_phrases[vid] for vid in self.get_adjacency().verbs_as_patient(actor_id)]
+
+    def get_actor_links(self, actor_id: str) -> List[SpatioTemporalLink]:
+        """Spatio-temporal links that include the actor."""
+        return [self.spatio_temporal_links[lid] for lid in self.get_adjacency().actor_links(actor_id)]
+
+    def get_questions_about(self, entity_id: str) -> List[PredictiveQuestion]:
+        """Questions whose target is the entity."""
+        return [self.questions[qid] for qid in self.get_adjacency().entity_questions(entity_id)]
+
     def find_actor_by_name(self, name: str) -> Optional[Actor]:
         """Find actor by name or alias."""
         actor_id = self._name_to_actor_id.get(name.lower())
@@ -299,17 +447,17 @@ class GlobalWorkspace(BaseModel):
 
     def get_entities_at_time(self, temporal_value: str) -> List[Actor]:
         """Get all actors linked to a specific time."""
-        actor_ids = set()
-        for link in self.spatio_temporal_links.values():
-            if link.tag_type == LinkType.TEMPORAL and link.tag_value == temporal_value:
-                actor_ids.update(link.linked_entity_ids)
-        return [self.actors[aid] for aid in actor_ids if aid in self.actors]
+        return self._entities_tagged(LinkType.TEMPORAL, temporal_value)
 
     def get_entities_at_location(self, spatial_value: str) -> List[Actor]:
         """Get all actors linked to a specific location."""
+        return self._entities_tagged(LinkType.SPATIAL, spatial_value)
+
+    def _entities_tagged(self, tag_type: LinkType, tag_value: str) -> List[Actor]:
         actor_ids = set()
-        for link in self.spatio_temporal_links.values():
-            if link.tag_type == LinkType.SPATIAL and link.tag_value == spatial_value:
+        for link_id in self.get_adjacency().tag_links(tag_value):
+            link = self.spatio_temporal_links[link_id]
+            if link.tag_type == tag_type:
                 actor_ids.update(link.linked_entity_ids)
         return [self.actors[aid] for aid in actor_ids if aid in self.actors]
 
@@ -330,6 +478,26 @@ class GlobalWorkspace(BaseModel):
             "last_updated": self.last_updated
         }
 
+    def materialize(self) -> None:
+        """
+        Replace lazily-loaded entity maps (see src/gsw/snapshot.py) with
+        plain dicts, loading every entity.
+        """
+        for field in ("actors", "verb_phrases", "questions", "spatio_temporal_links"):
+            entities = getattr(self, field)
+            if not isinstance(entities, dict):
+                setattr(self, field, dict(entities.items()))
+
+    def model_dump(self, **kwargs) -> Dict[str, Any]:
+        """Dump to a dict, materializing lazily-loaded entities first."""
+        self.materialize()
+        return super().model_dump(**kwargs)
+
+    def model_dump_json(self, **kwargs) -> str:
+        """Dump to JSON, materializing lazily-loaded entities first."""
+        self.materialize()
+        return super().model_dump_json(**kwargs)
+
     def touch(self) -> None:
         """Update the last_updated timestamp."""
         self.last_updated = datetime.now().isoformat()
@@ -409,8 +577,28 @@ class OntologyContext(BaseModel):
     standard_states: List[str] = Field(default_factory=list)
     standard_verbs: List[str] = Field(default_factory=list)
 
+    # Live counters this context reads from (see from_vocabulary)
+    _vocabulary: Optional[WorkspaceVocabulary] = PrivateAttr(default=None)
+
+    @classmethod
+    def from_vocabulary(cls, vocabulary: WorkspaceVocabulary) -> "OntologyContext":
+        """
+        Context over a workspace's vocabulary counters, built in O(1).
+
+        The count dicts are live views of the counters (not copies), so
+        they reflect later workspace changes; use model_copy(deep=True)
+        for a snapshot.
+        """
+        context = cls.model_construct(**{
+            category: vocabulary.counts(category) for category in VOCABULARY_CATEGORIES
+        })
+        context._vocabulary = vocabulary
+        return context
+
     def get_top_n(self, category: str, n: int = 20) -> List[str]:
         """Get top N items from a category by frequency."""
+        if self._vocabulary is not None and category in VOCABULARY_CATEGORIES:
+            return self._vocabulary.top(category, n)
         counts = getattr(self, category, {})
         sorted_items = sorted(counts.items(), key=lambda x: x[1], reverse=True)
         return [item for item, count in sorted_items[:n]]
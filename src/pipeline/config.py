@@ -62,7 +62,9 @@ class PipelineConfig:
         "deepseek/deepseek-chat",
         "meta-llama/llama-3.3-70b-instruct"
     ])
-    gsw_delay: float = 0.5  # API rate limiting delay in seconds
+    gsw_delay: float = 0.5  # Minimum seconds between requests to one model
+    gsw_rate_limits: Dict[str, float] = field(default_factory=dict)  # model -> requests/minute (overrides gsw_delay)
+    gsw_concurrency: int = 4  # Extractions kept in flight
     gsw_max_retries: int = 3
     gsw_use_toon: bool = True  # Use TOON format for context (~40% token reduction)
 
@@ -73,6 +75,7 @@ class PipelineConfig:
     enable_graph_building: bool = True
     graph_include_legislation: bool = True
     graph_min_citation_confidence: float = 0.7
+    graph_incremental: bool = True  # Only re-extract new or changed cases
 
     # ========================================================================
     # FORMAT SETTINGS
@@ -110,8 +113,8 @@ class PipelineConfig:
     # PARALLEL PROCESSING
     # ========================================================================
 
-    parallel_workers: int = 1  # Number of parallel workers (future)
-    use_multiprocessing: bool = False  # Enable multiprocessing (future)
+    parallel_workers: int = 1  # Number of parallel workers
+    use_multiprocessing: bool = False  # Classify corpus shards in a process pool
 
     def __post_init__(self):
         """Convert string paths to Path objects."""
@@ -183,6 +186,9 @@ class PipelineConfig:
             if not self.gsw_model:
                 errors.append("GSW model not specified")
 
+            if self.gsw_concurrency < 1:
+                errors.append(f"Invalid GSW concurrency: {self.gsw_concurrency}")
+
         # Validate limits
         if self.document_limit is not None and self.document_limit < 1:
             errors.append(f"Invalid document limit: {self.document_limit}")
@@ -217,11 +223,13 @@ class PipelineConfig:
             f"  - Model: {self.gsw_model}",
             f"  - Fallback models: {len(self.gsw_fallback_models)}",
             f"  - Batch size: {self.gsw_batch_size}",
-            f"  - Rate limit delay: {self.gsw_delay}s",
+            f"  - Rate limit delay: {self.gsw_delay}s per model",
+            f"  - Concurrency: {self.gsw_concurrency}",
             "",
             "Graph Building:",
             f"  - Enabled: {self.enable_graph_building}",
             f"  - Include legislation: {self.graph_include_legislation}",
+            f"  - Incremental: {self.graph_incremental}",
             "=" * 60,
         ]
         return "\n".join(lines)
@@ -277,7 +277,8 @@ class FullPipeline:
             stats = extractor.extract_all(
                 progress_interval=self.config.classification_progress_interval,
                 resume=self.config.classification_resume,
-                limit=self.config.document_limit
+                limit=self.config.document_limit,
+                workers=self.config.parallel_workers if self.config.use_multiprocessing else 1
             )
 
             # Queue high-authority documents for GSW
@@ -319,10 +320,15 @@ class FullPipeline:
         """
         Populate GSW queue by scanning classified domain files.
 
+        Only a pointer to each row (file, byte offset) is queued; the
+        text is read back when the document is dequeued.
+
         Args:
             stats: Classification statistics
         """
-        from src.utils.toon import ToonDecoder
+        from src.ingestion.auto_gsw_trigger import DocumentLocation, TOON
+        from src.ingestion.toon_integration import convert_row_to_doc
+        from src.utils.toon import ToonReader
 
         scanned = 0
         queued = 0
@@ -332,41 +338,24 @@ class FullPipeline:
 
         for domain_file in domain_files:
             try:
-                with open(domain_file, 'r', encoding='utf-8') as f:
-                    content = f.read()
-
-                tables = ToonDecoder.decode(content)
-
-                for table_name, rows in tables.items():
-                    for row in rows:
+                # Streamed row by row: domain files hold full case text
+                with open(domain_file, 'rb') as f:
+                    for table_name, headers, offset, row in ToonReader.row_offsets(f):
                         scanned += 1
 
-                        # Check authority score
-                        authority = row.get('score', 0)  # 'score' is authority_score in TOON
+                        # Check authority score ('score' is authority_score in TOON, stored as text)
+                        authority = float(row.get('score') or 0)
                         if authority >= self.config.gsw_authority_threshold:
-                            # Reconstruct doc for queue
-                            doc = {
-                                'citation': row.get('citation', ''),
-                                'text': row.get('text', ''),
-                                'type': row.get('type', ''),
-                                'jurisdiction': row.get('jurisdiction', ''),
-                                '_classification': {
-                                    'primary_domain': row.get('domain', ''),
-                                    'authority_score': authority,
-                                    'court': row.get('court', ''),
-                                    'court_level': row.get('court_level', ''),
-                                    'case_refs': row.get('case_refs', '').split('|') if row.get('case_refs') else [],
-                                    'legislation_refs': row.get('leg_refs', '').split('|') if row.get('leg_refs') else []
-                                }
-                            }
-
-                            if self.gsw_queue.add(doc):
+                            location = DocumentLocation(str(domain_file.resolve()), offset, TOON, tuple(headers))
+                            if self.gsw_queue.add(convert_row_to_doc(row), location=location):
                                 queued += 1
 
             except Exception as e:
                 print(f"[Warning] Error scanning {domain_file}: {e}")
                 continue
 
+        # Persist the queue so the GSW stage can run in a later invocation
+        self.gsw_queue.save_checkpoint()
         print(f"[Classification] Scanned {scanned} documents, queued {queued} for GSW extraction")
 
     def _run_gsw_extraction(self) -> StageResult:
@@ -410,73 +399,123 @@ class FullPipeline:
         print(f"[GSW] Fallback models: {len(self.config.gsw_fallback_models)}")
 
         from src.gsw.legal_operator import LegalOperator
+        from src.gsw.legal_reconciler import LegalReconciler
         from src.gsw.workspace import WorkspaceManager
+        from src.gsw.journal import WorkspaceJournal
+        from src.gsw.extraction_scheduler import ExtractionScheduler, RateLimiter
         from src.logic.gsw_schema import GlobalWorkspace
 
+        # Per-model request limits shared by all in-flight extractions
+        rate_limiter = RateLimiter(
+            self.config.gsw_rate_limits,
+            default_rpm=60.0 / self.config.gsw_delay if self.config.gsw_delay > 0 else None
+        )
+
         # Initialize operator with model rotation
         operator = LegalOperator(
             model=self.config.gsw_fallback_models,  # Pass list for rotation
-            use_toon=self.config.gsw_use_toon
+            use_toon=self.config.gsw_use_toon,
+            rate_limiter=rate_limiter
         )
+        reconciler = LegalReconciler()
+        print(f"[GSW] Concurrency: {self.config.gsw_concurrency}")
 
-        # Track workspaces per domain
+        # Track workspaces (and their write-ahead journals) per domain
         domain_workspaces: Dict[str, WorkspaceManager] = {}
+        domain_journals: Dict[str, WorkspaceJournal] = {}
+        # Documents already reconciled into a journal (not yet checkpointed in the queue)
+        journaled_ids: set = set()
 
         processed = 0
         errors = []
 
-        try:
+        def document_id(doc: Dict[str, Any]) -> str:
+            return doc.get('version_id', doc.get('citation', 'Unknown'))
+
+        def load_domain(domain: str) -> None:
+            """Get or create the workspace for a domain, replaying its journal."""
+            if domain in domain_workspaces:
+                return
+            workspace_path = self.config.workspace_dir / f"{domain}_workspace.json"
+            if workspace_path.exists():
+                manager = WorkspaceManager.load(workspace_path)
+            else:
+                workspace = GlobalWorkspace(domain=domain)
+                manager = WorkspaceManager(workspace=workspace, storage_path=workspace_path)
+
+            # Recover changes made since the last compaction
+            journal = WorkspaceJournal.for_workspace(workspace_path)
+            for commit in journal.replay(manager.workspace):
+                journaled_ids.add(commit.get("document_id"))
+
+            domain_workspaces[domain] = manager
+            domain_journals[domain] = journal
+
+        def queued_documents():
+            """Drain the queue in priority order, skipping journaled documents."""
             while not self.gsw_queue.empty():
-                batch = self.gsw_queue.process_batch(self.config.gsw_batch_size)
-
-                for doc in batch:
-                    try:
-                        domain = doc['_classification']['primary_domain']
-                        citation = doc.get('citation', 'Unknown')
-
-                        print(f"[GSW] Extracting: {citation} (domain={domain})")
-
-                        # Extract
-                        extraction = operator.extract(
-                            text=doc.get('text', '')[:self.config.max_text_length],
-                            situation=f"Legal case: {citation}",
-                            document_id=doc.get('version_id', citation)
-                        )
-
-                        # Get or create workspace for domain
-                        if domain not in domain_workspaces:
-                            workspace_path = self.config.workspace_dir / f"{domain}_workspace.json"
-                            if workspace_path.exists():
-                                manager = WorkspaceManager.load(workspace_path)
-                            else:
-                                workspace = GlobalWorkspace(domain=domain)
-                                manager = WorkspaceManager(workspace=workspace, storage_path=workspace_path)
-                            domain_workspaces[domain] = manager
-
-                        # Merge extraction into workspace
-                        domain_workspaces[domain].workspace.merge_extraction(extraction)
-
-                        # Mark as processed
+                for doc in self.gsw_queue.process_batch(self.config.gsw_batch_size):
+                    domain = doc.get('_classification', {}).get('primary_domain')
+                    if domain:
+                        load_domain(domain)
+                    if document_id(doc) in journaled_ids:
                         self.gsw_queue.mark_processed(doc)
-                        processed += 1
+                        continue
+                    yield doc
+
+        def extract(doc: Dict[str, Any]):
+            """LLM extraction (worker thread; no workspace access)."""
+            citation = doc.get('citation', 'Unknown')
+            text = doc.get('text', '')[:self.config.max_text_length]
+            return operator.extract(
+                text=text,
+                situation=f"Legal case: {citation}",
+                document_id=document_id(doc)
+            )
 
-                        # Rate limiting
-                        time.sleep(self.config.gsw_delay)
+        scheduler = ExtractionScheduler(extract, max_in_flight=self.config.gsw_concurrency)
 
-                    except Exception as e:
-                        error_msg = f"Error processing {doc.get('citation', 'unknown')}: {str(e)[:100]}"
-                        print(f"[GSW Error] {error_msg}")
-                        errors.append(error_msg)
-                        continue
+        try:
+            # Single writer: extractions arrive in queue order and are
+            # reconciled here, one at a time
+            for result in scheduler.run(queued_documents()):
+                doc = result.item
+                try:
+                    if result.error is not None:
+                        raise result.error
+
+                    domain = doc['_classification']['primary_domain']
+                    citation = doc.get('citation', 'Unknown')
+
+                    print(f"[GSW] Extracted: {citation} (domain={domain}, {result.seconds:.1f}s)")
+
+                    # Merge extraction into workspace (journaled)
+                    text = doc.get('text', '')[:self.config.max_text_length]
+                    reconciler.reconcile(
+                        result.extraction,
+                        domain_workspaces[domain].workspace,
+                        text,
+                        journal=domain_journals[domain]
+                    )
+
+                    # Mark as processed
+                    self.gsw_queue.mark_processed(doc)
+                    processed += 1
+
+                except Exception as e:
+                    error_msg = f"Error processing {doc.get('citation', 'unknown')}: {str(e)[:100]}"
+                    print(f"[GSW Error] {error_msg}")
+                    errors.append(error_msg)
+                    continue
 
-                # Checkpoint every batch
+                # Checkpoint the queue together with the workspaces
                 if processed % (self.config.gsw_batch_size * 10) == 0:
                     print(f"[GSW] Checkpoint: {processed} documents processed")
                     self.gsw_queue.save_checkpoint()
-                    self._save_workspaces(domain_workspaces)
+                    self._save_workspaces(domain_workspaces, domain_journals)
 
             # Save final workspaces
-            self._save_workspaces(domain_workspaces)
+            self._save_workspaces(domain_workspaces, domain_journals, force=True)
             self.gsw_queue.save_checkpoint()
 
             # Statistics
@@ -510,11 +549,28 @@ class FullPipeline:
                 errors=[str(e)]
             )
 
-    def _save_workspaces(self, domain_workspaces: Dict[str, Any]) -> None:
-        """Save all domain workspaces."""
-        from src.utils.toon import ToonEncoder
+    def _save_workspaces(
+        self,
+        domain_workspaces: Dict[str, Any],
+        domain_journals: Optional[Dict[str, Any]] = None,
+        force: bool = False
+    ) -> None:
+        """
+        Save all domain workspaces.
+
+        Journaled workspaces are already durable, so they are only
+        compacted (rewritten in full) when their journal has grown large,
+        or when force is set.
+        """
+        domain_journals = domain_journals or {}
 
         for domain, manager in domain_workspaces.items():
+            journal = domain_journals.get(domain)
+            if journal is not None:
+                if force or journal.should_compact():
+                    journal.compact(manager)
+                continue
+
             # Save as JSON
             json_path = self.config.workspace_dir / f"{domain}_workspace.json"
             manager.save(json_path)
@@ -554,18 +610,17 @@ class FullPipeline:
             # Create builder
             builder = SPCNetBuilder(
                 input_dir=self.config.output_dir / "cases",
-                output_dir=self.config.graph_dir
+                output_dir=self.config.graph_dir,
+                workers=self.config.parallel_workers if self.config.use_multiprocessing else 1
             )
 
-            # Build graph
-            builder._index_nodes()
-            builder._extract_edges()
-
-            # Save as TOON
+            # Build graph and save as TOON (unchanged case files are reused)
             nodes_path = self.config.graph_dir / "spcnet_nodes.toon"
             edges_path = self.config.graph_dir / "spcnet_edges.toon"
 
-            builder._export()
+            builder.build(incremental=self.config.graph_incremental)
+            print(f"[Graph] Documents extracted: {builder.build_stats['docs_extracted']}, "
+                  f"reused: {builder.build_stats['docs_reused']}")
 
             # Update state
             self.state.graph_node_count = len(builder.nodes)
@@ -0,0 +1,340 @@
+"""
+Persistent BM25 Index - Array-Backed Postings, Memory-Mapped Loading
+====================================================================
+
+SimpleBM25 re-tokenises the whole corpus on every process start and
+scores postings one by one in Python. This index is built once, offline,
+and opened with mmap:
+
+- Postings in CSR form: term t's documents are doc_ids[indptr[t]:indptr[t+1]]
+  with matching term frequencies in freqs
+- Document lengths (the BM25 length normalisation is precomputed at load)
+- Vocabulary (term list in term id order)
+- Document metadata as JSON lines with byte offsets, parsed only for hits
+- Citation -> document map for direct citation lookup
+
+Scoring accumulates each query term's postings into a dense score array
+with NumPy, in float64 and in the same operation order as SimpleBM25, so
+scores are identical.
+
+Directory layout:
+
+    meta.json        k1, b, corpus size, avg doc length, source stamp
+    vocab.json       terms (index = term id)
+    citations.json   lowercased citation -> document index
+    indptr.npy       int64 (V + 1)
+    doc_ids.npy      int32 (postings)
+    freqs.npy        int32 (postings)
+    doc_len.npy      int32 (N)
+    doc_offsets.npy  int64 (N + 1) byte offsets into documents.jsonl
+    documents.jsonl  one metadata object per document
+
+Usage:
+    build_corpus_index(Path("data/by_court/family.jsonl"), index_dir)
+    index = BM25Index.load(index_dir)
+    for metadata, score in index.search("parenting orders relocation"):
+        ...
+"""
+
+import json
+import math
+import mmap
+import re
+from array import array
+from collections import Counter
+from collections.abc import Mapping
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+
+INDEX_VERSION = 1
+
+_TOKEN_RE = re.compile(r'\w+')
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercased word tokens (same tokenisation as SimpleBM25)."""
+    return [t.lower() for t in _TOKEN_RE.findall(text)]
+
+
+def source_stamp(path: Path) -> Dict[str, Any]:
+    """Size and mtime of a source file, used to detect a stale index."""
+    stat = Path(path).stat()
+    return {"path": str(path), "size": stat.st_size, "mtime": stat.st_mtime}
+
+
+# ============================================================================
+# BUILDER
+# ============================================================================
+
+class BM25IndexBuilder:
+    """Accumulates documents and writes a BM25Index directory."""
+
+    def __init__(self, k1: float = 1.5, b: float = 0.75):
+        self.k1 = k1
+        self.b = b
+        self.vocab: Dict[str, int] = {}
+        self.doc_len = array('i')
+        self.citations: Dict[str, int] = {}
+        # Flat (term id, doc idx, freq) triples, sorted into CSR on write
+        self._terms = array('i')
+        self._docs = array('i')
+        self._freqs = array('i')
+        self._documents: List[bytes] = []
+
+    @property
+    def corpus_size(self) -> int:
+        return len(self.doc_len)
+
+    def add_document(self, text: str, metadata: Dict, citation: Optional[str] = None) -> int:
+        """Adds a document; returns its index."""
+        doc_idx = self.corpus_size
+        tokens = tokenize(text)
+        record = json.dumps(metadata, ensure_ascii=False).encode('utf-8') + b"\n"
+        citation_key = citation.lower() if citation else None
+        self.doc_len.append(len(tokens))
+
+        for term, freq in Counter(tokens).items():
+            term_id = self.vocab.get(term)
+            if term_id is None:
+                term_id = self.vocab[term] = len(self.vocab)
+            self._terms.append(term_id)
+            self._docs.append(doc_idx)
+            self._freqs.append(freq)
+
+        self._documents.append(record)
+        if citation_key:
+            self.citations[citation_key] = doc_idx
+        return doc_idx
+
+    def write(self, index_dir: Path, source: Optional[Dict[str, Any]] = None) -> Path:
+        """Write the index files; returns the directory."""
+        index_dir = Path(index_dir)
+        index_dir.mkdir(parents=True, exist_ok=True)
+
+        terms = np.frombuffer(self._terms, dtype=np.int32)
+        order = np.argsort(terms, kind='stable')  # Keeps doc ids ascending per term
+        counts = np.bincount(terms, minlength=len(self.vocab))
+        indptr = np.zeros(len(self.vocab) + 1, dtype=np.int64)
+        np.cumsum(counts, out=indptr[1:])
+
+        np.save(index_dir / "indptr.npy", indptr)
+        np.save(index_dir / "doc_ids.npy", np.frombuffer(self._docs, dtype=np.int32)[order])
+        np.save(index_dir / "freqs.npy", np.frombuffer(self._freqs, dtype=np.int32)[order])
+        np.save(index_dir / "doc_len.npy", np.frombuffer(self.doc_len, dtype=np.int32))
+
+        offsets = np.zeros(self.corpus_size + 1, dtype=np.int64)
+        np.cumsum([len(d) for d in self._documents], out=offsets[1:])
+        np.save(index_dir / "doc_offsets.npy", offsets)
+        with open(index_dir / "documents.jsonl", 'wb') as f:
+            f.writelines(self._documents)
+
+        with open(index_dir / "vocab.json", 'w', encoding='utf-8') as f:
+            json.dump(sorted(self.vocab, key=self.vocab.__getitem__), f, ensure_ascii=False)
+        with open(index_dir / "citations.json", 'w', encoding='utf-8') as f:
+            json.dump(self.citations, f, ensure_ascii=False)
+
+        # meta.json last: its presence marks a complete index
+        avg_dl = sum(self.doc_len) / self.corpus_size if self.corpus_size else 0
+        with open(index_dir / "meta.json", 'w', encoding='utf-8') as f:
+            json.dump({
+                "version": INDEX_VERSION,
+                "k1": self.k1,
+                "b": self.b,
+                "corpus_size": self.corpus_size,
+                "avg_dl": avg_dl,
+                "num_terms": len(self.vocab),
+                "num_postings": int(len(terms)),
+                "source": source,
+            }, f, indent=2)
+        return index_dir
+
+
+def build_corpus_index(source_path: Path, index_dir: Path, k1: float = 1.5, b: float = 0.75) -> Path:
+    """
+    Index a JSONL case corpus (citation + text per line).
+
+    Document metadata matches what LegalRetriever has always returned:
+    id, type, title and a 200-character text preview.
+    """
+    builder = BM25IndexBuilder(k1=k1, b=b)
+    stamp = source_stamp(source_path)
+    with open(source_path, 'r', encoding='utf-8') as f:
+        for line in f:
+            try:
+                doc = json.loads(line)
+                text = doc.get('text', '')
+                meta = {
+                    'id': doc.get('citation', f"doc_{builder.corpus_size}"),
+                    'type': 'case',
+                    'title': doc.get('citation', ''),
+                    'text_preview': text[:200]
+                }
+                builder.add_document(text, meta, citation=doc.get('citation'))
+            except Exception:
+                continue  # Malformed line
+    return builder.write(index_dir, source=stamp)
+
+
+# ============================================================================
+# INDEX
+# ============================================================================
+
+class CitationLookup(Mapping):
+    """Lowercased citation -> document metadata, parsed on access."""
+
+    def __init__(self, index: "BM25Index"):
+        self._index = index
+
+    def __getitem__(self, citation: str) -> Dict:
+        return self._index.document(self._index.citations[citation])
+
+    def __contains__(self, citation) -> bool:
+        return citation in self._index.citations
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._index.citations)
+
+    def __len__(self) -> int:
+        return len(self._index.citations)
+
+
+class BM25Index:
+    """Read-only, memory-mapped BM25 index (same search() API as SimpleBM25)."""
+
+    def __init__(self, index_dir: Path):
+        self.index_dir = Path(index_dir)
+        with open(self.index_dir / "meta.json", 'r', encoding='utf-8') as f:
+            self.meta = json.load(f)
+        if self.meta.get("version") != INDEX_VERSION:
+            raise ValueError(f"Unsupported BM25 index version: {self.meta.get('version')}")
+
+        self.k1 = self.meta["k1"]
+        self.b = self.meta["b"]
+        self.corpus_size = self.meta["corpus_size"]
+        self.avg_dl = self.meta["avg_dl"]
+
+        with open(self.index_dir / "vocab.json", 'r', encoding='utf-8') as f:
+            self.vocab: Dict[str, int] = {term: i for i, term in enumerate(json.load(f))}
+        with open(self.index_dir / "citations.json", 'r', encoding='utf-8') as f:
+            self.citations: Dict[str, int] = json.load(f)
+
+        self.indptr = self._array("indptr")
+        self.doc_ids = self._array("doc_ids")
+        self.freqs = self._array("freqs")
+        self.doc_len = self._array("doc_len")
+        self.doc_offsets = self._array("doc_offsets")
+
+        # Length normalisation per document: k1 * (1 - b + b * dl / avg_dl)
+        if self.corpus_size:
+            self._norm = self.k1 * (1 - self.b + self.b * (self.doc_len / self.avg_dl))
+        else:
+            self._norm = np.zeros(0)
+
+        self._documents = self._open_documents()
+
+    def _array(self, name: str) -> np.ndarray:
+        path = self.index_dir / f"{name}.npy"
+        try:
+            return np.load(path, mmap_mode='r')
+        except ValueError:  # Empty arrays cannot be memory-mapped
+            return np.load(path)
+
+    def _open_documents(self) -> Optional[mmap.mmap]:
+        with open(self.index_dir / "documents.jsonl", 'rb') as f:
+            if self.corpus_size == 0:
+                return None
+            return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    @classmethod
+    def load(cls, index_dir: Path) -> "BM25Index":
+        return cls(index_dir)
+
+    @staticmethod
+    def exists(index_dir: Path) -> bool:
+        return (Path(index_dir) / "meta.json").exists()
+
+    @staticmethod
+    def is_current(index_dir: Path, source_path: Path) -> bool:
+        """True if a complete index exists and was built from the current source file."""
+        meta_path = Path(index_dir) / "meta.json"
+        if not meta_path.exists():
+            return False
+        with open(meta_path, 'r', encoding='utf-8') as f:
+            meta = json.load(f)
+        stamp = source_stamp(source_path)
+        return (
+            meta.get("version") == INDEX_VERSION
+            and meta.get("source") is not None
+            and meta["source"].get("size") == stamp["size"]
+            and meta["source"].get("mtime") == stamp["mtime"]
+        )
+
+    def document(self, doc_idx: int) -> Dict:
+        """Metadata of one document."""
+        start, end = self.doc_offsets[doc_idx], self.doc_offsets[doc_idx + 1]
+        return json.loads(self._documents[start:end])
+
+    def citation_lookup(self) -> CitationLookup:
+        return CitationLookup(self)
+
+    def _term_scores(self, term_id: int) -> Tuple[np.ndarray, np.ndarray]:
+        """(doc ids, BM25 contribution) of one term's postings."""
+        start, end = self.indptr[term_id], self.indptr[term_id + 1]
+        doc_ids = self.doc_ids[start:end]
+        freqs = self.freqs[start:end].astype(np.float64)
+
+        n_q = end - start
+        idf = math.log((self.corpus_size - n_q + 0.5) / (n_q + 0.5) + 1.0)
+        return doc_ids, idf * ((freqs * (self.k1 + 1)) / (freqs + self._norm[doc_ids]))
+
+    def scores(self, query: str) -> np.ndarray:
+        """Dense BM25 score per document."""
+        return self.scores_batch([query])[0]
+
+    def scores_batch(self, queries: List[str]) -> np.ndarray:
+        """
+        Dense (queries, documents) BM25 scores.
+
+        Each distinct term's contributions are computed once for the whole
+        batch; rows accumulate them in their own token order, so every row
+        equals scores() of that query exactly.
+        """
+        scores = np.zeros((len(queries), self.corpus_size), dtype=np.float64)
+        term_scores: Dict[int, Tuple[np.ndarray, np.ndarray]] = {}
+        for row, query in enumerate(queries):
+            for term in tokenize(query):
+                term_id = self.vocab.get(term)
+                if term_id is None:
+                    continue
+                if term_id not in term_scores:
+                    term_scores[term_id] = self._term_scores(term_id)
+                doc_ids, contribution = term_scores[term_id]
+                scores[row, doc_ids] += contribution
+        return scores
+
+    def search(self, query: str, top_k: int = 5) -> List[Tuple[Dict, float]]:
+        """Top-k (metadata, score), best first (ties by document order)."""
+        return self.search_batch([query], top_k)[0]
+
+    def search_batch(self, queries: List[str], top_k: int = 5) -> List[List[Tuple[Dict, float]]]:
+        """search() for many queries, sharing postings work across the batch."""
+        if not self.corpus_size or top_k <= 0:
+            return [[] for _ in queries]
+        return [self._top_hits(row, top_k) for row in self.scores_batch(queries)]
+
+    def _top_hits(self, scores: np.ndarray, top_k: int) -> List[Tuple[Dict, float]]:
+        hits = np.flatnonzero(scores)
+        if len(hits) > top_k:
+            # Keep everything scoring at least the k-th best score (ties included)
+            kth = np.partition(scores[hits], len(hits) - top_k)[len(hits) - top_k]
+            hits = hits[scores[hits] >= kth]
+        hits = hits[np.lexsort((hits, -scores[hits]))][:top_k]
+        return [(self.document(int(i)), float(scores[i])) for i in hits]
+
+    def close(self) -> None:
+        if self._documents is not None:
+            self._documents.close()
+            self._documents = None
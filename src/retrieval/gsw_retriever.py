@@ -16,6 +16,7 @@ Based on: arXiv:2511.07587 - Functional Structure of Episodic Memory
 
 import re
 import json
+import heapq
 from pathlib import Path
 from typing import List, Dict, Any, Optional, Set, Tuple
 from collections import defaultdict, Counter
@@ -29,6 +30,7 @@ from src.logic.gsw_schema import (
     GlobalWorkspace, Actor, VerbPhrase, State,
     SpatioTemporalLink, ActorType, LinkType
 )
+from src.logic.gsw_index import ACTOR, VERB, QUESTION
 
 
 class GSWRetriever:
@@ -73,8 +75,19 @@ class GSWRetriever:
             print(f"[GSWRetriever] Warning: Workspace directory {self.workspace_dir} not found")
             return
 
-        # Load all *_workspace.json files
-        workspace_files = list(self.workspace_dir.glob("*_workspace.json"))
+        # Load all *_workspace.json files, preferring an up-to-date
+        # binary snapshot (*_workspace.gsws) when one exists
+        workspace_files = []
+        for json_file in self.workspace_dir.glob("*_workspace.json"):
+            snapshot_file = json_file.with_suffix('.gsws')
+            if (snapshot_file.exists() and
+                    snapshot_file.stat().st_mtime >= json_file.stat().st_mtime):
+                workspace_files.append(snapshot_file)
+            else:
+                workspace_files.append(json_file)
+        for snapshot_file in self.workspace_dir.glob("*_workspace.gsws"):
+            if not snapshot_file.with_suffix('.json').exists():
+                workspace_files.append(snapshot_file)
 
         if not workspace_files:
             print(f"[GSWRetriever] Warning: No workspace files found in {self.workspace_dir}")
@@ -91,12 +104,16 @@ class GSWRetriever:
 
             try:
                 manager = WorkspaceManager.load(workspace_file)
+                if workspace_file.suffix != '.gsws':
+                    # Build inverted index up front (snapshots build it on
+                    # first query, so loading materialises no entities)
+                    manager.workspace.get_search_index()
                 self.workspaces[domain] = manager
                 loaded_count += 1
 
-                stats = manager.get_statistics()
-                print(f"[GSWRetriever] Loaded {domain}: {stats['total_actors']} actors, "
-                      f"{stats['total_verb_phrases']} verbs, {stats['total_questions']} questions")
+                workspace = manager.workspace
+                print(f"[GSWRetriever] Loaded {domain}: {len(workspace.actors)} actors, "
+                      f"{len(workspace.verb_phrases)} verbs, {len(workspace.questions)} questions")
             except Exception as e:
                 print(f"[GSWRetriever] Error loading {workspace_file}: {e}")
 
@@ -137,11 +154,15 @@ class GSWRetriever:
 
         for domain_name, manager in workspaces_to_search.items():
             workspace = manager.workspace
+            index = workspace.get_search_index()
 
-            # Search actors
-            for actor_id, actor in workspace.actors.items():
+            # Score candidate actors once; verbs reuse these scores
+            actor_scores: Dict[str, float] = {}
+            for actor_id in index.candidates(ACTOR, query_concepts):
+                actor = workspace.actors[actor_id]
                 score = self._score_actor(actor, query_concepts)
                 if score > 0:
+                    actor_scores[actor_id] = score
                     results.append({
                         'id': actor_id,
                         'type': 'actor',
@@ -154,9 +175,12 @@ class GSWRetriever:
                         'domain': domain_name
                     })
 
-            # Search verb phrases
-            for verb_id, verb in workspace.verb_phrases.items():
-                score = self._score_verb(verb, query_concepts, workspace)
+            # Search verb phrases (matching verb text or matching participants)
+            verb_ids = set(index.candidates(VERB, query_concepts))
+            verb_ids |= index.verbs_for_actors(actor_scores)
+            for verb_id in index.in_order(VERB, verb_ids):
+                verb = workspace.verb_phrases[verb_id]
+                score = self._score_verb(verb, query_concepts, workspace, actor_scores)
                 if score > 0:
                     # Get agent name
                     agent_name = "Unknown"
@@ -181,7 +205,8 @@ class GSWRetriever:
                     })
 
             # Search questions (for question-answering)
-            for question_id, question in workspace.questions.items():
+            for question_id in index.candidates(QUESTION, query_concepts):
+                question = workspace.questions[question_id]
                 score = self._score_question(question, query_concepts)
                 if score > 0:
                     results.append({
@@ -195,10 +220,8 @@ class GSWRetriever:
                         'domain': domain_name
                     })
 
-        # Sort by score (descending)
-        results.sort(key=lambda x: x['score'], reverse=True)
-
-        return results[:top_k]
+        # Top-k by score (descending, stable like a full sort)
+        return heapq.nlargest(top_k, results, key=lambda x: x['score'])
 
     def _extract_concepts(self, query: str) -> Dict[str, float]:
         """
@@ -305,7 +328,8 @@ class GSWRetriever:
         return score
 
     def _score_verb(self, verb: VerbPhrase, query_concepts: Dict[str, float],
-                   workspace: GlobalWorkspace) -> float:
+                   workspace: GlobalWorkspace,
+                   actor_scores: Optional[Dict[str, float]] = None) -> float:
         """
         Score verb phrase relevance to query.
 
@@ -314,6 +338,11 @@ class GSWRetriever:
         - Agent/patient name match: 2.0x weight
         - Connected entities: 1.5x weight
 
+        Args:
+            actor_scores: Precomputed non-zero actor scores for this query.
+                Actors missing from it score 0. If None, agent and patient
+                are scored from scratch.
+
         Returns:
             Relevance score (0.0+)
         """
@@ -327,19 +356,29 @@ class GSWRetriever:
 
         # 2. Agent match
         if verb.agent_id and verb.agent_id in workspace.actors:
-            agent = workspace.actors[verb.agent_id]
-            agent_score = self._score_actor(agent, query_concepts)
+            agent_score = self._actor_score(
+                verb.agent_id, query_concepts, workspace, actor_scores
+            )
             score += agent_score * 0.5  # Partial credit
 
         # 3. Patient match
         for patient_id in verb.patient_ids:
             if patient_id in workspace.actors:
-                patient = workspace.actors[patient_id]
-                patient_score = self._score_actor(patient, query_concepts)
+                patient_score = self._actor_score(
+                    patient_id, query_concepts, workspace, actor_scores
+                )
                 score += patient_score * 0.5  # Partial credit
 
         return score
 
+    def _actor_score(self, actor_id: str, query_concepts: Dict[str, float],
+                     workspace: GlobalWorkspace,
+                     actor_scores: Optional[Dict[str, float]]) -> float:
+        """Look up a precomputed actor score, or score the actor directly."""
+        if actor_scores is not None:
+            return actor_scores.get(actor_id, 0.0)
+        return self._score_actor(workspace.actors[actor_id], query_concepts)
+
     def _score_question(self, question, query_concepts: Dict[str, float]) -> float:
         """
         Score question relevance to query.
@@ -14,6 +14,11 @@ The "auto" mode:
 2. If GSW returns good results (score > threshold), use them
 3. Otherwise, fall back to BM25
 4. Can also blend results from both
+
+Case results from BM25 are re-ranked with graph authority when a
+citation graph has been built (spcnet_authority.npz, written by
+SPCNetBuilder and recomputed if stale): score * (1 + authority_weight *
+PageRank percentile).
 """
 
 import sys
@@ -22,9 +27,13 @@ from typing import List, Dict, Any, Optional
 
 sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
 
+from src.graph.analytics import load_authority
 from src.retrieval.gsw_retriever import GSWRetriever
 from src.retrieval.retriever import LegalRetriever
 
+# BM25 candidates per requested result when re-ranking by authority
+AUTHORITY_CANDIDATES = 3
+
 
 class HybridRetriever:
     """
@@ -54,7 +63,9 @@ class HybridRetriever:
         workspace_dir: Path = None,
         data_dir: Path = None,
         gsw_score_threshold: float = 2.0,
-        blend_results: bool = False
+        blend_results: bool = False,
+        graph_dir: Path = None,
+        authority_weight: float = 0.3
     ):
         """
         Initialize hybrid retriever.
@@ -64,11 +75,15 @@ class HybridRetriever:
             data_dir: Directory with case corpus
             gsw_score_threshold: Minimum GSW score to use GSW results (default 2.0)
             blend_results: If True, blend GSW and BM25 results (default False)
+            graph_dir: Directory with the citation graph (default data_dir/processed/graph)
+            authority_weight: Weight of graph authority in case ranking (0 disables)
         """
         self.workspace_dir = workspace_dir or Path("data/workspaces")
         self.data_dir = data_dir or Path("data")
         self.gsw_score_threshold = gsw_score_threshold
         self.blend_results = blend_results
+        self.graph_dir = graph_dir or self.data_dir / "processed" / "graph"
+        self.authority_weight = authority_weight
 
         # Initialize retrievers
         print("[HybridRetriever] Initializing retrievers...")
@@ -76,6 +91,12 @@ class HybridRetriever:
         self.gsw_retriever = GSWRetriever(workspace_dir=self.workspace_dir)
         self.bm25_retriever = LegalRetriever(data_dir=str(self.data_dir))
 
+        # Graph authority, recomputed if the graph changed since it was
+        # persisted (None if the graph has not been built)
+        self.authority = load_authority(self.graph_dir) if authority_weight > 0 else None
+        if self.authority is not None:
+            print(f"[HybridRetriever] Graph authority loaded for {len(self.authority)} cases")
+
         print("[HybridRetriever] Initialization complete")
 
     def retrieve(
@@ -114,8 +135,9 @@ class HybridRetriever:
         return self.gsw_retriever.retrieve(query, top_k=top_k, domain=domain)
 
     def _retrieve_bm25(self, query: str, top_k: int) -> List[Dict[str, Any]]:
-        """Pure BM25 retrieval."""
-        bm25_results = self.bm25_retriever.search(query, top_k=top_k)
+        """Pure BM25 retrieval (re-ranked by graph authority when available)."""
+        candidates = top_k * AUTHORITY_CANDIDATES if self.authority is not None else top_k
+        bm25_results = self.bm25_retriever.search(query, top_k=candidates)
 
         # Normalize format to match GSW
         normalized = []
@@ -129,7 +151,25 @@ class HybridRetriever:
                 'source': 'bm25'
             })
 
-        return normalized
+        if self.authority is not None:
+            # A direct citation match (no BM25 score) stays in front
+            lead = 1 if bm25_results and 'score' not in bm25_results[0] else 0
+            normalized = normalized[:lead] + self._apply_authority(normalized[lead:])
+
+        return normalized[:top_k]
+
+    def _apply_authority(self, results: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Boost case scores by graph authority and re-sort.
+
+        Authority is the case's PageRank percentile (0-1, one dict lookup);
+        cases outside the graph get no boost. Ties keep BM25 order.
+        """
+        for result in results:
+            authority = self.authority.score(result['id'])
+            result['authority'] = authority
+            result['score'] = result['score'] * (1 + self.authority_weight * authority)
+        return sorted(results, key=lambda r: r['score'], reverse=True)
 
     def _retrieve_auto(self, query: str, top_k: int, domain: Optional[str]) -> List[Dict[str, Any]]:
         """
@@ -275,6 +315,10 @@ class HybridRetriever:
                 'indexed_documents': self.bm25_retriever.bm25.corpus_size,
                 'citation_index_size': len(self.bm25_retriever.citation_index)
             },
+            'graph_authority': {
+                'cases': len(self.authority) if self.authority is not None else 0,
+                'weight': self.authority_weight
+            },
             'config': {
                 'gsw_score_threshold': self.gsw_score_threshold,
                 'blend_results': self.blend_results
@@ -6,10 +6,14 @@ Provides retrieval capabilities over the OALC.
 Optimized Strategy:
 1.  Full Corpus Metadata Index (Citation/Title) for specific navigation.
 2.  Domain-Specific Full-Text Index (Family Law) for semantic search.
+    Prebuilt on disk (see bm25_index.py / scripts/build_bm25_index.py)
+    and memory-mapped at startup.
 3.  Legislation Index (Family Law Act) for statutory grounding.
 4.  VSA Anti-Hallucination Validation for response quality assurance.
 """
 
+import bisect
+import heapq
 import json
 import re
 import math
@@ -18,12 +22,31 @@ from typing import List, Dict, Tuple, Optional
 from collections import Counter
 
 from src.logic.gsw_schema import GlobalWorkspace
+from src.retrieval.bm25_index import BM25Index, build_corpus_index
 from src.retrieval.vsa_validator import VSAValidator
 
+# Prebuilt Family Law index, relative to data_dir
+DEFAULT_INDEX_DIR = Path('indexes') / 'bm25_family'
+
 class SimpleBM25:
     """
     In-memory BM25 implementation for text ranking.
+
+    search() prunes with per-term score upper bounds: documents whose
+    bounds cannot beat the current k-th best score are never scored.
+
+    - "maxscore" (default): term-at-a-time, rarest terms first. Once the
+      remaining terms' bounds cannot lift an unseen document into the
+      top-k, long posting lists ("court", "order", "child") are only probed
+      for the existing candidates instead of being walked.
+    - "wand": document-at-a-time WAND over sorted posting lists.
+    - "exhaustive": scores every posting.
+
+    All methods return identical rankings; ties are broken by document order.
     """
+    # Relative slack on score bounds, so float rounding never prunes a hit
+    BOUND_SLACK = 1e-9
+
     def __init__(self, k1=1.5, b=0.75):
         self.k1 = k1
         self.b = b
@@ -33,11 +56,16 @@ class SimpleBM25:
         self.inverted_index = {} # term -> {doc_idx: freq}
         self.doc_len = []
         self.corpus_size = 0
+        # Pruning state (built by finalize): term -> sorted doc ids, term -> max contribution
+        self._posting_docs: Dict[str, List[int]] = {}
+        self._max_score: Dict[str, float] = {}
+        self._finalized = False
 
     def add_document(self, text: str, metadata: Dict):
         """Adds document to index."""
         doc_idx = self.corpus_size
         self.corpus_size += 1
+        self._finalized = False
         
         # Tokenize (simple)
         tokens = [t.lower() for t in re.findall(r'\w+', text)]
@@ -54,13 +82,59 @@ class SimpleBM25:
         self.documents.append(metadata)
 
     def finalize(self):
-        """Calculates stats."""
+        """Calculates stats and per-term score upper bounds."""
         if self.corpus_size > 0:
             self.avg_dl = sum(self.doc_len) / self.corpus_size
-            
-    def search(self, query: str, top_k: int = 5) -> List[Tuple[Dict, float]]:
-        """Searches index."""
+
+        self._posting_docs = {}
+        self._max_score = {}
+        if self.avg_dl:
+            for term, postings in self.inverted_index.items():
+                # Documents are added in order, so postings are sorted by doc id
+                self._posting_docs[term] = list(postings)
+                idf = self._idf(term)
+                self._max_score[term] = max(
+                    self._term_score(idf, freq, self.doc_len[doc_idx])
+                    for doc_idx, freq in postings.items()
+                )
+        self._finalized = True
+
+    def _idf(self, term: str) -> float:
+        n_q = len(self.inverted_index[term])
+        return math.log((self.corpus_size - n_q + 0.5) / (n_q + 0.5) + 1.0)
+
+    def _term_score(self, idf: float, freq: int, dl: int) -> float:
+        numerator = freq * (self.k1 + 1)
+        denominator = freq + self.k1 * (1 - self.b + self.b * (dl / self.avg_dl))
+        return idf * (numerator / denominator)
+
+    def search(self, query: str, top_k: int = 5, method: str = "maxscore") -> List[Tuple[Dict, float]]:
+        """
+        Searches index.
+
+        Args:
+            query: Free-text query
+            top_k: Number of results
+            method: "maxscore", "wand" or "exhaustive" (see class docstring)
+        """
         tokens = [t.lower() for t in re.findall(r'\w+', query)]
+        if top_k <= 0:
+            return []
+        if method == "maxscore":
+            results = self._search_maxscore(tokens, top_k)
+        elif method == "wand":
+            results = self._search_wand(tokens, top_k)
+        elif method == "exhaustive":
+            results = self._search_exhaustive(tokens, top_k)
+        else:
+            raise ValueError(f"Unknown search method: {method}")
+        return [(self.documents[idx], score) for idx, score in results]
+
+    def search_batch(self, queries: List[str], top_k: int = 5) -> List[List[Tuple[Dict, float]]]:
+        """search() for each query (same API as BM25Index.search_batch)."""
+        return [self.search(query, top_k=top_k) for query in queries]
+
+    def _search_exhaustive(self, tokens: List[str], top_k: int) -> List[Tuple[int, float]]:
         scores = {}
         
         for term in tokens:
@@ -68,25 +142,134 @@ class SimpleBM25:
                 continue
             
             # IDF
-            n_q = len(self.inverted_index[term])
-            idf = math.log((self.corpus_size - n_q + 0.5) / (n_q + 0.5) + 1.0)
+            idf = self._idf(term)
             
             # Score
             for doc_idx, freq in self.inverted_index[term].items():
-                dl = self.doc_len[doc_idx]
-                numerator = freq * (self.k1 + 1)
-                denominator = freq + self.k1 * (1 - self.b + self.b * (dl / self.avg_dl))
-                score = idf * (numerator / denominator)
-                
+                score = self._term_score(idf, freq, self.doc_len[doc_idx])
                 scores[doc_idx] = scores.get(doc_idx, 0) + score
                 
-        # Sort
-        results = sorted(scores.items(), key=lambda x: x[1], reverse=True)[:top_k]
-        return [(self.documents[idx], score) for idx, score in results]
+        # Top-k with a bounded heap (ties by document order)
+        return heapq.nsmallest(top_k, scores.items(), key=lambda x: (-x[1], x[0]))
+
+    def _score_document(self, doc_idx: int, tokens: List[str], idfs: Dict[str, float]) -> float:
+        """Full score of one document, summed in query token order."""
+        score = 0
+        dl = self.doc_len[doc_idx]
+        for term in tokens:
+            freq = self.inverted_index[term].get(doc_idx) if term in idfs else None
+            if freq is not None:
+                score = score + self._term_score(idfs[term], freq, dl)
+        return score
+
+    def _search_maxscore(self, tokens: List[str], top_k: int) -> List[Tuple[int, float]]:
+        if not self._finalized:
+            self.finalize()
+
+        multiplicity = Counter(t for t in tokens if t in self.inverted_index)
+        idfs = {term: self._idf(term) for term in multiplicity}
+        bounds = {
+            term: count * self._max_score[term] * (1 + self.BOUND_SLACK)
+            for term, count in multiplicity.items()
+        }
+
+        # High-impact (rare) terms first; their postings are short
+        remaining = sum(bounds.values())
+        partial: Dict[int, float] = {}
+        closed = False  # Once set, documents not yet seen cannot reach the top-k
+        for term in sorted(bounds, key=bounds.get, reverse=True):
+            remaining -= bounds[term]
+            idf, count = idfs[term], multiplicity[term]
+            postings = self.inverted_index[term]
+
+            if not closed:
+                for doc_idx, freq in postings.items():
+                    partial[doc_idx] = partial.get(doc_idx, 0) + count * self._term_score(
+                        idf, freq, self.doc_len[doc_idx])
+            else:
+                for doc_idx in partial:
+                    freq = postings.get(doc_idx)
+                    if freq is not None:
+                        partial[doc_idx] += count * self._term_score(idf, freq, self.doc_len[doc_idx])
+
+            if len(partial) < top_k:
+                continue
+            # Partial scores are lower bounds, so the k-th best bounds the final k-th best
+            threshold = heapq.nlargest(top_k, partial.values())[-1] * (1 - self.BOUND_SLACK)
+            if remaining < threshold:
+                closed = True
+                partial = {d: s for d, s in partial.items() if s + remaining >= threshold}
+
+        # Exact scores (query token order) for the surviving candidates
+        scores = ((doc_idx, self._score_document(doc_idx, tokens, idfs)) for doc_idx in partial)
+        return heapq.nsmallest(top_k, scores, key=lambda x: (-x[1], x[0]))
+
+    def _search_wand(self, tokens: List[str], top_k: int) -> List[Tuple[int, float]]:
+        if not self._finalized:
+            self.finalize()
+
+        multiplicity = Counter(t for t in tokens if t in self.inverted_index)
+        idfs = {term: self._idf(term) for term in multiplicity}
+
+        # Cursor: [current doc, position, sorted doc ids, score upper bound]
+        cursors = []
+        for term, count in multiplicity.items():
+            docs = self._posting_docs[term]
+            bound = count * self._max_score[term] * (1 + self.BOUND_SLACK)
+            cursors.append([docs[0], 0, docs, bound])
+
+        heap: List[Tuple[float, int]] = []  # (score, -doc_idx), worst result on top
+        threshold = float("-inf")
+
+        while cursors:
+            cursors.sort(key=lambda c: c[0])
+
+            # Pivot: first cursor at which the summed bounds could beat the threshold
+            bound_sum = 0.0
+            pivot = None
+            for i, cursor in enumerate(cursors):
+                bound_sum += cursor[3]
+                if bound_sum > threshold:
+                    pivot = i
+                    break
+            if pivot is None:
+                break
+            pivot_doc = cursors[pivot][0]
+
+            if cursors[0][0] == pivot_doc:
+                score = self._score_document(pivot_doc, tokens, idfs)
+                entry = (score, -pivot_doc)
+                if len(heap) < top_k:
+                    heapq.heappush(heap, entry)
+                elif entry > heap[0]:
+                    heapq.heapreplace(heap, entry)
+                if len(heap) == top_k:
+                    threshold = heap[0][0]
+                advance_to = pivot_doc + 1
+            else:
+                # Documents before the pivot cannot reach the threshold
+                advance_to = pivot_doc
+
+            for cursor in cursors:
+                if cursor[0] >= advance_to:
+                    continue
+                docs = cursor[2]
+                pos = bisect.bisect_left(docs, advance_to, cursor[1] + 1)
+                cursor[1] = pos
+                cursor[0] = docs[pos] if pos < len(docs) else None
+            cursors = [c for c in cursors if c[0] is not None]
+
+        return [(-neg_idx, score) for score, neg_idx in sorted(heap, key=lambda e: (-e[0], -e[1]))]
 
 class LegalRetriever:
-    def __init__(self, data_dir: str = 'data', enable_vsa_validation: bool = True):
+    def __init__(
+        self,
+        data_dir: str = 'data',
+        enable_vsa_validation: bool = True,
+        index_dir: Optional[str] = None
+    ):
         self.data_dir = Path(data_dir)
+        self.index_dir = Path(index_dir) if index_dir else self.data_dir / DEFAULT_INDEX_DIR
         self.bm25 = SimpleBM25()
         self.citation_index = {}
         self.enable_vsa_validation = enable_vsa_validation
@@ -115,40 +298,32 @@ class LegalRetriever:
             except Exception as e:
                 print(f"Error loading legislation: {e}")
 
-        # 2. Family Law Cases (Full Text)
+        # 2. Family Law Cases (Full Text, prebuilt index)
         family_path = self.data_dir / 'by_court/family.jsonl'
-        if family_path.exists():
-            with open(family_path, 'r', encoding='utf-8') as f:
-                count = 0
-                for line in f:
-                    try:
-                        doc = json.loads(line)
-                        text = doc.get('text', '')
-                        meta = {
-                            'id': doc.get('citation', f"doc_{count}"),
-                            'type': 'case',
-                            'title': doc.get('citation', ''),
-                            'text_preview': text[:200]
-                        }
-                        self.bm25.add_document(text, meta)
-                        
-                        # Add to citation index
-                        cit = doc.get('citation')
-                        if cit:
-                            self.citation_index[cit.lower()] = meta
-                            
-                        count += 1
-                    except:
-                        continue
-                print(f"[Retriever] Indexed {count} Family Law cases.")
-        
-        self.bm25.finalize()
+        if family_path.exists() and not BM25Index.is_current(self.index_dir, family_path):
+            print(f"[Retriever] Building BM25 index for {family_path} (one-off)...")
+            build_corpus_index(family_path, self.index_dir)
+
+        if BM25Index.exists(self.index_dir):
+            self.bm25 = BM25Index.load(self.index_dir)
+            self.citation_index = self.bm25.citation_lookup()
+            print(f"[Retriever] Loaded {self.bm25.corpus_size} Family Law cases from {self.index_dir}.")
+        else:
+            self.bm25.finalize()
         print("[Retriever] Indexing Complete.")
 
     def search(self, query: str, top_k: int = 5) -> List[Dict]:
         """
         Hybrid search: Citation Lookup + Full Text Search.
         """
+        return self._merge_hits(query, self.bm25.search(query, top_k=top_k), top_k)
+
+    def search_batch(self, queries: List[str], top_k: int = 5) -> List[List[Dict]]:
+        """search() for many queries with one batched BM25 pass."""
+        hits = self.bm25.search_batch(queries, top_k=top_k)
+        return [self._merge_hits(query, bm25_results, top_k) for query, bm25_results in zip(queries, hits)]
+
+    def _merge_hits(self, query: str, bm25_results: List[Tuple[Dict, float]], top_k: int) -> List[Dict]:
         results = []
 
         # 1. Direct Citation Lookup
@@ -158,7 +333,6 @@ class LegalRetriever:
             results.append(self.citation_index[q_norm])
 
         # 2. Full Text Search
-        bm25_results = self.bm25.search(query, top_k=top_k)
         for doc, score in bm25_results:
             # Avoid duplicates
             if doc['id'] not in [r['id'] for r in results]:
@@ -298,8 +472,5 @@ class LegalRetriever:
                 'valid': None
             } for _ in claims]
 
-        return [
-            self.vsa_validator.validate_claim(claim, workspace)
-            for claim in claims
-        ]
+        return self.vsa_validator.validate_claims(claims, workspace)
 
@@ -223,7 +223,7 @@ class VSAValidator:
             Hypervector representation of the claim
         """
         if not concepts:
-            return torch.zeros(self.vsa.dimension, device=self.vsa.device)
+            return self.vsa.empty_vector()
 
         # Get vectors for each concept
         concept_vectors = []
@@ -337,29 +337,60 @@ class VSAValidator:
         Returns:
             Validation result dictionary
         """
-        # Encode workspace
-        scene_vector = self.encoder.encode_workspace(workspace)
+        return self.validate_claims([claim], workspace)[0]
 
-        # Extract concepts and encode claim
-        concepts = self._extract_concepts(claim)
-        claim_vector = self._encode_claim(concepts)
+    def validate_claims(
+        self,
+        claims: List[str],
+        workspace: GlobalWorkspace
+    ) -> List[Dict]:
+        """
+        Validate many claims against workspace in one pass.
 
-        # Calculate similarity
-        similarity = self.vsa.similarity(scene_vector, claim_vector)
+        The scene vector is encoded once and all claim similarities come
+        from a single batched comparison.
 
-        # VSA validation
-        vsa_check = self.vsa.verify_no_hallucination(concepts)
+        Args:
+            claims: The claims to validate
+            workspace: The global workspace containing ground truth
 
-        return {
-            'claim': claim,
-            'concepts': concepts,
-            'similarity': similarity,
-            'confidence': self._calibrate_confidence(similarity),
-            'valid': similarity > 0.7,
-            'vsa_valid': vsa_check['valid'],
-            'vsa_issues': vsa_check['issues'],
-            'vsa_confidence': vsa_check['confidence']
-        }
+        Returns:
+            One validate_claim() result per claim
+        """
+        if not claims:
+            return []
+
+        # Encode workspace
+        scene_vector = self.encoder.encode_workspace(workspace)
+
+        # Extract concepts and encode claims
+        concepts = [self._extract_concepts(claim) for claim in claims]
+        encoded = [i for i, c in enumerate(concepts) if c]
+
+        # Calculate similarities (claims without concepts encode to the
+        # empty vector: similarity 0)
+        similarities = [0.0] * len(claims)
+        if encoded:
+            claim_vectors = torch.stack([self._encode_claim(concepts[i]) for i in encoded])
+            for i, similarity in zip(encoded, self.vsa.similarity_batch(claim_vectors, scene_vector)):
+                similarities[i] = similarity
+
+        results = []
+        for claim, claim_concepts, similarity in zip(claims, concepts, similarities):
+            # VSA validation
+            vsa_check = self.vsa.verify_no_hallucination(claim_concepts)
+
+            results.append({
+                'claim': claim,
+                'concepts': claim_concepts,
+                'similarity': similarity,
+                'confidence': self._calibrate_confidence(similarity),
+                'valid': similarity > 0.7,
+                'vsa_valid': vsa_check['valid'],
+                'vsa_issues': vsa_check['issues'],
+                'vsa_confidence': vsa_check['confidence']
+            })
+        return results
 
 
 class EnhancedVSAValidator(VSAValidator):
@@ -0,0 +1,78 @@
+"""
+Random-Walk Loaders over the Compact Graph Store
+================================================
+
+PyTorch side of the CSR citation graph (src/graph/csr_graph.py): walk
+batches in the TEM training format, and a DataLoader that generates
+them in worker processes. CSRGraph and its cache helpers are re-exported
+here for TEM code.
+
+Usage:
+    graph = CSRGraph.load(Path("data/processed/graph"))
+    loader = walk_loader(graph, batch_size=64, walk_length=10, num_workers=2)
+    for batch in loader:
+        ...
+"""
+
+from typing import Dict, Iterator, Optional
+
+import numpy as np
+import torch
+from torch.utils.data import DataLoader, IterableDataset, get_worker_info
+
+from src.graph.csr_graph import ACTION_NAMES, CACHE_NAME, CACHE_VERSION, CSRGraph, file_stamps
+
+
+def walk_batches(graph: CSRGraph, batch_size: int, walk_length: int,
+                 rng: Optional[np.random.Generator] = None) -> Iterator[Dict[str, torch.Tensor]]:
+    """Endless batches of graph.sample_walks() in the TEM training format."""
+    rng = rng if rng is not None else np.random.default_rng()
+    while True:
+        observations, actions = graph.sample_walks(batch_size, walk_length, rng)
+        yield {
+            'observations': torch.from_numpy(observations),
+            'actions': torch.from_numpy(actions),
+        }
+
+
+class WalkDataset(IterableDataset):
+    """
+    Endless stream of walk batches for a DataLoader.
+
+    Each worker process samples with its own generator (seed + worker id
+    when a seed is given), so workers never produce the same walks.
+    """
+
+    def __init__(self, graph: CSRGraph, batch_size: int, walk_length: int, seed: Optional[int] = None):
+        self.graph = graph
+        self.batch_size = batch_size
+        self.walk_length = walk_length
+        self.seed = seed
+
+    def __iter__(self) -> Iterator[Dict[str, torch.Tensor]]:
+        worker = get_worker_info()
+        worker_id = worker.id if worker is not None else 0
+        if self.seed is not None:
+            rng = np.random.default_rng([self.seed, worker_id])
+        else:
+            rng = np.random.default_rng()
+        return walk_batches(self.graph, self.batch_size, self.walk_length, rng)
+
+
+def walk_loader(
+    graph: CSRGraph,
+    batch_size: int,
+    walk_length: int,
+    num_workers: int = 0,
+    prefetch_factor: int = 4,
+    seed: Optional[int] = None,
+) -> DataLoader:
+    """
+    DataLoader yielding walk batches; with num_workers > 0, batches are
+    generated in worker processes and prefetched while the model trains.
+    """
+    dataset = WalkDataset(graph, batch_size, walk_length, seed=seed)
+    if num_workers > 0:
+        return DataLoader(dataset, batch_size=None, num_workers=num_workers,
+                          prefetch_factor=prefetch_factor, persistent_workers=True)
+    return DataLoader(dataset, batch_size=None)
@@ -6,83 +6,70 @@ Constructs the graph environment for the Tolman-Eichenbaum Machine (TEM).
 Loads the Hier-SPCNet and generates training episodes (random walks).
 
 Key Responsibilities:
-1.  Load graph structure from JSONL (Nodes/Edges).
+1.  Load graph structure from TOON (Nodes/Edges) into a CSR graph store
+    (cached as spcnet_graph.npz, see src/graph/csr_graph.py).
 2.  Generate sequences of (Observation, Action) pairs.
     - Observation (x_t): Document embedding (or ID for lookup).
     - Action (a_t): Edge type traversed to reach the next node.
-3.  Provide efficient batched streaming for PyTorch training.
+3.  Provide efficient batched streaming for PyTorch training: walks are
+    sampled for the whole batch at once with NumPy, optionally in
+    DataLoader worker processes.
 """
 
-import json
 import random
 import numpy as np
 import torch
 from pathlib import Path
 from typing import Dict, List, Tuple, Iterator, Optional
-from collections import defaultdict
+from torch.utils.data import DataLoader
 
-from src.tem.action_space import LegalAction, ACTION_TO_ID
+from src.tem.action_space import LegalAction, ID_TO_ACTION
+from src.tem.graph_store import CSRGraph, walk_batches, walk_loader
 
 from src.utils.toon import ToonDecoder
 
 class LegalGraphBuilder:
-    def __init__(self, graph_dir: Path):
+    def __init__(self, graph_dir: Path, use_cache: bool = True):
         self.graph_dir = graph_dir
-        self.adj_list: Dict[str, List[Tuple[str, LegalAction]]] = defaultdict(list)
+        self.use_cache = use_cache
         self.nodes: Dict[str, Dict] = {} # ID -> Metadata
         self.node_ids: List[str] = []
+        self.graph: Optional[CSRGraph] = None
+        self._adj_list: Optional[Dict[str, List[Tuple[str, LegalAction]]]] = None
         
         self._load_graph()
 
     def _load_graph(self):
-        """Loads nodes and edges from TOON files."""
+        """Loads node metadata and the CSR graph (from cache or TOON files)."""
         nodes_path = self.graph_dir / "spcnet_nodes.toon"
-        edges_path = self.graph_dir / "spcnet_edges.toon"
 
         print(f"Loading graph from {self.graph_dir}...")
 
         # Load Nodes
         if nodes_path.exists():
-            with open(nodes_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-                tables = ToonDecoder.decode(content)
-                rows = tables.get("Nodes", [])
-                for row in rows:
-                    node_id = row['id']
-                    self.nodes[node_id] = row
-                    self.node_ids.append(node_id)
-        
-        # Load Edges
-        if edges_path.exists():
-            with open(edges_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-                tables = ToonDecoder.decode(content)
-                rows = tables.get("Edges", [])
-                for row in rows:
-                    source = row['source']
-                    target = row['target']
-                    rel_type = row.get('action', row.get('type', 'CITE'))  # Support both 'action' and 'type' field
-
-                    # Map string relation to LegalAction enum
-                    # Handle variations in action names
-                    action_mapping = {
-                        'CITED': LegalAction.CITE,
-                        'CITE': LegalAction.CITE,
-                        'CITES': LegalAction.CITE,
-                        'FOLLOWED': LegalAction.FOLLOW,
-                        'FOLLOW': LegalAction.FOLLOW,
-                        'DISTINGUISHED': LegalAction.DISTINGUISH,
-                        'DISTINGUISH': LegalAction.DISTINGUISH,
-                        'OVERRULED': LegalAction.OVERRULE,
-                        'OVERRULE': LegalAction.OVERRULE,
-                        'CONSIDERED': LegalAction.CONSIDER,
-                        'CONSIDER': LegalAction.CONSIDER,
-                    }
-
-                    action = action_mapping.get(rel_type.upper(), LegalAction.CITE)
-                    self.adj_list[source].append((target, action))
+            with open(nodes_path, 'r', encoding='utf-8', newline='') as f:
+                for _, row in ToonDecoder.iter_rows(f, ["Nodes"]):
+                    self.nodes[row['id']] = row
+
+        # Load Edges (node index order: Nodes file, then unknown edge endpoints)
+        self.graph = CSRGraph.load(self.graph_dir, use_cache=self.use_cache)
+        self.node_ids = self.graph.node_ids
+        self._id_to_idx = {nid: i for i, nid in enumerate(self.node_ids)}
         
-        print(f"Graph loaded: {len(self.nodes)} nodes, {sum(len(v) for v in self.adj_list.values())} edges.")
+        print(f"Graph loaded: {len(self.nodes)} nodes, {self.graph.num_edges} edges.")
+
+    @property
+    def adj_list(self) -> Dict[str, List[Tuple[str, LegalAction]]]:
+        """Source ID -> [(target ID, action)], built on first use from the CSR arrays."""
+        if self._adj_list is None:
+            self._adj_list = {}
+            for idx, node_id in enumerate(self.node_ids):
+                targets, actions = self.graph.neighbors(idx)
+                if len(targets):
+                    self._adj_list[node_id] = [
+                        (self.node_ids[t], ID_TO_ACTION[int(a)]) for t, a in zip(targets, actions)
+                    ]
+        return self._adj_list
 
     def random_walk(self, start_node: str, length: int) -> Tuple[List[str], List[int]]:
         """
@@ -94,73 +81,39 @@ class LegalGraphBuilder:
         path = [start_node]
         actions = []
         
-        current = start_node
+        current = self._id_to_idx.get(start_node)
         for _ in range(length - 1):
-            neighbors = self.adj_list.get(current, [])
-            if not neighbors:
+            if current is None:
+                break # Unknown node
+            start, end = int(self.graph.indptr[current]), int(self.graph.indptr[current + 1])
+            if start == end:
                 break # Dead end
             
             # Sample next node
-            next_node, action = random.choice(neighbors)
+            edge = random.randrange(start, end)
+            current = int(self.graph.indices[edge])
             
-            path.append(next_node)
-            actions.append(ACTION_TO_ID[action])
-            current = next_node
+            path.append(self.node_ids[current])
+            actions.append(int(self.graph.actions[edge]))
             
         return path, actions
 
-    def batch_generator(self, batch_size: int, walk_length: int) -> Iterator[Dict[str, torch.Tensor]]:
+    def batch_generator(self, batch_size: int, walk_length: int,
+                        seed: Optional[int] = None) -> Iterator[Dict[str, torch.Tensor]]:
         """
         Yields batches of training data for TEM.
         Each batch contains:
         - 'observations': (batch, seq_len) - Node IDs (indices in node_ids list)
         - 'actions': (batch, seq_len-1) - Action IDs
+        Walks start at nodes with outgoing edges; walks that hit a dead end
+        are padded with 0.
         """
-        # Create efficient ID map for tensor conversion
-        id_to_idx = {nid: i for i, nid in enumerate(self.node_ids)}
-        
-        while True:
-            batch_obs = []
-            batch_acts = []
-            
-            for _ in range(batch_size):
-                # Pick random start node (prefer nodes with outgoing edges)
-                # Simple heuristic: try 10 times to find a node with neighbors
-                start_node = random.choice(self.node_ids)
-                for _ in range(10):
-                    if start_node in self.adj_list:
-                        break
-                    start_node = random.choice(self.node_ids)
-                
-                path_ids, actions = self.random_walk(start_node, walk_length)
-                
-                # Padding if walk ended early (dead end)
-                actual_len = len(path_ids)
-                pad_len = walk_length - actual_len
-                
-                # Convert to indices
-                path_indices = [id_to_idx.get(nid, 0) for nid in path_ids]
-                
-                # Pad observations (repeat last node or use 0)
-                path_indices += [0] * pad_len
-                
-                # Pad actions (use 0 - e.g. CITE or a special PAD token)
-                # We need to handle actions length (always 1 less than path)
-                # If path was full length (T), actions is T-1.
-                # If path was 1 (start only), actions is 0.
-                
-                # Ensure actions match expected sequence length (T-1)
-                target_act_len = walk_length - 1
-                if len(actions) < target_act_len:
-                    actions += [0] * (target_act_len - len(actions))
-                
-                batch_obs.append(path_indices)
-                batch_acts.append(actions)
-            
-            yield {
-                'observations': torch.tensor(batch_obs, dtype=torch.long),
-                'actions': torch.tensor(batch_acts, dtype=torch.long)
-            }
+        return walk_batches(self.graph, batch_size, walk_length, np.random.default_rng(seed))
+
+    def walk_loader(self, batch_size: int, walk_length: int, num_workers: int = 0,
+                    seed: Optional[int] = None) -> DataLoader:
+        """batch_generator() as a DataLoader, prefetched by num_workers processes."""
+        return walk_loader(self.graph, batch_size, walk_length, num_workers=num_workers, seed=seed)
 
     def get_embedding_matrix(self, embedding_dim: int = 768) -> torch.Tensor:
         """
@@ -7,7 +7,7 @@ Minimizes sensory prediction error (reconstruction loss) to learn
 structural representations (grid cells) of the legal space.
 
 Usage:
-    python -m src.tem.train --graph_dir data/processed/graph --epochs 100
+    python -m src.tem.train --graph_dir data/processed/graph --epochs 100 [--num_workers 2]
 """
 
 import argparse
@@ -30,7 +30,8 @@ def train(
     batch_size: int = 16,
     seq_len: int = 10,
     epochs: int = 10,
-    lr: float = 1e-3
+    lr: float = 1e-3,
+    num_workers: int = 0
 ):
     # 1. Setup Environment
     device = torch.device("cuda" if torch.cuda.is_available() else "cpu")
@@ -58,10 +59,10 @@ def train(
     print("Starting training...")
     model.train()
     
-    # Create data loader
+    # Create data loader (walks sampled in num_workers processes, prefetched)
     # 100 batches per epoch
     steps_per_epoch = 100 
-    data_iter = builder.batch_generator(batch_size, seq_len)
+    data_iter = iter(builder.walk_loader(batch_size, seq_len, num_workers=num_workers))
     
     for epoch in range(epochs):
         total_loss = 0.0
@@ -123,6 +124,7 @@ if __name__ == '__main__':
     parser.add_argument('--graph_dir', type=Path, default=Path('data/processed/graph'))
     parser.add_argument('--output_dir', type=Path, default=Path('data/models/tem'))
     parser.add_argument('--epochs', type=int, default=10)
+    parser.add_argument('--num_workers', type=int, default=0, help="DataLoader processes generating walks")
     
     args = parser.parse_args()
     
@@ -131,6 +133,7 @@ if __name__ == '__main__':
     train(
         graph_dir=args.graph_dir,
         output_dir=args.output_dir,
-        epochs=args.epochs
+        epochs=args.epochs,
+        num_workers=args.num_workers
     )
 
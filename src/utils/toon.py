@@ -14,11 +14,27 @@ Example:
     TOON (27 tokens):
     Actors[1]{id,name,type}
     a1,John,person
+
+Large files (domain .toon files hold full case text) are streamed:
+ToonReader yields rows table by table from a file handle, and ToonWriter
+writes rows as they come, in blocks of bounded size. Rows use CSV
+quoting (quoted values may contain commas, newlines and "" escapes), so
+rows are parsed by the csv module.
+
+ToonReader.row_offsets() also reports the byte offset of every row in a
+file opened in binary mode, and read_row_at() reads a single row back
+from such an offset, so a row can be referenced without holding it.
 """
 
-from typing import List, Any, Dict, Optional, Union
+from itertools import islice
+from typing import List, Any, BinaryIO, Dict, Iterable, Iterator, Optional, TextIO, Tuple, Union
+import csv
+import io
 import re
 
+# Case text fields exceed the csv module's default 128 KB field limit
+FIELD_SIZE_LIMIT = 2 ** 31 - 1
+
 
 class ToonEncoder:
     """
@@ -32,8 +48,8 @@ class ToonEncoder:
         if val is None:
             return ""
         s = str(val)
-        # Quote if contains comma, newline, or leading/trailing whitespace
-        if "," in s or "\n" in s or s != s.strip():
+        # Quote if contains comma, newline, a leading quote, or leading/trailing whitespace
+        if "," in s or "\n" in s or "\r" in s or s.startswith('"') or s != s.strip():
             s = s.replace('"', '""')  # Escape internal quotes
             return f'"{s}"'
         return s
@@ -296,75 +312,219 @@ class ToonEncoder:
         return "\n".join(blocks)
 
 
-class ToonDecoder:
+class ToonWriter:
     """
-    TOON Decoder - Parse TOON format back to structured data.
+    Incremental TOON writer.
+
+    Rows are buffered per table and written as blocks of at most
+    block_size rows ("Name[n]{cols}" + rows), so memory stays bounded
+    however many rows are written. A table may span several blocks;
+    ToonReader and ToonDecoder.decode() concatenate them.
+
+    Usage:
+        with open(path, 'w', encoding='utf-8', newline='') as f, ToonWriter(f) as writer:
+            for doc in docs:
+                writer.write_row("Cases_family", DOC_HEADERS, convert_doc_to_row(doc))
+    """
+
+    def __init__(self, f: TextIO, block_size: int = 1000):
+        self.f = f
+        self.block_size = block_size
+        self._headers: Dict[str, List[str]] = {}
+        self._buffers: Dict[str, List[List[Any]]] = {}
+
+    def __enter__(self) -> "ToonWriter":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.flush()
+
+    def write_comment(self, text: str) -> None:
+        self.f.write(f"# {text}\n")
+
+    def write_row(self, name: str, headers: List[str], row: List[Any]) -> None:
+        """Buffer one row; the table's block is written when full."""
+        if name not in self._buffers:
+            self._headers[name] = list(headers)
+            self._buffers[name] = []
+        buffer = self._buffers[name]
+        buffer.append(row)
+        if len(buffer) >= self.block_size:
+            self._write_block(name, self._headers[name], buffer)
+            buffer.clear()
+
+    def write_table(self, name: str, headers: List[str], rows: Iterable[List[Any]]) -> int:
+        """Write all rows of an iterable (in blocks); returns the row count."""
+        rows = iter(rows)
+        written = 0
+        while True:
+            block = list(islice(rows, self.block_size))
+            if not block:
+                return written
+            self._write_block(name, headers, block)
+            written += len(block)
+
+    def flush(self) -> None:
+        """Write all buffered rows."""
+        for name, buffer in self._buffers.items():
+            if buffer:
+                self._write_block(name, self._headers[name], buffer)
+                buffer.clear()
+
+    def _write_block(self, name: str, headers: List[str], rows: List[List[Any]]) -> None:
+        escape = ToonEncoder._escape_value
+        self.f.write(f"{name}[{len(rows)}]{{{','.join(headers)}}}\n")
+        self.f.writelines(",".join([escape(item) for item in row]) + "\n" for row in rows)
+
+
+class _ByteLines:
+    """Decoded lines of a binary file, tracking the byte offset of the next line."""
+
+    def __init__(self, f: BinaryIO, position: int = 0):
+        self.f = f
+        self.position = position
+
+    def __iter__(self) -> "_ByteLines":
+        return self
+
+    def __next__(self) -> str:
+        line = self.f.readline()
+        if not line:
+            raise StopIteration
+        self.position += len(line)
+        return line.decode('utf-8')
+
+
+class ToonReader:
+    """
+    Streaming TOON reader over a text file handle.
+
+    Iterating yields (table name, headers, rows) per block; rows is a
+    lazy iterator of row dicts (unconsumed rows are skipped when the
+    next block is requested). rows() flattens this to (table name, row).
+    Only the current row is held in memory.
+
+    Open files with newline='' so quoted values keep their line endings.
+
+    Usage:
+        with open(path, 'r', encoding='utf-8', newline='') as f:
+            for table_name, row in ToonReader(f).rows():
+                ...
     """
 
     HEADER_PATTERN = re.compile(r'^(\w+)\[(\d+)\]\{([^}]*)\}$')
 
-    @staticmethod
-    def decode(toon_str: str) -> Dict[str, List[Dict]]:
-        """
-        Decode TOON string to dictionary of tables.
+    def __init__(self, f: Union[TextIO, Iterable[str]]):
+        if csv.field_size_limit() < FIELD_SIZE_LIMIT:
+            csv.field_size_limit(FIELD_SIZE_LIMIT)
+        self._lines = iter(f)
+        # Shares the line iterator: quoted values may span several lines
+        self._records = csv.reader(self._lines)
+        self.comments: List[str] = []
 
-        Returns:
-            Dict mapping table names to list of row dicts
-        """
-        result = {}
-        lines = toon_str.strip().split("\n")
+    def __iter__(self) -> Iterator[Tuple[str, List[str], Iterator[Dict[str, str]]]]:
+        return self.tables()
 
-        i = 0
-        while i < len(lines):
-            line = lines[i].strip()
+    def tables(self) -> Iterator[Tuple[str, List[str], Iterator[Dict[str, str]]]]:
+        for line in self._lines:
+            line = line.strip()
 
             # Skip comments and empty lines
-            if not line or line.startswith("#"):
-                i += 1
+            if not line:
+                continue
+            if line.startswith("#"):
+                self.comments.append(line)
                 continue
 
-            # Try to match header
-            match = ToonDecoder.HEADER_PATTERN.match(line)
+            match = self.HEADER_PATTERN.match(line)
             if match:
-                name = match.group(1)
-                count = int(match.group(2))
                 headers = [h.strip() for h in match.group(3).split(",")]
+                rows = self._rows(headers, int(match.group(2)))
+                yield match.group(1), headers, rows
+                for _ in rows:  # Skip rows the caller did not consume
+                    pass
+
+    def rows(self, tables: Optional[Iterable[str]] = None) -> Iterator[Tuple[str, Dict[str, str]]]:
+        """(table name, row dict) for every row, optionally only for some tables."""
+        wanted = set(tables) if tables is not None else None
+        for name, _, rows in self.tables():
+            if wanted is None or name in wanted:
+                for row in rows:
+                    yield name, row
 
-                # Read data rows
-                rows = []
-                for j in range(count):
-                    if i + 1 + j < len(lines):
-                        row_line = lines[i + 1 + j]
-                        values = ToonDecoder._parse_row(row_line, len(headers))
-                        row_dict = dict(zip(headers, values))
-                        rows.append(row_dict)
-
-                result[name] = rows
-                i += count + 1
-            else:
-                i += 1
+    @staticmethod
+    def row_offsets(
+        f: BinaryIO, tables: Optional[Iterable[str]] = None
+    ) -> Iterator[Tuple[str, List[str], int, Dict[str, str]]]:
+        """
+        (table name, headers, byte offset, row dict) for every row of a
+        TOON file opened in binary mode.
+        """
+        lines = _ByteLines(f, f.tell())
+        wanted = set(tables) if tables is not None else None
+        for name, headers, rows in ToonReader(lines).tables():
+            if wanted is not None and name not in wanted:
+                continue
+            while True:
+                # Rows are parsed lazily: the position is where this row starts
+                offset = lines.position
+                row = next(rows, None)
+                if row is None:
+                    break
+                yield name, headers, offset, row
+
+    @staticmethod
+    def read_row_at(f: BinaryIO, offset: int, headers: List[str]) -> Dict[str, str]:
+        """Read the row starting at a byte offset reported by row_offsets()."""
+        f.seek(offset)
+        row = next(ToonReader(_ByteLines(f, offset))._rows(headers, 1), None)
+        if row is None:
+            raise ValueError(f"No TOON row at offset {offset}")
+        return row
+
+    def _rows(self, headers: List[str], count: int) -> Iterator[Dict[str, str]]:
+        width = len(headers)
+        for _ in range(count):
+            values = next(self._records, None)
+            if values is None:
+                return
+            if len(values) < width:
+                values.extend([""] * (width - len(values)))
+            yield dict(zip(headers, values))
 
+
+class ToonDecoder:
+    """
+    TOON Decoder - Parse TOON format back to structured data.
+    """
+
+    HEADER_PATTERN = ToonReader.HEADER_PATTERN
+
+    @staticmethod
+    def decode(toon_str: str) -> Dict[str, List[Dict]]:
+        """
+        Decode TOON string to dictionary of tables.
+
+        Blocks with the same table name are concatenated. For files, use
+        ToonReader (or iter_rows) instead of reading them into a string.
+
+        Returns:
+            Dict mapping table names to list of row dicts
+        """
+        result = {}
+        for name, _, rows in ToonReader(io.StringIO(toon_str.strip())):
+            result.setdefault(name, []).extend(rows)
         return result
 
+    @staticmethod
+    def iter_rows(f: TextIO, tables: Optional[Iterable[str]] = None) -> Iterator[Tuple[str, Dict[str, str]]]:
+        """Stream (table name, row dict) pairs from an open TOON file."""
+        return ToonReader(f).rows(tables)
+
     @staticmethod
     def _parse_row(line: str, expected_cols: int) -> List[str]:
         """Parse a TOON row handling quoted values."""
-        values = []
-        current = ""
-        in_quotes = False
-
-        for char in line:
-            if char == '"' and not in_quotes:
-                in_quotes = True
-            elif char == '"' and in_quotes:
-                in_quotes = False
-            elif char == ',' and not in_quotes:
-                values.append(current)
-                current = ""
-            else:
-                current += char
-
-        values.append(current)
+        values = next(csv.reader([line]), [])
 
         # Pad if needed
         while len(values) < expected_cols:
@@ -4,13 +4,42 @@ Statutory Corpus Loader
 
 Loads and manages statutory corpus from JSON files.
 Provides search and retrieval capabilities for statutory provisions.
+
+Search runs on indices built once at load time:
+- Token set of every section (title, summary, legal test, keywords)
+- Inverted term -> section index, so text search only touches sections
+  sharing a term with the query
+- Trigram index over keywords, so partial keyword matches are found
+  without scanning every keyword
 """
 
 import json
+from collections import Counter, defaultdict
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Dict, FrozenSet, List, Optional, Any, Set, Tuple
 import re
 
+KEYWORD_NGRAM = 3
+
+
+def tokenize(text: str) -> FrozenSet[str]:
+    """Lowercased word tokens of a text (as matched by search_by_text)."""
+    return frozenset(re.findall(r'\w+', text.lower()))
+
+
+def section_text(section: Dict) -> str:
+    """The searchable text of a section."""
+    return ' '.join([
+        section.get('title', ''),
+        section.get('summary', ''),
+        section.get('legal_test', ''),
+        ' '.join(section.get('keywords', []))
+    ])
+
+
+def _ngrams(text: str) -> Set[str]:
+    return {text[i:i + KEYWORD_NGRAM] for i in range(len(text) - KEYWORD_NGRAM + 1)}
+
 
 class CorpusLoader:
     """
@@ -32,6 +61,17 @@ class CorpusLoader:
         self.section_index: Dict[str, List[Dict]] = {}  # section_number -> [provisions]
         self.keyword_index: Dict[str, List[Dict]] = {}  # keyword -> [provisions]
 
+        # Every section (with act metadata) in corpus order, and its tokens
+        self.sections: List[Dict] = []
+        self.section_terms: List[FrozenSet[str]] = []
+        self.term_index: Dict[str, List[int]] = {}  # term -> positions in self.sections
+        # (act name, section number, title) -> positions, for section_tokens()
+        self._section_keys: Dict[Tuple[str, str, str], List[int]] = defaultdict(list)
+        # keyword trigram -> keywords, and keyword -> insertion order
+        self._keyword_grams: Dict[str, Set[str]] = defaultdict(set)
+        self._keyword_order: Dict[str, int] = {}
+        self._max_keyword_length = 0
+
         if not self.corpus_dir.exists():
             print(f"[CorpusLoader] Warning: Corpus directory {corpus_dir} does not exist")
             return
@@ -75,22 +115,32 @@ class CorpusLoader:
         """
         print("[CorpusLoader] Building indices...")
 
+        term_index: Dict[str, List[int]] = defaultdict(list)
+
         for act_name, act_data in self.acts.items():
             sections = act_data.get('sections', [])
 
             for section in sections:
+                # Add act metadata to section
+                section_with_act = section.copy()
+                section_with_act['act_name'] = act_name
+                section_with_act['act_citation'] = act_data['act'].get('citation', '')
+                section_with_act['act_url'] = act_data['act'].get('url', '')
+
+                # Tokens and inverted index
+                position = len(self.sections)
+                terms = tokenize(section_text(section))
+                self.sections.append(section_with_act)
+                self.section_terms.append(terms)
+                for term in terms:
+                    term_index[term].append(position)
+                self._section_keys[self._section_key(section_with_act)].append(position)
+
                 # Index by section number
                 section_num = section.get('section', '')
                 if section_num:
                     if section_num not in self.section_index:
                         self.section_index[section_num] = []
-
-                    # Add act metadata to section
-                    section_with_act = section.copy()
-                    section_with_act['act_name'] = act_name
-                    section_with_act['act_citation'] = act_data['act'].get('citation', '')
-                    section_with_act['act_url'] = act_data['act'].get('url', '')
-
                     self.section_index[section_num].append(section_with_act)
 
                 # Index by keywords
@@ -99,11 +149,43 @@ class CorpusLoader:
                     keyword_lower = keyword.lower()
                     if keyword_lower not in self.keyword_index:
                         self.keyword_index[keyword_lower] = []
+                        self._index_keyword(keyword_lower)
 
                     if section_with_act not in self.keyword_index[keyword_lower]:
                         self.keyword_index[keyword_lower].append(section_with_act)
 
-        print(f"[CorpusLoader] Indexed {len(self.section_index)} sections, {len(self.keyword_index)} keywords")
+        self.term_index = dict(term_index)
+        print(f"[CorpusLoader] Indexed {len(self.section_index)} sections, {len(self.keyword_index)} keywords, "
+              f"{len(self.term_index)} terms")
+
+    def _index_keyword(self, keyword: str) -> None:
+        self._keyword_order[keyword] = len(self._keyword_order)
+        self._max_keyword_length = max(self._max_keyword_length, len(keyword))
+        for gram in _ngrams(keyword):
+            self._keyword_grams[gram].add(keyword)
+
+    @staticmethod
+    def _section_key(section: Dict) -> Tuple[str, str, str]:
+        return (section.get('act_name', ''), section.get('section', ''), section.get('title', ''))
+
+    def section_tokens(self, section: Dict) -> FrozenSet[str]:
+        """
+        Token set of a section's searchable text.
+
+        Sections returned by this loader (or copies of them) reuse the
+        tokens computed at load time; anything else is tokenised.
+        """
+        for position in self._section_keys.get(self._section_key(section), ()):
+            indexed = self.sections[position]
+            if all(section.get(field) is indexed.get(field) for field in ('summary', 'legal_test', 'keywords')):
+                return self.section_terms[position]
+        return tokenize(section_text(section))
+
+    def _with_act(self, position: int, **extra: Any) -> Dict:
+        """Fresh copy of an indexed section (with act metadata) plus extra fields."""
+        section = self.sections[position].copy()
+        section.update(extra)
+        return section
 
     def get_section(self, section_number: str, act_name: Optional[str] = None) -> Optional[Dict]:
         """
@@ -148,15 +230,33 @@ class CorpusLoader:
         if keyword_lower in self.keyword_index:
             results.extend(self.keyword_index[keyword_lower])
 
-        # Partial match
-        for indexed_keyword, sections in self.keyword_index.items():
-            if keyword_lower in indexed_keyword or indexed_keyword in keyword_lower:
-                for section in sections:
-                    if section not in results:
-                        results.append(section)
+        # Partial match, in keyword insertion order
+        for indexed_keyword in self._partial_keywords(keyword_lower):
+            for section in self.keyword_index[indexed_keyword]:
+                if section not in results:
+                    results.append(section)
 
         return results[:top_k]
 
+    def _partial_keywords(self, keyword: str) -> List[str]:
+        """Indexed keywords containing the keyword or contained in it."""
+        # Indexed keywords containing it share all of its trigrams
+        grams = _ngrams(keyword)
+        if grams:
+            postings = sorted((self._keyword_grams.get(g, set()) for g in grams), key=len)
+            found = set(postings[0]).intersection(*postings[1:])
+            found = {k for k in found if keyword in k}
+        else:
+            found = {k for k in self._keyword_order if keyword in k}
+
+        # Indexed keywords contained in it are among its substrings
+        for start in range(len(keyword)):
+            for end in range(start + 1, min(len(keyword), start + self._max_keyword_length) + 1):
+                if keyword[start:end] in self._keyword_order:
+                    found.add(keyword[start:end])
+
+        return sorted(found, key=self._keyword_order.__getitem__)
+
     def search_by_text(self, query: str, top_k: int = 5) -> List[Dict]:
         """
         Search for sections by text content.
@@ -168,39 +268,19 @@ class CorpusLoader:
         Returns:
             List of matching sections with relevance scores
         """
-        query_lower = query.lower()
-        query_terms = set(re.findall(r'\w+', query_lower))
-
-        results = []
-
-        for act_name, act_data in self.acts.items():
-            sections = act_data.get('sections', [])
-
-            for section in sections:
-                # Score based on term overlap
-                section_text = ' '.join([
-                    section.get('title', ''),
-                    section.get('summary', ''),
-                    section.get('legal_test', ''),
-                    ' '.join(section.get('keywords', []))
-                ]).lower()
-
-                section_terms = set(re.findall(r'\w+', section_text))
-                overlap = len(query_terms.intersection(section_terms))
-
-                if overlap > 0:
-                    section_with_act = section.copy()
-                    section_with_act['act_name'] = act_name
-                    section_with_act['act_citation'] = act_data['act'].get('citation', '')
-                    section_with_act['act_url'] = act_data['act'].get('url', '')
-                    section_with_act['relevance_score'] = overlap / len(query_terms)
-
-                    results.append(section_with_act)
-
-        # Sort by relevance score
-        results.sort(key=lambda x: x.get('relevance_score', 0), reverse=True)
-
-        return results[:top_k]
+        query_terms = tokenize(query)
+
+        # Score based on term overlap, via the inverted index
+        overlap = Counter()
+        for term in query_terms:
+            overlap.update(self.term_index.get(term, ()))
+
+        # Highest overlap first, ties in corpus order
+        ranked = sorted(overlap, key=lambda position: (-overlap[position], position))[:top_k]
+        return [
+            self._with_act(position, relevance_score=overlap[position] / len(query_terms))
+            for position in ranked
+        ]
 
     def get_related_provisions(self, section_number: str, act_name: Optional[str] = None) -> List[Dict]:
         """
@@ -11,7 +11,7 @@ from typing import Dict, List, Optional, Any
 import re
 from pathlib import Path
 
-from .corpus_loader import CorpusLoader
+from .corpus_loader import CorpusLoader, section_text, tokenize
 
 
 @dataclass
@@ -337,6 +337,12 @@ class StatutoryRAGValidator:
         # Return unique keywords
         return list(dict.fromkeys(keywords))[:10]
 
+    def _statute_terms(self, statute: Dict) -> frozenset:
+        """Token set of a statute's title, summary, legal test and keywords."""
+        if self.corpus_loader:
+            return self.corpus_loader.section_tokens(statute)
+        return tokenize(section_text(statute))
+
     def _check_compliance(self, claims: List[str], statutes: List[Dict]) -> float:
         """
         Check compliance of claims against statutes.
@@ -355,23 +361,16 @@ class StatutoryRAGValidator:
         total_score = 0.0
         checked_claims = 0
 
+        # Statute tokens come from the corpus index, computed once at load time
+        statute_terms_list = [self._statute_terms(statute) for statute in statutes]
+
         for claim in claims:
             claim_lower = claim.lower()
-            claim_terms = set(re.findall(r'\w+', claim_lower))
+            claim_terms = tokenize(claim_lower)
 
             best_match_score = 0.0
 
-            for statute in statutes:
-                # Build statute text
-                statute_text = ' '.join([
-                    statute.get('title', ''),
-                    statute.get('summary', ''),
-                    statute.get('legal_test', ''),
-                    ' '.join(statute.get('keywords', []))
-                ]).lower()
-
-                statute_terms = set(re.findall(r'\w+', statute_text))
-
+            for statute, statute_terms in zip(statutes, statute_terms_list):
                 # Calculate term overlap
                 if claim_terms and statute_terms:
                     overlap = len(claim_terms.intersection(statute_terms))
@@ -419,6 +418,9 @@ class StatutoryRAGValidator:
         """
         conflicts = []
 
+        # Combine all claims for checking
+        all_claims_text = ' '.join(claims).lower()
+
         # Check for missing required elements
         for statute in statutes:
             if 'required_elements' in statute:
@@ -426,9 +428,6 @@ class StatutoryRAGValidator:
                 minimum_elements = statute.get('minimum_elements', len(elements))
                 threshold = statute.get('threshold', 0.5)
 
-                # Combine all claims for checking
-                all_claims_text = ' '.join(claims).lower()
-
                 found_elements = 0
                 missing_elements = []
 
@@ -461,29 +460,33 @@ class StatutoryRAGValidator:
         negative_indicators = ['not', 'no', 'never', 'cannot', 'unable', 'fails', 'lacks']
         positive_indicators = ['must', 'shall', 'required', 'necessary', 'essential', 'needs']
 
+        # Only claims that negate something can conflict; tokenise each once
+        negative_claims = [
+            tokenize(claim_lower) for claim_lower in (claim.lower() for claim in claims)
+            if any(neg in claim_lower for neg in negative_indicators)
+        ]
+
         for statute in statutes:
             statute_summary = statute.get('summary', '').lower()
 
-            for claim in claims:
-                claim_lower = claim.lower()
+            # Check if claim negates a requirement
+            statute_has_positive = any(pos in statute_summary for pos in positive_indicators)
+            if not statute_has_positive or not negative_claims:
+                continue
 
-                # Check if claim negates a requirement
-                has_negative = any(neg in claim_lower for neg in negative_indicators)
-                statute_has_positive = any(pos in statute_summary for pos in positive_indicators)
+            statute_terms = tokenize(statute_summary)
 
-                if has_negative and statute_has_positive:
-                    # Potential conflict - check for keyword overlap
-                    claim_terms = set(re.findall(r'\w+', claim_lower))
-                    statute_terms = set(re.findall(r'\w+', statute_summary))
-                    overlap = len(claim_terms.intersection(statute_terms))
+            for claim_terms in negative_claims:
+                # Potential conflict - check for keyword overlap
+                overlap = len(claim_terms.intersection(statute_terms))
 
-                    if overlap > 3:  # Significant overlap
-                        section_ref = f"{statute.get('act_name', 'Unknown')} s{statute.get('section', '?')}"
-                        conflict = (
-                            f"Potential conflict with {section_ref}: "
-                            f"claim appears to negate statutory requirement"
-                        )
-                        conflicts.append(conflict)
+                if overlap > 3:  # Significant overlap
+                    section_ref = f"{statute.get('act_name', 'Unknown')} s{statute.get('section', '?')}"
+                    conflict = (
+                        f"Potential conflict with {section_ref}: "
+                        f"claim appears to negate statutory requirement"
+                    )
+                    conflicts.append(conflict)
 
         print(f"[StatutoryRAGValidator] Detected {len(conflicts)} conflicts")
         return conflicts
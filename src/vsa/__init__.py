@@ -12,16 +12,19 @@ the Verridian AI legal reasoning system, including:
 
 Key Components:
     - LegalVSA: Main VSA engine for legal reasoning
+    - BinaryLegalVSA: Bit-packed backend (XOR bind, popcount similarity)
     - SpanAlignedVSA: Span-level issue detection
     - SpanIssue: Dataclass for representing detected issues
 """
 
 from .legal_vsa import LegalVSA, get_vsa_service
+from .binary_vsa import BinaryLegalVSA
 from .span_detector import SpanIssue, SpanAlignedVSA
 
 __all__ = [
     # Main VSA classes
     "LegalVSA",
+    "BinaryLegalVSA",
     "get_vsa_service",
 
     # Span detection classes
@@ -0,0 +1,147 @@
+"""
+Binary Legal VSA (Bit-Packed Hypervectors)
+==========================================
+
+LegalVSA backend that stores each bipolar hypervector as D/8 bytes
+(1,250 bytes at D = 10,000, 32x smaller than float32).
+
+Bit i is set where the bipolar value is -1, so:
+- Bind (multiply) is XOR
+- Bundle is a per-bit majority count (ties broken at random, as in LegalVSA)
+- Dot product is D - 2 * Hamming distance, with Hamming = popcount(XOR)
+
+similarity() and cleanup() return exactly the values the float backend
+gives for the same bipolar vectors. Packed vectors have no zero element,
+so the empty vector (the float zero vector) is a zero-length tensor that
+every operation treats like zero. Packed vectors live on the CPU; the
+popcount path runs in NumPy.
+
+Usage:
+    vsa = get_vsa_service("binary")   # or VSA_BACKEND=binary
+"""
+
+from typing import List
+
+import numpy as np
+import torch
+
+from src.vsa.legal_vsa import DIMENSION, ItemMemory, LegalVSA
+
+# Bit weights of one packed byte, most significant bit first
+_SHIFTS = torch.arange(7, -1, -1, dtype=torch.uint8)
+
+if hasattr(np, "bitwise_count"):  # NumPy >= 2.0
+    _popcount = np.bitwise_count
+else:
+    _POPCOUNT_TABLE = np.array([bin(i).count("1") for i in range(256)], dtype=np.uint8)
+
+    def _popcount(packed: np.ndarray) -> np.ndarray:
+        return _POPCOUNT_TABLE[packed]
+
+
+class BinaryLegalVSA(LegalVSA):
+    """
+    LegalVSA with bit-packed (D/8,) uint8 hypervectors.
+
+    empty_vector() is a zero-length tensor. Like the float zero vector it
+    is skipped by bundle(), absorbs bind() and permute(), and has
+    similarity 0 to every vector.
+    """
+
+    def __init__(self, dimension: int = DIMENSION, device: str = "cpu"):
+        if dimension % 8:
+            raise ValueError(f"Binary VSA dimension must be a multiple of 8, got {dimension}")
+        self.num_bytes = dimension // 8
+        super().__init__(dimension=dimension, device="cpu")
+
+    def _create_memory(self) -> ItemMemory:
+        return ItemMemory(self.num_bytes, self.device, dtype=torch.uint8)
+
+    def _generate_random_vector(self) -> torch.Tensor:
+        """Uniform random bits == random bipolar {-1, 1} values."""
+        return torch.randint(0, 256, (self.num_bytes,), device=self.device, dtype=torch.uint8)
+
+    # ------------------------------------------------------------------
+    # Packing
+    # ------------------------------------------------------------------
+
+    def pack(self, bipolar: torch.Tensor) -> torch.Tensor:
+        """(..., D) bipolar values -> (..., D/8) packed bytes."""
+        return self.pack_bits(bipolar < 0)
+
+    def pack_bits(self, bits: torch.Tensor) -> torch.Tensor:
+        """(..., D) bits -> (..., D/8) packed bytes."""
+        bits = bits.to(torch.uint8).reshape(*bits.shape[:-1], self.num_bytes, 8)
+        return (bits << _SHIFTS).sum(dim=-1, dtype=torch.uint8)
+
+    def unpack_bits(self, packed: torch.Tensor) -> torch.Tensor:
+        """(..., D/8) packed bytes -> (..., D) bits (1 where the value is -1)."""
+        bits = (packed.unsqueeze(-1) >> _SHIFTS) & 1
+        return bits.reshape(*packed.shape[:-1], self.dimension)
+
+    def to_bipolar(self, v: torch.Tensor) -> torch.Tensor:
+        if self.is_empty(v):
+            return torch.zeros(self.dimension)
+        return 1.0 - 2.0 * self.unpack_bits(v).to(torch.float32)
+
+    # ------------------------------------------------------------------
+    # VSA operations
+    # ------------------------------------------------------------------
+
+    def bind(self, v1: torch.Tensor, v2: torch.Tensor) -> torch.Tensor:
+        """Binding: XOR of the sign bits (== element-wise product)."""
+        if self.is_empty(v1) or self.is_empty(v2):
+            return self.empty_vector()
+        return torch.bitwise_xor(v1, v2)
+
+    def bundle(self, vectors) -> torch.Tensor:
+        """Bundling: per-bit majority over a list or stacked (N, D/8) tensor."""
+        if not isinstance(vectors, torch.Tensor):
+            vectors = [v for v in vectors if not self.is_empty(v)]
+        if len(vectors) == 0:
+            return self.empty_vector()
+
+        stacked = vectors if isinstance(vectors, torch.Tensor) else torch.stack(vectors)
+        negatives = self.unpack_bits(stacked).sum(dim=0, dtype=torch.int32)
+        return self.from_sum((stacked.shape[0] - 2 * negatives).to(torch.float32))
+
+    def empty_vector(self) -> torch.Tensor:
+        return torch.zeros(0, dtype=torch.uint8)
+
+    def is_empty(self, v: torch.Tensor) -> bool:
+        return v.shape[-1] == 0
+
+    def from_sum(self, sum_vec: torch.Tensor) -> torch.Tensor:
+        return self.pack(self._majority(sum_vec))
+
+    def permute(self, v: torch.Tensor, shifts: int = 1) -> torch.Tensor:
+        """Cyclic shift of the D bipolar positions."""
+        if self.is_empty(v):
+            return v
+        return self.pack_bits(torch.roll(self.unpack_bits(v), shifts=shifts, dims=0))
+
+    def similarity(self, v1: torch.Tensor, v2: torch.Tensor) -> float:
+        """Cosine similarity: (D - 2 * Hamming) / D."""
+        if self.is_empty(v1) or self.is_empty(v2):
+            return 0.0
+        hamming = int(_popcount(np.bitwise_xor(v1.numpy(), v2.numpy())).sum())
+        return (self.dimension - 2 * hamming) / self.dimension
+
+    def similarity_batch(self, vectors: torch.Tensor, v: torch.Tensor) -> List[float]:
+        """similarity() of each packed row of (B, D/8) to one vector."""
+        if self.is_empty(vectors) or self.is_empty(v):
+            return [0.0] * vectors.shape[0]
+        hamming = _popcount(np.bitwise_xor(vectors.numpy(), v.numpy())).sum(axis=1, dtype=np.int64)
+        return [(self.dimension - 2 * h) / self.dimension for h in hamming.tolist()]
+
+    def _memory_dots(self, vectors: torch.Tensor) -> torch.Tensor:
+        """(B, N) dot products via popcount of XOR against the packed memory."""
+        if self.is_empty(vectors):
+            return torch.zeros(vectors.shape[0], len(self.memory), dtype=torch.int64)
+        matrix = self.memory.matrix.numpy()
+        queries = vectors.numpy()
+        dots = np.empty((queries.shape[0], matrix.shape[0]), dtype=np.int64)
+        for row, query in enumerate(queries):
+            hamming = _popcount(np.bitwise_xor(matrix, query)).sum(axis=1, dtype=np.int64)
+            dots[row] = self.dimension - 2 * hamming
+        return torch.from_numpy(dots)
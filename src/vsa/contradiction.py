@@ -12,7 +12,6 @@ Algorithm:
 """
 
 from typing import List, Tuple
-import torch
 
 from src.logic.gsw_schema import GlobalWorkspace, LegalCase
 from src.vsa.legal_vsa import LegalVSA, get_vsa_service
@@ -40,7 +39,7 @@ class ContradictionDetector:
             
             # Encode Outcome (using simple concept lookup for now)
             # In reality, this would be a complex vector of the orders made.
-            outcome_vec = torch.zeros(self.vsa.dimension, device=self.vsa.device)
+            outcome_vec = self.vsa.empty_vector()
             # Hack: Use case title/type as proxy for outcome if not explicitly available,
             # or assume outcome is encoded in states with name "Outcome" or "Order".
             
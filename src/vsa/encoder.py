@@ -8,17 +8,65 @@ Allows the neuro-symbolic engine to reason about the extracted knowledge.
 Encoding Strategy:
 - Entity = Bind(ID, TYPE, NAME) + Bundle(ROLES) + Bundle(STATES)
 - Workspace = Bundle(Entities) + Bundle(Relationships)
+
+Scene vectors are cached per workspace, keyed on GlobalWorkspace.version.
+Each actor / verb vector is cached with a fingerprint of the fields it
+encodes, and the scene is the majority of a running sum, so a changed
+workspace only re-encodes the entities that changed.
 """
 
+import weakref
 import torch
-from typing import Union, List
+from typing import Dict, Set, Tuple, Union, List
 
 from src.logic.gsw_schema import GlobalWorkspace, ChunkExtraction, Actor, State, VerbPhrase
 from src.vsa.legal_vsa import LegalVSA, get_vsa_service
 
+class SceneCache:
+    """Encoding state of one workspace: entity vectors and their running sum."""
+
+    def __init__(self, vsa: LegalVSA):
+        self.vsa = vsa
+        self.key = None  # (version, actor count, verb count) the scene was built at
+        self.scene = None
+        self.total = torch.zeros(vsa.dimension, device=vsa.device)
+        self.actors: Dict[str, Tuple[tuple, torch.Tensor]] = {}  # id -> (fingerprint, vector)
+        self.verbs: Dict[str, Tuple[tuple, torch.Tensor]] = {}
+
+    def put(self, entries: Dict[str, Tuple[tuple, torch.Tensor]], item_id: str,
+            fingerprint: tuple, vector: torch.Tensor) -> None:
+        old = entries.get(item_id)
+        if old is not None:
+            self.total -= self.vsa.to_bipolar(old[1])
+        self.total += self.vsa.to_bipolar(vector)
+        entries[item_id] = (fingerprint, vector)
+
+    def drop(self, entries: Dict[str, Tuple[tuple, torch.Tensor]], keep) -> Set[str]:
+        """Remove entries whose id is not in keep; returns the removed ids."""
+        removed = set(entries.keys() - keep)
+        for item_id in removed:
+            self.total -= self.vsa.to_bipolar(entries.pop(item_id)[1])
+        return removed
+
+
 class GSWVSAEncoder:
     def __init__(self, vsa: LegalVSA = None):
         self.vsa = vsa if vsa else get_vsa_service()
+        self._scenes: Dict[int, SceneCache] = {}  # id(workspace) -> cache
+
+    @staticmethod
+    def actor_fingerprint(actor: Actor) -> tuple:
+        """The actor fields encode_actor() reads."""
+        return (
+            actor.actor_type.value,
+            actor.name,
+            tuple(actor.roles),
+            tuple((state.name, state.value) for state in actor.states),
+        )
+
+    @staticmethod
+    def verb_fingerprint(verb: VerbPhrase) -> tuple:
+        return (verb.verb, verb.agent_id, tuple(verb.patient_ids))
 
     def encode_actor(self, actor: Actor) -> torch.Tensor:
         """
@@ -31,9 +79,12 @@ class GSWVSAEncoder:
         v_name = self.vsa.get_vector(actor.name) # Names are auto-generated concepts
         identity = self.vsa.bind(v_type, v_name)
         
+        features = [identity]
+
         # 2. Roles
-        role_vectors = [self.vsa.get_vector(r.upper()) for r in actor.roles]
-        roles_bundled = self.vsa.bundle(role_vectors)
+        if actor.roles:
+            role_vectors = [self.vsa.get_vector(r.upper()) for r in actor.roles]
+            features.append(self.vsa.bundle(role_vectors))
         
         # 3. States
         # State = Name * Value
@@ -42,26 +93,30 @@ class GSWVSAEncoder:
             v_s_name = self.vsa.get_vector(state.name.upper())
             v_s_val = self.vsa.get_vector(state.value.upper())
             state_vectors.append(self.vsa.bind(v_s_name, v_s_val))
-        states_bundled = self.vsa.bundle(state_vectors)
+        if state_vectors:
+            features.append(self.vsa.bundle(state_vectors))
         
-        # Combine all features
-        return self.vsa.bundle([identity, roles_bundled, states_bundled])
+        # Combine all features (missing roles/states add nothing)
+        return self.vsa.bundle(features)
 
     def encode_verb(self, verb: VerbPhrase, actor_map: dict) -> torch.Tensor:
         """
         Encodes a relationship (Verb Phrase).
         Vector = Agent * Action * Patient
+        (the empty vector if the agent or every patient is unknown)
         """
         # Find agent vector
-        agent_vec = torch.zeros(self.vsa.dimension, device=self.vsa.device)
-        if verb.agent_id and verb.agent_id in actor_map:
-            agent_vec = actor_map[verb.agent_id]
+        if not verb.agent_id or verb.agent_id not in actor_map:
+            return self.vsa.empty_vector()
+        agent_vec = actor_map[verb.agent_id]
             
         # Find patient vectors
         patient_vecs = []
         for pid in verb.patient_ids:
             if pid in actor_map:
                 patient_vecs.append(actor_map[pid])
+        if not patient_vecs:
+            return self.vsa.empty_vector()
         patient_bundled = self.vsa.bundle(patient_vecs)
         
         # Action vector
@@ -73,25 +128,51 @@ class GSWVSAEncoder:
     def encode_workspace(self, workspace: GlobalWorkspace) -> torch.Tensor:
         """
         Encodes an entire workspace into a single Scene Vector.
+
+        Cached: an unchanged workspace returns the previous scene, and a
+        changed one re-encodes only new or modified actors and the verbs
+        that involve them.
         """
-        # 1. Encode all Actors
+        cache = self._scene_cache(workspace)
+        key = (workspace.version, len(workspace.actors), len(workspace.verb_phrases))
+        if cache.key == key:
+            return cache.scene
+
+        # 1. Actors whose encoded fields changed
+        changed = cache.drop(cache.actors, workspace.actors.keys())
         actor_vectors = {} # ID -> Vector
-        actor_list = []
-        
         for actor_id, actor in workspace.actors.items():
-            vec = self.encode_actor(actor)
-            actor_vectors[actor_id] = vec
-            actor_list.append(vec)
-            
-        # 2. Encode all Relationships (Verbs)
-        verb_list = []
-        for verb in workspace.verb_phrases.values():
-            vec = self.encode_verb(verb, actor_vectors)
-            verb_list.append(vec)
-            
-        # 3. Bundle Everything
-        scene_vector = self.vsa.bundle(actor_list + verb_list)
-        return scene_vector
+            fingerprint = self.actor_fingerprint(actor)
+            entry = cache.actors.get(actor_id)
+            if entry is None or entry[0] != fingerprint:
+                cache.put(cache.actors, actor_id, fingerprint, self.encode_actor(actor))
+                changed.add(actor_id)
+            actor_vectors[actor_id] = cache.actors[actor_id][1]
+
+        # 2. Relationships that changed or involve a changed actor
+        cache.drop(cache.verbs, workspace.verb_phrases.keys())
+        for verb_id, verb in workspace.verb_phrases.items():
+            fingerprint = self.verb_fingerprint(verb)
+            entry = cache.verbs.get(verb_id)
+            if (entry is None or entry[0] != fingerprint
+                    or verb.agent_id in changed or not changed.isdisjoint(verb.patient_ids)):
+                cache.put(cache.verbs, verb_id, fingerprint, self.encode_verb(verb, actor_vectors))
+
+        # 3. Bundle Everything (majority of the running sum)
+        if cache.actors or cache.verbs:
+            cache.scene = self.vsa.from_sum(cache.total.clone())
+        else:
+            cache.scene = self.vsa.empty_vector()
+        cache.key = key
+        return cache.scene
+
+    def _scene_cache(self, workspace: GlobalWorkspace) -> SceneCache:
+        cache = self._scenes.get(id(workspace))
+        if cache is None:
+            cache = self._scenes[id(workspace)] = SceneCache(self.vsa)
+            # Forget the cache when the workspace is garbage collected
+            weakref.finalize(workspace, self._scenes.pop, id(workspace), None)
+        return cache
 
     def encode_chunk(self, chunk: ChunkExtraction) -> torch.Tensor:
         """
@@ -7,11 +7,16 @@ Provides symbolic reasoning, binding/unbinding of concepts, and anti-hallucinati
 
 This module uses Hyperdimensional Computing (HDC) with bipolar vectors {-1, 1}.
 Implemented using PyTorch for GPU acceleration.
+
+A bit-packed backend (src/vsa/binary_vsa.py) stores the same vectors as
+D/8 bytes; select it with get_vsa_service("binary") or VSA_BACKEND=binary.
 """
 
+import os
 import torch
 import numpy as np
-from typing import Dict, List, Optional, Tuple, Union
+from collections.abc import Mapping
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple, Union
 from dataclasses import dataclass
 
 from src.vsa.ontology import get_all_tokens, LOGIC_RULES
@@ -19,6 +24,64 @@ from src.vsa.ontology import get_all_tokens, LOGIC_RULES
 # Hypervector Dimension (D)
 DIMENSION = 10000 
 
+
+class ItemMemory(Mapping):
+    """
+    Item memory: concept name -> hypervector, stored as one contiguous
+    (N, D) tensor with a name -> row map.
+
+    Behaves as a read-only dict of row views; whole-memory operations
+    (cleanup, nearest concept) are a single matmul over `matrix`.
+    Rows are appended into a capacity-doubling buffer.
+
+    `dimension` is the row width: D floats, or D/8 bytes for packed vectors.
+    """
+
+    def __init__(self, dimension: int, device: torch.device, capacity: int = 256,
+                 dtype: torch.dtype = torch.float32):
+        self.dimension = dimension
+        self.device = device
+        self.dtype = dtype
+        self.names: List[str] = []
+        self.rows: Dict[str, int] = {}
+        self._matrix = torch.zeros((capacity, dimension), device=device, dtype=dtype)
+
+    @property
+    def matrix(self) -> torch.Tensor:
+        """(N, D) view of the stored hypervectors, in insertion order."""
+        return self._matrix[:len(self.names)]
+
+    def add(self, name: str, vector: torch.Tensor) -> torch.Tensor:
+        """Store a new concept; returns its row view."""
+        row = len(self.names)
+        if row == self._matrix.shape[0]:
+            grown = torch.zeros(
+                (2 * self._matrix.shape[0], self.dimension), device=self.device, dtype=self.dtype
+            )
+            grown[:row] = self._matrix[:row]
+            self._matrix = grown
+        self._matrix[row] = vector
+        self.names.append(name)
+        self.rows[name] = row
+        return self._matrix[row]
+
+    def indices(self, names: Sequence[str]) -> torch.Tensor:
+        """Row indices of known concepts (as a tensor for gathering)."""
+        return torch.tensor([self.rows[n] for n in names], device=self.device, dtype=torch.long)
+
+    def __getitem__(self, name: str) -> torch.Tensor:
+        return self._matrix[self.rows[name]]
+
+    def __contains__(self, name) -> bool:
+        return name in self.rows
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.names)
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+
 class LegalVSA:
     """
     Vector Symbolic Architecture engine for Legal Reasoning.
@@ -27,13 +90,19 @@ class LegalVSA:
         self.dimension = dimension
         self.device = torch.device(device if torch.cuda.is_available() else "cpu")
         
-        # Item Memory: Concept String -> Hypervector (D,)
-        self.memory: Dict[str, torch.Tensor] = {} 
+        # Item Memory: Concept String -> Hypervector (D,), one (N, D) tensor
+        self.memory = self._create_memory()
         self.inverse_memory: Dict[str, str] = {} # Hash -> Name (simplified)
+
+        # Knowledge base vector (LOGIC_RULES is static, encode once)
+        self._kb_vector: Optional[torch.Tensor] = None
         
         # Initialize Ontology (Phase 2.3)
         self._initialize_ontology()
 
+    def _create_memory(self) -> ItemMemory:
+        return ItemMemory(self.dimension, self.device)
+
     def _initialize_ontology(self):
         """Generates orthogonal vectors for all ontology terms."""
         tokens = get_all_tokens()
@@ -51,8 +120,7 @@ class LegalVSA:
     def add_concept(self, name: str) -> torch.Tensor:
         """Adds a new concept to memory."""
         if name not in self.memory:
-            vec = self._generate_random_vector()
-            self.memory[name] = vec
+            return self.memory.add(name, self._generate_random_vector())
         return self.memory[name]
 
     def get_vector(self, name: str) -> torch.Tensor:
@@ -73,18 +141,44 @@ class LegalVSA:
         """
         return v1 * v2
 
-    def bundle(self, vectors: List[torch.Tensor]) -> torch.Tensor:
+    def bundle(self, vectors: Union[List[torch.Tensor], torch.Tensor]) -> torch.Tensor:
         """
         Bundling operation (SUPERPOSITION).
         Element-wise addition followed by sign function (Majority Rule).
         Result is similar to all inputs.
+        Accepts a list of (D,) vectors or a stacked (N, D) tensor.
+        Empty vectors in a list are skipped.
         """
-        if not vectors:
-            return torch.zeros(self.dimension, device=self.device)
+        if not isinstance(vectors, torch.Tensor):
+            vectors = [v for v in vectors if not self.is_empty(v)]
+        if len(vectors) == 0:
+            return self.empty_vector()
         
         # Sum
-        sum_vec = torch.stack(vectors).sum(dim=0)
-        
+        stacked = vectors if isinstance(vectors, torch.Tensor) else torch.stack(vectors)
+        return self._majority(stacked.sum(dim=0))
+
+    def empty_vector(self) -> torch.Tensor:
+        """
+        The bundle of nothing: skipped by bundle(), zero when bound and
+        similarity 0 to every vector.
+        """
+        return torch.zeros(self.dimension, device=self.device)
+
+    def is_empty(self, v: torch.Tensor) -> bool:
+        """Whether v is empty_vector()."""
+        return not bool(v.any())
+
+    def to_bipolar(self, v: torch.Tensor) -> torch.Tensor:
+        """Float {-1, 0, 1} values of a hypervector, for summing outside bundle()."""
+        return v
+
+    def from_sum(self, sum_vec: torch.Tensor) -> torch.Tensor:
+        """Hypervector of a sum of to_bipolar() values (majority rule, modifies sum_vec)."""
+        return self._majority(sum_vec)
+
+    def _majority(self, sum_vec: torch.Tensor) -> torch.Tensor:
+        """Binarize a sum of hypervectors."""
         # Binarize (Majority Rule)
         # Zeros are random tie-break
         zeros = sum_vec == 0
@@ -106,41 +200,95 @@ class LegalVSA:
         # For bipolar vectors, cosine sim is dot product / D
         return torch.dot(v1, v2).item() / self.dimension
 
+    def similarity_batch(self, vectors: torch.Tensor, v: torch.Tensor) -> List[float]:
+        """similarity() of each row of a (B, D) tensor to one vector: one matvec."""
+        return [dot / self.dimension for dot in (vectors @ v).tolist()]
+
     def cleanup(self, noisy_vector: torch.Tensor, threshold: float = 0.3) -> List[Tuple[str, float]]:
         """
         Finds the closest concepts in memory to the noisy vector.
         Returns list of (Concept, Similarity).
         """
+        return self.cleanup_batch(noisy_vector.unsqueeze(0), threshold)[0]
+
+    def cleanup_batch(
+        self,
+        noisy_vectors: torch.Tensor,
+        threshold: float = 0.3,
+        top_k: Optional[int] = None
+    ) -> List[List[Tuple[str, float]]]:
+        """
+        Cleans up many noisy vectors at once: one (B, D) x (D, N) matmul.
+
+        Args:
+            noisy_vectors: (B, D) tensor
+            threshold: Minimum similarity to report
+            top_k: Keep at most this many concepts per vector
+
+        Returns:
+            Per input vector, (Concept, Similarity) sorted by similarity
+            (ties in memory insertion order)
+        """
+        if len(self.memory) == 0:
+            return [[] for _ in range(noisy_vectors.shape[0])]
+
+        dots = self._memory_dots(noisy_vectors)
+        sorted_dots, order = torch.sort(dots, dim=1, descending=True, stable=True)
+        keep = (sorted_dots.double() / self.dimension > threshold).sum(dim=1)
+        if top_k is not None:
+            keep = keep.clamp(max=top_k)
+
+        names = self.memory.names
+        order_rows = order.tolist()
+        dot_rows = dots.tolist()
         results = []
-        # Linear scan (ok for <10k items). For larger, use FAISS/quantization.
-        for name, vec in self.memory.items():
-            sim = self.similarity(noisy_vector, vec)
-            if sim > threshold:
-                results.append((name, sim))
-        
-        return sorted(results, key=lambda x: x[1], reverse=True)
+        for row, count in enumerate(keep.tolist()):
+            columns = order_rows[row][:count]
+            results.append([
+                (names[col], dot_rows[row][col] / self.dimension) for col in columns
+            ])
+        return results
+
+    def _memory_dots(self, vectors: torch.Tensor) -> torch.Tensor:
+        """(B, N) dot products of vectors against every stored concept."""
+        return vectors.to(self.memory.matrix.dtype) @ self.memory.matrix.T
+
+    def nearest_concepts(self, vector: torch.Tensor, k: int = 5) -> List[Tuple[str, float]]:
+        """The k most similar concepts in memory (no threshold)."""
+        return self.cleanup_batch(vector.unsqueeze(0), threshold=float("-inf"), top_k=k)[0]
 
     def encode_graph(self, triplets: List[Tuple[str, str, str]]) -> torch.Tensor:
         """
         Encodes a knowledge graph (Subject, Relation, Object) into a single hypervector.
         Graph = Sum( Subj * Rel * Obj )
         """
-        edges = []
-        for s, r, o in triplets:
-            v_s = self.get_vector(s)
-            v_r = self.get_vector(r)
-            v_o = self.get_vector(o)
-            
-            # Binding: Subject * Relation * Object
-            # Note: This is commutative. A*B*C = C*B*A.
-            # To preserve direction, we could use permutation: A * Roll(B) * Roll(Roll(C))
-            # Or specific role binding: (SUBJ*s) + (REL*r) + (OBJ*o)
-            
-            # Simple approach for now: Holistic Triplet
-            edges.append(self.bind(self.bind(v_s, v_r), v_o))
-            
+        if not triplets:
+            return self.bundle([])
+
+        for triplet in triplets:
+            for name in triplet:
+                self.get_vector(name)
+        subjects, relations, objects = zip(*triplets)
+        matrix = self.memory.matrix
+
+        # Binding: Subject * Relation * Object (gathered rows, all edges at once)
+        # Note: This is commutative. A*B*C = C*B*A.
+        # To preserve direction, we could use permutation: A * Roll(B) * Roll(Roll(C))
+        # Or specific role binding: (SUBJ*s) + (REL*r) + (OBJ*o)
+
+        # Simple approach for now: Holistic Triplet
+        edges = self.bind(
+            self.bind(matrix[self.memory.indices(subjects)], matrix[self.memory.indices(relations)]),
+            matrix[self.memory.indices(objects)]
+        )
         return self.bundle(edges)
 
+    def kb_vector(self) -> torch.Tensor:
+        """Hypervector of the knowledge base rules (encoded once)."""
+        if self._kb_vector is None:
+            self._kb_vector = self.encode_graph(LOGIC_RULES)
+        return self._kb_vector
+
     def _classify_issue_severity(self, issue: str) -> str:
         """
         Classifies issue severity based on content.
@@ -188,19 +336,15 @@ class LegalVSA:
         if not concepts:
             return 0.0
 
-        # Encode the concepts as a bundled vector
-        concept_vectors = []
-        for concept in concepts:
-            if concept in self.memory:
-                concept_vectors.append(self.get_vector(concept))
-
-        if not concept_vectors:
+        # Encode the concepts as a bundled vector (gathered rows)
+        known = [concept for concept in concepts if concept in self.memory]
+        if not known:
             return 0.0
 
-        concept_bundle = self.bundle(concept_vectors)
+        concept_bundle = self.bundle(self.memory.matrix[self.memory.indices(known)])
 
         # Encode knowledge base
-        kb_vector = self.encode_graph(LOGIC_RULES)
+        kb_vector = self.kb_vector()
 
         # Calculate similarity
         sim = self.similarity(concept_bundle, kb_vector)
@@ -277,9 +421,6 @@ class LegalVSA:
                 - concept_coverage: Percentage of concepts in ontology
                 - kb_similarity: Similarity to knowledge base
         """
-        # Encode Knowledge Base (Rules)
-        kb_vector = self.encode_graph(LOGIC_RULES)
-
         issues = []
 
         # Check specific rules
@@ -324,11 +465,29 @@ class LegalVSA:
             "kb_similarity": kb_similarity
         }
 
-# Singleton instance
-_vsa_instance = None
+# Singleton instance per backend
+_vsa_instances: Dict[str, LegalVSA] = {}
+
+VSA_BACKENDS = ("float", "binary")
 
-def get_vsa_service() -> LegalVSA:
-    global _vsa_instance
-    if _vsa_instance is None:
-        _vsa_instance = LegalVSA()
-    return _vsa_instance
+
+def get_vsa_service(backend: Optional[str] = None) -> LegalVSA:
+    """
+    Shared VSA engine.
+
+    Args:
+        backend: "float" (float32 bipolar tensors) or "binary" (bit-packed,
+            XOR / popcount). Defaults to the VSA_BACKEND environment
+            variable, then "float".
+    """
+    backend = (backend or os.environ.get("VSA_BACKEND") or "float").lower()
+    if backend not in VSA_BACKENDS:
+        raise ValueError(f"Unknown VSA backend: {backend} (expected one of {VSA_BACKENDS})")
+
+    if backend not in _vsa_instances:
+        if backend == "binary":
+            from src.vsa.binary_vsa import BinaryLegalVSA
+            _vsa_instances[backend] = BinaryLegalVSA()
+        else:
+            _vsa_instances[backend] = LegalVSA()
+    return _vsa_instances[backend]
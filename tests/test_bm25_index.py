@@ -0,0 +1,97 @@
+"""
+Test Persistent BM25 Index
+
+Validates:
+1. Scores and rankings match SimpleBM25 on the same corpus
+2. Citation lookup and malformed-line handling match the old loader
+3. LegalRetriever builds the index once, then reuses it until the corpus changes
+"""
+
+import json
+import os
+import random
+import sys
+from pathlib import Path
+
+project_root = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(project_root))
+
+from src.retrieval.bm25_index import BM25Index, build_corpus_index
+
+WORDS = ("parenting orders child relocation property settlement spousal maintenance "
+         "contravention consent family violence interim hearing appeal mother father").split()
+
+
+def write_corpus(path: Path, count: int = 200, seed: int = 1) -> None:
+    rng = random.Random(seed)
+    with open(path, 'w', encoding='utf-8') as f:
+        for i in range(count):
+            text = " ".join(rng.choice(WORDS) for _ in range(rng.randint(5, 60)))
+            f.write(json.dumps({"citation": f"Smith & Smith [{2000 + i % 20}] FamCA {i}", "text": text}) + "\n")
+            if i == 50:
+                f.write("not json\n")
+
+
+def simple_bm25(path: Path):
+    from src.retrieval.retriever import SimpleBM25
+    bm25 = SimpleBM25()
+    with open(path, encoding='utf-8') as f:
+        for line in f:
+            try:
+                doc = json.loads(line)
+            except ValueError:
+                continue
+            bm25.add_document(doc['text'], {'id': doc['citation']})
+    bm25.finalize()
+    return bm25
+
+
+def test_scores_match_simple_bm25(tmp_path):
+    corpus = tmp_path / "family.jsonl"
+    write_corpus(corpus)
+    index = BM25Index.load(build_corpus_index(corpus, tmp_path / "index"))
+    reference = simple_bm25(corpus)
+
+    assert index.corpus_size == reference.corpus_size == 200
+    for query in ["parenting orders", "child child relocation", "appeal hearing mother", "unknown"]:
+        expected = reference.search(query, top_k=200)
+        actual = index.search(query, top_k=200)
+        assert {d['id']: s for d, s in actual} == {d['id']: s for d, s in expected}
+        top = index.search(query, top_k=5)
+        assert [s for _, s in top] == sorted((s for _, s in expected), reverse=True)[:5]
+
+
+def test_citation_lookup(tmp_path):
+    corpus = tmp_path / "family.jsonl"
+    write_corpus(corpus)
+    index = BM25Index.load(build_corpus_index(corpus, tmp_path / "index"))
+    citations = index.citation_lookup()
+
+    doc = citations["smith & smith [2003] famca 3"]
+    assert doc['id'] == "Smith & Smith [2003] FamCA 3"
+    assert doc['type'] == 'case' and len(doc['text_preview']) <= 200
+    assert len(citations) == 200
+
+
+def test_retriever_reuses_prebuilt_index(tmp_path, capsys):
+    from src.retrieval.retriever import LegalRetriever
+
+    (tmp_path / "by_court").mkdir()
+    corpus = tmp_path / "by_court" / "family.jsonl"
+    write_corpus(corpus, count=30)
+
+    first = LegalRetriever(data_dir=str(tmp_path), enable_vsa_validation=False)
+    assert "Building BM25 index" in capsys.readouterr().out
+    hits = first.search("parenting orders", top_k=3)
+    assert len(hits) == 3 and all('score' in h for h in hits)
+    assert first.search("Smith & Smith [2004] FamCA 4")[0]['id'] == "Smith & Smith [2004] FamCA 4"
+
+    second = LegalRetriever(data_dir=str(tmp_path), enable_vsa_validation=False)
+    assert "Building BM25 index" not in capsys.readouterr().out
+    assert second.search("parenting orders", top_k=3) == hits
+
+    write_corpus(corpus, count=40, seed=2)
+    os.utime(corpus, (1, 1))
+    third = LegalRetriever(data_dir=str(tmp_path), enable_vsa_validation=False)
+    assert "Building BM25 index" in capsys.readouterr().out
+    assert third.bm25.corpus_size == 40
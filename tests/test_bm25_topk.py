@@ -0,0 +1,62 @@
+"""
+Test SimpleBM25 Top-k Pruning
+
+Validates:
+1. MaxScore and WAND return exactly the exhaustive ranking and scores
+2. Repeated query terms, unknown terms and top_k larger than the hits
+3. Index grown after a search is re-finalized before pruning
+"""
+
+import random
+import sys
+from pathlib import Path
+
+import pytest
+
+project_root = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(project_root))
+
+from src.retrieval.retriever import SimpleBM25
+
+COMMON = ["court", "order", "child"]
+RARE = [f"term{i}" for i in range(40)]
+
+
+def make_index(seed: int, docs: int = 300) -> SimpleBM25:
+    rng = random.Random(seed)
+    bm25 = SimpleBM25()
+    for i in range(docs):
+        words = rng.choices(COMMON, k=rng.randint(1, 20)) + rng.choices(RARE, k=rng.randint(0, 8))
+        bm25.add_document(" ".join(words), {"id": i})
+    bm25.finalize()
+    return bm25
+
+
+@pytest.mark.parametrize("method", ["maxscore", "wand"])
+def test_pruned_search_matches_exhaustive(method):
+    for seed in range(5):
+        bm25 = make_index(seed)
+        rng = random.Random(100 + seed)
+        for _ in range(20):
+            query = " ".join(rng.sample(COMMON, 2) + rng.sample(RARE, rng.randint(1, 3)))
+            for top_k in (1, 5, 10):
+                expected = bm25.search(query, top_k=top_k, method="exhaustive")
+                assert bm25.search(query, top_k=top_k, method=method) == expected
+
+
+@pytest.mark.parametrize("method", ["maxscore", "wand"])
+def test_query_edge_cases(method):
+    bm25 = make_index(7)
+    for query in ["court court term3", "unknown words only", "term1 unknown", ""]:
+        assert bm25.search(query, top_k=500, method=method) == \
+            bm25.search(query, top_k=500, method="exhaustive")
+    assert bm25.search("court", top_k=0, method=method) == []
+    with pytest.raises(ValueError):
+        bm25.search("court", method="bogus")
+
+
+def test_documents_added_after_search():
+    bm25 = make_index(3, docs=50)
+    bm25.search("court term1")
+    bm25.add_document("term1 " * 30, {"id": "late"})
+    assert bm25.search("court term1", top_k=1)[0][0] == {"id": "late"}
@@ -0,0 +1,68 @@
+"""
+Test Single-Pass Citation Scanner
+
+Validates:
+1. All citation formats are found once each, sorted, without self-references
+2. Actions follow ACTION_PATTERNS priority within the 500-character window
+3. Each citation is classified at its own first occurrence
+4. A build with a process pool produces the same graph as a serial build
+"""
+
+import json
+import sys
+from pathlib import Path
+
+project_root = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(project_root))
+
+from src.graph.spcnet_builder import CONTEXT_WINDOW, SPCNetBuilder, scan_citations
+
+
+def test_finds_each_citation_once():
+    text = (
+        "Smith v Jones [2010] HCA 4 at [12]. See [2015] NSWSC 101, (1992) 175 CLR 1 "
+        "and again [2015] NSWSC 101. This case is [2020] HCA 9."
+    )
+    found = scan_citations(text, "[2020] HCA 9")
+    assert [c for c, _ in found] == ["(1992) 175 CLR 1", "[2010] HCA 4", "[2015] NSWSC 101"]
+    assert all(action == "CITED" for _, action in found)
+    assert scan_citations("") == []
+
+
+def test_action_priority_and_window():
+    padding = "x " * CONTEXT_WINDOW
+    text = f"We considered and then followed [2010] HCA 4. {padding} Overruled. {padding} [2011] HCA 5"
+    assert scan_citations(text) == [("[2010] HCA 4", "FOLLOWED"), ("[2011] HCA 5", "CITED")]
+
+    # Case-insensitive cues; 'distinguished' outranks 'overruled'
+    text = "[2012] FCAFC 7 was OVERRULED, and Distinguishing it matters."
+    assert scan_citations(text) == [("[2012] FCAFC 7", "DISTINGUISHED")]
+
+
+def test_classified_at_own_occurrence():
+    padding = "x " * CONTEXT_WINDOW
+    # "[2010] HCA 1" is a prefix of "[2010] HCA 12", which appears first
+    text = f"Applied [2010] HCA 12. {padding} [2010] HCA 1 was rejected."
+    assert scan_citations(text) == [("[2010] HCA 1", "OVERRULED"), ("[2010] HCA 12", "FOLLOWED")]
+
+
+def test_process_pool_matches_serial_build(tmp_path):
+    input_dir = tmp_path / "cases"
+    input_dir.mkdir()
+    for d in range(3):
+        with open(input_dir / f"domain_{d}.jsonl", 'w', encoding='utf-8') as f:
+            for i in range(10):
+                n = d * 10 + i
+                text = f"Followed [2010] HCA {(n + 1) % 30}. Considered [2010] HCA {(n * 7) % 30}."
+                f.write(json.dumps({"citation": f"Case {n} [2010] HCA {n}", "text": text}) + "\n")
+
+    serial = SPCNetBuilder(input_dir, tmp_path / "serial")
+    serial.build()
+    pooled = SPCNetBuilder(input_dir, tmp_path / "pooled", workers=2)
+    pooled.build()
+
+    assert list(pooled.nodes) == list(serial.nodes)
+    assert pooled.edges == serial.edges
+    assert pooled.build_stats == serial.build_stats == {
+        "files_reused": 0, "files_scanned": 3, "docs_reused": 0, "docs_extracted": 30,
+    }
@@ -0,0 +1,144 @@
+"""
+Test Embedding Service
+
+Validates:
+1. Texts are deduplicated, encoded in batches and served from the cache
+2. The persistent cache survives a new service instance
+3. VectorIndex top-k agrees with a brute-force scan
+4. LocalVectorStore and VectorReconciler match similar entity names
+5. VectorReconciler re-embeds only actors added since its last sync
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+
+project_root = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(project_root))
+
+from src.embeddings.embedding_service import (
+    EmbeddingCache, EmbeddingService, HashingEncoder, VectorIndex
+)
+
+
+class CountingEncoder(HashingEncoder):
+    def __init__(self):
+        super().__init__(dim=64)
+        self.calls = []
+
+    def encode(self, texts, batch_size=64):
+        self.calls.append(list(texts))
+        return super().encode(texts, batch_size)
+
+
+def test_batched_and_cached(tmp_path):
+    encoder = CountingEncoder()
+    service = EmbeddingService(encoder, cache=EmbeddingCache(tmp_path / "emb.sqlite"))
+
+    vectors = service.embed(["John Smith", "Jane Smith", "John Smith"])
+    assert vectors.shape == (3, 64) and vectors.dtype == np.float32
+    assert np.allclose(vectors[0], vectors[2])
+    assert np.allclose(np.linalg.norm(vectors, axis=1), 1.0)
+    assert encoder.calls == [["John Smith", "Jane Smith"]]
+
+    service.embed(["Jane Smith", "Family Court"])
+    assert encoder.calls[-1] == ["Family Court"]
+
+    # A fresh service reads the persistent cache instead of encoding
+    fresh_encoder = CountingEncoder()
+    fresh = EmbeddingService(fresh_encoder, cache=EmbeddingCache(tmp_path / "emb.sqlite"))
+    assert np.allclose(fresh.embed(["John Smith"])[0], vectors[0])
+    assert fresh_encoder.calls == []
+
+
+def test_index_search_matches_brute_force():
+    rng = np.random.default_rng(5)
+    vectors = rng.normal(size=(300, 32)).astype(np.float32)
+    vectors /= np.linalg.norm(vectors, axis=1, keepdims=True)
+    ids = [f"e{i}" for i in range(300)]
+
+    index = VectorIndex(32)
+    index.add(ids[:100], vectors[:100])
+    index.add(ids[100:], vectors[100:])
+    index.add(["e5"], vectors[5:6])  # overwrite keeps one row
+    assert len(index) == 300
+
+    queries = vectors[:7] + 0.1 * rng.normal(size=(7, 32)).astype(np.float32)
+    for query, hits in zip(queries, index.search(queries, k=5)):
+        expected = np.argsort(-(vectors @ query))[:5]
+        assert [h[0] for h in hits] == [ids[i] for i in expected]
+    assert [best for best, _ in index.best_match(queries)] == ids[:7]
+
+
+def test_vector_store_and_reconciler():
+    from src.embeddings.vector_store import LocalVectorStore
+    from src.gsw.vector_reconciler import VectorReconciler
+    from src.logic.gsw_schema import Actor, ActorType, GlobalWorkspace
+
+    service = EmbeddingService(HashingEncoder(dim=512))
+    store = LocalVectorStore(service=service)
+    store.add_entities([("p1", "John Andrew Smith"), ("p2", "Family Court of Australia")])
+    assert store.find_similar_entities(
+        ["John Andrew Smith", "Federal Circuit Court", "family court of australia"], threshold=0.9
+    ) == ["p1", None, "p2"]
+
+    workspace = GlobalWorkspace()
+    workspace.add_actor(Actor(id="a1", name="John Andrew Smith", actor_type=ActorType.PERSON))
+    workspace.add_actor(Actor(id="a2", name="Jane Smith", actor_type=ActorType.PERSON))
+    reconciler = VectorReconciler(service=service, threshold=0.8)
+    matches = reconciler.match_entities([
+        Actor(id="n1", name="john andrew smith", actor_type=ActorType.PERSON),
+        Actor(id="n2", name="Department of Home Affairs", actor_type=ActorType.ORGANIZATION),
+    ], workspace)
+
+    assert [(m["new_entity_id"], m["existing_entity_id"]) for m in matches] == [("n1", "a1")]
+    assert reconciler.compute_similarity("Jane Smith", "Jane Smith") > 0.99
+
+
+def test_reconciler_syncs_only_added_actors():
+    import gc
+    from src.gsw.vector_reconciler import VectorReconciler
+    from src.logic.gsw_schema import Actor, ActorType, GlobalWorkspace
+
+    class CountingReconciler(VectorReconciler):
+        def __init__(self, **kwargs):
+            super().__init__(**kwargs)
+            self.embedded = []
+
+        def actor_text(self, actor):
+            self.embedded.append(actor.id)
+            return super().actor_text(actor)
+
+    reconciler = CountingReconciler(service=EmbeddingService(HashingEncoder(dim=64)))
+    workspace = GlobalWorkspace()
+    for i in range(5):
+        workspace.add_actor(Actor(id=f"a{i}", name=f"Person {i}", actor_type=ActorType.PERSON))
+    reconciler.sync(workspace)
+    assert sorted(reconciler.embedded) == ["a0", "a1", "a2", "a3", "a4"]
+
+    # Only new and re-added actors are looked at on later syncs
+    reconciler.embedded.clear()
+    reconciler.sync(workspace)
+    assert reconciler.embedded == []
+    workspace.add_actor(Actor(id="a5", name="Person 5", actor_type=ActorType.PERSON))
+    actor = workspace.actors["a1"]
+    actor.aliases.append("P1")
+    workspace.add_actor(actor)
+    reconciler.sync(workspace)
+    assert reconciler.embedded == ["a5", "a1"]
+    assert reconciler._indexed_text["a1"] == "Person 1; P1"
+
+    # Direct dict inserts fall back to a full scan
+    reconciler.embedded.clear()
+    workspace.actors["a6"] = Actor(id="a6", name="Person 6", actor_type=ActorType.PERSON)
+    reconciler.sync(workspace)
+    assert "a6" in reconciler._indexed_text
+
+    # A new workspace is indexed from scratch, even if it reuses the old id()
+    del workspace, actor
+    gc.collect()
+    fresh = GlobalWorkspace()
+    fresh.add_actor(Actor(id="b1", name="Other", actor_type=ActorType.PERSON))
+    reconciler.sync(fresh)
+    assert list(reconciler._indexed_text) == ["b1"]
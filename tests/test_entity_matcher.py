@@ -0,0 +1,76 @@
+"""
+Test EntityMatcher Rule-Based Reconciliation
+
+Validates:
+1. Indexed matching returns the same matches as a scan of every actor
+2. Merged aliases/roles are picked up after re-adding the actor
+"""
+
+import random
+import sys
+from pathlib import Path
+
+project_root = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(project_root))
+
+from src.gsw.entity_matcher import EntityMatcher
+from src.logic.gsw_schema import Actor, ActorType, GlobalWorkspace
+
+NAMES = ["John Smith", "Jane Smith", "the husband", "the wife", "the child",
+         "the applicant", "Mr Smith", " Family Court ", "ACME Pty Ltd", "the respondent"]
+ROLES = ["Husband", "Wife", "Applicant", "Respondent", "Child", "Subject Child",
+         "Applicant Husband", "Court", "Father"]
+
+
+def scan_reconcile(matcher: EntityMatcher, new_actors, workspace):
+    """Reference: compare each new actor with every workspace actor."""
+    matches = []
+    for new_actor in new_actors:
+        new_name = new_actor.name.lower().strip()
+        new_aliases = [a.lower().strip() for a in new_actor.aliases]
+        for existing_id, existing_actor in workspace.actors.items():
+            found, reason = matcher._check_match(new_actor, new_name, new_aliases, existing_actor)
+            if found:
+                matches.append({"new_entity_id": new_actor.id, "existing_entity_id": existing_id,
+                                "confidence": 0.8, "reason": reason})
+                break
+    return matches
+
+
+def random_actor(rng: random.Random, actor_id: str) -> Actor:
+    return Actor(
+        id=actor_id,
+        name=rng.choice(NAMES).upper() if rng.random() < 0.2 else rng.choice(NAMES),
+        actor_type=ActorType.PERSON,
+        aliases=rng.sample(NAMES, rng.randint(0, 2)),
+        roles=rng.sample(ROLES, rng.randint(0, 2)),
+    )
+
+
+def test_matches_full_scan():
+    rng = random.Random(11)
+    matcher = EntityMatcher()
+    for trial in range(100):
+        workspace = GlobalWorkspace()
+        for i in range(rng.randint(0, 12)):
+            workspace.add_actor(random_actor(rng, f"a{trial}_{i}"))
+        new_actors = [random_actor(rng, f"n{trial}_{i}") for i in range(5)]
+
+        assert (matcher.rule_based_reconcile(new_actors, workspace) ==
+                scan_reconcile(matcher, new_actors, workspace))
+
+
+def test_merged_aliases_are_indexed():
+    workspace = GlobalWorkspace()
+    actor = Actor(id="a1", name="John Smith", actor_type=ActorType.PERSON)
+    workspace.add_actor(actor)
+    matcher = EntityMatcher()
+    probe = [Actor(id="n1", name="Mr Smith", actor_type=ActorType.PERSON)]
+
+    assert matcher.rule_based_reconcile(probe, workspace) == []
+
+    actor.aliases.append("Mr Smith")
+    workspace.add_actor(actor)
+    [match] = matcher.rule_based_reconcile(probe, workspace)
+    assert match["existing_entity_id"] == "a1"
+    assert match["reason"] == "Name matches alias: Mr Smith"
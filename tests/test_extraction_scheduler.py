@@ -0,0 +1,83 @@
+"""
+Test Extraction Scheduler
+
+Validates:
+1. Results are delivered in submission order with bounded concurrency
+2. Extraction errors are returned as results, not raised
+3. Items are pulled lazily; closing early stops further extraction
+4. RateLimiter spaces requests per model
+"""
+
+import sys
+import threading
+import time
+from pathlib import Path
+
+project_root = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(project_root))
+
+from src.gsw.extraction_scheduler import ExtractionScheduler, RateLimiter
+
+
+def test_in_order_delivery_with_bounded_concurrency():
+    lock = threading.Lock()
+    running = [0]
+    peak = [0]
+
+    def extract(item):
+        with lock:
+            running[0] += 1
+            peak[0] = max(peak[0], running[0])
+        # Later items finish first
+        time.sleep(0.01 * (10 - item))
+        with lock:
+            running[0] -= 1
+        return item * item
+
+    scheduler = ExtractionScheduler(extract, max_in_flight=3)
+    results = list(scheduler.run(range(10)))
+
+    assert [r.item for r in results] == list(range(10))
+    assert [r.extraction for r in results] == [i * i for i in range(10)]
+    assert peak[0] == 3
+
+
+def test_errors_are_returned():
+    def extract(item):
+        if item == 2:
+            raise RuntimeError("model unavailable")
+        return item
+
+    results = list(ExtractionScheduler(extract, max_in_flight=2).run(range(4)))
+    assert [r.error is None for r in results] == [True, True, False, True]
+    assert "unavailable" in str(results[2].error)
+
+
+def test_items_pulled_lazily():
+    pulled = []
+
+    def items():
+        for i in range(100):
+            pulled.append(i)
+            yield i
+
+    run = ExtractionScheduler(lambda item: item, max_in_flight=4).run(items())
+    first = [next(run).item for _ in range(2)]
+    run.close()
+
+    assert first == [0, 1]
+    assert len(pulled) <= 6
+
+
+def test_rate_limiter_spaces_requests_per_model():
+    limiter = RateLimiter({"slow-model": 600}, default_rpm=None)  # 0.1s apart
+
+    start = time.monotonic()
+    for _ in range(3):
+        limiter.acquire("slow-model")
+    assert time.monotonic() - start >= 0.2
+
+    start = time.monotonic()
+    for _ in range(50):
+        limiter.acquire("unlimited-model")
+    assert time.monotonic() - start < 0.05
@@ -0,0 +1,144 @@
+"""
+Test SPCNet Graph Analytics
+
+Validates:
+1. Sparse PageRank and HITS match dense reference computations
+2. k-hop neighbourhoods in each direction
+3. Precedent chains follow only the requested treatments, shortest first
+4. SPCNetBuilder persists authority scores; stale scores are recomputed
+5. Graph analytics and the graph builder import without PyTorch
+"""
+
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import numpy as np
+
+project_root = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(project_root))
+
+from src.graph.analytics import AuthorityIndex, GraphAnalytics, load_authority
+from src.graph.csr_graph import CSRGraph
+
+EDGES = [
+    ("A", "B", "FOLLOWED"),
+    ("A", "C", "CITED"),
+    ("B", "D", "FOLLOWED"),
+    ("C", "D", "OVERRULED"),
+    ("D", "E", "FOLLOWED"),
+    ("A", "E", "DISTINGUISHED"),
+    ("F", "D", "CITED"),
+]
+
+
+def analytics(edges=EDGES) -> GraphAnalytics:
+    return GraphAnalytics(CSRGraph.from_edge_list("ABCDEF", edges))
+
+
+def dense_adjacency(graph: CSRGraph) -> np.ndarray:
+    matrix = np.zeros((graph.num_nodes, graph.num_nodes))
+    for source in range(graph.num_nodes):
+        for target in graph.neighbors(source)[0]:
+            matrix[source, target] += 1
+    return matrix
+
+
+def test_pagerank_and_hits_match_dense():
+    rng = np.random.default_rng(0)
+    nodes = [f"n{i}" for i in range(40)]
+    edges = {(f"n{s}", f"n{t}", "CITED") for s, t in rng.integers(0, 40, (120, 2)) if s != t}
+    graph_analytics = GraphAnalytics(CSRGraph.from_edge_list(nodes, sorted(edges)))
+    adjacency = dense_adjacency(graph_analytics.graph)
+    n = len(nodes)
+
+    # Dense PageRank: dangling rows spread uniformly
+    out = adjacency.sum(axis=1, keepdims=True)
+    transition = np.where(out > 0, adjacency / np.maximum(out, 1), 1.0 / n)
+    expected = np.full(n, 1.0 / n)
+    for _ in range(200):
+        expected = 0.85 * expected @ transition + 0.15 / n
+    ranks = graph_analytics.pagerank()
+    assert np.allclose(ranks, expected, atol=1e-9)
+    assert abs(ranks.sum() - 1) < 1e-9
+
+    # HITS authority is the principal eigenvector of A^T A
+    hub, authority = graph_analytics.hits(max_iter=1000)
+    eigenvalues, eigenvectors = np.linalg.eigh(adjacency.T @ adjacency)
+    principal = np.abs(eigenvectors[:, -1])
+    assert np.allclose(authority, principal / principal.sum(), atol=1e-6)
+    assert abs(hub.sum() - 1) < 1e-9
+
+
+def test_k_hop():
+    graph_analytics = analytics()
+    assert graph_analytics.k_hop("A", 1) == {"A": 0, "B": 1, "C": 1, "E": 1}
+    assert graph_analytics.k_hop("A", 2) == {"A": 0, "B": 1, "C": 1, "E": 1, "D": 2}
+    assert graph_analytics.k_hop("D", 1, direction="in") == {"D": 0, "B": 1, "C": 1, "F": 1}
+    assert graph_analytics.k_hop("F", 2, direction="both") == {"F": 0, "D": 1, "B": 2, "C": 2, "E": 2}
+    assert graph_analytics.k_hop("missing", 2) == {}
+
+
+def test_precedent_chains():
+    graph_analytics = analytics()
+    chains = graph_analytics.precedent_chains("A", "E")
+    # A -> E directly is DISTINGUISHED, so the chains go through D
+    assert sorted(chains) == [
+        [("A", "B", "FOLLOW"), ("B", "D", "FOLLOW"), ("D", "E", "FOLLOW")],
+    ]
+    assert graph_analytics.precedent_chains("A", "E", actions=("DISTINGUISH",)) == [[("A", "E", "DISTINGUISH")]]
+    assert len(graph_analytics.precedent_chains("A", "D", actions=("FOLLOW", "OVERRULE", "CITE"))) == 2
+    assert graph_analytics.precedent_chains("A", "E", max_depth=2) == []
+    assert graph_analytics.precedent_chains("E", "A") == []
+
+
+def test_builder_persists_authority(tmp_path):
+    from src.graph.spcnet_builder import SPCNetBuilder
+    from src.utils.toon import ToonWriter
+
+    input_dir = tmp_path / "cases"
+    input_dir.mkdir()
+    cases = {
+        1: "Applied [2010] HCA 2.",
+        2: "Followed [2010] HCA 3.",
+        3: "",
+        4: "See [2010] HCA 3 and [2010] HCA 2.",
+    }
+    with open(input_dir / "hca.jsonl", 'w', encoding='utf-8') as f:
+        for n, text in cases.items():
+            f.write(json.dumps({"citation": f"Case {n} [2010] HCA {n}", "text": text}) + "\n")
+    SPCNetBuilder(input_dir, tmp_path / "graph").build()
+
+    authority = AuthorityIndex.load(tmp_path / "graph")
+    assert AuthorityIndex.is_current(tmp_path / "graph")
+    assert authority.top(1)[0][0] == "Case 3 [2010] HCA 3"
+    assert authority.score("Case 3 [2010] HCA 3") == 1.0
+    assert authority.score("Case 1 [2010] HCA 1") == 0.0
+    assert authority.score("Unknown [2000] HCA 9", default=-1) == -1
+    assert authority.get("Case 2 [2010] HCA 2")["in_degree"] == 2
+
+    stats = json.loads((tmp_path / "graph" / "graph_statistics.json").read_text())
+    assert stats["top_authorities"][0]["citation"] == "Case 3 [2010] HCA 3"
+
+    assert load_authority(tmp_path / "graph").node_ids == authority.node_ids
+
+    # Edges rewritten outside the builder: the persisted scores are stale
+    with open(tmp_path / "graph" / "spcnet_edges.toon", 'w', encoding='utf-8', newline='') as f:
+        ToonWriter(f).write_table("Edges", ["source", "target", "action"], [
+            ["Case 3 [2010] HCA 3", "Case 1 [2010] HCA 1", "FOLLOWED"],
+            ["Case 4 [2010] HCA 4", "Case 1 [2010] HCA 1", "CITED"],
+        ])
+    assert not AuthorityIndex.is_current(tmp_path / "graph")
+    refreshed = load_authority(tmp_path / "graph")
+    assert refreshed.top(1)[0][0] == "Case 1 [2010] HCA 1"
+    assert AuthorityIndex.is_current(tmp_path / "graph")
+    assert load_authority(tmp_path / "missing") is None
+
+
+def test_imports_without_torch():
+    code = ("import sys; sys.modules['torch'] = None; "
+            "import src.graph.analytics, src.graph.spcnet_builder")
+    subprocess.run([sys.executable, "-c", code], cwd=project_root, check=True,
+                   env=dict(os.environ, PYTHONPATH=str(project_root)))
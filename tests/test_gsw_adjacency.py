@@ -0,0 +1,130 @@
+"""
+Test GSW Per-Actor Adjacency Indexes
+
+Validates:
+1. Actor neighbourhood queries match a full scan, in workspace order
+2. Re-added verbs/links move between actors; direct dict inserts trigger a rebuild
+3. Time/location lookups, timelines and summaries use the indexes
+4. Indexes are rebuilt after JSON and snapshot loads
+"""
+
+import random
+import sys
+from pathlib import Path
+
+project_root = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(project_root))
+
+from src.gsw.legal_summary import LegalSummary
+from src.gsw.workspace import WorkspaceManager
+from src.logic.gsw_schema import (
+    GlobalWorkspace, Actor, VerbPhrase, PredictiveQuestion, SpatioTemporalLink,
+    ActorType, LinkType, QuestionType
+)
+
+
+def random_workspace(seed: int = 0, n_actors: int = 12) -> GlobalWorkspace:
+    rng = random.Random(seed)
+    workspace = GlobalWorkspace(domain="family")
+    ids = [f"actor_{i:03d}" for i in range(n_actors)]
+    for actor_id in ids:
+        workspace.add_actor(Actor(id=actor_id, name=actor_id.title(), actor_type=ActorType.PERSON))
+    for i in range(60):
+        workspace.add_verb_phrase(VerbPhrase(
+            id=f"verb_{i:03d}", verb=rng.choice(["filed", "ordered", "paid"]),
+            agent_id=rng.choice(ids + [None]), patient_ids=rng.sample(ids, rng.randint(0, 3))
+        ))
+    for i in range(30):
+        workspace.add_spatio_temporal_link(SpatioTemporalLink(
+            id=f"link_{i:03d}", linked_entity_ids=rng.sample(ids, rng.randint(1, 4)),
+            tag_type=rng.choice([LinkType.TEMPORAL, LinkType.SPATIAL]),
+            tag_value=rng.choice(["2019", "2020", "Sydney", None])
+        ))
+    for i in range(20):
+        workspace.add_question(PredictiveQuestion(
+            id=f"q_{i:03d}", question_text="When?", question_type=QuestionType.WHEN,
+            target_entity_id=rng.choice(ids + [None])
+        ))
+    return workspace
+
+
+def assert_matches_scan(workspace: GlobalWorkspace) -> None:
+    for actor_id in workspace.actors:
+        verbs = workspace.verb_phrases.values()
+        assert workspace.get_verbs_as_agent(actor_id) == [v for v in verbs if v.agent_id == actor_id]
+        assert workspace.get_verbs_as_patient(actor_id) == [v for v in verbs if actor_id in v.patient_ids]
+        assert workspace.get_actor_verbs(actor_id) == [
+            v for v in verbs if v.agent_id == actor_id or actor_id in v.patient_ids
+        ]
+        assert workspace.get_actor_links(actor_id) == [
+            l for l in workspace.spatio_temporal_links.values() if actor_id in l.linked_entity_ids
+        ]
+        assert workspace.get_questions_about(actor_id) == [
+            q for q in workspace.questions.values() if q.target_entity_id == actor_id
+        ]
+
+
+def test_neighbourhoods_match_scan():
+    assert_matches_scan(random_workspace(0))
+    assert_matches_scan(random_workspace(1))
+    assert GlobalWorkspace().get_actor_verbs("missing") == []
+
+
+def test_updates_and_direct_inserts():
+    workspace = random_workspace(2)
+
+    # Re-adding a verb with new participants moves it, keeping its position
+    verb = workspace.verb_phrases["verb_000"].model_copy()
+    verb.agent_id, verb.patient_ids = "actor_011", ["actor_010"]
+    workspace.add_verb_phrase(verb)
+    link = workspace.spatio_temporal_links["link_000"].model_copy()
+    link.linked_entity_ids, link.tag_value = ["actor_000"], "Melbourne"
+    workspace.add_spatio_temporal_link(link)
+    assert_matches_scan(workspace)
+    assert workspace.get_actor_verbs("actor_011")[0].id == "verb_000"
+
+    # Inserted behind the workspace's back: rebuilt on next query
+    workspace.verb_phrases["verb_x"] = VerbPhrase(id="verb_x", verb="appealed", agent_id="actor_001")
+    workspace.questions["q_x"] = PredictiveQuestion(
+        id="q_x", question_text="Who?", question_type=QuestionType.WHO, target_entity_id="actor_001"
+    )
+    assert_matches_scan(workspace)
+
+
+def test_lookups_timeline_and_summary():
+    workspace = GlobalWorkspace(domain="family")
+    for actor_id, name in [("a1", "John Smith"), ("a2", "Jane Smith"), ("t1", "2019-03-01"), ("t2", "2020-06-01")]:
+        workspace.add_actor(Actor(id=actor_id, name=name, actor_type=ActorType.PERSON))
+    workspace.add_verb_phrase(VerbPhrase(id="v1", verb="separated", agent_id="a1", patient_ids=["a2"], temporal_id="t1"))
+    workspace.add_verb_phrase(VerbPhrase(id="v2", verb="relocated", agent_id="a2", temporal_id="t2"))
+    workspace.add_spatio_temporal_link(SpatioTemporalLink(
+        id="l1", linked_entity_ids=["a1", "a2"], tag_type=LinkType.TEMPORAL, tag_value="2019"
+    ))
+    workspace.add_spatio_temporal_link(SpatioTemporalLink(
+        id="l2", linked_entity_ids=["a2"], tag_type=LinkType.SPATIAL, tag_value="2019"
+    ))
+
+    assert {a.id for a in workspace.get_entities_at_time("2019")} == {"a1", "a2"}
+    assert {a.id for a in workspace.get_entities_at_location("2019")} == {"a2"}
+    assert workspace.get_entities_at_time("2021") == []
+
+    manager = WorkspaceManager(workspace)
+    assert [e["verb"] for e in manager.get_timeline()] == ["separated", "relocated"]
+    assert manager.get_timeline("a1") == [
+        {"date": "2019-03-01", "type": "action", "verb": "separated", "agent": "John Smith", "id": "v1"}
+    ]
+
+    summary = LegalSummary(use_openrouter=False)
+    assert summary._format_actions("a2", workspace) == "- Was separated by John Smith\n- relocated (as agent)"
+    assert summary._format_spacetime("a2", workspace) == "- Temporal: 2019\n- Spatial: 2019"
+    assert summary._find_related_entities("a1", workspace) == "Jane Smith (person)"
+
+
+def test_rebuilt_after_load(tmp_path):
+    from src.gsw.snapshot import read_snapshot, write_snapshot
+
+    workspace = random_workspace(3)
+    assert_matches_scan(GlobalWorkspace.model_validate_json(workspace.model_dump_json()))
+
+    write_snapshot(workspace, tmp_path / "ws.gsws")
+    assert_matches_scan(read_snapshot(tmp_path / "ws.gsws"))
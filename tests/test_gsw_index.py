@@ -0,0 +1,164 @@
+"""
+Test GSW Search Index
+
+Validates:
+1. Indexed retrieval returns the same ranking as a full workspace scan
+2. The index stays in sync with GlobalWorkspace add_* methods
+3. Answered questions are re-indexed
+"""
+
+import sys
+from pathlib import Path
+
+project_root = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(project_root))
+
+from src.retrieval.gsw_retriever import GSWRetriever
+from src.gsw.workspace import WorkspaceManager
+from src.logic.gsw_index import ACTOR, VERB, QUESTION
+from src.logic.gsw_schema import (
+    GlobalWorkspace, Actor, State, VerbPhrase, PredictiveQuestion,
+    ActorType, QuestionType
+)
+
+
+def create_test_workspace() -> GlobalWorkspace:
+    """Create a small workspace with actors, verbs and questions."""
+    workspace = GlobalWorkspace(domain="family")
+
+    husband = Actor(
+        id="actor_001", name="John Smith", actor_type=ActorType.PERSON,
+        aliases=["the husband"], roles=["Applicant", "Father"]
+    )
+    husband.add_state(State(entity_id="", name="RelationshipStatus", value="Separated"))
+    workspace.add_actor(husband)
+    workspace.add_actor(Actor(
+        id="actor_002", name="Jane Smith", actor_type=ActorType.PERSON,
+        aliases=["the wife"], roles=["Respondent", "Mother"]
+    ))
+    workspace.add_actor(Actor(
+        id="actor_003", name="Family Court", actor_type=ActorType.ORGANIZATION,
+        roles=["Court"]
+    ))
+    workspace.add_actor(Actor(
+        id="actor_004", name="Emily Smith", actor_type=ActorType.PERSON,
+        roles=["Child"]
+    ))
+
+    workspace.add_verb_phrase(VerbPhrase(
+        id="verb_001", verb="filed", agent_id="actor_001", patient_ids=["actor_003"]
+    ))
+    workspace.add_verb_phrase(VerbPhrase(
+        id="verb_002", verb="ordered", agent_id="actor_003", patient_ids=["actor_002"]
+    ))
+    workspace.add_verb_phrase(VerbPhrase(
+        id="verb_003", verb="relocated", agent_id="actor_002", patient_ids=["actor_004"]
+    ))
+
+    workspace.add_question(PredictiveQuestion(
+        id="q_001", question_text="When did the parties separate?",
+        question_type=QuestionType.WHEN, target_entity_id="actor_001"
+    ))
+    workspace.add_question(PredictiveQuestion(
+        id="q_002", question_text="Who has primary care of the child?",
+        question_type=QuestionType.WHO, target_entity_id="actor_004"
+    ))
+    return workspace
+
+
+def make_retriever(workspace: GlobalWorkspace) -> GSWRetriever:
+    """Build a retriever over an in-memory workspace."""
+    retriever = GSWRetriever(workspace_dir=project_root / "nonexistent")
+    retriever.workspaces["family"] = WorkspaceManager(workspace)
+    return retriever
+
+
+def full_scan(retriever: GSWRetriever, query: str, top_k: int):
+    """Reference implementation: score every entity in the workspace."""
+    concepts = retriever._extract_concepts(query)
+    results = []
+    for domain, manager in retriever.workspaces.items():
+        ws = manager.workspace
+        for aid, actor in ws.actors.items():
+            score = retriever._score_actor(actor, concepts)
+            if score > 0:
+                results.append((aid, score))
+        for vid, verb in ws.verb_phrases.items():
+            score = retriever._score_verb(verb, concepts, ws)
+            if score > 0:
+                results.append((vid, score))
+        for qid, question in ws.questions.items():
+            score = retriever._score_question(question, concepts)
+            if score > 0:
+                results.append((qid, score))
+    results.sort(key=lambda x: x[1], reverse=True)
+    return results[:top_k]
+
+
+def test_indexed_retrieval_matches_full_scan():
+    """Indexed candidates + exact rescoring == full scan."""
+    retriever = make_retriever(create_test_workspace())
+
+    queries = [
+        "custody of the child",
+        "John Smith filed",
+        "court ordered the wife",
+        "when did the parties separate",
+        "relocation of children",
+        "a vs b",
+    ]
+    for query in queries:
+        expected = full_scan(retriever, query, top_k=10)
+        actual = [(r['id'], r['score']) for r in retriever.retrieve(query, top_k=10)]
+        assert actual == expected, query
+
+
+def test_index_tracks_workspace_mutations():
+    """Entities added after the index is built are searchable."""
+    workspace = create_test_workspace()
+    index = workspace.get_search_index()
+
+    workspace.add_actor(Actor(
+        id="actor_005", name="Independent Children's Lawyer",
+        actor_type=ActorType.PERSON, roles=["ICL"]
+    ))
+    workspace.add_verb_phrase(VerbPhrase(
+        id="verb_004", verb="recommended", agent_id="actor_005"
+    ))
+
+    assert workspace.get_search_index() is index
+    assert "actor_005" in index.candidates(ACTOR, ["lawyer"])
+    assert "verb_004" in index.candidates(VERB, ["recommend"])
+    assert index.verbs_for_actors(["actor_005"]) == {"verb_004"}
+
+    # Merged information is picked up when the actor is re-added
+    actor = workspace.actors["actor_003"]
+    actor.aliases.append("Federal Circuit Court")
+    workspace.add_actor(actor)
+    assert index.candidates(ACTOR, ["federal"]) == ["actor_003"]
+
+
+def test_answered_questions_are_reindexed():
+    """Answer text becomes searchable once a question is answered."""
+    workspace = create_test_workspace()
+    index = workspace.get_search_index()
+
+    assert index.candidates(QUESTION, ["march 2020"]) == []
+    assert workspace.answer_question("q_001", "March 2020", answered_in_chunk_id="chunk_1")
+    assert index.candidates(QUESTION, ["march 2020"]) == ["q_001"]
+    assert workspace.questions["q_001"].answerable
+    assert not workspace.answer_question("q_missing", "n/a")
+
+
+def test_direct_dict_insert_triggers_rebuild():
+    """Bypassing add_* is detected and the index is rebuilt."""
+    workspace = create_test_workspace()
+    index = workspace.get_search_index()
+
+    workspace.actors["actor_009"] = Actor(
+        id="actor_009", name="Department of Child Protection",
+        actor_type=ActorType.ORGANIZATION
+    )
+    rebuilt = workspace.get_search_index()
+    assert rebuilt is not index
+    assert "actor_009" in rebuilt.candidates(ACTOR, ["protection"])
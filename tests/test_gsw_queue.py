@@ -0,0 +1,186 @@
+"""
+Test Disk-Backed GSW Extraction Queue
+
+Validates:
+1. Priority order, threshold filtering and processed-id tracking
+2. Queue contents and processed ids survive reopening; documents handed
+   out but not processed are queued again; JSON checkpoints are imported
+3. Corpus documents are queued as line pointers (sequential and sharded
+   extraction) and read back in full at dequeue time
+4. TOON rows are addressed by byte offset; the pipeline queues domain
+   file rows as pointers
+"""
+
+import io
+import json
+import sys
+from pathlib import Path
+
+project_root = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(project_root))
+
+from src.ingestion.auto_gsw_trigger import DocumentLocation, GSWExtractionQueue, TOON
+from src.ingestion.corpus_domain_extractor import CorpusDomainExtractor
+from src.ingestion.toon_integration import convert_row_to_doc
+from src.utils.toon import ToonDecoder, ToonReader, ToonWriter
+
+COURTS = ["HCA", "NSWCA", "FamCAFC", "FCAFC", "NSWSC", "FamCA", "NSWDC"]
+
+
+def classified(citation: str, authority: int, court_level: str = "apex"):
+    return {"citation": citation, "text": f"Text of {citation}",
+            "_classification": {"authority_score": authority, "court_level": court_level}}
+
+
+def drain(queue: GSWExtractionQueue, batch_size: int = 3):
+    docs = []
+    while not queue.empty():
+        docs.extend(queue.process_batch(batch_size))
+    return docs
+
+
+def write_corpus(path: Path, count: int = 40) -> None:
+    with open(path, 'w', encoding='utf-8') as f:
+        for i in range(count):
+            court = COURTS[i % len(COURTS)]
+            f.write(json.dumps({
+                "version_id": f"doc_{i}",
+                "type": "decision",
+                "citation": f"Smith v Jones [{2000 + i}] {court} {i}",
+                "text": f"The appellant and respondent, in the matter of {court},\nsought orders. ünïcode {i}",
+                "jurisdiction": "commonwealth",
+            }) + "\n")
+
+
+def test_priority_order_and_processed(tmp_path):
+    queue = GSWExtractionQueue(min_authority=60, checkpoint_path=tmp_path / "queue.json")
+    assert queue.add(classified("[2020] HCA 2", 95))
+    assert queue.add(classified("[2020] NSWCA 1", 75, "intermediate"))
+    assert queue.add(classified("[2020] HCA 1", 95))
+    assert not queue.add(classified("[2020] NSWDC 1", 45, "trial"))
+    assert queue.add(classified("[2020] NSWDC 2", 45, "trial"), priority=65)
+    assert queue.qsize() == 4
+
+    # Highest priority first, ties by id (as the in-memory heap ordered them)
+    assert [d["citation"] for d in queue.process_batch(2)] == ["[2020] HCA 1", "[2020] HCA 2"]
+    assert queue.qsize() == 2
+    queue.mark_processed(classified("[2020] HCA 1", 95))
+    assert queue.is_processed(classified("[2020] HCA 1", 95))
+    assert not queue.add(classified("[2020] HCA 1", 95))
+
+    # Re-adding a queued document updates it instead of duplicating it
+    assert queue.add(classified("[2020] NSWDC 2", 45, "trial"), priority=99)
+    assert [d["citation"] for d in drain(queue)] == ["[2020] NSWDC 2", "[2020] NSWCA 1"]
+
+    stats = queue.get_statistics()
+    assert stats["total_processed"] == 1 and stats["current_queue_size"] == 0
+    assert stats["authority_stats"] == {"apex": 2, "intermediate": 1, "trial": 2}
+
+
+def test_persistence_and_resume(tmp_path):
+    path = tmp_path / "queue.json"
+    queue = GSWExtractionQueue(min_authority=0, checkpoint_path=path)
+    for i in range(5):
+        queue.add(classified(f"[2020] HCA {i}", 90 - i))
+    first, second = queue.process_batch(2)
+    queue.mark_processed(first)
+    queue.save_checkpoint()
+    queue.mark_processed(queue.process_batch(1)[0])  # Not checkpointed
+    queue.close()
+
+    # Checkpointed state only: the uncommitted mark is rolled back, and the
+    # document handed out but never processed is queued again
+    reopened = GSWExtractionQueue(min_authority=0, checkpoint_path=path)
+    assert reopened.checkpoint.total_processed == 1
+    assert reopened.is_processed(first) and not reopened.is_processed(second)
+    assert [d["citation"] for d in drain(reopened)] == [f"[2020] HCA {i}" for i in range(1, 5)]
+    reopened.close()
+
+    # A checkpoint written by the JSON-only queue is imported
+    legacy = tmp_path / "legacy.json"
+    legacy.write_text(json.dumps({"processed_ids": ["[2020] HCA 0"], "total_processed": 1, "total_queued": 3}))
+    imported = GSWExtractionQueue(min_authority=0, checkpoint_path=legacy)
+    assert imported.checkpoint.total_queued == 3
+    assert imported.is_processed(classified("[2020] HCA 0", 90))
+    assert not imported.add(classified("[2020] HCA 0", 90))
+
+
+def test_corpus_documents_queued_as_pointers(tmp_path):
+    corpus = tmp_path / "corpus.jsonl"
+    write_corpus(corpus)
+    with open(corpus, encoding='utf-8') as f:
+        originals = {d["citation"]: d for d in map(json.loads, f)}
+
+    def extract(name, parallel):
+        queue = GSWExtractionQueue(min_authority=60, checkpoint_path=tmp_path / f"{name}.json")
+        extractor = CorpusDomainExtractor(
+            input_path=corpus, output_dir=tmp_path / name, state_path=tmp_path / f"{name}_state.json",
+            enable_auto_gsw=True, gsw_queue=queue, gsw_min_authority=60
+        )
+        if parallel:
+            extractor._extract_parallel(workers=2, progress_interval=5, resume=False, num_shards=3)
+        else:
+            extractor.extract_all(progress_interval=1000)
+        return queue
+
+    sequential = extract("sequential", parallel=False)
+    parallel = extract("parallel", parallel=True)
+
+    # Only pointers are stored
+    conn = sequential._connect()
+    assert conn.execute("SELECT COUNT(*) FROM queue WHERE doc IS NOT NULL").fetchone()[0] == 0
+    assert sequential.qsize() == parallel.qsize() > 0
+
+    docs = drain(sequential)
+    assert docs == drain(parallel)
+    for doc in docs:
+        classification = doc.pop("_classification")
+        assert classification["authority_score"] >= 0
+        assert doc == originals[doc["citation"]]
+
+
+def test_toon_row_offsets(tmp_path):
+    rows = [["a1", "plain"], ["a2", "quoted, value"], ["a3", "multi\nline\r\nvalue"], ["a4", "ünïcode"]]
+    buffer = io.StringIO(newline='')
+    with ToonWriter(buffer, block_size=3) as writer:
+        writer.write_comment("header")
+        for row in rows:
+            writer.write_row("Docs", ["id", "text"], row)
+    data = buffer.getvalue().encode('utf-8')
+
+    offsets = list(ToonReader.row_offsets(io.BytesIO(data)))
+    assert [row for _, _, _, row in offsets] == ToonDecoder.decode(buffer.getvalue())["Docs"]
+    f = io.BytesIO(data)
+    for _, headers, offset, row in reversed(offsets):
+        assert ToonReader.read_row_at(f, offset, headers) == row
+
+
+def test_pipeline_queues_domain_rows(tmp_path):
+    from src.pipeline.config import PipelineConfig
+    from src.pipeline.orchestrator import FullPipeline
+
+    corpus = tmp_path / "corpus.jsonl"
+    write_corpus(corpus)
+    config = PipelineConfig(corpus_path=corpus, output_dir=tmp_path / "out", checkpoint_dir=tmp_path / "cp")
+    CorpusDomainExtractor(corpus, config.output_dir, state_path=tmp_path / "state.json").extract_all()
+
+    pipeline = FullPipeline(config)
+    pipeline.gsw_queue = GSWExtractionQueue(min_authority=60, checkpoint_path=config.checkpoint_dir / "gsw_queue.json")
+    pipeline._populate_gsw_queue({})
+
+    expected = []
+    for path in (config.output_dir / "cases").rglob("*.toon"):
+        with open(path, 'r', encoding='utf-8', newline='') as f:
+            expected.extend(convert_row_to_doc(row) for _, row in ToonDecoder.iter_rows(f))
+    expected = [d for d in expected if d["_classification"]["authority_score"] >= 60]
+    expected.sort(key=lambda d: (-d["_classification"]["authority_score"], d["citation"]))
+    assert expected
+
+    # A later run (e.g. the GSW stage alone) finds the persisted queue
+    pipeline.gsw_queue.close()
+    reopened = GSWExtractionQueue(min_authority=60, checkpoint_path=config.checkpoint_dir / "gsw_queue.json")
+    assert drain(reopened, batch_size=4) == expected
+
+    location = DocumentLocation(str(tmp_path / "missing.toon"), 0, TOON, ("citation",))
+    reopened.add(expected[0] | {"citation": "Moved [2020] HCA 9"}, location=location)
+    assert reopened.process_batch(1) == []
@@ -0,0 +1,165 @@
+"""
+Test GSW Query Service
+
+Validates:
+1. Batched BM25 search and VSA claim validation match their per-query forms
+2. MicroBatcher groups concurrent requests, flushes full batches and
+   confines an error to the request that caused it
+3. The HTTP service answers tool endpoints from warm state and batches concurrent searches
+"""
+
+import asyncio
+import json
+import random
+import sys
+import threading
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+
+project_root = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(project_root))
+
+from src.agents.gsw_service import GSWService, MicroBatcher
+from src.gsw.workspace import WorkspaceManager
+from src.logic.gsw_schema import Actor, ActorType, GlobalWorkspace, State
+from src.retrieval.bm25_index import BM25Index, build_corpus_index
+
+WORDS = ("parenting orders child relocation property settlement spousal maintenance "
+         "contravention consent family violence interim hearing appeal mother father").split()
+QUERIES = ["parenting orders", "child child relocation", "appeal hearing mother", "unknown", "property"]
+
+
+def write_corpus(path: Path, count: int = 60) -> None:
+    rng = random.Random(4)
+    with open(path, 'w', encoding='utf-8') as f:
+        for i in range(count):
+            text = " ".join(rng.choice(WORDS) for _ in range(rng.randint(5, 40)))
+            f.write(json.dumps({"citation": f"Smith & Smith [{2000 + i % 20}] FamCA {i}", "text": text}) + "\n")
+
+
+def sample_workspace() -> GlobalWorkspace:
+    workspace = GlobalWorkspace(domain="family")
+    husband = Actor(id="a1", name="John Smith", actor_type=ActorType.PERSON, roles=["Applicant", "Father"])
+    husband.add_state(State(entity_id="a1", name="RelationshipStatus", value="Separated"))
+    workspace.add_actor(husband)
+    workspace.add_actor(Actor(id="a2", name="Jane Smith", actor_type=ActorType.PERSON, roles=["Respondent", "Mother"]))
+    workspace.add_actor(Actor(id="a3", name="Justice Brown", actor_type=ActorType.PERSON, roles=["Judge"]))
+    return workspace
+
+
+def test_batched_calls_match_single(tmp_path):
+    corpus = tmp_path / "family.jsonl"
+    write_corpus(corpus)
+    index = BM25Index.load(build_corpus_index(corpus, tmp_path / "index"))
+    assert index.search_batch(QUERIES, top_k=7) == [index.search(q, top_k=7) for q in QUERIES]
+    assert index.search_batch([], top_k=3) == []
+
+    from src.retrieval.vsa_validator import VSAValidator
+    validator = VSAValidator()
+    workspace = sample_workspace()
+    # Odd concept counts: bundles have no majority ties, so encoding is deterministic
+    claims = ["John Smith is the father.", "The respondent relocated overseas.", ""]
+    assert validator.validate_claims(claims, workspace) == [validator.validate_claim(c, workspace) for c in claims]
+
+
+def test_micro_batcher():
+    batches = []
+
+    def double(items):
+        batches.append(list(items))
+        if "boom" in items:
+            raise RuntimeError("boom")
+        return [item * 2 for item in items]
+
+    async def run():
+        batcher = MicroBatcher(double, ThreadPoolExecutor(max_workers=1), max_batch=4, max_wait=0.05)
+        results = await asyncio.gather(*(batcher.submit(i) for i in range(6)))
+        assert results == [0, 2, 4, 6, 8, 10]
+        # A full batch is flushed at once; the rest waits for the timer
+        assert batches == [[0, 1, 2, 3], [4, 5]]
+
+        # A failing batch is retried item by item
+        ok, failed = await asyncio.gather(batcher.submit("ok"), batcher.submit("boom"), return_exceptions=True)
+        assert ok == "okok" and isinstance(failed, RuntimeError)
+        assert batches[2:] == [["ok", "boom"], ["ok"], ["boom"]]
+        assert batcher.get_statistics()["batches"] == 3
+
+    asyncio.run(run())
+
+
+def request(port: int, method: str, path: str, body=None):
+    data = json.dumps(body).encode() if body is not None else None
+    req = urllib.request.Request(f"http://127.0.0.1:{port}{path}", data=data, method=method)
+    try:
+        with urllib.request.urlopen(req, timeout=30) as response:
+            return response.status, json.loads(response.read())
+    except urllib.error.HTTPError as e:
+        return e.code, json.loads(e.read())
+
+
+@pytest.fixture
+def service_port(tmp_path):
+    (tmp_path / "by_court").mkdir()
+    write_corpus(tmp_path / "by_court" / "family.jsonl")
+    workspace_path = tmp_path / "workspace.json"
+    WorkspaceManager(sample_workspace(), workspace_path).save()
+
+    service = GSWService(workspace_path, data_dir=tmp_path, max_wait_ms=50)
+    loop = asyncio.new_event_loop()
+    ready = threading.Event()
+    port = []
+
+    def started(server):
+        port.append(server.sockets[0].getsockname()[1])
+        ready.set()
+
+    task = loop.create_task(service.serve(port=0, started=started))
+    thread = threading.Thread(target=loop.run_forever, daemon=True)
+    thread.start()
+    assert ready.wait(60)
+    yield port[0], service
+
+    async def shutdown():
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+
+    asyncio.run_coroutine_threadsafe(shutdown(), loop).result(10)
+    loop.call_soon_threadsafe(loop.stop)
+    thread.join(10)
+    loop.close()
+
+
+def test_http_service(service_port):
+    port, service = service_port
+
+    assert request(port, "GET", "/health") == (200, {"success": True, "status": "ok"})
+    status, parties = request(port, "POST", "/find_parties", {"query": "smith"})
+    assert status == 200 and [p["id"] for p in parties["parties"]] == ["a1", "a2"]
+    status, judges = request(port, "POST", "/find_actors_by_role", {"role": "Judge"})
+    assert judges["count"] == 1 and judges["actors"][0]["name"] == "Justice Brown"
+
+    # Concurrent searches share batched BM25 calls and match a direct search
+    with ThreadPoolExecutor(max_workers=len(QUERIES)) as pool:
+        responses = list(pool.map(lambda q: request(port, "POST", "/search", {"query": q, "top_k": 3}), QUERIES))
+    for query, (status, body) in zip(QUERIES, responses):
+        assert status == 200 and body["results"] == service.retriever.search(query, top_k=3)
+    batching = request(port, "GET", "/stats")[1]["service"]["search_batching"]
+    assert batching["requests"] == len(QUERIES) and batching["batches"] < len(QUERIES)
+
+    status, body = request(port, "POST", "/validate", {"claims": ["John Smith is the father.", "Jane Smith is the mother."]})
+    assert status == 200 and body["count"] == 2 and "confidence" in body["validations"][0]
+
+    # A malformed search fails alone, not the valid search batched with it
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        bad, good = pool.map(lambda body: request(port, "POST", "/search", body),
+                             [{"query": 123}, {"query": "parenting orders", "top_k": 3}])
+    assert bad[0] == 400 and good[0] == 200 and good[1]["count"] == 3
+    assert request(port, "POST", "/search", {"query": "appeal", "top_k": "3"})[0] == 400
+
+    assert request(port, "POST", "/search", {})[0] == 400
+    assert request(port, "GET", "/search")[0] == 405
+    assert request(port, "POST", "/missing", {})[0] == 404
@@ -0,0 +1,73 @@
+"""
+Test Keyword Automaton
+
+Validates:
+1. Occurrences match a naive scan (including overlapping keywords)
+2. Leftmost-first counts equal re.findall() over an alternation regex
+3. Case folding matches re.IGNORECASE
+4. DomainClassifier counts agree with the per-category regexes
+"""
+
+import random
+import re
+import sys
+from pathlib import Path
+
+project_root = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(project_root))
+
+from src.ingestion.keyword_automaton import KeywordAutomaton, count_leftmost_first
+
+
+def findall_count(keywords, text):
+    pattern = re.compile("|".join(re.escape(k) for k in keywords), re.IGNORECASE)
+    return len(pattern.findall(text))
+
+
+def automaton_count(keywords, text):
+    automaton = KeywordAutomaton()
+    for alt, keyword in enumerate(keywords):
+        automaton.add(keyword, alt)
+    spans = [
+        (start, min(values), end)
+        for start, end, values in automaton.build().find_all(text)
+    ]
+    return count_leftmost_first(spans)
+
+
+def test_find_all_reports_overlaps():
+    automaton = KeywordAutomaton()
+    for keyword in ["he", "she", "his", "hers"]:
+        automaton.add(keyword, keyword)
+    hits = [(start, end, values[0]) for start, end, values in automaton.build().find_all("ushers")]
+    assert sorted(hits) == [(1, 4, "she"), (2, 4, "he"), (2, 6, "hers")]
+
+
+def test_counts_match_regex_findall():
+    random.seed(3)
+    alphabet = "ab c"
+    for _ in range(300):
+        keywords = ["".join(random.choice(alphabet) for _ in range(random.randint(1, 4)))
+                    for _ in range(random.randint(1, 6))]
+        keywords = [k for k in keywords if k]
+        text = "".join(random.choice(alphabet) for _ in range(random.randint(0, 40)))
+        assert automaton_count(keywords, text) == findall_count(keywords, text), (keywords, text)
+
+
+def test_folding_matches_ignorecase():
+    text = "the ſtatute and the ıncome act"
+    assert automaton_count(["statute", "income"], text) == findall_count(["statute", "income"], text) == 2
+
+
+def test_classifier_matches_category_regexes():
+    from src.ingestion.classification_config import CLASSIFICATION_MAP
+    from src.ingestion.corpus_domain_extractor import DomainClassifier
+
+    classifier = DomainClassifier()
+    text = ("The husband and wife separated. Parenting orders and property settlement "
+            "under the Family Law Act 1975 (Cth). The visa applicant appealed to the tribunal; "
+            "negligence and duty of care were not argued. Sentence imposed for the offence.").lower()
+
+    counts = classifier._category_counts(classifier.automaton.find_all(text))
+    for cat_idx, (category, keywords) in enumerate(CLASSIFICATION_MAP.items()):
+        assert counts.get(cat_idx, 0) == findall_count(keywords, text), category
@@ -0,0 +1,152 @@
+"""
+Test LegalVSA Item Memory
+
+Validates (float and bit-packed binary backends):
+1. Item memory behaves as a name -> vector mapping while growing
+2. cleanup() matches a per-concept similarity scan
+3. cleanup_batch() agrees with cleanup() for every input vector
+4. Binary bind / bundle / similarity / cleanup equal the float results
+   on the same bipolar vectors
+5. The empty vector is neutral on both backends, so encode_actor and
+   encode_verb give the same vectors on each
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+import torch
+
+project_root = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(project_root))
+
+from src.logic.gsw_schema import Actor, ActorType, State, VerbPhrase
+from src.vsa.binary_vsa import BinaryLegalVSA
+from src.vsa.encoder import GSWVSAEncoder
+from src.vsa.legal_vsa import LegalVSA, get_vsa_service
+
+BACKENDS = {"float": LegalVSA, "binary": BinaryLegalVSA}
+
+
+@pytest.fixture(params=sorted(BACKENDS))
+def backend(request):
+    return request.param
+
+
+def make_vsa(backend: str = "float", extra: int = 600) -> LegalVSA:
+    torch.manual_seed(7)
+    vsa = BACKENDS[backend](dimension=2000)
+    for i in range(extra):
+        vsa.add_concept(f"CONCEPT_{i}")
+    return vsa
+
+
+def scan_cleanup(vsa: LegalVSA, noisy: torch.Tensor, threshold: float):
+    results = []
+    for name in vsa.memory:
+        sim = vsa.similarity(noisy, vsa.memory[name])
+        if sim > threshold:
+            results.append((name, sim))
+    return sorted(results, key=lambda x: x[1], reverse=True)
+
+
+def test_item_memory_mapping(backend):
+    vsa = make_vsa(backend)
+    first = vsa.get_vector("CONCEPT_0").clone()
+
+    assert len(vsa.memory) == len(vsa.memory.names) == vsa.memory.matrix.shape[0]
+    assert "CONCEPT_599" in vsa.memory and "UNKNOWN" not in vsa.memory
+    assert torch.equal(vsa.memory["CONCEPT_0"], first)
+    assert torch.equal(vsa.get_vector("CONCEPT_0"), first)
+    assert set(vsa.to_bipolar(vsa.memory.matrix).unique().tolist()) == {-1.0, 1.0}
+    if backend == "binary":
+        assert vsa.memory.matrix.dtype == torch.uint8 and vsa.memory.matrix.shape[1] == 250
+
+
+def test_cleanup_matches_scan(backend):
+    vsa = make_vsa(backend)
+    for i in range(10):
+        noisy = vsa.bundle([vsa.get_vector(f"CONCEPT_{j}") for j in range(i, i + 3)])
+        assert vsa.cleanup(noisy) == scan_cleanup(vsa, noisy, 0.3)
+        assert vsa.cleanup(noisy, threshold=0.05) == scan_cleanup(vsa, noisy, 0.05)
+
+
+def test_cleanup_batch(backend):
+    vsa = make_vsa(backend)
+    noisy = torch.stack([
+        vsa.bundle([vsa.get_vector(f"CONCEPT_{j}") for j in range(i, i + 3)])
+        for i in range(16)
+    ])
+
+    batch = vsa.cleanup_batch(noisy)
+    assert batch == [vsa.cleanup(v) for v in noisy]
+    assert [hits[0][0] for hits in vsa.cleanup_batch(noisy, top_k=1)] == [
+        hits[0][0] for hits in batch
+    ]
+    assert vsa.nearest_concepts(vsa.get_vector("CONCEPT_3"), k=1) == [("CONCEPT_3", 1.0)]
+
+
+def test_binary_matches_float():
+    binary = make_vsa("binary", extra=50)
+    dense = LegalVSA(dimension=2000)
+    for name in binary.memory:
+        dense.get_vector(name).copy_(binary.to_bipolar(binary.memory[name]))
+
+    a, b, c = (binary.get_vector(f"CONCEPT_{i}") for i in range(3))
+    da, db, dc = (dense.get_vector(f"CONCEPT_{i}") for i in range(3))
+    assert torch.equal(binary.to_bipolar(binary.bind(a, b)), dense.bind(da, db))
+    assert torch.equal(binary.to_bipolar(binary.permute(a, 3)), dense.permute(da, 3))
+    assert torch.equal(binary.to_bipolar(binary.bundle([a, b, c])), dense.bundle([da, db, dc]))
+    assert binary.similarity(a, binary.bind(a, b)) == dense.similarity(da, dense.bind(da, db))
+    assert binary.cleanup(binary.bundle([a, b, c]), threshold=0.1) == \
+        dense.cleanup(dense.bundle([da, db, dc]), threshold=0.1)
+
+    with pytest.raises(ValueError):
+        get_vsa_service("quantum")
+
+
+def test_encoder_matches_float():
+    binary = make_vsa("binary", extra=0)
+    dense = LegalVSA(dimension=2000)
+    binary_encoder, dense_encoder = GSWVSAEncoder(binary), GSWVSAEncoder(dense)
+
+    actors = [
+        Actor(id="a0", name="John Smith", actor_type=ActorType.PERSON),
+        Actor(id="a1", name="Jane Smith", actor_type=ActorType.PERSON, roles=["Respondent"]),
+        Actor(id="a2", name="Family Court", actor_type=ActorType.ORGANIZATION, roles=["Court", "Judge"],
+              states=[State(entity_id="a2", name="Jurisdiction", value="Federal")]),
+        Actor(id="a3", name="Child", actor_type=ActorType.PERSON,
+              states=[State(entity_id="a3", name="Age", value="Minor")]),
+    ]
+    verbs = [
+        VerbPhrase(verb="filed", agent_id="a0", patient_ids=["a2"]),
+        VerbPhrase(verb="ordered", agent_id="a2", patient_ids=["a0", "a1", "missing"]),
+        VerbPhrase(verb="relocated", patient_ids=["a3"]),
+        VerbPhrase(verb="separated", agent_id="a0"),
+        VerbPhrase(verb="appealed", agent_id="missing", patient_ids=["a2"]),
+    ]
+
+    def encode(encoder):
+        torch.manual_seed(11)  # Same bundle tie-breaks on both backends
+        actor_map = {a.id: encoder.encode_actor(a) for a in actors}
+        return actor_map, [encoder.encode_verb(v, actor_map) for v in verbs]
+
+    # Create every concept on the binary backend, then mirror them
+    encode(binary_encoder)
+    for name in binary.memory:
+        dense.get_vector(name).copy_(binary.to_bipolar(binary.memory[name]))
+
+    binary_actors, binary_verbs = encode(binary_encoder)
+    dense_actors, dense_verbs = encode(dense_encoder)
+    for actor_id, vector in binary_actors.items():
+        assert torch.equal(binary.to_bipolar(vector), dense_actors[actor_id])
+    for binary_vec, dense_vec in zip(binary_verbs, dense_verbs):
+        assert torch.equal(binary.to_bipolar(binary_vec), dense_vec)
+
+    # An actor with no roles or states is its identity; unresolved verbs are empty
+    identity = binary.bind(binary.get_vector("PERSON"), binary.get_vector("John Smith"))
+    assert binary.similarity(binary_actors["a0"], identity) == 1.0
+    assert [binary.is_empty(v) for v in binary_verbs] == [False, False, True, True, True]
+    assert [dense.is_empty(v) for v in dense_verbs] == [False, False, True, True, True]
+    assert binary.similarity(binary_verbs[2], binary_verbs[0]) == 0.0
+    assert torch.equal(binary.bundle([binary_verbs[2], binary_actors["a1"]]), binary_actors["a1"])
@@ -0,0 +1,161 @@
+"""
+Test LLM Response Cache
+
+Validates:
+1. Cache keys are stable and independent of dict ordering
+2. Hits and misses are counted and reported to the CostTracker
+3. Least recently used entries are evicted past max_bytes
+4. Entries persist across cache instances
+5. A repeated operator call is answered from the cache
+6. Responses without message content (error bodies) are never cached
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+project_root = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(project_root))
+
+from src.gsw.cost_tracker import reset_cost_tracker
+from src.gsw.llm_cache import LLMResponseCache, cache_key, response_content
+
+
+def payload(prompt: str, model: str = "google/gemini-2.5-flash"):
+    return {
+        "model": model,
+        "messages": [{"role": "user", "content": prompt}],
+        "temperature": 0.1,
+        "max_tokens": 4000,
+    }
+
+
+def response(content: str):
+    return {
+        "choices": [{"message": {"content": content}}],
+        "usage": {"prompt_tokens": 1000, "completion_tokens": 200},
+    }
+
+
+def test_key_is_canonical():
+    a = payload("hello")
+    b = dict(reversed(list(a.items())))
+    assert cache_key(a) == cache_key(b)
+    assert cache_key(a) != cache_key(payload("hello", model="other/model"))
+    assert cache_key(a) != cache_key({**a, "temperature": 0.3})
+
+
+def test_hits_reported_to_cost_tracker(tmp_path):
+    tracker = reset_cost_tracker()
+    cache = LLMResponseCache(tmp_path / "cache.sqlite")
+
+    assert cache.lookup(payload("q1"), "operator") is None
+    cache.store(payload("q1"), response("a1"))
+    assert cache.lookup(payload("q1"), "operator")["choices"][0]["message"]["content"] == "a1"
+    assert cache.lookup(payload("q1"), "operator") is not None
+
+    assert (cache.hits, cache.misses) == (2, 1)
+    assert tracker.cache_hits == 2 and tracker.cache_misses == 1
+    assert tracker.cached_input_tokens == 2000
+    assert tracker.cache_by_component["operator"] == {"hits": 2, "misses": 1}
+    assert abs(tracker.cache_hit_rate - 2 / 3) < 1e-9
+    assert tracker.to_dict()["cache"]["hits"] == 2
+    assert "RESPONSE CACHE" in tracker.get_summary()
+
+
+def test_lru_eviction(tmp_path):
+    cache = LLMResponseCache(tmp_path / "cache.sqlite", max_bytes=2000)
+    # Incompressible-ish content so each entry is a few hundred bytes
+    for i in range(20):
+        cache.store(payload(f"q{i}"), response(str(i) * 10 + cache_key({"i": i}) * 4))
+        if i >= 1:
+            cache.get(payload("q0"))  # keep q0 recently used
+
+    assert cache.size_bytes <= 2000
+    assert len(cache) < 20
+    assert cache.get(payload("q0")) is not None
+    assert cache.get(payload("q1")) is None
+    assert cache.get(payload("q19")) is not None
+
+
+def test_persists_across_instances(tmp_path):
+    path = tmp_path / "cache.sqlite"
+    first = LLMResponseCache(path)
+    first.store(payload("q"), response("a"))
+    size = first.size_bytes
+    first.close()
+
+    second = LLMResponseCache(path)
+    assert second.get(payload("q")) == response("a")
+    assert second.size_bytes == size
+
+
+def test_operator_call_served_from_cache(tmp_path):
+    from src.gsw.legal_operator import LegalOperator
+
+    class FakeResponse:
+        status_code = 200
+
+        def raise_for_status(self):
+            pass
+
+        def json(self):
+            return response('{"actors": []}')
+
+    class FakeClient:
+        calls = 0
+
+        def post(self, url, json):
+            FakeClient.calls += 1
+            return FakeResponse()
+
+    cache = LLMResponseCache(tmp_path / "cache.sqlite")
+    operator = LegalOperator(api_key="test", cache=cache)
+    operator.client = FakeClient()
+
+    assert operator._call_llm("prompt") == operator._call_llm("prompt") == '{"actors": []}'
+    assert FakeClient.calls == 1
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_error_bodies_not_cached(tmp_path, monkeypatch):
+    from src.gsw import legal_operator
+    from src.gsw.legal_operator import LegalOperator
+
+    bodies = [{"error": {"message": "Provider returned error", "code": 502}}, {"choices": []}]
+
+    class FakeResponse:
+        status_code = 200
+
+        def raise_for_status(self):
+            pass
+
+        def json(self):
+            return bodies[0]
+
+    class FakeClient:
+        calls = 0
+
+        def post(self, url, json):
+            FakeClient.calls += 1
+            return FakeResponse()
+
+    monkeypatch.setattr(legal_operator.time, "sleep", lambda seconds: None)
+    cache = LLMResponseCache(tmp_path / "cache.sqlite")
+    operator = LegalOperator(api_key="test", cache=cache)
+    operator.client = FakeClient()
+
+    with pytest.raises(Exception, match="Provider returned error"):
+        operator._call_llm("prompt")
+    assert len(cache) == 0
+
+    # A later call reaches the API again and caches the good response
+    bodies[0] = response('{"actors": []}')
+    calls = FakeClient.calls
+    assert operator._call_llm("prompt") == '{"actors": []}'
+    assert FakeClient.calls == calls + 1 and len(cache) == 1
+
+    for body in bodies[1:] + [{"choices": [{"message": {"content": None}}]}, []]:
+        with pytest.raises(ValueError):
+            response_content(body)
@@ -0,0 +1,131 @@
+"""
+Test Ontology Vocabulary Counters
+
+Validates:
+1. Counts follow add_actor/add_verb_phrase (including merges that re-add
+   an actor) and match a full recount of the workspace
+2. Top-N reads match a sort of the recounted frequencies
+3. Counters rebuild after direct dict inserts and JSON loads
+4. The ontology context and its prompt text match the recounting implementation
+"""
+
+import random
+import sys
+from pathlib import Path
+
+project_root = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(project_root))
+
+from src.gsw.workspace import WorkspaceManager
+from src.logic.gsw_index import VOCABULARY_CATEGORIES, RankedCounter
+from src.logic.gsw_schema import (
+    Actor, ActorType, GlobalWorkspace, OntologyContext, State, VerbPhrase
+)
+
+ROLES = ["Applicant", "Respondent", "Mother", "Father", "Child", "Judge", "ICL"]
+STATES = ["RelationshipStatus", "Residence", "Employment", "Income", "CareArrangement"]
+VERBS = ["married", "separated", "relocated", "filed", "paid", "ordered"]
+TYPES = [ActorType.PERSON, ActorType.PERSON, ActorType.ORGANIZATION, ActorType.ASSET]
+
+
+def recount(workspace: GlobalWorkspace) -> OntologyContext:
+    """The full scan get_ontology_context() used to do."""
+    context = OntologyContext()
+    for actor in workspace.actors.values():
+        context.actor_types[actor.actor_type.value] = context.actor_types.get(actor.actor_type.value, 0) + 1
+        for role in actor.roles:
+            context.role_types[role] = context.role_types.get(role, 0) + 1
+        for state in actor.states:
+            context.state_names[state.name] = context.state_names.get(state.name, 0) + 1
+    for verb in workspace.verb_phrases.values():
+        context.verb_types[verb.verb] = context.verb_types.get(verb.verb, 0) + 1
+    return context
+
+
+def random_actor(rng: random.Random, actor_id: str) -> Actor:
+    actor = Actor(id=actor_id, name=f"Person {actor_id}", actor_type=rng.choice(TYPES),
+                  roles=rng.sample(ROLES, rng.randint(0, 3)))
+    for _ in range(rng.randint(0, 3)):
+        actor.add_state(State(entity_id=actor_id, name=rng.choice(STATES), value="x"))
+    return actor
+
+
+def random_verb(rng: random.Random, verb_id: str) -> VerbPhrase:
+    return VerbPhrase(id=verb_id, verb=rng.choice(VERBS))
+
+
+def assert_counts_match(workspace: GlobalWorkspace) -> None:
+    vocabulary = workspace.get_vocabulary()
+    expected = recount(workspace)
+    for category in VOCABULARY_CATEGORIES:
+        assert vocabulary.counts(category) == getattr(expected, category)
+
+
+def test_counts_follow_updates():
+    rng = random.Random(0)
+    workspace = GlobalWorkspace(domain="family")
+    workspace.get_vocabulary()
+    for step in range(400):
+        action = rng.random()
+        if action < 0.4 or not workspace.actors:
+            workspace.add_actor(random_actor(rng, f"a{step}"))
+        elif action < 0.6:
+            # Merge in place, then re-add (as the reconciler does)
+            actor = workspace.actors[rng.choice(sorted(workspace.actors))]
+            actor.roles = list(dict.fromkeys(actor.roles + rng.sample(ROLES, 2)))
+            actor.add_state(State(entity_id=actor.id, name=rng.choice(STATES), value="y"))
+            workspace.add_actor(actor)
+        elif action < 0.7:
+            # Replace with different terms
+            workspace.add_actor(random_actor(rng, rng.choice(sorted(workspace.actors))))
+        elif action < 0.9 or not workspace.verb_phrases:
+            workspace.add_verb_phrase(random_verb(rng, f"v{step}"))
+        else:
+            workspace.add_verb_phrase(random_verb(rng, rng.choice(sorted(workspace.verb_phrases))))
+        if step % 50 == 0:
+            assert_counts_match(workspace)
+    assert_counts_match(workspace)
+
+
+def test_top_n_matches_sort():
+    rng = random.Random(1)
+    workspace = GlobalWorkspace(domain="family")
+    for i in range(300):
+        workspace.add_actor(random_actor(rng, f"a{i}"))
+        workspace.add_verb_phrase(random_verb(rng, f"v{i}"))
+
+    context = WorkspaceManager(workspace).get_ontology_context()
+    expected = recount(workspace)
+    for category in VOCABULARY_CATEGORIES:
+        for n in (0, 1, 3, 15, 100):
+            assert context.get_top_n(category, n) == expected.get_top_n(category, n)
+    assert context.to_prompt_context() == expected.to_prompt_context()
+    assert context.to_toon() == expected.to_toon()
+
+    counter = RankedCounter()
+    for key in "abcabca":
+        counter.increment(key)
+    counter.decrement("a")
+    counter.decrement("a")
+    counter.decrement("c")
+    assert counter.counts == {"a": 1, "b": 2, "c": 1}
+    assert counter.top(3) == ["b", "a", "c"]
+    # A key that drops to zero ranks as new when it comes back
+    counter.decrement("a")
+    counter.increment("a")
+    assert counter.top(3) == ["b", "c", "a"]
+
+
+def test_rebuild_after_direct_inserts():
+    workspace = GlobalWorkspace(domain="family")
+    workspace.add_actor(Actor(id="a1", name="Jane", actor_type=ActorType.PERSON, roles=["Mother"]))
+    vocabulary = workspace.get_vocabulary()
+
+    workspace.actors["a2"] = Actor(id="a2", name="John", actor_type=ActorType.PERSON, roles=["Father"])
+    workspace.verb_phrases["v1"] = VerbPhrase(id="v1", verb="separated")
+    assert workspace.get_vocabulary() is not vocabulary
+    assert_counts_match(workspace)
+
+    loaded = GlobalWorkspace.model_validate_json(workspace.model_dump_json())
+    assert loaded.get_vocabulary().top("role_types", 5) == ["Mother", "Father"]
+    assert_counts_match(loaded)
@@ -0,0 +1,141 @@
+"""
+Test Parallel Corpus Extraction
+
+Validates:
+1. Sharded parallel extraction writes the same rows, in the same order,
+   as sequential extraction
+2. Merged statistics match the sequential run
+3. An interrupted shard resumes from its checkpoint without duplicates
+"""
+
+import json
+import re
+import sys
+from pathlib import Path
+
+import pytest
+
+project_root = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(project_root))
+
+from src.ingestion.corpus_domain_extractor import CorpusDomainExtractor, ShardState
+
+HEADER = re.compile(r"^\w+\[\d+\]\{")
+
+TEXTS = [
+    "The husband and wife separated. Parenting orders and property settlement under the Family Law Act 1975.",
+    "The visa applicant sought review of the delegate's decision under the Migration Act 1958.",
+    "The accused was convicted of murder and the sentence was appealed.",
+    "Negligence claim: duty of care, breach and causation of personal injury.",
+    "Contract dispute over breach of warranty and damages.",
+]
+
+
+def write_corpus(path: Path, count: int = 60) -> None:
+    with open(path, 'w', encoding='utf-8') as f:
+        for i in range(count):
+            doc_type = "primary_legislation" if i % 7 == 0 else "decision"
+            citation = f"Smith v Jones [{2000 + i}] FamCA {i}" if i % 2 else f"R v Brown [{2000 + i}] NSWCCA {i}"
+            f.write(json.dumps({
+                "version_id": f"doc_{i}",
+                "type": doc_type,
+                "citation": citation,
+                "text": TEXTS[i % len(TEXTS)],
+                "jurisdiction": "commonwealth",
+                "date": f"{2000 + i}-01-01",
+            }) + "\n")
+            if i == 30:
+                f.write("not json\n")
+
+
+def output_rows(output_dir: Path):
+    """All TOON rows per output file, ignoring block boundaries."""
+    rows = {}
+    for path in sorted(output_dir.rglob("*.toon")):
+        lines = path.read_text(encoding='utf-8').splitlines()
+        rows[str(path.relative_to(output_dir))] = [l for l in lines if l and not HEADER.match(l)]
+    return rows
+
+
+def run(tmp_path: Path, name: str, **kwargs):
+    corpus = tmp_path / "corpus.jsonl"
+    extractor = CorpusDomainExtractor(
+        input_path=corpus,
+        output_dir=tmp_path / name,
+        state_path=tmp_path / f"{name}_state.json"
+    )
+    if kwargs.pop("parallel", False):
+        stats = extractor._extract_parallel(workers=2, progress_interval=5, resume=False, num_shards=5)
+    else:
+        stats = extractor.extract_all(progress_interval=1000)
+    return extractor, stats
+
+
+@pytest.fixture
+def corpus_dir(tmp_path):
+    write_corpus(tmp_path / "corpus.jsonl")
+    return tmp_path
+
+
+def test_parallel_matches_sequential(corpus_dir):
+    sequential, seq_stats = run(corpus_dir, "sequential")
+    parallel, par_stats = run(corpus_dir, "parallel", parallel=True)
+
+    assert output_rows(corpus_dir / "sequential") == output_rows(corpus_dir / "parallel")
+    assert not (corpus_dir / "parallel" / "_shards").exists()
+
+    assert set(seq_stats) == set(par_stats)
+    for domain, stats in seq_stats.items():
+        other = par_stats[domain]
+        assert stats.document_count == other.document_count
+        assert stats.by_category == other.by_category
+        assert stats.by_court == other.by_court
+        assert stats.sample_citations == other.sample_citations
+        assert (stats.date_min, stats.date_max) == (other.date_min, other.date_max)
+
+    assert (sequential.overlap_stats.single_domain_count ==
+            parallel.overlap_stats.single_domain_count)
+    assert sequential.overlap_stats.domain_pairs == parallel.overlap_stats.domain_pairs
+
+
+def test_interrupted_shard_resumes(corpus_dir):
+    corpus = corpus_dir / "corpus.jsonl"
+
+    def shard_extractor(name):
+        return CorpusDomainExtractor(
+            input_path=corpus,
+            output_dir=corpus_dir / name,
+            state_path=corpus_dir / f"{name}.json"
+        )
+
+    reference = shard_extractor("reference")
+    shard = reference._plan_shards(1)[0]
+    reference._extract_shard(shard, checkpoint_interval=10)
+
+    # Crash after 25 documents: 20 are checkpointed, a full batch may be on disk
+    crashed = shard_extractor("crashed")
+    crashed_shard = crashed._plan_shards(1)[0]
+    original = crashed._process_document
+    seen = []
+
+    def flaky(doc, file_manager, line_num):
+        if len(seen) == 25:
+            raise KeyboardInterrupt
+        seen.append(line_num)
+        original(doc, file_manager, line_num)
+
+    crashed._process_document = flaky
+    with pytest.raises(KeyboardInterrupt):
+        crashed._extract_shard(crashed_shard, checkpoint_interval=10)
+
+    with open(corpus_dir / "crashed.json", encoding='utf-8') as f:
+        checkpoint = ShardState.from_dict(json.load(f))
+    assert checkpoint.next_line == 20 and not checkpoint.done
+
+    resumed = shard_extractor("crashed")
+    final = resumed._extract_shard(checkpoint, checkpoint_interval=10)
+
+    assert final.done
+    assert output_rows(corpus_dir / "crashed") == output_rows(corpus_dir / "reference")
+    assert (sum(s.document_count for s in resumed.stats.values()) ==
+            sum(s.document_count for s in reference.stats.values()))
@@ -0,0 +1,148 @@
+"""
+Test Pending Question Index
+
+Validates:
+1. Index-driven answering matches the per-question scan over every
+   unanswered question, in the same order
+2. The index follows add_question/answer_question and rebuilds after
+   direct dict inserts and JSON loads
+3. Reconciliation answers questions through the index
+"""
+
+import random
+import re
+import sys
+from pathlib import Path
+
+project_root = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(project_root))
+
+from src.gsw.legal_reconciler import LegalReconciler
+from src.gsw.question_answerer import QuestionAnswerer
+from src.logic.gsw_schema import (
+    GlobalWorkspace, Actor, ActorType, ChunkExtraction, PredictiveQuestion, QuestionType
+)
+
+QUESTIONS = [
+    "When did the parties separate?", "When did they marry?", "When was the hearing?",
+    "When were orders filed?", "When did the father relocate?", "Who is the applicant?",
+    "Who cares for the children, the mother or father?", "Who is the ICL?", "Who paid?",
+    "What is the value of the home?", "What is the pool worth?", "Why did they separate?",
+    "What orders were sought?",
+]
+ROLES = ["Applicant", "Mother", "Father", "ICL", "Judge", "", "Mo"]
+CHUNKS = [
+    "The parties separated on 1 March 2020.", "They married on June 5, 2001 and divorced 2019-02-03.",
+    "The hearing was listed. The home is worth $850,000.", "Orders were filed for $1.5 million.",
+    "The mother relocated to Perth.", "Nothing of note happened.",
+]
+
+
+def scan_answers(questions, chunk_text, extraction):
+    """The per-question answering the index replaces."""
+    answered = []
+    chunk_lower = chunk_text.lower()
+    dates = [r'(\d{1,2}\s+(?:january|february|march|april|may|june|july|august|september|october|november|december)\s+\d{4})',
+             r'((?:january|february|march|april|may|june|july|august|september|october|november|december)\s+\d{1,2},?\s+\d{4})',
+             r'(\d{4}-\d{2}-\d{2})']
+    for q in questions:
+        q_text = q.question_text.lower()
+        answer = None
+        if "when" in q_text:
+            for word in ["separate", "marry", "divorce", "hear", "order", "file"]:
+                if word in q_text and word in chunk_lower:
+                    answer = next((re.findall(p, chunk_lower)[0] for p in dates if re.findall(p, chunk_lower)), None)
+                    break
+        elif "who" in q_text:
+            answer = next((a.name for a in extraction.actors if a.actor_type.value == "person"
+                           and any(r.lower() in q_text for r in a.roles)), None)
+        elif "value" in q_text or "worth" in q_text:
+            money = re.findall(r'\$[\d,]+(?:\.\d{2})?(?:\s*(?:million|m))?', chunk_lower)
+            answer = money[0] if money else None
+        if answer:
+            answered.append({"question_id": q.id, "answer_text": str(answer).title(),
+                             "answer_entity_id": None, "confidence": 0.7})
+    return answered
+
+
+def random_extraction(rng: random.Random, chunk_id: str) -> ChunkExtraction:
+    actors = [
+        Actor(id=f"{chunk_id}_a{i}", name=rng.choice(["John Smith", "Jane Smith", ""]),
+              actor_type=rng.choice([ActorType.PERSON, ActorType.PERSON, ActorType.ORGANIZATION]),
+              roles=rng.sample(ROLES, rng.randint(0, 2)))
+        for i in range(rng.randint(0, 3))
+    ]
+    return ChunkExtraction(chunk_id=chunk_id, actors=actors)
+
+
+def random_workspace(rng: random.Random, count: int = 200) -> GlobalWorkspace:
+    workspace = GlobalWorkspace(domain="family")
+    for i in range(count):
+        workspace.add_question(PredictiveQuestion(
+            id=f"q_{i:03d}", question_text=rng.choice(QUESTIONS), question_type=QuestionType.WHAT
+        ))
+    return workspace
+
+
+def test_matches_scan():
+    rng = random.Random(0)
+    answerer = QuestionAnswerer()
+    workspace = random_workspace(rng)
+    for step in range(60):
+        chunk = " ".join(rng.sample(CHUNKS, rng.randint(1, 3)))
+        extraction = random_extraction(rng, f"c{step}")
+        expected = scan_answers(workspace.get_unanswered_questions(), chunk, extraction)
+        assert answerer.answer_pending(workspace, chunk, extraction) == expected
+        assert answerer.answer_questions(workspace.get_unanswered_questions(), chunk, extraction) == expected
+
+        # Answer some, add more: the index follows
+        for answer in expected[:rng.randint(0, len(expected))]:
+            workspace.answer_question(answer["question_id"], answer["answer_text"])
+        workspace.add_question(PredictiveQuestion(
+            id=f"q_new_{step}", question_text=rng.choice(QUESTIONS), question_type=QuestionType.WHO
+        ))
+
+
+def test_maintenance_and_rebuild():
+    workspace = GlobalWorkspace(domain="family")
+    workspace.add_question(PredictiveQuestion(id="q1", question_text="When did they separate?",
+                                              question_type=QuestionType.WHEN))
+    workspace.add_question(PredictiveQuestion(id="q2", question_text="Who is the applicant?",
+                                              question_type=QuestionType.WHO))
+    index = workspace.get_pending_questions()
+    assert index.when_questions(["separate"]) == {"q1"}
+    assert index.who_candidates("applicant") == {"q2"}
+
+    workspace.answer_question("q1", "1 March 2020")
+    assert index.when_questions(["separate", "marry"]) == set()
+
+    # Re-adding with new text re-keys the question
+    workspace.add_question(PredictiveQuestion(id="q2", question_text="What is the home worth?",
+                                              question_type=QuestionType.WHAT))
+    assert index.who_candidates("applicant") == set() and index.value_questions() == {"q2"}
+
+    workspace.questions["q3"] = PredictiveQuestion(id="q3", question_text="When were orders filed?",
+                                                   question_type=QuestionType.WHEN)
+    assert workspace.get_pending_questions().when_questions(["file"]) == {"q3"}
+
+    loaded = GlobalWorkspace.model_validate_json(workspace.model_dump_json())
+    assert loaded.get_pending_questions().when_questions(["separate", "order"]) == {"q3"}
+
+
+def test_reconcile_answers_through_index():
+    workspace = GlobalWorkspace(domain="family")
+    workspace.add_question(PredictiveQuestion(id="q1", question_text="When did the parties separate?",
+                                              question_type=QuestionType.WHEN))
+    workspace.add_question(PredictiveQuestion(id="q2", question_text="Who is the applicant?",
+                                              question_type=QuestionType.WHO))
+    extraction = ChunkExtraction(chunk_id="c1", actors=[
+        Actor(id="a1", name="Jane Smith", actor_type=ActorType.PERSON, roles=["Applicant"])
+    ])
+
+    reconciler = LegalReconciler(api_key=None, use_openrouter=False)
+    _, log = reconciler.reconcile(extraction, workspace, "The parties separated on 1 March 2020.")
+
+    assert [e["question_id"] for e in log if e["action"] == "answered_question"] == ["q1", "q2"]
+    assert workspace.questions["q1"].answer_text == "1 March 2020"
+    assert workspace.questions["q2"].answered_in_chunk_id == "c1"
+    assert workspace.get_unanswered_questions() == []
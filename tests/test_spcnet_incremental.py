@@ -0,0 +1,138 @@
+"""
+Test Incremental SPCNet Builds
+
+Validates:
+1. An incremental build over unchanged inputs reuses every file and document
+2. Editing one case re-extracts only that case; the graph matches a full build
+3. Added and deleted input files are reflected in nodes, edges and the manifest
+4. A file that fails to parse partway is not reused until it parses in full
+"""
+
+import json
+import os
+import sys
+from pathlib import Path
+
+project_root = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(project_root))
+
+from src.graph.spcnet_builder import SPCNetBuilder
+
+
+def case(number: int, text: str) -> dict:
+    return {
+        "citation": f"Smith v Jones [2010] HCA {number}",
+        "text": text,
+        "_classification": {"court": "HCA", "primary_domain": "Family"},
+    }
+
+
+def write_cases(path: Path, cases) -> None:
+    with open(path, 'w', encoding='utf-8') as f:
+        for doc in cases:
+            f.write(json.dumps(doc) + "\n")
+    # Distinct mtime even on coarse-grained filesystems
+    stamp = path.stat().st_mtime_ns + 10**9 * (1 + len(cases))
+    os.utime(path, ns=(stamp, stamp))
+
+
+def build(input_dir: Path, output_dir: Path, incremental: bool) -> SPCNetBuilder:
+    builder = SPCNetBuilder(input_dir, output_dir)
+    builder.build(incremental=incremental)
+    return builder
+
+
+def graph(builder: SPCNetBuilder):
+    return sorted(builder.nodes), sorted(builder.edges)
+
+
+def setup_corpus(tmp_path: Path) -> Path:
+    input_dir = tmp_path / "cases"
+    input_dir.mkdir()
+    write_cases(input_dir / "a.jsonl", [
+        case(1, "We applied [2010] HCA 2 and followed [2010] HCA 3."),
+        case(2, "See [2010] HCA 3."),
+    ])
+    write_cases(input_dir / "b.jsonl", [
+        case(3, "No citations here."),
+        case(4, "Distinguished from [2010] HCA 1."),
+    ])
+    return input_dir
+
+
+def test_unchanged_inputs_are_reused(tmp_path):
+    input_dir = setup_corpus(tmp_path)
+    full = build(input_dir, tmp_path / "graph", incremental=False)
+    assert full.build_stats["docs_extracted"] == 4
+    assert len(full.edges) == 4
+    edges_file = (tmp_path / "graph" / "spcnet_edges.toon").read_text()
+
+    again = build(input_dir, tmp_path / "graph", incremental=True)
+    assert again.build_stats == {"files_reused": 2, "files_scanned": 0, "docs_reused": 0, "docs_extracted": 0}
+    assert graph(again) == graph(full)
+    assert (tmp_path / "graph" / "spcnet_edges.toon").read_text() == edges_file
+
+
+def test_changed_case_is_reextracted(tmp_path):
+    input_dir = setup_corpus(tmp_path)
+    build(input_dir, tmp_path / "graph", incremental=False)
+
+    write_cases(input_dir / "b.jsonl", [
+        case(3, "No citations here."),
+        case(4, "Overruled [2010] HCA 1 and applied [2010] HCA 2."),
+    ])
+    incremental = build(input_dir, tmp_path / "graph", incremental=True)
+    assert incremental.build_stats == {"files_reused": 1, "files_scanned": 1, "docs_reused": 1, "docs_extracted": 1}
+
+    full = build(input_dir, tmp_path / "full", incremental=False)
+    assert graph(incremental) == graph(full)
+    assert ("Smith v Jones [2010] HCA 4", "Smith v Jones [2010] HCA 2") in {(s, t) for s, t, _ in incremental.edges}
+
+
+def test_added_and_deleted_files(tmp_path):
+    input_dir = setup_corpus(tmp_path)
+    first = build(input_dir, tmp_path / "graph", incremental=False)
+
+    (input_dir / "b.jsonl").unlink()
+    write_cases(input_dir / "c.jsonl", [case(5, "Followed [2010] HCA 2.")])
+    incremental = build(input_dir, tmp_path / "graph", incremental=True)
+
+    full = build(input_dir, tmp_path / "full", incremental=False)
+    assert graph(incremental) == graph(full)
+    assert "Smith v Jones [2010] HCA 4" not in incremental.nodes
+    assert incremental.build_stats["files_reused"] == 1
+
+    manifest = json.loads((tmp_path / "graph" / "spcnet_state" / "manifest.json").read_text())
+    assert sorted(manifest["files"]) == ["a.jsonl", "c.jsonl"]
+    segments = sorted(p.name for p in (tmp_path / "graph" / "spcnet_state" / "segments").iterdir())
+    assert segments == sorted(entry["segment"] for entry in manifest["files"].values())
+    assert len(first.nodes) == 4
+
+
+def test_partially_parsed_file_is_rescanned(tmp_path):
+    input_dir = setup_corpus(tmp_path)
+    build(input_dir, tmp_path / "graph", incremental=False)
+
+    # A truncated line in the middle of b.jsonl hides case 4
+    write_cases(input_dir / "b.jsonl", [case(3, "No citations here.")])
+    with open(input_dir / "b.jsonl", 'a', encoding='utf-8') as f:
+        f.write('{"citation": "Smith v Jones [2010] HCA 5", "te\n')
+        f.write(json.dumps(case(4, "Distinguished from [2010] HCA 1.")) + "\n")
+    broken = build(input_dir, tmp_path / "graph", incremental=True)
+    assert "Smith v Jones [2010] HCA 4" not in broken.nodes
+
+    manifest = json.loads((tmp_path / "graph" / "spcnet_state" / "manifest.json").read_text())
+    assert manifest["files"]["b.jsonl"]["stamp"] is None
+    assert manifest["files"]["a.jsonl"]["stamp"] is not None
+
+    # The partial result is never reused, even though the file is unchanged
+    again = build(input_dir, tmp_path / "graph", incremental=True)
+    assert again.build_stats["files_reused"] == 1 and again.build_stats["files_scanned"] == 1
+
+    write_cases(input_dir / "b.jsonl", [
+        case(3, "No citations here."),
+        case(4, "Distinguished from [2010] HCA 1."),
+    ])
+    fixed = build(input_dir, tmp_path / "graph", incremental=True)
+    assert graph(fixed) == graph(build(input_dir, tmp_path / "full", incremental=False))
+    assert build(input_dir, tmp_path / "graph", incremental=True).build_stats["files_reused"] == 2
@@ -0,0 +1,144 @@
+"""
+Test Statute Term Indexes
+
+Validates:
+1. Text search through the inverted term index matches a full corpus scan
+2. Keyword search through the trigram index matches a scan over all keywords
+3. Statute tokens are reused from the index, with a fallback for unknown sections
+4. Compliance and conflict checks match the per-claim tokenising implementation
+"""
+
+import random
+import re
+import sys
+from pathlib import Path
+
+project_root = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(project_root))
+
+from src.validation.corpus_loader import CorpusLoader
+from src.validation.statutory_rag import StatutoryRAGValidator
+
+CORPUS = project_root / "data" / "statutory_corpus"
+
+
+def terms(text):
+    return set(re.findall(r'\w+', text.lower()))
+
+
+def statute_text(section):
+    return ' '.join([
+        section.get('title', ''), section.get('summary', ''),
+        section.get('legal_test', ''), ' '.join(section.get('keywords', []))
+    ])
+
+
+def scan_text(loader, query, top_k):
+    query_terms = terms(query)
+    results = []
+    for act_name, act_data in loader.acts.items():
+        for section in act_data.get('sections', []):
+            overlap = len(query_terms & terms(statute_text(section)))
+            if overlap > 0:
+                results.append(dict(section, act_name=act_name,
+                                    act_citation=act_data['act'].get('citation', ''),
+                                    act_url=act_data['act'].get('url', ''),
+                                    relevance_score=overlap / len(query_terms)))
+    results.sort(key=lambda x: x['relevance_score'], reverse=True)
+    return results[:top_k]
+
+
+def scan_keyword(loader, keyword, top_k):
+    keyword = keyword.lower()
+    results = list(loader.keyword_index.get(keyword, []))
+    for indexed_keyword, sections in loader.keyword_index.items():
+        if keyword in indexed_keyword or indexed_keyword in keyword:
+            results.extend(s for s in sections if s not in results)
+    return results[:top_k]
+
+
+def vocabulary(loader):
+    words = set()
+    for keyword in loader.keyword_index:
+        words.update(keyword.split())
+    for section in loader.sections:
+        words.update(terms(section.get('summary', '')))
+    return sorted(words) + ['x', 'zzz', 'not']
+
+
+def test_text_search_matches_scan():
+    loader = CorpusLoader(str(CORPUS))
+    words = vocabulary(loader)
+    rng = random.Random(0)
+    for _ in range(100):
+        query = " ".join(rng.choice(words) for _ in range(rng.randint(1, 10)))
+        top_k = rng.choice([3, 100])
+        assert loader.search_by_text(query, top_k=top_k) == scan_text(loader, query, top_k)
+    assert loader.search_by_text("", top_k=5) == []
+
+
+def test_keyword_search_matches_scan():
+    loader = CorpusLoader(str(CORPUS))
+    words = vocabulary(loader) + list(loader.keyword_index)
+    rng = random.Random(1)
+    for _ in range(200):
+        keyword = rng.choice(words)
+        if rng.random() < 0.3:
+            keyword = keyword[:rng.randint(1, len(keyword))]
+        if rng.random() < 0.3:
+            keyword = keyword + " " + rng.choice(words)
+        assert loader.search_by_keyword(keyword, top_k=50) == scan_keyword(loader, keyword, 50)
+    assert loader.search_by_keyword("", top_k=3) == scan_keyword(loader, "", 3)
+
+
+def test_section_tokens():
+    loader = CorpusLoader(str(CORPUS))
+    section = loader.search_by_text("best interests of the child", top_k=1)[0]
+    assert loader.section_tokens(section) is loader.section_terms[loader.sections.index(
+        next(s for s in loader.sections if s['act_name'] == section['act_name'] and s['section'] == section['section'])
+    )]
+
+    # Edited or foreign sections are tokenised afresh
+    edited = dict(section, summary="entirely new words")
+    assert loader.section_tokens(edited) == terms(statute_text(edited))
+    assert loader.section_tokens({"title": "Unknown provision"}) == {"unknown", "provision"}
+
+
+def test_compliance_and_conflicts_unchanged():
+    validator = StatutoryRAGValidator(str(CORPUS))
+    words = vocabulary(validator.corpus_loader)
+    rng = random.Random(2)
+    claims = [
+        " ".join(rng.choice(words) for _ in range(rng.randint(3, 25))) + (" not" if rng.random() < 0.5 else "")
+        for _ in range(20)
+    ]
+    statutes = validator._retrieve_statutes(claims)
+
+    expected_score = 0.0
+    for claim in claims:
+        claim_terms = terms(claim)
+        best = 0.0
+        for statute in statutes:
+            statute_terms = terms(statute_text(statute))
+            if claim_terms and statute_terms:
+                score = len(claim_terms & statute_terms) / len(claim_terms)
+                elements = statute.get('required_elements')
+                if elements:
+                    matched = sum(
+                        any(k.lower() in claim.lower() for k in e.get('keywords', [])) for e in elements
+                    )
+                    score = (score + matched / len(elements)) / 2
+                best = max(best, score)
+        expected_score += best
+    assert abs(validator._check_compliance(claims, statutes) - expected_score / len(claims)) < 1e-12
+
+    negated = [
+        s for s in statutes
+        for claim in claims
+        if any(n in claim.lower() for n in ['not', 'no', 'never', 'cannot', 'unable', 'fails', 'lacks'])
+        and any(p in s.get('summary', '').lower()
+                for p in ['must', 'shall', 'required', 'necessary', 'essential', 'needs'])
+        and len(terms(claim) & terms(s.get('summary', ''))) > 3
+    ]
+    conflicts = validator._detect_conflicts(claims, statutes)
+    assert sum(c.startswith("Potential conflict") for c in conflicts) == len(negated)
@@ -0,0 +1,115 @@
+"""
+Test CSR Graph Store and Vectorised Walks
+
+Validates:
+1. CSR arrays match the edge list (per-node order, action codes, unknown endpoints)
+2. The .npz cache is reused, and rebuilt when the TOON files change
+3. Walks follow edges, carry their actions and pad after dead ends
+4. LegalGraphBuilder batches and DataLoader workers produce TEM-shaped tensors
+"""
+
+import os
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+project_root = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(project_root))
+
+from src.tem.action_space import ACTION_TO_ID, LegalAction
+from src.tem.graph_store import CACHE_NAME, CSRGraph
+from src.utils.toon import ToonWriter
+
+EDGES = [
+    ("A", "B", "FOLLOWED"),
+    ("A", "C", "CITED"),
+    ("B", "C", "DISTINGUISHED"),
+    ("C", "A", "OVERRULED"),
+    ("C", "X", "CONSIDERED"),  # X is not in the nodes file
+    ("A", "D", "unknown"),
+]
+
+
+def write_graph(graph_dir: Path, edges=EDGES) -> None:
+    graph_dir.mkdir(exist_ok=True)
+    with open(graph_dir / "spcnet_nodes.toon", 'w', encoding='utf-8', newline='') as f:
+        ToonWriter(f).write_table("Nodes", ["id", "title"], ([n, n] for n in "ABCD"))
+    with open(graph_dir / "spcnet_edges.toon", 'w', encoding='utf-8', newline='') as f:
+        ToonWriter(f).write_table("Edges", ["source", "target", "action"], edges)
+
+
+def test_csr_matches_edges(tmp_path):
+    write_graph(tmp_path)
+    graph = CSRGraph.load(tmp_path)
+
+    assert graph.node_ids == ["A", "B", "C", "D", "X"]
+    assert graph.indptr.tolist() == [0, 3, 4, 6, 6, 6]
+    targets, actions = graph.neighbors(0)
+    assert [graph.node_ids[t] for t in targets] == ["B", "C", "D"]
+    assert actions.tolist() == [ACTION_TO_ID[a] for a in (LegalAction.FOLLOW, LegalAction.CITE, LegalAction.CITE)]
+    assert graph.indices.dtype == graph.actions.dtype == graph.indptr.dtype == np.int32
+    assert graph.start_nodes.tolist() == [0, 1, 2]
+
+
+def test_cache_reuse_and_invalidation(tmp_path, monkeypatch):
+    write_graph(tmp_path)
+    CSRGraph.load(tmp_path)
+    assert (tmp_path / CACHE_NAME).exists()
+
+    # A cache hit never parses TOON
+    monkeypatch.setattr(CSRGraph, "from_toon", classmethod(lambda cls, d: pytest.fail("cache not used")))
+    assert CSRGraph.load(tmp_path).num_edges == len(EDGES)
+    monkeypatch.undo()
+
+    write_graph(tmp_path, EDGES[:2])
+    os.utime(tmp_path / "spcnet_edges.toon", ns=(1, 1))
+    assert CSRGraph.load(tmp_path).num_edges == 2
+
+
+def test_walks_follow_edges(tmp_path):
+    write_graph(tmp_path)
+    graph = CSRGraph.load(tmp_path)
+    action_of = {"FOLLOWED": LegalAction.FOLLOW, "DISTINGUISHED": LegalAction.DISTINGUISH,
+                 "OVERRULED": LegalAction.OVERRULE, "CONSIDERED": LegalAction.CONSIDER}
+    edges = {
+        (graph.node_ids.index(s), graph.node_ids.index(t)): ACTION_TO_ID[action_of.get(a, LegalAction.CITE)]
+        for s, t, a in EDGES
+    }
+
+    observations, actions = graph.sample_walks(500, 6, np.random.default_rng(0))
+    assert observations.shape == (500, 6) and actions.shape == (500, 5)
+    for obs, acts in zip(observations, actions):
+        for step in range(5):
+            if graph.degree[obs[step]] == 0:
+                # Dead end (D or X): padded from here on
+                assert (obs[step + 1:] == 0).all() and (acts[step:] == 0).all()
+                break
+            assert acts[step] == edges[(obs[step], obs[step + 1])]
+
+    # Every out-edge of A is taken about equally often
+    first = graph.sample_walks(3000, 2, np.random.default_rng(1), starts=np.zeros(3000, dtype=np.int64))[0][:, 1]
+    assert set(np.bincount(first, minlength=5)[[1, 2, 3]] // 100) <= {9, 10, 11}
+
+
+def test_builder_batches_and_loader(tmp_path):
+    from src.tem.legal_graph_builder import LegalGraphBuilder
+
+    write_graph(tmp_path)
+    builder = LegalGraphBuilder(tmp_path)
+    assert len(builder.nodes) == 4
+    assert builder.adj_list["A"][0] == ("B", LegalAction.FOLLOW)
+
+    path, actions = builder.random_walk("B", 3)
+    assert path[:2] == ["B", "C"] and actions[0] == ACTION_TO_ID[LegalAction.DISTINGUISH]
+
+    batch = next(builder.batch_generator(8, 5, seed=0))
+    assert batch['observations'].shape == (8, 5) and batch['actions'].shape == (8, 4)
+    assert next(builder.batch_generator(8, 5, seed=0))['observations'].equal(batch['observations'])
+
+    loader = iter(builder.walk_loader(4, 5, num_workers=2, seed=3))
+    batches = [next(loader) for _ in range(4)]
+    assert all(b['observations'].shape == (4, 5) for b in batches)
+    # Workers sample independently
+    assert not batches[0]['observations'].equal(batches[1]['observations'])
@@ -0,0 +1,77 @@
+"""
+Test Streaming TOON Reader / Writer
+
+Validates:
+1. ToonWriter output round-trips through ToonReader (commas, quotes, newlines)
+2. Tables split over several blocks are concatenated, and decode() agrees
+3. Rows are yielded lazily and unconsumed rows are skipped
+4. Case text longer than the csv module's default field limit
+"""
+
+import io
+import sys
+from pathlib import Path
+
+project_root = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(project_root))
+
+from src.utils.toon import ToonDecoder, ToonEncoder, ToonReader, ToonWriter
+
+HEADERS = ["citation", "score", "text"]
+ROWS = [
+    ["Smith & Smith [2020] FamCA 1", "7", "Plain text"],
+    ["Jones, Re [2019] FamCAFC 2", "3", 'He said "stay", then left.\nNew paragraph.'],
+    ["", "", '"Quoted" at start'],
+    ["Brown [2018] FCCA 3", "5", "  leading and trailing spaces  "],
+]
+
+
+def write(rows, block_size=2) -> str:
+    buffer = io.StringIO(newline='')
+    with ToonWriter(buffer, block_size=block_size) as writer:
+        writer.write_comment("Domain: family")
+        for row in rows:
+            writer.write_row("Cases_family", HEADERS, row)
+        writer.write_table("Edges", ["source", "target"], ([str(i), str(i + 1)] for i in range(3)))
+    return buffer.getvalue()
+
+
+def test_round_trip():
+    content = write(ROWS)
+    assert content.count("Cases_family[") == 2
+
+    reader = ToonReader(io.StringIO(content, newline=''))
+    rows = list(reader.rows())
+    assert [list(row.values()) for name, row in rows if name == "Cases_family"] == ROWS
+    assert [row["target"] for name, row in rows if name == "Edges"] == ["1", "2", "3"]
+    assert reader.comments == ["# Domain: family"]
+
+    tables = ToonDecoder.decode(content)
+    assert [list(row.values()) for row in tables["Cases_family"]] == ROWS
+    assert len(tables["Edges"]) == 3
+
+
+def test_encoder_blocks_decode_like_before():
+    block = ToonEncoder.encode("Actors", ["id", "name", "roles"], [["a1", "John", "Father|Applicant"], ["a2", "Jane"]])
+    assert ToonDecoder.decode(block) == {"Actors": [
+        {"id": "a1", "name": "John", "roles": "Father|Applicant"},
+        {"id": "a2", "name": "Jane", "roles": ""},
+    ]}
+
+
+def test_lazy_rows_and_skipping():
+    reader = ToonReader(io.StringIO(write(ROWS, block_size=10), newline=''))
+    names = []
+    for name, headers, rows in reader:
+        names.append(name)
+        if name == "Cases_family":
+            assert next(rows)["score"] == "7"  # Leave the rest unconsumed
+    assert names == ["Edges", "Cases_family"]  # Buffered rows are written on flush
+    assert [n for n, _ in ToonDecoder.iter_rows(io.StringIO(write(ROWS)), ["Edges"])] == ["Edges"] * 3
+
+
+def test_large_field():
+    text = "parenting orders, " * 20000  # ~360 KB
+    content = write([["Big [2021] FamCA 9", "9", text]])
+    (_, row), = ToonReader(io.StringIO(content)).rows(["Cases_family"])
+    assert row["text"] == text
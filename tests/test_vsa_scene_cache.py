@@ -0,0 +1,104 @@
+"""
+Test Cached VSA Scene Vectors
+
+Validates:
+1. GlobalWorkspace.version is bumped by its mutators
+2. encode_workspace() reuses the scene of an unchanged workspace
+3. A changed actor re-encodes only itself and the verbs involving it
+4. The running sum always equals the sum of the cached entity vectors
+   (float and bit-packed binary backends)
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+import torch
+
+project_root = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(project_root))
+
+from src.vsa.binary_vsa import BinaryLegalVSA
+from src.vsa.encoder import GSWVSAEncoder
+from src.vsa.legal_vsa import LegalVSA
+from src.logic.gsw_schema import GlobalWorkspace, Actor, State, VerbPhrase, ActorType
+
+
+def make_workspace() -> GlobalWorkspace:
+    workspace = GlobalWorkspace(domain="family")
+    for i, role in enumerate(["Applicant", "Respondent", "Court", "Child"]):
+        workspace.add_actor(Actor(id=f"actor_{i}", name=f"Party {i}",
+                                  actor_type=ActorType.PERSON, roles=[role]))
+    workspace.add_verb_phrase(VerbPhrase(id="verb_0", verb="filed", agent_id="actor_0", patient_ids=["actor_2"]))
+    workspace.add_verb_phrase(VerbPhrase(id="verb_1", verb="ordered", agent_id="actor_2", patient_ids=["actor_1"]))
+    return workspace
+
+
+@pytest.fixture(params=[LegalVSA, BinaryLegalVSA], ids=["float", "binary"])
+def vsa(request):
+    return request.param(dimension=1000)
+
+
+def counting_encoder(monkeypatch, vsa):
+    encoder = GSWVSAEncoder(vsa)
+    calls = {"actor": 0, "verb": 0}
+    encode_actor, encode_verb = encoder.encode_actor, encoder.encode_verb
+
+    def count_actor(actor):
+        calls["actor"] += 1
+        return encode_actor(actor)
+
+    def count_verb(verb, actor_map):
+        calls["verb"] += 1
+        return encode_verb(verb, actor_map)
+
+    monkeypatch.setattr(encoder, "encode_actor", count_actor)
+    monkeypatch.setattr(encoder, "encode_verb", count_verb)
+    return encoder, calls
+
+
+def assert_sum_consistent(encoder, workspace):
+    cache = encoder._scenes[id(workspace)]
+    vsa = encoder.vsa
+    vectors = [v for _, v in cache.actors.values()] + [v for _, v in cache.verbs.values()]
+    assert torch.equal(cache.total, vsa.to_bipolar(torch.stack(vectors)).sum(dim=0))
+    assert set(vsa.to_bipolar(cache.scene).unique().tolist()) <= {-1.0, 1.0}
+
+
+def test_version_bumped_by_mutators():
+    workspace = make_workspace()
+    version = workspace.version
+    workspace.add_state(State(entity_id="actor_0", name="Status", value="Separated"))
+    assert workspace.version == version + 1
+    assert GlobalWorkspace.model_validate(workspace.model_dump()).version == 0
+
+
+def test_unchanged_workspace_reuses_scene(monkeypatch, vsa):
+    encoder, calls = counting_encoder(monkeypatch, vsa)
+    workspace = make_workspace()
+
+    scene = encoder.encode_workspace(workspace)
+    assert calls == {"actor": 4, "verb": 2}
+    assert encoder.encode_workspace(workspace) is scene
+    assert calls == {"actor": 4, "verb": 2}
+    assert_sum_consistent(encoder, workspace)
+
+
+def test_changed_actor_reencodes_incrementally(monkeypatch, vsa):
+    encoder, calls = counting_encoder(monkeypatch, vsa)
+    workspace = make_workspace()
+    encoder.encode_workspace(workspace)
+
+    # Merge-style update: mutate in place, then re-add (as the reconciler does)
+    actor = workspace.actors["actor_1"]
+    actor.roles.append("Mother")
+    workspace.add_actor(actor)
+    encoder.encode_workspace(workspace)
+    assert calls == {"actor": 5, "verb": 3}  # actor_1 and verb_1 only
+    assert_sum_consistent(encoder, workspace)
+
+    # Entities inserted directly into the dicts are still picked up
+    workspace.actors["actor_9"] = Actor(id="actor_9", name="Late", actor_type=ActorType.PERSON)
+    encoder.encode_workspace(workspace)
+    assert calls == {"actor": 6, "verb": 3}
+    assert_sum_consistent(encoder, workspace)
@@ -0,0 +1,157 @@
+"""
+Test Workspace Journal
+
+Validates:
+1. Replaying the journal over the last snapshot rebuilds the workspace
+2. Uncommitted / torn tails are discarded
+3. Compaction folds the journal into the workspace file
+4. A reconcile that fails midway commits what it applied, so compaction
+   still succeeds
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+project_root = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(project_root))
+
+from src.gsw.journal import WorkspaceJournal
+from src.gsw.legal_reconciler import LegalReconciler
+from src.gsw.workspace import WorkspaceManager
+from src.logic.gsw_schema import (
+    GlobalWorkspace, Actor, VerbPhrase, PredictiveQuestion, SpatioTemporalLink,
+    ChunkExtraction, ActorType, QuestionType, LinkType
+)
+
+
+def make_extraction(chunk: int) -> ChunkExtraction:
+    """One chunk mentioning the husband, with a question, verb and link."""
+    husband = Actor(
+        id=f"actor_h{chunk}", name="John Smith", actor_type=ActorType.PERSON,
+        aliases=["the husband"], roles=["Applicant"], source_chunk_ids=[f"chunk_{chunk}"]
+    )
+    child = Actor(
+        id=f"actor_c{chunk}", name=f"Child {chunk}", actor_type=ActorType.PERSON,
+        roles=["Child"]
+    )
+    return ChunkExtraction(
+        chunk_id=f"chunk_{chunk}",
+        source_document_id=f"doc_{chunk}",
+        actors=[husband, child],
+        verb_phrases=[VerbPhrase(
+            id=f"verb_{chunk}", verb="filed", agent_id=husband.id, patient_ids=[child.id]
+        )],
+        questions=[PredictiveQuestion(
+            id=f"q_{chunk}", question_text="When did the parties separate?",
+            question_type=QuestionType.WHEN, target_entity_id=husband.id
+        )],
+        spatio_temporal_links=[SpatioTemporalLink(
+            id=f"link_{chunk}", linked_entity_ids=[husband.id, child.id],
+            tag_type=LinkType.TEMPORAL, tag_value="2020-03-01"
+        )]
+    )
+
+
+def run_chunks(workspace: GlobalWorkspace, journal: WorkspaceJournal, chunks) -> None:
+    reconciler = LegalReconciler(api_key=None, use_openrouter=False)
+    for chunk in chunks:
+        text = "The parties separated on 1 March 2020. Orders were filed."
+        reconciler.reconcile(make_extraction(chunk), workspace, text, journal=journal)
+
+
+def test_replay_rebuilds_workspace(tmp_path):
+    """Snapshot + journal replay == live workspace."""
+    workspace_path = tmp_path / "family_workspace.json"
+    live = GlobalWorkspace(domain="family")
+    manager = WorkspaceManager(live, workspace_path)
+    manager.save()
+
+    journal = WorkspaceJournal.for_workspace(workspace_path, fsync=False)
+    run_chunks(live, journal, range(3))
+    journal.close()
+
+    # The husband was merged across chunks, and a question got answered
+    assert len([a for a in live.actors.values() if a.name == "John Smith"]) == 1
+    assert live.get_answered_questions()
+
+    recovered = WorkspaceManager.load(workspace_path).workspace
+    commits = WorkspaceJournal.for_workspace(workspace_path).replay(recovered)
+
+    assert [c["document_id"] for c in commits] == ["doc_0", "doc_1", "doc_2"]
+    assert (WorkspaceManager._serialize_workspace(recovered) ==
+            WorkspaceManager._serialize_workspace(live))
+
+
+def test_uncommitted_tail_is_discarded(tmp_path):
+    """Records without a commit marker, and torn lines, are dropped."""
+    workspace_path = tmp_path / "family_workspace.json"
+    live = GlobalWorkspace(domain="family")
+    journal = WorkspaceJournal.for_workspace(workspace_path, fsync=False)
+    run_chunks(live, journal, range(2))
+
+    committed_size = journal.size_bytes()
+    journal.actor_added(Actor(id="actor_x", name="Ghost", actor_type=ActorType.PERSON))
+    journal._open().write('{"op": "actor_added", "actor": {"id": "act')
+    journal.close()
+
+    recovered = GlobalWorkspace(domain="family")
+    commits = WorkspaceJournal.for_workspace(workspace_path).replay(recovered)
+
+    assert len(commits) == 2
+    assert "actor_x" not in recovered.actors
+    assert recovered.chunk_count == 2
+    assert journal.size_bytes() == committed_size
+
+
+def test_compaction_truncates_journal(tmp_path):
+    """Compaction writes the workspace file and empties the journal."""
+    workspace_path = tmp_path / "family_workspace.json"
+    live = GlobalWorkspace(domain="family")
+    manager = WorkspaceManager(live, workspace_path)
+
+    journal = WorkspaceJournal.for_workspace(workspace_path, compact_bytes=1, fsync=False)
+    run_chunks(live, journal, range(2))
+    assert journal.should_compact()
+
+    journal.compact(manager)
+    assert journal.size_bytes() == 0
+
+    run_chunks(live, journal, [2])
+    journal.close()
+
+    recovered = WorkspaceManager.load(workspace_path).workspace
+    commits = WorkspaceJournal.for_workspace(workspace_path).replay(recovered)
+    assert [c["document_id"] for c in commits] == ["doc_2"]
+    assert set(recovered.actors) == set(live.actors)
+    assert recovered.chunk_count == 3
+
+
+def test_failed_reconcile_commits_partial_chunk(tmp_path, monkeypatch):
+    """Changes applied before a failure are committed, marked partial."""
+    workspace_path = tmp_path / "family_workspace.json"
+    live = GlobalWorkspace(domain="family")
+    manager = WorkspaceManager(live, workspace_path)
+    journal = WorkspaceJournal.for_workspace(workspace_path, fsync=False)
+    run_chunks(live, journal, [0])
+
+    def fail(self, verb):
+        raise RuntimeError("verb store unavailable")
+
+    monkeypatch.setattr(GlobalWorkspace, "add_verb_phrase", fail)
+    with pytest.raises(RuntimeError, match="verb store unavailable"):
+        run_chunks(live, journal, [1])
+    monkeypatch.undo()
+    assert "actor_c1" in live.actors and "q_1" in live.questions
+
+    recovered = GlobalWorkspace(domain="family")
+    commits = WorkspaceJournal.for_workspace(workspace_path).replay(recovered)
+    assert [c.get("partial", False) for c in commits] == [False, True]
+    assert recovered.model_dump(exclude={"created_at"}) == live.model_dump(exclude={"created_at"})
+
+    # The pipeline carries on: later chunks and compaction still work
+    run_chunks(live, journal, [2])
+    journal.compact(manager)
+    journal.close()
+    assert WorkspaceManager.load(workspace_path).workspace.chunk_count == live.chunk_count == 2
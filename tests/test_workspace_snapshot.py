@@ -0,0 +1,107 @@
+"""
+Test Binary Workspace Snapshots
+
+Validates:
+1. Round-trip conversion (workspace -> snapshot -> workspace)
+2. Lazy materialisation of entities
+3. Mutations on a snapshot-backed workspace
+4. GSWRetriever prefers an up-to-date snapshot
+"""
+
+import sys
+from pathlib import Path
+
+project_root = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(project_root))
+
+from src.gsw.workspace import WorkspaceManager
+from src.gsw.snapshot import write_snapshot, read_snapshot, is_snapshot
+from src.retrieval.gsw_retriever import GSWRetriever
+from src.logic.gsw_schema import Actor, ActorType, PredictiveQuestion, QuestionType
+
+from test_toon_workspace import create_test_workspace
+
+
+def test_round_trip(tmp_path):
+    """Snapshot preserves everything the JSON format preserves."""
+    workspace = create_test_workspace()
+    workspace.entity_summaries["actor_001"] = "John Smith is the applicant."
+    path = tmp_path / "family_workspace.gsws"
+
+    write_snapshot(workspace, path)
+    assert is_snapshot(path)
+
+    loaded = read_snapshot(path)
+    assert (WorkspaceManager._serialize_workspace(loaded) ==
+            WorkspaceManager._serialize_workspace(workspace))
+
+
+def test_entities_materialised_lazily(tmp_path):
+    """Only entities that are looked up get built."""
+    path = tmp_path / "family_workspace.gsws"
+    write_snapshot(create_test_workspace(), path)
+    loaded = read_snapshot(path)
+
+    assert len(loaded.actors) == 3
+    assert loaded.actors.materialized_count() == 0
+    # No names are decoded at open; lookups binary-search the names column
+    assert loaded._name_to_actor_id._reader._string_cache == {}
+
+    # Name and alias lookups work before anything is materialised
+    john = loaded.find_actor_by_name("John Smith")
+    assert john is not None and john.id == "actor_001"
+    assert loaded.find_actor_by_name("mr. smith") is john
+    assert loaded.find_actor_by_name("missing person") is None
+    assert loaded.actors.materialized_count() == 1
+
+    actor = loaded.actors["actor_001"]
+    assert actor.name == "John Smith"
+    assert [s.value for s in actor.states] == ["Married", "Separated"]
+    assert loaded.actors.materialized_count() == 1
+    assert loaded.actors["actor_001"] is actor
+    assert "actor_999" not in loaded.actors
+
+
+def test_snapshot_workspace_is_mutable(tmp_path):
+    """New entities, edits and model_dump work on a snapshot workspace."""
+    path = tmp_path / "family_workspace.gsws"
+    write_snapshot(create_test_workspace(), path)
+    loaded = read_snapshot(path)
+
+    loaded.actors["actor_001"].roles.append("Father")
+    loaded.add_actor(Actor(id="actor_010", name="Emily Smith", actor_type=ActorType.PERSON))
+    loaded.add_question(PredictiveQuestion(
+        id="q_010", question_text="Where does the child live?",
+        question_type=QuestionType.WHERE
+    ))
+
+    assert list(loaded.actors) == ["actor_001", "actor_002", "actor_003", "actor_010"]
+    assert "Father" in loaded.actors["actor_001"].roles
+    assert len(loaded.questions) == 3
+    assert loaded.find_actor_by_name("emily smith").id == "actor_010"
+    assert loaded.find_actor_by_name("John Smith").id == "actor_001"
+
+    dumped = loaded.model_dump()
+    assert set(dumped["actors"]) == {"actor_001", "actor_002", "actor_003", "actor_010"}
+
+    # Saving through the manager round-trips the edits
+    manager = WorkspaceManager(loaded)
+    manager.save_snapshot(tmp_path / "edited_workspace.gsws")
+    reloaded = WorkspaceManager.load(tmp_path / "edited_workspace.gsws").workspace
+    assert "Father" in reloaded.actors["actor_001"].roles
+    assert reloaded.actors["actor_010"].name == "Emily Smith"
+
+
+def test_retriever_prefers_snapshot(tmp_path):
+    """A snapshot at least as new as the JSON file is loaded instead."""
+    manager = WorkspaceManager(create_test_workspace())
+    manager.save(tmp_path / "family_workspace.json")
+    manager.save_snapshot(tmp_path / "family_workspace.json")
+
+    retriever = GSWRetriever(workspace_dir=tmp_path)
+    loaded = retriever.workspaces["family"]
+    assert loaded.storage_path.suffix == ".gsws"
+    assert loaded.workspace.actors.materialized_count() == 0
+
+    results = retriever.retrieve("John Smith applicant", top_k=3)
+    assert results[0]["id"] == "actor_001"